@@ -145,6 +145,10 @@ __all__ = [
 #x = sys.stdout
 
 
+import importlib
+import sys
+import types
+
 #-------------------------------------------------------------------------------
 # base Music21Object -- all objects should inherit from this!
 from music21 import base
@@ -176,8 +180,38 @@ from music21.base import *
 
 
 #------------------------------------------------------------------------------
-# this bring all of the __all__ names into the music21 package namespace
-from music21 import * # @UnresolvedImport
+# the other names in __all__ are imported into the music21 package namespace
+# the first time they are used (music21.note, music21.stream, etc.), so that
+# "import music21" does not load every module; "from music21 import *"
+# still imports them all at once.
+
+def __getattr__(name):
+    '''
+    Import the submodule `name` of music21 if it is in __all__.
+    '''
+    if name in __all__:
+        return importlib.import_module('music21.' + name)
+    raise AttributeError("module 'music21' has no attribute '%s'" % name)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ is only supported from Python 3.7 on; before
+    # then, replace this module with one whose class does the same
+    class _LazyModule(types.ModuleType):
+        def __getattr__(self, name):
+            return self._getattr(name)
+
+        def __dir__(self):
+            return sorted(set(self.__dict__) | set(__all__))
+
+    _lazyModule = _LazyModule(__name__, __doc__)
+    _lazyModule.__dict__.update(globals())
+    _lazyModule._getattr = __getattr__
+    # keep the original module alive, or its globals are cleared
+    _lazyModule._originalModule = sys.modules[__name__]
+    sys.modules[__name__] = _lazyModule
 
 #------------------------------------------------------------------------------
 # eof
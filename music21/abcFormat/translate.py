@@ -322,7 +322,6 @@ def abcToStreamScore(abcHandler, inputM21=None):
     if the optional parameter inputM21 is given a music21 Stream subclass, it will use that object
     as the outermost object.  However, inner parts will always be made :class:`~music21.stream.Part` objects.
     '''
-    from music21 import abcFormat
     from music21 import metadata
 
     if inputM21 == None:
@@ -333,32 +332,7 @@ def abcToStreamScore(abcHandler, inputM21=None):
     # meta data can be first
     md = metadata.Metadata()
     s.insert(0, md)
-
-    # get title from large-scale metadata
-    titleCount = 0
-    for t in abcHandler.tokens:
-        if isinstance(t, abcFormat.ABCMetadata):
-            if t.isTitle():
-                if titleCount == 0: # first
-                    md.title = t.data
-                    #environLocal.printDebug(['got metadata title', md.title])
-                    titleCount += 1
-                # all other titles go in alternative field
-                else:
-                    md.alternativeTitle = t.data
-                    #environLocal.printDebug(['got alternative title', md.alternativeTitle])
-                    titleCount += 1
-            elif t.isComposer():
-                md.composer = t.data
-
-            elif t.isOrigin():
-                md.localeOfComposition = t.data
-                #environLocal.printDebug(['got local of composition', md.localOfComposition])
-
-            elif t.isReferenceNumber():
-                md.number = int(t.data) # convert to int?
-                #environLocal.printDebug(['got work number', md.number])
-
+    abcTokensToMetadata(abcHandler.tokens, md)
 
     partHandlers = []
     tokenCollections = abcHandler.splitByVoice()
@@ -390,6 +364,101 @@ def abcToStreamScore(abcHandler, inputM21=None):
 
 
 
+def abcTokensToMetadata(tokens, md):
+    '''
+    Set the title, alternative title, composer, origin, and work number given
+    by the :class:`~music21.abcFormat.ABCMetadata` objects among `tokens` on
+    the :class:`~music21.metadata.Metadata` object `md`.
+    '''
+    from music21 import abcFormat
+    # get title from large-scale metadata
+    titleCount = 0
+    for t in tokens:
+        if isinstance(t, abcFormat.ABCMetadata):
+            if t.isTitle():
+                if titleCount == 0: # first
+                    md.title = t.data
+                    #environLocal.printDebug(['got metadata title', md.title])
+                    titleCount += 1
+                # all other titles go in alternative field
+                else:
+                    md.alternativeTitle = t.data
+                    #environLocal.printDebug(['got alternative title', md.alternativeTitle])
+                    titleCount += 1
+            elif t.isComposer():
+                md.composer = t.data
+
+            elif t.isOrigin():
+                md.localeOfComposition = t.data
+                #environLocal.printDebug(['got local of composition', md.localOfComposition])
+
+            elif t.isReferenceNumber():
+                md.number = int(t.data) # convert to int?
+                #environLocal.printDebug(['got work number', md.number])
+
+
+def abcToStreamMetadataOnly(strSrc, inputM21=None):
+    r'''
+    Read only the information fields (lines such as "T:Title") of the ABC
+    data in `strSrc`, skipping all the music, and return a Score holding
+    just the Metadata of the work.  If more than one work is defined, an
+    Opus of such Scores is returned, as :func:`abcToStreamOpus` would.
+
+    If the optional parameter inputM21 is given a Score, it is used for a
+    single work.
+
+    >>> abcStr = 'X:5\nT:Tune A\nC:Anon.\nM:6/8\nK:G\nB3 A3 | G6 ||\n'
+    >>> abcStr += 'X:6\nT:Tune B\nM:6/8\nK:G\nB3 A3 | G6 ||\n'
+    >>> op = abcFormat.translate.abcToStreamMetadataOnly(abcStr)
+    >>> op
+    <music21.stream.Opus ...>
+    >>> for sc in op.scores:
+    ...     print("%s %s %s" % (sc.metadata.number, sc.metadata.title, len(sc.parts)))
+    5 Tune A 0
+    6 Tune B 0
+    '''
+    from music21 import abcFormat
+    from music21 import metadata
+
+    # tokens before the first reference number, then those of each work
+    tokenLists = [[]]
+    for line in strSrc.splitlines():
+        line = line.strip()
+        # as in ABCHandler.tokenize, a repeat bar is not an information field
+        if abcFormat.reMetadataTag.match(line) is None or line[2:3] == '|':
+            continue
+        t = abcFormat.ABCMetadata(line)
+        t.preParse()
+        if t.isReferenceNumber():
+            tokenLists.append([])
+        tokenLists[-1].append(t)
+
+    if len(tokenLists) <= 2: # just one work
+        if inputM21 is None:
+            s = stream.Score()
+        else:
+            s = inputM21
+        md = metadata.Metadata()
+        abcTokensToMetadata([t for tokens in tokenLists for t in tokens], md)
+        s.insert(0, md)
+        return s
+
+    # as in ABCHandler.splitByReferenceNumber, the last of two works
+    # with the same number is used
+    tokensByNumber = {}
+    for tokens in tokenLists[1:]:
+        tokensByNumber[int(tokens[0].data)] = tokens
+    opus = stream.Opus()
+    for key in sorted(tokensByNumber.keys()):
+        s = stream.Score()
+        md = metadata.Metadata()
+        abcTokensToMetadata(tokensByNumber[key], md)
+        s.insert(0, md)
+        opus._appendCore(s)
+    opus._elementsChanged()
+    return opus
+
+
 def abcToStreamOpus(abcHandler, inputM21=None, number=None):
     '''Convert a multi-work stream into one or more complete works packed into a an Opus Stream.
 
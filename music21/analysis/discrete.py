@@ -24,6 +24,7 @@ The :class:`music21.analysis.discrete.KrumhanslSchmuckler`
 
 import unittest
 
+from music21 import base # for _missingImport testing.
 from music21 import exceptions21
 
 from music21 import pitch
@@ -155,6 +156,40 @@ class DiscreteAnalysis(object):
         '''
         pass
 
+    # processors that can summarize each minimum window of a
+    # WindowedAnalysis set this to 'additive', if summaries are lists of
+    # numbers that are summed and subtracted, or 'mergeable', if summaries
+    # can only be combined with combineWindowSummaries()
+    windowSummaryType = None
+
+    def getWindowSummary(self, subStream):
+        '''
+        Return a summary of a Stream (generally, a minimum window of a
+        :class:`~music21.analysis.windowed.WindowedAnalysis`) from which,
+        combined with the summaries of adjacent Streams, the same results as
+        :meth:`process` can be found with :meth:`processWindowSummaries`.
+        Only used if `windowSummaryType` is defined.
+        '''
+        raise DiscreteAnalysisException(
+            'window summaries are not defined for %s' % self.__class__.__name__)
+
+    def combineWindowSummaries(self, summaryA, summaryB):
+        '''
+        Given the summaries of two adjacent Streams, where `summaryA` is of
+        the earlier Stream, return the summary of both. Must be
+        associative. Only used if `windowSummaryType` is 'mergeable'.
+        '''
+        raise DiscreteAnalysisException(
+            'window summaries are not defined for %s' % self.__class__.__name__)
+
+    def processWindowSummaries(self, summaries):
+        '''
+        Given a list of summaries, return a list of solution and color
+        pairs, as :meth:`process` would return for the summarized Streams.
+        '''
+        raise DiscreteAnalysisException(
+            'window summaries are not defined for %s' % self.__class__.__name__)
+
 
 #------------------------------------------------------------------------------
 # alternative names
@@ -170,6 +205,11 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
     # these are specialized in subclass
     name = 'KeyWeightKeyAnalysis Base Class'
     identifiers = ['key', 'keyscape']
+    # window summaries are pitch class distributions
+    windowSummaryType = 'additive'
+    # the fewest distributions for which _getKeyResults uses numpy; 
+    # building the arrays costs more than analyzing a few in Python
+    _numpyMinimumDistributions = 4
 
     # in general go to Gb, F#: favor F# majorKeyColors
     # favor eb minor
@@ -326,39 +366,171 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         return pcDist
 
 
+    def _getWeightRows(self, weightType='major'):
+        '''
+        Return a tuple of three values for the weights of `weightType`: a 
+        list with the weights rotated for each of the 12 tonics, the same 
+        rows with the average weight subtracted, and the sum of squares of 
+        each centered row. These do not depend on the distribution analyzed, 
+        and are stored after they are first calculated.
+
+        >>> a = analysis.discrete.KrumhanslSchmuckler()
+        >>> rows, centeredRows, sumsOfSquares = a._getWeightRows('major')
+        >>> rows[0] == a._getWeights('major')
+        True
+        >>> rows[2][:3]
+        [2.29, 2.88, 6.35]
+        >>> len(sumsOfSquares)
+        12
+        '''
+        try:
+            return self._weightRows[weightType]
+        except AttributeError:
+            self._weightRows = {}
+        except KeyError:
+            pass
+        toneWeights = self._getWeights(weightType)
+        profileAverage = float(sum(toneWeights)) / len(toneWeights)
+        rows = []
+        centeredRows = []
+        sumsOfSquares = []
+        for i in range(12):
+            row = [toneWeights[(j - i) % 12] for j in range(12)]
+            centeredRow = [w - profileAverage for w in row]
+            rows.append(row)
+            centeredRows.append(centeredRow)
+            sumsOfSquares.append(sum(w ** 2 for w in centeredRow))
+        self._weightRows[weightType] = (rows, centeredRows, sumsOfSquares)
+        return self._weightRows[weightType]
+
+    def _getKeyResults(self, pcDistributions):
+        '''
+        Given a list of pitch class distributions, return a list with, for 
+        each, a tuple of the major key results, the major differences, the 
+        minor key results and the minor differences, as given by 
+        :meth:`_convoluteDistribution` and :meth:`_getDifference`. For a 
+        distribution that is None, all four values are None.
+
+        If numpy is available and there are at least 
+        `_numpyMinimumDistributions` distributions, all are analyzed with 
+        one matrix product for each of the results; otherwise each 
+        distribution is analyzed in turn. The two ways differ only by 
+        rounding in the last places, which :meth:`_getLikelyKeys` ignores.
+
+        >>> a = analysis.discrete.KrumhanslSchmuckler()
+        >>> dist = [3.0, 0, 1.5, 0, 1.5, 0, 2.0, 0, 0, 0, 1.5, 0]
+        >>> results = a._getKeyResults([dist, None])
+        >>> len(results)
+        2
+        >>> keyResultsMajor, diffMajor, keyResultsMinor, diffMinor = results[0]
+        >>> keyResultsMajor[0] == a._convoluteDistribution(dist, 'major')[0]
+        True
+        >>> round(diffMinor[0], 4)
+        0.2161
+        >>> results[1]
+        (None, None, None, None)
+        '''
+        if 'numpy' not in base._missingImport:
+            found = [pcDist for pcDist in pcDistributions if pcDist is not None]
+            if len(found) >= self._numpyMinimumDistributions:
+                return self._getKeyResultsNumpy(pcDistributions)
+
+        post = []
+        for pcDistribution in pcDistributions:
+            if pcDistribution is None:
+                post.append((None, None, None, None))
+                continue
+            results = []
+            for weightType in ('major', 'minor'):
+                keyResults = self._convoluteDistribution(pcDistribution, 
+                                                         weightType)
+                results.append(keyResults)
+                results.append(self._getDifference(keyResults, 
+                                pcDistribution, weightType))
+            post.append(tuple(results))
+        return post
+
+    def _getKeyResultsNumpy(self, pcDistributions):
+        '''
+        The numpy implementation of :meth:`_getKeyResults`.
+        '''
+        import numpy
+
+        found = [pcDist for pcDist in pcDistributions if pcDist is not None]
+        if len(found) > 0:
+            rowsMajor, centeredMajor, squaresMajor = self._getWeightRows('major')
+            rowsMinor, centeredMinor, squaresMinor = self._getWeightRows('minor')
+            # 24 rows, the major keys then the minor keys
+            weights = numpy.array(rowsMajor + rowsMinor, dtype=float)
+            centeredWeights = numpy.array(centeredMajor + centeredMinor, 
+                                          dtype=float)
+            sumsOfSquares = numpy.array(squaresMajor + squaresMinor, 
+                                        dtype=float)
+
+            dists = numpy.array(found, dtype=float)
+            centeredDists = dists - dists.mean(axis=1)[:, numpy.newaxis]
+            keyResults = dists.dot(weights.T)
+            top = centeredDists.dot(centeredWeights.T)
+            bottom = numpy.sqrt(numpy.outer(
+                (centeredDists ** 2).sum(axis=1), sumsOfSquares))
+            zero = (bottom == 0)
+            bottom[zero] = 1
+            differences = top / bottom
+            differences[zero] = 0
+            keyResults = keyResults.tolist()
+            differences = differences.tolist()
+
+        post = []
+        i = 0
+        for pcDistribution in pcDistributions:
+            if pcDistribution is None:
+                post.append((None, None, None, None))
+                continue
+            post.append((keyResults[i][:12], differences[i][:12], 
+                         keyResults[i][12:], differences[i][12:]))
+            i += 1
+        return post
+
     def _convoluteDistribution(self, pcDistribution, weightType='major'):
         ''' Takes in a pitch class distribution as a list and convolutes it
             over Sapp's given distribution for finding key, returning the result. 
+
+        >>> a = analysis.discrete.KrumhanslSchmuckler()
+        >>> a._convoluteDistribution([1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])[:3]
+        [6.35, 2.88, 2.29]
         '''
         # may get an empty distribution
         if pcDistribution == None:
             return None
 
-        soln = [0] * 12
-        toneWeights = self._getWeights(weightType)
-        for i in range(len(soln)):
-            for j in range(len(pcDistribution)):
-                soln[i] = soln[i] + (toneWeights[(j - i) % 12] * pcDistribution[j])
+        rows = self._getWeightRows(weightType)[0]
+        soln = []
+        for row in rows:
+            soln.append(sum(row[j] * pcDistribution[j] for j in range(12)))
         return soln  
     
     def _getLikelyKeys(self, keyResults, differences):
         ''' Takes in a list of probably key results in points and returns a
             list of keys in letters, sorted from most likely to least likely
+
+        >>> a = analysis.discrete.KrumhanslSchmuckler()
+        >>> keyResults = [3, 1, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0]
+        >>> [(str(p), d) for p, d in a._getLikelyKeys(keyResults, range(12))][:4]
+        [('C', 0), ('D', 2), ('E-', 3), ('C#', 1)]
         '''
         # case of empty data
         if keyResults == None:
             return None
 
-        likelyKeys = [0] * 12
-        a = sorted(keyResults)
-        a.reverse()
-        
+        # the pitch classes, from highest to lowest result; a stable sort 
+        # puts equal results in order of pitch class.  Results are rounded 
+        # so that sums that differ only in their last places are equal 
+        order = sorted(range(len(keyResults)), 
+                       key=lambda i: round(keyResults[i], 8), reverse=True)
         #Return pairs, the pitch class and the correlation value, in order by point value
-        for i in range(len(a)):
-            # pitch objects created here
-            likelyKeys[i] = (pitch.Pitch(keyResults.index(a[i])),
-                             differences[keyResults.index(a[i])])
-            #environLocal.printDebug(['added likely key', likelyKeys[i]])
+        # pitch objects created here
+        likelyKeys = [(pitch.Pitch(i), differences[i]) for i in order]
+        #environLocal.printDebug(['added likely key', likelyKeys])
         return likelyKeys
         
         
@@ -370,30 +542,19 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         if keyResults == None:
             return None
  
-        soln = [0] * 12
-        top = [0] * 12
-        bottomRight = [0] * 12
-        bottomLeft = [0] * 12
-            
-        toneWeights = self._getWeights(weightType)
-        profileAverage = float(sum(toneWeights)) / len(toneWeights)
+        unused_rows, centeredRows, sumsOfSquares = self._getWeightRows(weightType)
         histogramAverage = float(sum(pcDistribution)) / len(pcDistribution) 
-            
+        centeredDistribution = [x - histogramAverage for x in pcDistribution]
+        bottomLeft = sum(x ** 2 for x in centeredDistribution)
+
+        soln = [0] * 12
         for i in range(len(soln)):
-            for j in range(len(toneWeights)):
-                top[i] = top[i] + ((
-                    toneWeights[(j - i) % 12]-profileAverage) * (
-                    pcDistribution[j]-histogramAverage))
-
-                bottomRight[i] = bottomRight[i] + ((
-                    toneWeights[(j-i)%12]-profileAverage)**2)
-                bottomLeft[i] = bottomLeft[i] + ((
-                    pcDistribution[j]-histogramAverage)**2)
-
-                if (bottomRight[i] == 0 or bottomLeft[i] == 0):
-                    soln[i] = 0
-                else:
-                    soln[i] = float(top[i]) / ((bottomRight[i]*bottomLeft[i])**.5)
+            bottomRight = sumsOfSquares[i]
+            if (bottomRight == 0 or bottomLeft == 0):
+                continue
+            top = sum(centeredRows[i][j] * centeredDistribution[j] 
+                      for j in range(12))
+            soln[i] = float(top) / ((bottomRight * bottomLeft) ** .5)
         return soln    
 
     def solutionLegend(self, compress=False):
@@ -486,15 +647,9 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         pcDistribution = self._getPitchClassDistribution(sStream)
         #environLocal.printDebug(['process(); pcDistribution', pcDistribution])
     
-        keyResultsMajor = self._convoluteDistribution(pcDistribution, 'major')
-        differenceMajor = self._getDifference(keyResultsMajor, 
-                          pcDistribution, 'major')
+        (keyResultsMajor, differenceMajor, keyResultsMinor, 
+            differenceMinor) = self._getKeyResults([pcDistribution])[0]
         likelyKeysMajor = self._getLikelyKeys(keyResultsMajor, differenceMajor)
-        
-
-        keyResultsMinor = self._convoluteDistribution(pcDistribution, 'minor')   
-        differenceMinor = self._getDifference(keyResultsMinor, 
-                          pcDistribution, 'minor')
         likelyKeysMinor = self._getLikelyKeys(keyResultsMinor, differenceMinor)
 
         return likelyKeysMajor, likelyKeysMinor
@@ -571,7 +726,15 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
     
         likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
+        return self._processLikelyKeys(likelyKeysMajor, likelyKeysMinor, 
+                                       sStream, storeAlternatives)
 
+    def _processLikelyKeys(self, likelyKeysMajor, likelyKeysMinor, 
+                           sStream=None, storeAlternatives=False):
+        '''
+        Given the likely major and minor keys found by :meth:`_likelyKeys`, 
+        return the solution and color, as given by :meth:`process`.
+        '''
         #find the largest correlation value to use to select major or minor as the resulting key
         # values are the result of _getLikelyKeys
         # each first index is the sorted results; there will be 12
@@ -618,6 +781,57 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         # store solutions for compressed legend generation
         self._solutionsFound.append((solution, color))
         return solution, color        
+
+    def getWindowSummary(self, subStream):
+        '''
+        Return the pitch class distribution of `subStream`, as given by 
+        :meth:`_getPitchClassDistribution`, followed by the number of 
+        notes found. Summaries of adjacent Streams can be added.
+
+        >>> from music21 import note, stream
+        >>> a = analysis.discrete.KrumhanslSchmuckler()
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('c', quarterLength=3))
+        >>> s.append(note.Note('f#', quarterLength=2))
+        >>> a.getWindowSummary(s)
+        [3.0, 0, 0, 0, 0, 0, 2.0, 0, 0, 0, 0, 0, 2]
+        >>> a.getWindowSummary(stream.Stream())
+        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+        '''
+        sStream = subStream.flat.notesAndRests
+        pcDistribution = self._getPitchClassDistribution(sStream)
+        if pcDistribution is None:
+            return [0] * 13
+        return pcDistribution + [len(sStream.notes)]
+
+    def processWindowSummaries(self, summaries):
+        '''
+        Given a list of summaries from :meth:`getWindowSummary`, return a 
+        list of the solution and color :meth:`process` would give for each. 
+        The key correlations of all summaries are found together.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> summary = p.getWindowSummary(s)
+        >>> p.processWindowSummaries([summary]) == [p.process(s)]
+        True
+        '''
+        pcDistributions = []
+        for summary in summaries:
+            if summary[12] == 0: # no notes
+                pcDistributions.append(None)
+            else:
+                pcDistributions.append(summary[:12])
+        post = []
+        for (keyResultsMajor, differenceMajor, keyResultsMinor, 
+             differenceMinor) in self._getKeyResults(pcDistributions):
+            likelyKeysMajor = self._getLikelyKeys(keyResultsMajor, 
+                                                  differenceMajor)
+            likelyKeysMinor = self._getLikelyKeys(keyResultsMinor, 
+                                                  differenceMinor)
+            post.append(self._processLikelyKeys(likelyKeysMajor, 
+                                                likelyKeysMinor))
+        return post
     
     def _solutionToObject(self, solution):
         '''Convert a solution into an appropriate object representation, returning a Key object.
@@ -900,6 +1114,8 @@ class Ambitus(DiscreteAnalysis):
     name = 'Ambitus Analysis'
     # provide possible string matches for this processor
     identifiers = ['ambitus', 'range', 'span']
+    # window summaries are the lowest and highest pitches
+    windowSummaryType = 'mergeable'
 
     def __init__(self, referenceStream=None):
         '''
@@ -1129,6 +1345,13 @@ class Ambitus(DiscreteAnalysis):
         (<music21.interval.Interval m38>, '#665288')
         '''
         post = self.getPitchSpan(sStream)
+        return self._processPitchSpan(post)
+
+    def _processPitchSpan(self, post):
+        '''
+        Given the pitch span found by :meth:`getPitchSpan`, return the 
+        solution and color, as given by :meth:`process`.
+        '''
         if post != None:
             solution = interval.Interval(noteStart = post[0], noteEnd = post[1])
         else:
@@ -1139,6 +1362,55 @@ class Ambitus(DiscreteAnalysis):
         self._solutionsFound.append((solution, color))
         return solution, color
 
+    def getWindowSummary(self, subStream):
+        '''
+        Return the lowest and highest pitches of `subStream`, as given 
+        by :meth:`getPitchSpan`. 
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> p.getWindowSummary(s.parts[0].getElementsByClass('Measure')[6])
+        (<music21.pitch.Pitch A4>, <music21.pitch.Pitch C#5>)
+        '''
+        return self.getPitchSpan(subStream)
+
+    def combineWindowSummaries(self, summaryA, summaryB):
+        '''
+        Combine two pitch spans; where pitches have the same pitch space 
+        value, the pitch from `summaryA` is kept, as :meth:`getPitchSpan` 
+        keeps the first pitch found.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> measures = s.parts[0].getElementsByClass('Measure')
+        >>> summaryA = p.getWindowSummary(measures[3])
+        >>> summaryB = p.getWindowSummary(measures[6])
+        >>> p.combineWindowSummaries(summaryA, summaryB)
+        (<music21.pitch.Pitch F#4>, <music21.pitch.Pitch C#5>)
+        >>> p.combineWindowSummaries(None, summaryB) == summaryB
+        True
+        '''
+        if summaryA is None:
+            return summaryB
+        elif summaryB is None:
+            return summaryA
+        if summaryB[0].ps < summaryA[0].ps:
+            minPitch = summaryB[0]
+        else:
+            minPitch = summaryA[0]
+        if summaryB[1].ps > summaryA[1].ps:
+            maxPitch = summaryB[1]
+        else:
+            maxPitch = summaryA[1]
+        return minPitch, maxPitch
+
+    def processWindowSummaries(self, summaries):
+        '''
+        Given a list of summaries from :meth:`getWindowSummary`, return a 
+        list of the solution and color :meth:`process` would give for each.
+        '''
+        return [self._processPitchSpan(summary) for summary in summaries]
+
 
     def getSolution(self, sStream):
         '''
@@ -1501,6 +1773,37 @@ class Test(unittest.TestCase):
         #s.plot('grid', 'KrumhanslSchmuckler')
         #s.plot('windowed', 'aarden')
 
+    def testKeyResultsNumpyParity(self):
+        if 'numpy' in base._missingImport:
+            return
+        from music21 import corpus
+        s = corpus.parse('bach/bwv66.6')
+        distributions = []
+        for m in s.parts[0].getElementsByClass('Measure'):
+            distributions.append(KrumhanslSchmuckler().getWindowSummary(m)[:12])
+        # distributions with ties among keys
+        distributions.append([1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0])
+        distributions.append([1] * 12)
+        distributions.append([0.1, 0.2, 0, 0, 0.3, 0, 0, 0.3, 0, 0, 0, 0])
+        for analysisClass in (KrumhanslSchmuckler, AardenEssen, 
+                              TemperleyKostkaPayne):
+            a = analysisClass()
+            a._numpyMinimumDistributions = len(distributions) + 1
+            pythonResults = a._getKeyResults(distributions)
+            a._numpyMinimumDistributions = 1
+            numpyResults = a._getKeyResults(distributions)
+            for pythonResult, numpyResult in zip(pythonResults, numpyResults):
+                for i in (0, 2):
+                    pythonKeys = a._getLikelyKeys(pythonResult[i], 
+                                                  pythonResult[i + 1])
+                    numpyKeys = a._getLikelyKeys(numpyResult[i], 
+                                                 numpyResult[i + 1])
+                    self.assertEqual([str(p) for p, unused in pythonKeys], 
+                                     [str(p) for p, unused in numpyKeys])
+                    for (unused, c1), (unused, c2) in zip(pythonKeys, 
+                                                          numpyKeys):
+                        self.assertAlmostEqual(c1, c2)
+
 
 # define presented order in documentation
 _DOC_ORDER = [analyzeStream, DiscreteAnalysis, Ambitus, MelodicIntervalDiversity, KeyWeightKeyAnalysis, SimpleWeights, AardenEssen, BellmanBudge, KrumhanslSchmuckler, KrumhanslKessler, TemperleyKostkaPayne]
@@ -16,6 +16,8 @@ Modular analysis procedures inherit from :class:`music21.analysis.discrete.Discr
 '''
 
 
+import copy
+import multiprocessing
 import unittest
 import sys
 
@@ -43,6 +45,8 @@ class WindowedAnalysis(object):
         '''Create a WindowedAnalysis object.
 
         The provided `analysisProcessor` must provide a `process()` method that, when given a windowed Stream (a Measure) returns two element tuple containing (a) a data value (implementation dependent) and (b) a color code. 
+
+        If the processor defines a `windowSummaryType` (see :class:`~music21.analysis.discrete.DiscreteAnalysis`), each minimum window is summarized once, and windows of every size are found by combining these summaries rather than by building and processing a Stream for each window.
         '''
         self.processor = analysisProcessor
         #environLocal.printDebug(self.processor)
@@ -51,6 +55,10 @@ class WindowedAnalysis(object):
         self._srcStream = streamObj
         # store a windowed Stream, partitioned into bars of 1/4
         self._windowedStream = self._getMinimumWindowStream() 
+        self._windowCount = len(self._windowedStream)
+        # summaries of each minimum window, if the processor defines them
+        self._windowSummaries = None
+        self._cumulativeSummaries = None
 
     def _getMinimumWindowStream(self, timeSignature='1/4'):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -112,77 +120,201 @@ class WindowedAnalysis(object):
         (33, 33)
 
         '''
-        maxWindowCount = len(self._windowedStream)
-        # assuming that this is sorted
+        windowRanges = self._getWindowRanges(windowSize, windowType)
+        summaryType = getattr(self.processor, 'windowSummaryType', None)
+
+        if summaryType is not None:
+            if summaryType == 'additive':
+                summaries = self._addSummaryRanges(windowRanges)
+            else:
+                # no range is longer than the block size
+                if windowType == 'adjacentAverage':
+                    blockSize = 2 * windowSize - 1
+                else:
+                    blockSize = windowSize
+                summaries = self._combineSummaryRanges(windowRanges, blockSize)
+            results = self.processor.processWindowSummaries(summaries)
+            data = [result[0] for result in results]
+            color = [result[1] for result in results]
+            return data, color
+
+        data = [0] * len(windowRanges)
+        color = [0] * len(windowRanges)
+        for i, (start, end) in enumerate(windowRanges):
+            current = stream.Stream()
+            for j in range(start, end):
+                #environLocal.printDebug(['self._windowedStream[j]', self._windowedStream[j]])
+                current.append(self._windowedStream[j])
+            data[i], color[i] = self.processor.process(current)
 
-        if windowType == 'overlap':
-            windowCount = maxWindowCount - windowSize + 1
+        return data, color
 
-        elif windowType == 'noOverlap':
-            windowCount = (maxWindowCount / windowSize) + 1
+    def _getWindowRanges(self, windowSize, windowType='overlap'):
+        '''
+        Return a list of the first index and the index after the last of the 
+        minimum windows combined for each result of :meth:`_analyze`.
 
-        elif windowType == 'adjacentAverage':
-            windowCount = maxWindowCount
+        For the "adjacentAverage" windowType, each minimum window is 
+        analyzed with all other minimum windows that share one of the 
+        overlapping windows of `windowSize` with it.
 
-        data = [0] * windowCount
-        color = [0] * windowCount
-        # how many windows in this row
-        windowCountIndices = range(windowCount)
-        
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 5)
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> wa._getWindowRanges(3)
+        [(0, 3), (1, 4), (2, 5)]
+        >>> wa._getWindowRanges(2, 'noOverlap')
+        [(0, 2), (2, 4), (4, 5)]
+        >>> wa._getWindowRanges(2, 'adjacentAverage')
+        [(0, 2), (0, 3), (1, 4), (2, 5), (3, 5)]
+        '''
+        maxWindowCount = self._windowCount
+        # assuming that this is sorted
+
+        windowRanges = []
         if windowType == 'overlap':
-            for i in windowCountIndices:
-                current = stream.Stream()
-                for j in range(i, i+windowSize):
-                    #environLocal.printDebug(['self._windowedStream[j]', self._windowedStream[j]])
-                    current.append(self._windowedStream[j])
-                data[i], color[i] = self.processor.process(current)
+            for i in range(maxWindowCount - windowSize + 1):
+                windowRanges.append((i, i + windowSize))
 
         elif windowType == 'noOverlap':
-            start = 0
-            end = start+windowSize
-            i = 0
-            while True:
-                if end >= len(self._windowedStream):
-                    end = len(self._windowedStream)
-
-                current = stream.Stream()
-                for j in range(start, end):
-                    current.append(self._windowedStream[j])
-                data[i], color[i] = self.processor.process(current)
-
-                start = end
-                end = start + windowSize
-                i += 1
-                if i >= windowCount:
-                    break
-       
+            # the last window may be shorter than windowSize
+            for start in range(0, maxWindowCount, windowSize):
+                windowRanges.append((start, 
+                                     min(maxWindowCount, start + windowSize)))
+
         elif windowType == 'adjacentAverage':
-            # first get overlapping windows
-            overlapped = []
-            for i in range(maxWindowCount - windowSize + 1):
-                current = stream.Stream()
-                # store indices of min windows that participate
-                participants = [] 
-                for j in range(i, i+windowSize):
-                    current.append(self._windowedStream[j])
-                    participants.append(j)
-                overlapped.append([current, participants])
-
-            # then distribute to each of maxWindowCount
             for i in range(maxWindowCount):
-                # get all participants, combine into a single 
-                current = stream.Stream()
-                for dataStream, participants in overlapped:
-                    if i in participants:
-                        for m in dataStream:
-                            current.append(m)
-                data[i], color[i] = self.processor.process(current)
+                if windowSize > maxWindowCount:
+                    # no overlapping windows of this size
+                    windowRanges.append((i, i))
+                else:
+                    windowRanges.append((max(0, i - windowSize + 1), 
+                                         min(maxWindowCount, i + windowSize)))
 
-        return data, color
+        return windowRanges
+
+    def _getWindowSummaries(self):
+        '''
+        Return a list of the summaries given by the processor's 
+        getWindowSummary() method for each minimum window. These are 
+        stored after they are first found.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s.parts[0], p)
+        >>> wa._getWindowSummaries()[0]
+        (<music21.pitch.Pitch B4>, <music21.pitch.Pitch C#5>)
+        '''
+        if self._windowSummaries is None:
+            self._windowSummaries = [self.processor.getWindowSummary(m) 
+                                     for m in self._windowedStream]
+        return self._windowSummaries
+
+    def _addSummaryRanges(self, windowRanges):
+        '''
+        For each pair of indices in `windowRanges`, return the sum of the 
+        additive summaries of the minimum windows in that range, found as 
+        the difference of two cumulative sums.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('c'))
+        >>> s.append(note.Note('d'))
+        >>> s.append(note.Note('c', quarterLength=2))
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> [summary[:3] for summary in wa._addSummaryRanges([(0, 2), (1, 4)])]
+        [[1.0, 0, 1.0], [2.0, 0, 1.0]]
+        '''
+        if self._cumulativeSummaries is None:
+            summaries = self._getWindowSummaries()
+            total = [0] * len(summaries[0])
+            cumulative = [total]
+            for summary in summaries:
+                total = [a + b for a, b in zip(total, summary)]
+                cumulative.append(total)
+            self._cumulativeSummaries = cumulative
+
+        cumulative = self._cumulativeSummaries
+        post = []
+        for start, end in windowRanges:
+            post.append([b - a for a, b in zip(cumulative[start], 
+                                               cumulative[end])])
+        return post
+
+    def _combineSummaryRanges(self, windowRanges, blockSize):
+        '''
+        For each pair of indices in `windowRanges`, none more than 
+        `blockSize` apart, return the combination of the mergeable summaries 
+        of the minimum windows in that range.
+
+        The minimum windows are divided into blocks of `blockSize`; for each 
+        minimum window, the summaries combined from the start of its block 
+        and to the end of its block are found, so that each range is 
+        the combination of at most two of these.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s.parts[0], p)
+        >>> for summary in wa._combineSummaryRanges([(0, 3), (2, 5)], 3):
+        ...     print(summary)
+        (<music21.pitch.Pitch A4>, <music21.pitch.Pitch C#5>)
+        (<music21.pitch.Pitch B4>, <music21.pitch.Pitch E5>)
+        '''
+        summaries = self._getWindowSummaries()
+        combine = self.processor.combineWindowSummaries
+        windowCount = len(summaries)
+
+        fromBlockStart = list(summaries)
+        for i in range(windowCount):
+            if i % blockSize != 0:
+                fromBlockStart[i] = combine(fromBlockStart[i-1], summaries[i])
+        toBlockEnd = list(summaries)
+        for i in range(windowCount - 2, -1, -1):
+            if (i + 1) % blockSize != 0:
+                toBlockEnd[i] = combine(summaries[i], toBlockEnd[i+1])
+
+        post = []
+        for start, end in windowRanges:
+            if start >= end:
+                post.append(self.processor.getWindowSummary(stream.Stream()))
+            elif start // blockSize != (end - 1) // blockSize:
+                post.append(combine(toBlockEnd[start], fromBlockStart[end-1]))
+            elif start % blockSize == 0:
+                post.append(fromBlockStart[end-1])
+            elif end % blockSize == 0 or end == windowCount:
+                post.append(toBlockEnd[start])
+            else:
+                summary = summaries[start]
+                for j in range(start + 1, end):
+                    summary = combine(summary, summaries[j])
+                post.append(summary)
+        return post
 
         
+    def _getWorkerAnalysis(self):
+        '''
+        Return a copy of this WindowedAnalysis to be sent to each worker 
+        process of :meth:`process`. Only the data of the minimum windows is 
+        kept: their summaries, if the processor defines them, or else the 
+        Stream of minimum windows, frozen with 
+        :class:`~music21.freezeThaw.StreamFreezer`.
+        '''
+        from music21 import freezeThaw
+
+        workerAnalysis = copy.copy(self)
+        workerAnalysis._srcStream = None
+        if getattr(self.processor, 'windowSummaryType', None) is not None:
+            workerAnalysis._windowSummaries = self._getWindowSummaries()
+            workerAnalysis._windowedStream = None
+        else:
+            freezer = freezeThaw.StreamFreezer(self._windowedStream)
+            workerAnalysis._windowedStream = freezer.writeStr(fmt='pickle')
+        return workerAnalysis
+
     def process(self, minWindow=1, maxWindow=1, windowStepSize=1, 
-                windowType='overlap', includeTotalWindow=True):
+                windowType='overlap', includeTotalWindow=True, 
+                processCount=1):
 
         ''' Main method for windowed analysis across one or more window size.
 
@@ -217,6 +349,15 @@ class WindowedAnalysis(object):
         (<music21.pitch.Pitch B>, 'major', 0.6868258874056411)
         >>> y[0][0].startswith('#') # a color is returned for each matching data position
         True
+
+        If `processCount` is greater than 1, window sizes are analyzed in 
+        parallel by that many processes; if it is None, one process for each 
+        available core is used. The data of the minimum windows is sent 
+        once to each process, and results are returned in the same order.
+
+        >>> x2, y2, z2 = wa.process(1, 2, includeTotalWindow=False, processCount=2)
+        >>> y2 == y
+        True
         '''
         if maxWindow == None:
             maxLength = len(self._windowedStream)
@@ -261,10 +402,36 @@ class WindowedAnalysis(object):
             if totalWindow not in windowSizes:
                 windowSizes.append(totalWindow)
 
-        for i in windowSizes:
+        if processCount is None:
+            processCount = multiprocessing.cpu_count()
+        if processCount > 1 and len(windowSizes) > 1:
+            processCount = min(processCount, len(windowSizes))
+            pool = multiprocessing.Pool(processes=processCount, 
+                                        initializer=_initializeWorker, 
+                                        initargs=(self._getWorkerAnalysis(),))
+            try:
+                results = pool.map(_analyzeInWorker, 
+                                   [(i, windowType) for i in windowSizes], 
+                                   chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+            # solutions found in the worker processes are not stored on 
+            # this processor, which it may need for a legend
+            solutionsFound = getattr(self.processor, '_solutionsFound', None)
+            if solutionsFound is not None:
+                for soln, colorn in results:
+                    solutionsFound.extend(zip(soln, colorn))
+        else:
+            results = None
+
+        for j, i in enumerate(windowSizes):
             #environLocal.printDebug(['processing window:', i])
             # each of these results are lists, where len is based on 
-            soln, colorn = self._analyze(i, windowType=windowType) 
+            if results is not None:
+                soln, colorn = results[j]
+            else:
+                soln, colorn = self._analyze(i, windowType=windowType) 
             # store lists of results in a list of lists
             solutionMatrix.append(soln)
             colorMatrix.append(colorn)
@@ -274,6 +441,32 @@ class WindowedAnalysis(object):
         return solutionMatrix, colorMatrix, metaMatrix
 
 
+#------------------------------------------------------------------------------
+# the WindowedAnalysis used by a worker process of WindowedAnalysis.process()
+_workerAnalysis = None
+
+def _initializeWorker(workerAnalysis):
+    '''
+    Store, in a worker process, the WindowedAnalysis given by 
+    :meth:`WindowedAnalysis._getWorkerAnalysis`, thawing its minimum 
+    windows if they were frozen.
+    '''
+    global _workerAnalysis
+    from music21 import freezeThaw
+
+    if workerAnalysis._windowedStream is not None:
+        thawer = freezeThaw.StreamThawer()
+        thawer.openStr(workerAnalysis._windowedStream, pickleFormat='pickle')
+        workerAnalysis._windowedStream = thawer.stream
+    _workerAnalysis = workerAnalysis
+
+def _analyzeInWorker(arguments):
+    '''
+    Analyze, in a worker process, the windows of one size.
+    '''
+    windowSize, windowType = arguments
+    return _workerAnalysis._analyze(windowSize, windowType=windowType)
+
 
 
 
@@ -376,6 +569,55 @@ class Test(unittest.TestCase):
 
 
 
+    def testWindowSummaries(self):
+        '''Test that processing window summaries gets the same results as
+        processing each window
+        '''
+        from music21 import corpus
+        from music21.analysis import discrete
+
+        s = corpus.parse('bach/bwv324')
+        for pClass in [discrete.KrumhanslSchmuckler, discrete.Ambitus]:
+            p = pClass()
+            wa = WindowedAnalysis(s.parts[0], p)
+            pStreams = pClass()
+            pStreams.windowSummaryType = None
+            waStreams = WindowedAnalysis(s.parts[0], pStreams)
+            for windowType in ['overlap', 'noOverlap', 'adjacentAverage']:
+                for i in [1, 2, 5]:
+                    x, y, unused_z = wa.process(i, i, windowType=windowType,
+                                                includeTotalWindow=False)
+                    xStreams, yStreams, unused_z = waStreams.process(i, i,
+                        windowType=windowType, includeTotalWindow=False)
+                    self.assertEqual(y, yStreams)
+                    self.assertEqual(len(x[0]), len(xStreams[0]))
+                    # correlation coefficients found together with numpy 
+                    # may differ from those found one at a time in the 
+                    # last places
+                    for d, dStreams in zip(x[0], xStreams[0]):
+                        if isinstance(d, tuple):
+                            self.assertEqual(str(d[:-1]), str(dStreams[:-1]))
+                            self.assertAlmostEqual(d[-1], dStreams[-1])
+                        else:
+                            self.assertEqual(str(d), str(dStreams))
+            self.assertEqual(len(p.getSolutionsUsed()),
+                             len(pStreams.getSolutionsUsed()))
+
+    def testProcessCount(self):
+        from music21 import corpus
+        from music21.analysis import discrete
+
+        s = corpus.parse('bach/bwv66.6')
+        # a processor with summaries, and one that processes each Stream
+        for p in [discrete.Ambitus(), TestMockProcesor()]:
+            wa = WindowedAnalysis(s.parts[0], p)
+            x, y, z = wa.process(1, 6, 1, windowType='adjacentAverage')
+            x2, y2, z2 = wa.process(1, 6, 1, windowType='adjacentAverage',
+                                    processCount=3)
+            self.assertEqual([str(d) for d in x], [str(d) for d in x2])
+            self.assertEqual(y, y2)
+            self.assertEqual(z, z2)
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
@@ -22,6 +22,7 @@ __all__ = ['transcriber', 'recording', 'scoreFollower']
 import copy
 import math
 import os
+import struct
 import wave
 import unittest
 
@@ -136,6 +137,70 @@ def autocorrelationFunction(recordedSignal, recordSampleRate):
         finalResult = recordSampleRate / vertex
     return finalResult
 
+def autocorrelationFunctionBatch(recordedFrames, recordSampleRate):
+    '''
+    Like :func:`~music21.audioSearch.autocorrelationFunction`, but finds the
+    frequency of every row of the two-dimensional array `recordedFrames` at once,
+    computing all of the autocorrelations with a single real FFT.  Only numpy
+    is required.
+
+    Returns a numpy array with one frequency per frame.
+
+
+    >>> import wave
+    >>> import os
+    >>> import numpy
+
+    >>> wv = wave.open(common.getSourceFilePath() + os.path.sep + 'audioSearch' + os.path.sep + 'test_audio.wav', 'r')
+    >>> data = wv.readframes(2048)
+    >>> samps = numpy.fromstring(data, dtype=numpy.int16)
+    >>> wv.close()
+    >>> for frequency in audioSearch.autocorrelationFunctionBatch(samps.reshape(2, 1024), 44100):
+    ...     print(round(frequency, 6))
+    143.627689
+    99.083545
+    '''
+    if 'numpy' in base._missingImport:
+        raise AudioSearchException("Cannot run autocorrelationFunctionBatch without numpy installed")
+    import numpy
+
+    frames = numpy.asarray(recordedFrames, dtype=numpy.float64)
+    if frames.ndim == 1:
+        frames = frames.reshape(1, -1)
+    numFrames, frameLength = frames.shape
+    if numFrames == 0 or frameLength < 2:
+        return numpy.zeros(numFrames) + 10 # Rest
+
+    # zero-pad to a power of two at least 2 * frameLength - 1 long so that the
+    # circular correlation computed by the FFT is the same as the linear one;
+    # only non-negative lags are kept, as in autocorrelationFunction
+    fftLength = 1
+    while fftLength < 2 * frameLength - 1:
+        fftLength *= 2
+    spectrum = numpy.fft.rfft(frames, n=fftLength, axis=1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    correlation = numpy.fft.irfft(power, n=fftLength, axis=1)[:, :frameLength]
+
+    rising = numpy.diff(correlation, axis=1) > 0
+    hasRising = rising.any(axis=1)
+    beginning = rising.argmax(axis=1)
+    lags = numpy.arange(frameLength)
+    afterBeginning = numpy.where(lags[numpy.newaxis, :] >= beginning[:, numpy.newaxis],
+                                 correlation, -numpy.inf)
+    peak = afterBeginning.argmax(axis=1)
+
+    # vectorized version of interpolation()
+    rows = numpy.arange(numFrames)
+    before = correlation[rows, numpy.clip(peak - 1, 0, frameLength - 1)]
+    atPeak = correlation[rows, peak]
+    after = correlation[rows, numpy.clip(peak + 1, 0, frameLength - 1)]
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        vertex = (before - after) / (before - 2.0 * atPeak + after)
+        vertex = vertex * 0.5 + peak
+        frequencies = recordSampleRate / vertex
+    frequencies[~hasRising] = 10 # Rest
+    return frequencies
+
 def prepareThresholds(useScale=None):
     '''
     returns two elements.  The first is a list of threshold values
@@ -346,27 +411,90 @@ def getFrequenciesFromAudioFile(waveFilename='xmas.wav'):
     '''
     if "numpy" in base._missingImport:
         raise AudioSearchException("Cannot run getFrequenciesFromAudioFile without numpy installed")
+
+    environLocal.printDebug("* reading file from disk a batch of frames at a time")
+    return list(iterateFrequenciesFromAudioFile(waveFilename))
+
+
+def _waveDataOffset(waveFilename):
+    '''
+    Returns the byte offset of the sample data in the RIFF wave file `waveFilename`.
+
+    >>> import os
+    >>> readPath = common.getSourceFilePath() + os.path.sep + 'audioSearch' + os.path.sep + 'test_audio.wav'
+    >>> audioSearch._waveDataOffset(readPath)
+    44
+    '''
+    with open(waveFilename, 'rb') as f:
+        f.seek(12) # 'RIFF', size, 'WAVE'
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise AudioSearchException("Cannot find the data chunk in %s" % waveFilename)
+            chunkName, chunkSize = struct.unpack('<4sL', header)
+            if chunkName == b'data':
+                return f.tell()
+            f.seek(chunkSize + (chunkSize % 2), 1) # chunks are padded to even lengths
+
+
+def framesFromAudioFile(waveFilename, frameLength=audioChunkLength, framesPerBatch=256):
+    '''
+    Generator that memory-maps the samples of a wave file and yields them as
+    two-dimensional numpy arrays of at most `framesPerBatch` rows, each row
+    being one frame of `frameLength` wave frames read as 16-bit samples
+    (the same samples :func:`~music21.audioSearch.getFrequenciesFromAudioFile`
+    has always used).  The arrays are views on the file, so only the batch being
+    worked on is ever paged into memory.  Samples at the end of the file that
+    do not fill a complete frame are skipped.
+
+    >>> import os
+    >>> readPath = common.getSourceFilePath() + os.path.sep + 'audioSearch' + os.path.sep + 'test_audio.wav'
+    >>> batches = list(audioSearch.framesFromAudioFile(readPath, framesPerBatch=100))
+    >>> batches[0].shape
+    (100, 1024)
+    >>> sum(len(b) for b in batches)
+    861
+    '''
+    if "numpy" in base._missingImport:
+        raise AudioSearchException("Cannot run framesFromAudioFile without numpy installed")
     import numpy
 
-    storedWaveSampleList = []
-    environLocal.printDebug("* reading entire file from disk")
     try:
         wv = wave.open(waveFilename, 'r')
     except IOError:
         raise AudioSearchException("Cannot open %s for reading, does not exist" % waveFilename)
+    samplesPerFrame = frameLength * wv.getnchannels() * wv.getsampwidth() // 2
+    numFrames = wv.getnframes() // frameLength
+    wv.close()
+    if numFrames == 0:
+        return
 
-    #modify it to read the entire file
-    for i in range(int(wv.getnframes() / audioChunkLength)):
-        data = wv.readframes(audioChunkLength)
-        storedWaveSampleList.append(data)
+    samples = numpy.memmap(waveFilename, dtype='<i2', mode='r',
+                           offset=_waveDataOffset(waveFilename),
+                           shape=(numFrames * samplesPerFrame,))
+    frames = samples.reshape(numFrames, samplesPerFrame)
+    for start in range(0, numFrames, framesPerBatch):
+        yield frames[start:start + framesPerBatch]
 
-    freqFromAQList = []
-    for data in storedWaveSampleList:
-        samps = numpy.fromstring(data, dtype=numpy.int16)
-        freqFromAQList.append(autocorrelationFunction(samps, recordSampleRate))
-    wv.close()
 
-    return freqFromAQList
+def iterateFrequenciesFromAudioFile(waveFilename='xmas.wav', framesPerBatch=256):
+    '''
+    Generator that yields the same frequencies as
+    :func:`~music21.audioSearch.getFrequenciesFromAudioFile`, one by one,
+    reading and analyzing `framesPerBatch` chunks of the file at a time,
+    so that arbitrarily long recordings can be processed in bounded memory.
+
+    >>> import os
+    >>> readPath = common.getSourceFilePath() + os.path.sep + 'audioSearch' + os.path.sep + 'test_audio.wav'
+    >>> freqIter = audioSearch.iterateFrequenciesFromAudioFile(waveFilename=readPath)
+    >>> print(round(next(freqIter), 6))
+    143.627689
+    >>> print(round(next(freqIter), 6))
+    99.083545
+    '''
+    for frames in framesFromAudioFile(waveFilename, audioChunkLength, framesPerBatch):
+        for frequency in autocorrelationFunctionBatch(frames, recordSampleRate):
+            yield float(frequency)
 
 
 def getFrequenciesFromPartialAudioFile(waveFilenameOrHandle='temp', length=10.0, startSample=0):
@@ -442,7 +570,7 @@ def getFrequenciesFromPartialAudioFile(waveFilenameOrHandle='temp', length=10.0,
 
 def detectPitchFrequencies(freqFromAQList, useScale=None):
     '''
-    It detects the pitches of the notes from a list of frequencies, using thresholds which
+    It detects the pitches of the notes from a list (or other iterable) of frequencies, using thresholds which
     depend on the useScale option. If useScale is None, the default value is the Major Scale beginning C4.
 
     >>> freqFromAQList=[143.627689055,99.0835452019,211.004784689,4700.31347962,2197.9431119]
@@ -461,8 +589,7 @@ def detectPitchFrequencies(freqFromAQList, useScale=None):
 
     detectedPitchesFreq = []
 
-    for i in range(len(freqFromAQList)):    # to find thresholds and frequencies
-        inputPitchFrequency = freqFromAQList[i]
+    for inputPitchFrequency in freqFromAQList:    # to find thresholds and frequencies
         unused_freq, pitch_name = normalizeInputFrequency(inputPitchFrequency, thresholds, pitches)
         detectedPitchesFreq.append(pitch_name.frequency)
     return detectedPitchesFreq
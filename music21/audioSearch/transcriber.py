@@ -116,9 +116,10 @@ def monophonicStreamFromFile(fileName, useScale=None):
     '''
     from music21 import audioSearch as audioSearchBase
 
-    freqFromAQList = audioSearchBase.getFrequenciesFromAudioFile(waveFilename=fileName)
-        
-    detectedPitchesFreq = audioSearchBase.detectPitchFrequencies(freqFromAQList, useScale)
+    # frequencies are computed batch by batch as detectPitchFrequencies consumes them,
+    # so the audio itself is never held in memory all at once.
+    freqFromAQIter = audioSearchBase.iterateFrequenciesFromAudioFile(waveFilename=fileName)
+    detectedPitchesFreq = audioSearchBase.detectPitchFrequencies(freqFromAQIter, useScale)
     detectedPitchesFreq = audioSearchBase.smoothFrequencies(detectedPitchesFreq)
     (detectedPitchObjects, unused_listplot) = audioSearchBase.pitchFrequenciesToObjects(detectedPitchesFreq, useScale)
     (notesList, durationList) = audioSearchBase.joinConsecutiveIdenticalPitches(detectedPitchObjects)
@@ -45,6 +45,7 @@ under the module "base":
 '''
 from __future__ import print_function
 
+import bisect
 import collections
 import copy
 import doctest
@@ -1201,42 +1202,23 @@ class Music21Object(object):
         >>> noteA.getContextByClass('TimeSignature')
         <music21.meter.TimeSignature 4/4>
         '''
-        def extractElementFromVerticality(verticality):
-            if verticality is None:
+        def findElInContextIndex(contextIndex, offsetStart, atOffset):
+            # contextIndex holds the offsets and elements of a
+            # Stream._getContextIndex(); finds the last element starting
+            # before offsetStart, or at it if atOffset is True
+            offsets, elements = contextIndex
+            if atOffset:
+                i = bisect.bisect_right(offsets, offsetStart)
+            else:
+                i = bisect.bisect_left(offsets, offsetStart)
+            if i == 0:
                 return None
-            if len(verticality.startTimespans) > 0:
-                return verticality.startTimespans[0].element
-            elif len(verticality.overlapTimespans) > 0:
-                return verticality.overlapTimespans[0].element
-
-        def findElInTimespanCollection(ts, offsetStart):
-            if getElementMethod == 'getElementAtOrBefore':
-                verticality = ts.getVerticalityAtOrBefore(offsetStart)
-            elif getElementMethod == 'getElementBeforeOffset':
-                verticality = ts.getVerticalityAt(offsetStart).previousVerticality
-            if verticality is not None:
-                element = extractElementFromVerticality(verticality)
-                if element is not None and element.isClassOrSubclass(className):
-                    # latter should not be necessary...
-                    return element
+            element = elements[i - 1]
+            if element.isClassOrSubclass(className):
+                # latter should not be necessary...
+                return element
             return None
 
-        def findElInTimespanColNoRecurse(ts, offsetStart):
-            # goes through each, but should be fast because
-            # only contains containers and elements with the
-            # proper classes...
-            if getElementMethod == 'getElementAtOrBefore':
-                offsetStart += 0.0001
-            while offsetStart is not None: # redundant, but useful...
-                offsetStart = ts.getStartOffsetBefore(offsetStart)
-                if offsetStart is None:
-                    return None
-                startTimespans = ts.findTimespansStartingAt(offsetStart)
-                for element in startTimespans:
-                    if hasattr(element, 'source'):
-                        continue
-                    return element.element
-
         if not common.isListLike(className):
             className = (className,)
 
@@ -1248,13 +1230,18 @@ class Music21Object(object):
             offsetStart = searchPlace[1]
             searchType = searchPlace[2]
             if searchType == 'elementsOnly' or searchType == 'elementsFirst':
-                tsNotFlat = site.asTimespans(classList=className, recurse=False)
-                el = findElInTimespanColNoRecurse(tsNotFlat, offsetStart)
+                contextIndex = site._getContextIndex(className, recurse=False)
+                if getElementMethod == 'getElementAtOrBefore':
+                    el = findElInContextIndex(contextIndex,
+                                              offsetStart + 0.0001, False)
+                else:
+                    el = findElInContextIndex(contextIndex, offsetStart, False)
                 if el is not None:
                     return el
             if searchType != 'elementsOnly':
-                tsFlat = site.asTimespans(classList=className, recurse=True)
-                el = findElInTimespanCollection(tsFlat, offsetStart)
+                contextIndex = site._getContextIndex(className, recurse=True)
+                el = findElInContextIndex(contextIndex, offsetStart,
+                    getElementMethod == 'getElementAtOrBefore')
                 if el is not None:
                     return el
 
@@ -2001,6 +1988,10 @@ class Music21Object(object):
             # we cannot directly test to see isInstance(duration.DurationCommon) because of
             # circular imports; so we instead just take any object with a quarterLength as a
             # duration
+            if (self._duration is not None and
+                    getattr(self._duration, 'isGrace', False) !=
+                    getattr(durationObj, 'isGrace', False)):
+                self._clearSortKeysOfSites()
             self._duration = durationObj
         else:
             # need to permit Duration object assignment here
@@ -2034,8 +2025,20 @@ class Music21Object(object):
         '''
         if not isinstance(value, int):
             raise ElementException('priority values must be integers.')
+        if value != self._priority:
+            self._clearSortKeysOfSites()
         self._priority = value
 
+    def _clearSortKeysOfSites(self):
+        '''
+        Discard the sort keys stored by the Streams this object is in (see
+        :meth:`~music21.stream.Stream.sort`), as its priority or grace
+        status, which are part of its :meth:`sortTuple`, are changing.
+        '''
+        for site in self.sites.get(excludeNone=True):
+            if getattr(site, 'isStream', False):
+                site._cache.pop('sortKeys', None)
+
     priority = property(_getPriority, _setPriority,
         doc = '''
         Get and set the priority integer value.
@@ -3070,7 +3073,7 @@ class Music21Object(object):
         self.duration = mm.secondsToDuration(value)
         for s in self.sites.getSites(excludeNone=True):
             if self in s._elements:
-                s._elementsChanged() # highest time is changed.
+                s._elementsChanged(changes=['durations']) # highest time is changed.
 
     def _getSeconds(self):
         # do not search of duration is zero
@@ -4370,7 +4373,7 @@ def mainTest(*testClasses, **kwargs):
                 optionflags=optionflags,
                 )
         else:
-            globs = __import__('music21').__dict__.copy()
+            globs = __import__('music21', fromlist=['*']).__dict__.copy()
             s1 = doctest.DocTestSuite(
                 '__main__',
                 globs=globs,
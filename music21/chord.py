@@ -361,7 +361,8 @@ class Chord(note.NotRest):
 
         Inversion is either 0 (for symmetrical) or -1/1
 
-        NOTE: time consuming, and only should be run when necessary.
+        Addresses are found in a table of all pitch class sets (see
+        :func:`~music21.chordTables.pitchClassesToAddress`).
 
         ::
 
@@ -407,62 +408,11 @@ class Chord(note.NotRest):
             (3, 1, 0)
 
         '''
-        pcSet = self.orderedPitchClasses
+        pcSet = self.pitchClasses
         if len(pcSet) == 0:
             raise ChordException(
                 'cannot access chord tables address for Chord with %s pitches' % len(pcSet))
-
-        #environLocal.printDebug(['calling seekChordTablesAddress:', pcSet])
-
-        card = len(pcSet)
-        if card == 1: # its a singleton: return
-            return (1, 1, 0)
-        elif card == 11: # its the only 11 note pcset
-            return (11, 1, 0)
-        elif card == 12: # its the aggregate
-            return (12, 1, 0)
-        # go through each rotation of pcSet
-        candidates = []
-        for rot in range(0, card):
-            testSet = pcSet[rot:] + pcSet[0:rot]
-            # transpose to lead with zero
-            testSet = [(x - testSet[0]) % 12 for x in testSet]
-            # create inversion; first take difference from 12 mod 12
-            testSetInvert = [(12 - x) % 12 for x in testSet]
-            testSetInvert.reverse() # reverse order (first steps now last)
-            # transpose all steps (were last) to zero, mod 12
-            testSetInvert = [(x + (12 - testSetInvert[0])) % 12
-                            for x in testSetInvert]
-            candidates.append([testSet, testSetInvert])
-
-        # compare sets to those in table
-        match = False
-        for indexCandidate in range(len(chordTables.FORTE[card])):
-            dataLine = chordTables.FORTE[card][indexCandidate]
-            if dataLine == None: continue # spacer lines
-            inversionsAvailable = chordTables.forteIndexToInversionsAvailable(
-                                  card, indexCandidate)
-
-            for candidate, candidateInversion in candidates:
-                #environLocal.printDebug([candidate])
-                # need to only match form
-                if dataLine[0] == tuple(candidate): # must compare to tuple
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, 1
-                    match = True
-                    break
-                elif dataLine[0] == tuple(candidateInversion):
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, -1
-                    match = True
-                    break
-        if not match:
-            raise ChordException('cannot find a chord table address for %s' % pcSet)
-        return (card, index, inversion)
+        return chordTables.pitchClassesToAddress(pcSet)
 
     ### PRIVATE METHODS ###
 
@@ -2519,6 +2519,9 @@ def forteIndexToInversionsAvailable(card, index):
     else:
         return [-1, 1]
 
+# addresses given to _validateAddress, and the validated address for each
+_validatedAddresses = {}
+
 def _validateAddress(address):
     '''Check that an address is valid
 
@@ -2539,6 +2542,9 @@ def _validateAddress(address):
     Traceback (most recent call last):
     ChordTablesException: inversion -30 not valid
     '''
+    key = tuple(address)
+    if key in _validatedAddresses:
+        return _validatedAddresses[key]
     address = list(address)
     card = address[0]
     index = address[1]
@@ -2573,9 +2579,75 @@ def _validateAddress(address):
 #     except KeyError:
 #         raise ChordTablesException('cannot validate address: %s' % address)
 
+    _validatedAddresses[key] = (card, index, inversion)
     return (card, index, inversion)
 
 
+# the TN address of each pitch class set, indexed by a bit mask with a bit
+# set for each pitch class in the set; filled when first needed
+_addressesByPitchClassMask = []
+
+def _buildAddressesByPitchClassMask():
+    '''
+    Return a list of the TN addresses of all 4096 pitch class sets, indexed
+    by a bit mask with the bit `1 << pc` set for each pitch class `pc`.
+
+    >>> addresses = chordTables._buildAddressesByPitchClassMask()
+    >>> len(addresses)
+    4096
+    >>> addresses[0] is None
+    True
+    >>> addresses[(1 << 0) + (1 << 4) + (1 << 7)]
+    (3, 11, -1)
+    '''
+    addresses = [None] * 4096
+    for card in range(1, 13):
+        for index, dataLine in enumerate(FORTE[card]):
+            if dataLine is None: # spacer lines
+                continue
+            primeForm = dataLine[0]
+            invertedForm = [(12 - x) % 12 for x in primeForm]
+            if 0 in forteIndexToInversionsAvailable(card, index):
+                forms = [(primeForm, 0), (invertedForm, 0)]
+            else:
+                forms = [(primeForm, 1), (invertedForm, -1)]
+            for form, inversion in forms:
+                for transposition in range(12):
+                    mask = 0
+                    for x in form:
+                        mask |= 1 << ((x + transposition) % 12)
+                    if addresses[mask] is None:
+                        addresses[mask] = (card, index, inversion)
+    return addresses
+
+def pitchClassesToAddress(pitchClasses):
+    '''
+    Given a list of pitch classes, return the TN address of their set class.
+    Repeated pitch classes are ignored. Addresses are found in a table of
+    all 4096 pitch class sets, so this is fast.
+
+    >>> chordTables.pitchClassesToAddress([0, 4, 7])
+    (3, 11, -1)
+    >>> chordTables.pitchClassesToAddress([3, 7, 0, 0])
+    (3, 11, 1)
+    >>> chordTables.pitchClassesToAddress([0, 1, 3, 4, 6, 8, 10])
+    (7, 34, 0)
+    >>> chordTables.pitchClassesToAddress([])
+    Traceback (most recent call last):
+    ChordTablesException: cannot find a chord table address for []
+    '''
+    if not _addressesByPitchClassMask:
+        _addressesByPitchClassMask.extend(_buildAddressesByPitchClassMask())
+    mask = 0
+    for pc in pitchClasses:
+        mask |= 1 << (int(pc) % 12)
+    address = _addressesByPitchClassMask[mask]
+    if address is None:
+        raise ChordTablesException(
+            'cannot find a chord table address for %s' % list(pitchClasses))
+    return address
+
+
 def addressToNormalForm(address):
     '''Given a TN address, return the normal form
 
@@ -2764,6 +2836,19 @@ class Test(unittest.TestCase):
             # must subtract one b/c all groups contain a zero set to pad
             # index values
             self.assertEqual(len(FORTE[setSize])-1, setCount)
+
+    def testPitchClassesToAddress(self):
+        # every set has an address whose normal form is a transposition
+        # of the set
+        for mask in range(1, 4096):
+            pcs = [pc for pc in range(12) if mask & (1 << pc)]
+            address = pitchClassesToAddress(pcs)
+            self.assertEqual(address, _validateAddress(address))
+            normalForm = addressToNormalForm(address)
+            self.assertEqual(len(normalForm), len(pcs))
+            self.assertTrue(any(
+                sorted((x + t) % 12 for x in normalForm) == pcs
+                for t in range(12)))
         
 
 
@@ -43,8 +43,12 @@ the temp folder on the disk.
 import unittest
 
 import copy
+import hashlib
+import inspect
 import os
 import re
+import sys
+import time
 import urllib
 import zipfile
 
@@ -215,6 +219,9 @@ class PickleFilter(object):
     
     If the user has not specified a scratch directory, or if forceSource is True
     then a pickle path will not be created.
+
+    :class:`~music21.converter.Converter` now uses the content-addressed
+    :class:`~music21.converter.ParseCache` instead.
     '''
     def __init__(self, fp, forceSource=False, number=None):
         '''Provide a file path to check if there is pickled version.
@@ -290,6 +297,256 @@ class PickleFilter(object):
         return fpLoad, writePickle, fpPickle
 
 
+#-------------------------------------------------------------------------------
+class ParseCache(object):
+    '''
+    A cache of parsed Streams, stored frozen in a directory and found by the
+    contents of what was parsed (a file or a string of data) together with the
+    options it was parsed with.  Unlike the path-based
+    :class:`~music21.converter.PickleFilter`, a file that is copied or moved
+    is still found, and a file that has changed is never mistaken for
+    what it was before.
+
+    The files in the cache take up at most `maxBytes` (a Stream larger
+    than that is not stored); the least recently used ones are deleted to
+    make room for new ones.  If `directory` is None, a directory
+    called "parseCache" in the scratch directory is used.  Partly written
+    files left by a process that was stopped while storing are deleted
+    once they are older than `staleSeconds`.
+
+    `hits`, `misses`, `stores`, and `evictions` count what this object has
+    done; see :meth:`~music21.converter.ParseCache.stats`.
+
+    The cache used by :class:`~music21.converter.Converter` (and so by
+    `converter.parse` and `corpus.parse`) is `converter.parseCache`.
+
+    >>> import tempfile
+    >>> pc = converter.ParseCache(tempfile.mkdtemp(), maxBytes=10**6)
+    >>> key = pc.keyForData('tinyNotation: 4/4 c4 d e f', format='tinyNotation')
+    >>> pc.get(key) is None
+    True
+    >>> s = pc.store(key, converter.parse('tinyNotation: 4/4 c4 d e f'))
+    >>> len(pc.get(key).notes)
+    4
+    >>> stats = pc.stats()
+    >>> stats['hits'], stats['misses'], stats['stores'], stats['files']
+    (1, 1, 1, 1)
+    >>> stats['bytes'] > 0
+    True
+    >>> pc.clear()
+    >>> pc.stats()['files']
+    0
+    '''
+    def __init__(self, directory=None, maxBytes=256 * 1024 * 1024, staleSeconds=60 * 60):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self.staleSeconds = staleSeconds
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def getDirectory(self):
+        '''
+        Return the directory the cache is in, creating it if need be, or
+        None if there is no scratch directory to put it in.
+        '''
+        directory = self.directory
+        if directory is None:
+            scratch = environLocal.getRootTempDir()
+            if scratch is None:
+                return None
+            directory = os.path.join(scratch, 'parseCache')
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError: # made by another process in the meantime
+                if not os.path.isdir(directory):
+                    return None
+        return directory
+
+    def keyForFile(self, fp, number=None, format=None, **keywords): # @ReservedAssignment
+        '''
+        Return the key of the file (or directory of files) at `fp`, parsed
+        with `number`, `format`, and any options for the SubConverter given
+        as `keywords`.
+
+        >>> import os
+        >>> fp = os.path.join(common.getSourceFilePath(), 'musedata', 'testZip.zip')
+        >>> pc = converter.ParseCache()
+        >>> key = pc.keyForFile(fp, format='musedata')
+        >>> len(key)
+        32
+        >>> key == pc.keyForFile(fp, format='musedata')
+        True
+        >>> key == pc.keyForFile(fp, number=1, format='musedata')
+        False
+        '''
+        contentHash = hashlib.md5()
+        if os.path.isdir(fp):
+            paths = [os.path.join(fp, fn) for fn in sorted(os.listdir(fp))]
+            paths = [path for path in paths if os.path.isfile(path)]
+        else:
+            paths = [fp]
+        for path in paths:
+            if path is not fp: # the names of files in a directory matter
+                contentHash.update(os.path.basename(path).encode('utf-8'))
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    contentHash.update(block)
+        return self._getKey(contentHash, number, format, keywords)
+
+    def keyForData(self, dataStr, number=None, format=None, **keywords): # @ReservedAssignment
+        '''
+        Return the key of a string of data parsed with `number`, `format`,
+        and any options for the SubConverter given as `keywords`.
+        '''
+        if not isinstance(dataStr, bytes):
+            dataStr = dataStr.encode('utf-8')
+        return self._getKey(hashlib.md5(dataStr), number, format, keywords)
+
+    def _getKey(self, contentHash, number, format, keywords): # @ReservedAssignment
+        # a parse by another version of music21 or python may differ
+        options = '|'.join([_version.__version__, str(sys.version_info[:2]),
+                            str(number), str(format)] +
+                           ['%s=%r' % (k, keywords[k]) for k in sorted(keywords)])
+        contentHash.update(options.encode('utf-8'))
+        return contentHash.hexdigest()
+
+    def _getFp(self, directory, key):
+        return os.path.join(directory, key + '.pgz')
+
+    def get(self, key):
+        '''
+        Return the Stream stored under `key`, or None if there is none.
+        '''
+        directory = self.getDirectory()
+        if directory is not None:
+            fp = self._getFp(directory, key)
+            if os.path.exists(fp):
+                try:
+                    streamObj = thaw(fp, zipType='zlib')
+                except: # pylint: disable=bare-except
+                    environLocal.warn('Could not thaw %s from the parse cache, removing it' % fp)
+                    self._remove(fp)
+                else:
+                    self.hits += 1
+                    try:
+                        os.utime(fp, None) # now most recently used
+                    except OSError:
+                        pass
+                    return streamObj
+        self.misses += 1
+        return None
+
+    def store(self, key, streamObj):
+        '''
+        Store `streamObj` under `key`, making room for it if needed.  As
+        storing leaves `streamObj` unusable, return the Stream to use instead.
+        '''
+        from music21 import freezeThaw
+        directory = self.getDirectory()
+        if directory is None:
+            return streamObj
+        fp = self._getFp(directory, key)
+        # write under another name first so that no other process reads half a file
+        fpTemp = '%s.%d.tmp' % (fp, os.getpid())
+        sf = freezeThaw.StreamFreezer(streamObj, fastButUnsafe=True)
+        sf.write(fp=fpTemp, zipType='zlib')
+        streamObj = thaw(fpTemp, zipType='zlib')
+        if os.path.getsize(fpTemp) > self.maxBytes:
+            self._remove(fpTemp)
+            return streamObj
+        if os.path.exists(fp): # only Windows cannot rename over a file
+            self._remove(fp)
+        os.rename(fpTemp, fp)
+        self.stores += 1
+        self.evict(keep=fp)
+        return streamObj
+
+    def _cachedFiles(self, directory):
+        '''
+        Return a list of (time last used, size, path) of the files in the cache,
+        least recently used first.  Partly written files are included once
+        they are older than `staleSeconds`; younger ones may still be
+        being written by another process.
+        '''
+        post = []
+        staleTime = time.time() - self.staleSeconds
+        for fn in os.listdir(directory):
+            isTemp = fn.endswith('.tmp')
+            if not isTemp and not fn.endswith('.pgz'):
+                continue
+            fp = os.path.join(directory, fn)
+            try:
+                info = os.stat(fp)
+            except OSError: # removed by another process
+                continue
+            if isTemp and info.st_mtime > staleTime:
+                continue
+            post.append((info.st_mtime, info.st_size, fp))
+        post.sort()
+        return post
+
+    def evict(self, keep=None):
+        '''
+        Delete the least recently used files until the cache is no larger
+        than `maxBytes`, never deleting the file `keep`.  Stale partly
+        written files are always deleted.
+        '''
+        directory = self.getDirectory()
+        if directory is None:
+            return
+        cachedFiles = self._cachedFiles(directory)
+        totalBytes = sum(size for unused_time, size, unused_fp in cachedFiles)
+        for unused_time, size, fp in cachedFiles:
+            if fp == keep:
+                continue
+            if totalBytes <= self.maxBytes and not fp.endswith('.tmp'):
+                continue
+            self._remove(fp)
+            self.evictions += 1
+            totalBytes -= size
+
+    def _remove(self, fp):
+        try:
+            os.remove(fp)
+        except OSError: # removed by another process
+            pass
+
+    def clear(self):
+        '''
+        Delete every file in the cache.
+        '''
+        directory = self.getDirectory()
+        if directory is None:
+            return
+        for unused_time, unused_size, fp in self._cachedFiles(directory):
+            self._remove(fp)
+
+    def stats(self):
+        '''
+        Return a dictionary of the number of `hits`, `misses`, `stores`, and
+        `evictions` of this object, and the number of `files` and `bytes`
+        in the cache now (along with its `maxBytes`).
+        '''
+        directory = self.getDirectory()
+        if directory is None:
+            cachedFiles = []
+        else:
+            cachedFiles = self._cachedFiles(directory)
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'files': len(cachedFiles),
+                'bytes': sum(size for unused_time, size, unused_fp in cachedFiles),
+                'maxBytes': self.maxBytes,
+                }
+
+parseCache = ParseCache()
+
+
 #-------------------------------------------------------------------------------
 _registeredSubconverters = []
 _deregisteredSubconverters = [] # default subconverters to skip
@@ -386,6 +643,9 @@ class Converter(object):
     '''
     _DOC_ATTR = {'subConverter': 'a ConverterXXX object that will do the actual converting.',}
     
+    # data shorter than this is not stored in the parse cache by parseData
+    minimumCachedDataLength = 10000
+
     def __init__(self):
         self.subConverter = None
         self._thawedStream = None # a stream object unthawed
@@ -396,7 +656,7 @@ class Converter(object):
             raise ValueError
         return os.path.join(directory, 'm21-' + _version.__version__ + '-' + common.getMd5(url) + ext)
 
-    def parseFileNoPickle(self, fp, number=None, format=None, forceSource=False): # @ReservedAssignment
+    def parseFileNoPickle(self, fp, number=None, format=None, forceSource=False, **keywords): # @ReservedAssignment
         '''
         Given a file path, parse and store a music21 Stream.
 
@@ -404,6 +664,9 @@ class Converter(object):
         extension using `common.findFormatFile`.
         
         Does not use or store pickles in any circumstance.
+
+        Other keywords are passed to the parseFile method of the SubConverter,
+        if it takes them (see :meth:`subConverterKeywords`).
         '''
         #environLocal.printDebug(['attempting to parseFile', fp])
         if not os.path.exists(fp):
@@ -413,12 +676,36 @@ class Converter(object):
         if useFormat is None:
             useFormat = self.getFormatFromFileExtension(fp)
 
+        keywords = self.subConverterKeywords(useFormat, 'parseFile', keywords)
         self.setSubconverterFromFormat(useFormat)
-        self.subConverter.parseFile(fp, number=number)
+        self.subConverter.parseFile(fp, number=number, **keywords)
         self.stream.filePath = fp
         self.stream.fileNumber = number
         self.stream.fileFormat = useFormat
     
+    def parseFileMetadataOnly(self, fp, number=None, format=None): # @ReservedAssignment
+        '''
+        Given a file path, store a Stream holding just the metadata of the
+        file (see :func:`~music21.converter.parseMetadataOnly`).
+
+        If format is None then look up the format from the file
+        extension using `common.findFormatFile`.
+
+        The parse cache is neither used nor stored.
+        '''
+        if not os.path.exists(fp):
+            raise ConverterFileException('no such file exists: %s' % fp)
+        useFormat = format
+
+        if useFormat is None:
+            useFormat = self.getFormatFromFileExtension(fp)
+
+        self.setSubconverterFromFormat(useFormat)
+        self.subConverter.parseFileMetadataOnly(fp, number=number)
+        self.stream.filePath = fp
+        self.stream.fileNumber = number
+        self.stream.fileFormat = useFormat
+
     def getFormatFromFileExtension(self, fp):
         '''
         gets the format from a file extension.
@@ -440,59 +727,57 @@ class Converter(object):
                 raise ConverterFileException('cannot find a format extensions for: %s' % fp)
         return useFormat
     
-    def parseFile(self, fp, number=None, format=None, forceSource=False, storePickle=True): # @ReservedAssignment
+    def parseFile(self, fp, number=None, format=None, forceSource=False, storePickle=True, **keywords): # @ReservedAssignment
         '''
         Given a file path, parse and store a music21 Stream.
 
         If format is None then look up the format from the file
         extension using `common.findFormatFile`.
         
-        Will load from a pickle unless forceSource is True
-        Will store as a pickle unless storePickle is False
+        Will load from the parse cache (`converter.parseCache`) unless
+        forceSource is True.
+        Will store in the parse cache unless storePickle is False
+
+        Other keywords are passed to the parseFile method of the SubConverter,
+        if it takes them (see :meth:`subConverterKeywords`).
         '''
-        from music21 import freezeThaw
         if not os.path.exists(fp):
             raise ConverterFileException('no such file eists: %s' % fp)
         useFormat = format
 
         if useFormat is None:
             useFormat = self.getFormatFromFileExtension(fp)
-        pfObj = PickleFilter(fp, forceSource, number)
-        unused_fpDst, writePickle, fpPickle = pfObj.status()
-        if writePickle is False and fpPickle is not None and forceSource is False:
-            environLocal.printDebug("Loading Pickled version")
-            try:
-                self._thawedStream = thaw(fpPickle, zipType='zlib')
-            except:
-                environLocal.warn("Could not parse pickle, %s ...rewriting" % fpPickle)
-                os.remove(fpPickle)
-                self.parseFileNoPickle(fp, number, format, forceSource)
+        keywords = self.subConverterKeywords(useFormat, 'parseFile', keywords)
+        if forceSource or useFormat == 'pickle': # do not pickle a pickle
+            self.parseFileNoPickle(fp, number, format, forceSource, **keywords)
+            return
 
-            self.stream.filePath = fp
-            self.stream.fileNumber = number
-            self.stream.fileFormat = useFormat
+        key = parseCache.keyForFile(fp, number, useFormat, **keywords)
+        self._thawedStream = parseCache.get(key)
+        if self._thawedStream is not None:
+            environLocal.printDebug("Loading Pickled version")
         else:
             environLocal.printDebug("Loading original version")
-            self.parseFileNoPickle(fp, number, format, forceSource)
-            if writePickle is True and fpPickle is not None and storePickle is True:
-                # save the stream to disk...
+            self.parseFileNoPickle(fp, number, format, forceSource, **keywords)
+            if storePickle is True:
                 environLocal.printDebug("Freezing Pickle")
-                s = self.stream
-                sf = freezeThaw.StreamFreezer(s, fastButUnsafe=True)
-                sf.write(fp=fpPickle, zipType='zlib')
-                
-                environLocal.printDebug("Replacing self.stream")
-                # get a new stream
-                self._thawedStream = thaw(fpPickle, zipType='zlib')
-                self.stream.filePath = fp
-                self.stream.fileNumber = number
-                self.stream.fileFormat = useFormat
-
-            
-
-    def parseData(self, dataStr, number=None, format=None, forceSource=False): # @ReservedAssignment
+                self._thawedStream = parseCache.store(key, self.stream)
+        # the same contents may have been parsed from another file
+        self.stream.filePath = fp
+        self.stream.fileNumber = number
+        self.stream.fileFormat = useFormat
+
+
+    def parseData(self, dataStr, number=None, format=None, forceSource=False, storePickle=True, **keywords): # @ReservedAssignment
         '''
         Given raw data, determine format and parse into a music21 Stream.
+
+        Data at least `minimumCachedDataLength` long will be loaded from the
+        parse cache (`converter.parseCache`) unless forceSource is True, and
+        will be stored in it unless storePickle is False.
+
+        Other keywords are passed to the parseData method of the SubConverter,
+        if it takes them (see :meth:`subConverterKeywords`).
         '''
         useFormat = format
         # get from data in string if not specified
@@ -526,15 +811,30 @@ class Converter(object):
             else:
                 raise ConverterException('File not found or no such format found for: %s' % dataStrMakeStr)
 
+        keywords = self.subConverterKeywords(useFormat, 'parseData', keywords)
+        # short data is quicker to parse again than to thaw
+        useCache = (not forceSource and isinstance(dataStr, (bytes, six.text_type))
+                    and len(dataStr) >= self.minimumCachedDataLength)
+        if useCache:
+            key = parseCache.keyForData(dataStr, number, useFormat, **keywords)
+            self._thawedStream = parseCache.get(key)
+            if self._thawedStream is not None:
+                return
+
         self.setSubconverterFromFormat(useFormat)
-        self.subConverter.parseData(dataStr, number=number)
+        self.subConverter.parseData(dataStr, number=number, **keywords)
+        if useCache and storePickle is True:
+            self._thawedStream = parseCache.store(key, self.stream)
 
 
-    def parseURL(self, url, format=None, number=None): # @ReservedAssignment
+    def parseURL(self, url, format=None, number=None, **keywords): # @ReservedAssignment
         '''Given a url, download and parse the file
         into a music21 Stream stored in the `stream`
         property of the converter object.
 
+        Other keywords are passed to the parseFile method of the SubConverter,
+        if it takes them (see :meth:`subConverterKeywords`).
+
         Note that this checks the user Environment
         `autoDownlaad` setting before downloading.
 
@@ -595,8 +895,9 @@ class Converter(object):
             useFormat = common.findFormatFile(fp)
         else:
             useFormat = format
+        keywords = self.subConverterKeywords(useFormat, 'parseFile', keywords)
         self.setSubconverterFromFormat(useFormat)
-        self.subConverter.parseFile(fp, number=number)
+        self.subConverter.parseFile(fp, number=number, **keywords)
         self.stream.filePath = fp
         self.stream.fileNumber = number
         self.stream.fileFormat = useFormat
@@ -735,6 +1036,37 @@ class Converter(object):
         self.subConverter = subConverterClass()
 
 
+    def subConverterKeywords(self, converterFormat, methodName, keywords):
+        '''
+        Return a dictionary of the options in `keywords` that the method named
+        `methodName` of the SubConverter for `converterFormat` takes.  Options
+        for other formats are left out, so that they can be given to
+        :func:`~music21.converter.parse` whatever the format turns out to be.
+
+        >>> convObj = converter.Converter()
+        >>> convObj.subConverterKeywords('musicxml', 'parseFile', {'importer': 'iterparse'})
+        {'importer': 'iterparse'}
+        >>> convObj.subConverterKeywords('humdrum', 'parseFile', {'importer': 'iterparse'})
+        {}
+        '''
+        if not keywords:
+            return {}
+        scf = self.getSubConverterFormats()
+        if converterFormat is None or converterFormat.lower() not in scf:
+            return {} # setSubconverterFromFormat will raise an exception
+        method = getattr(scf[converterFormat.lower()], methodName)
+        if six.PY3:
+            argSpec = inspect.getfullargspec(method) # @UndefinedVariable
+            if argSpec.varkw is not None:
+                return dict(keywords)
+            argNames = argSpec.args + argSpec.kwonlyargs
+        else:
+            argSpec = inspect.getargspec(method)
+            if argSpec.keywords is not None:
+                return dict(keywords)
+            argNames = argSpec.args
+        return dict((k, v) for k, v in keywords.items() if k in argNames)
+
     def formatFromHeader(self, dataStr):
         '''
         if dataStr begins with a text header such as  "tinyNotation:" then
@@ -875,31 +1207,55 @@ class Converter(object):
 # module level convenience methods
 
 
-def parseFile(fp, number=None, format=None, forceSource=False):  #@ReservedAssignment
+def parseFile(fp, number=None, format=None, forceSource=False, **keywords):  #@ReservedAssignment
     '''
     Given a file path, attempt to parse the file into a Stream.
     '''
     v = Converter()
-    v.parseFile(fp, number=number, format=format, forceSource=forceSource)
+    v.parseFile(fp, number=number, format=format, forceSource=forceSource, **keywords)
     return v.stream
 
-def parseData(dataStr, number=None, format=None): # @ReservedAssignment
+def parseData(dataStr, number=None, format=None, **keywords): # @ReservedAssignment
     '''
     Given musical data represented within a Python string, attempt to parse the
     data into a Stream.
     '''
     v = Converter()
-    v.parseData(dataStr, number=number, format=format)
+    v.parseData(dataStr, number=number, format=format, **keywords)
     return v.stream
 
-def parseURL(url, number=None, format=None, forceSource=False): # @ReservedAssignment
+def parseURL(url, number=None, format=None, forceSource=False, **keywords): # @ReservedAssignment
     '''
     Given a URL, attempt to download and parse the file into a Stream. Note:
     URL downloading will not happen automatically unless the user has set their
     Environment "autoDownload" preference to "allow".
     '''
     v = Converter()
-    v.parseURL(url, format=format)
+    v.parseURL(url, format=format, **keywords)
+    return v.stream
+
+def parseMetadataOnly(fp, number=None, format=None): # @ReservedAssignment
+    '''
+    Given a file path, return a Stream that holds the
+    :class:`~music21.metadata.Metadata` of the file but none of its music,
+    or, for a file of several works, an Opus of such Scores.
+    This is much faster than :func:`~music21.converter.parse` for formats
+    whose headers can be read alone: MusicXML (reading stops at the first
+    part), ABC (only the information fields are read), and Humdrum (only the
+    reference records are read).  No metadata is read from MIDI files.
+    Other formats are parsed in full.
+
+    >>> fp = corpus.getWork('luca/gloria')
+    >>> s = converter.parseMetadataOnly(fp)
+    >>> print(s.metadata.title)
+    Gloria, Q15
+    >>> print(s.metadata.composer)
+    D. Luca
+    >>> len(s.flat.notes)
+    0
+    '''
+    v = Converter()
+    v.parseFileMetadataOnly(fp, number=number, format=format)
     return v.stream
 
 def parse(value, *args, **keywords):
@@ -914,6 +1270,12 @@ def parse(value, *args, **keywords):
 
     `format` specifies the format to parse the line of text or the file as.
 
+    Any other keywords are options for the SubConverter of the format.  For
+    MusicXML, `importer='iterparse'` reads the document in a single pass
+    with :class:`~music21.musicxml.xmlToM21.MusicXMLImporter` instead of
+    through mxObjects, which is faster and uses less memory for large scores.  Options
+    that the format does not take are ignored.
+
     A string of text is first checked to see if it is a filename that exists on
     disk.  If not it is searched to see if it looks like a URL.  If not it is
     processed as data.
@@ -961,6 +1323,12 @@ def parse(value, *args, **keywords):
     else:
         m21Format = None
 
+    # everything else is passed to the SubConverter
+    subConverterKeywords = {}
+    for k in keywords:
+        if k not in ('forceSource', 'number', 'format'):
+            subConverterKeywords[k] = keywords[k]
+
     if six.PY3 and isinstance(value, bytes):
         valueStr = value.decode('utf-8', 'ignore')
     else:
@@ -969,25 +1337,30 @@ def parse(value, *args, **keywords):
     if (common.isListLike(value) and len(value) == 2 and
         value[1] == None and os.path.exists(value[0])):
         # comes from corpus.search
-        return parseFile(value[0], format=m21Format)
+        return parseFile(value[0], format=m21Format, **subConverterKeywords)
     elif (common.isListLike(value) and len(value) == 2 and
         isinstance(value[1], int) and os.path.exists(value[0])):
         # corpus or other file with movement number
-        return parseFile(value[0], format=m21Format).getScoreByNumber(value[1])
+        return parseFile(value[0], format=m21Format,
+                         **subConverterKeywords).getScoreByNumber(value[1])
     elif common.isListLike(value) or len(args) > 0: # tiny notation list
         if len(args) > 0: # add additional args to a list
             value = [value] + list(args)
         return parseData(value, number=number)
     # a midi string, must come before os.path.exists test
     elif valueStr.startswith('MThd'):
-        return parseData(value, number=number, format=m21Format)
+        return parseData(value, number=number, format=m21Format, forceSource=forceSource,
+                         **subConverterKeywords)
     elif os.path.exists(value):
-        return parseFile(value, number=number, format=m21Format, forceSource=forceSource)
+        return parseFile(value, number=number, format=m21Format, forceSource=forceSource,
+                         **subConverterKeywords)
     elif (valueStr.startswith('http://') or valueStr.startswith('https://')):
         # its a url; may need to broaden these criteria
-        return parseURL(value, number=number, format=m21Format, forceSource=forceSource)
+        return parseURL(value, number=number, format=m21Format, forceSource=forceSource,
+                        **subConverterKeywords)
     else:
-        return parseData(value, number=number, format=m21Format)
+        return parseData(value, number=number, format=m21Format, forceSource=forceSource,
+                         **subConverterKeywords)
 
 
 
@@ -996,8 +1369,11 @@ def freeze(streamObj, fmt=None, fp=None, fastButUnsafe=False, zipType='zlib'):
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object.
 
-    The serialization format is defined by the `fmt` argument; 'pickle' (the default) is only one
-    presently supported.  'json' or 'jsonnative' will be used once jsonpickle is good enough.
+    The serialization format is defined by the `fmt` argument; 'pickle' (the default) is the
+    general purpose one.  'columnar' stores notes, rests, and chords in compact
+    columns and is smaller and faster to thaw.  'chunked' is columnar split into
+    chunks by part and measure, so that :func:`~music21.converter.thaw` can read just some
+    of them.  'json' or 'jsonnative' will be used once jsonpickle is good enough.
 
     If no file path is given, a temporary file is used.
 
@@ -1030,16 +1406,32 @@ def freeze(streamObj, fmt=None, fp=None, fastButUnsafe=False, zipType='zlib'):
     return v.write(fmt=fmt, fp=fp, zipType=zipType) # returns fp
 
 
-def thaw(fp, zipType='zlib'):
+def thaw(fp, zipType='zlib', parts=None, measures=None):
     '''Given a file path of a serialized Stream, defrost the file into a Stream.
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object.
 
     See the documentation for :meth:`~music21.converter.freeze` for demos.
+
+    A Stream frozen in the 'chunked' format can be thawed in part: `parts` is a
+    list of Part numbers or ids and `measures` a tuple of the first and last
+    measure number, and only the chunks holding them are read.
+
+    >>> c = corpus.parse('bwv66.6')
+    >>> fp = converter.freeze(c, fmt='chunked')
+    >>> d = converter.thaw(fp, parts=['Alto'], measures=(2, 3))
+    >>> d.parts[0].show('text')
+    {0.0} <music21.instrument.Instrument P2: Alto: Instrument 2>
+    {5.0} <music21.stream.Measure 2 offset=5.0>
+    ...
+    {9.0} <music21.stream.Measure 3 offset=9.0>
+    ...
+    >>> len(d.parts)
+    1
     '''
     from music21 import freezeThaw
     v = freezeThaw.StreamThawer()
-    v.open(fp, zipType=zipType)
+    v.open(fp, zipType=zipType, parts=parts, measures=measures)
     return v.stream
 
 
@@ -1079,15 +1471,18 @@ def freezeStr(streamObj, fmt=None):
     v = freezeThaw.StreamFreezer(streamObj)
     return v.writeStr(fmt=fmt) # returns a string
 
-def thawStr(strData):
+def thawStr(strData, parts=None, measures=None):
     '''
     Given a serialization string, defrost into a Stream.
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object.
+
+    `parts` and `measures` select what to thaw of a 'chunked' string, as in
+    :func:`~music21.converter.thaw`.
     '''
     from music21 import freezeThaw
     v = freezeThaw.StreamThawer()
-    v.openStr(strData)
+    v.openStr(strData, parts=parts, measures=measures)
     return v.stream
 
 
@@ -1723,11 +2118,100 @@ class Test(unittest.TestCase):
         cmd = subConverters.ConverterMuseData()
         cmd.parseFile(fp)
 
+    def testParseCache(self):
+        import shutil
+        import tempfile
+        global parseCache # pylint: disable=global-statement
+        from music21 import corpus
+        storedCache = parseCache
+        directory = tempfile.mkdtemp()
+        try:
+            parseCache = ParseCache(os.path.join(directory, 'cache'))
+            fp = os.path.join(directory, 'a.mxl')
+            shutil.copy(corpus.getWork('bwv66.6'), fp)
+            s = parseFile(fp)
+            self.assertEqual(parseCache.stats()['misses'], 1)
+            self.assertEqual(parseCache.stats()['stores'], 1)
+
+            # a copy of the file is found by its contents
+            fpCopy = os.path.join(directory, 'b.mxl')
+            shutil.copy(fp, fpCopy)
+            sCopy = parseFile(fpCopy)
+            self.assertEqual(parseCache.stats()['hits'], 1)
+            self.assertEqual(sCopy.filePath, fpCopy)
+            self.assertEqual(len(sCopy.flat.notes), len(s.flat.notes))
+
+            # but not if parsed with other options
+            parseFile(fpCopy, number=2)
+            self.assertEqual(parseCache.stats()['hits'], 1)
+            self.assertEqual(parseCache.stats()['misses'], 2)
+            self.assertNotEqual(parseCache.keyForFile(fp, format='musicxml'),
+                                parseCache.keyForFile(fp, format='musedata'))
+
+            # least recently used files are evicted past maxBytes
+            parseCache.maxBytes = int(parseCache.stats()['bytes'] * 0.75)
+            parseFile(fp, number=3)
+            stats = parseCache.stats()
+            self.assertEqual(stats['evictions'], 2)
+            self.assertEqual(stats['files'], 1)
+            self.assertTrue(stats['bytes'] <= stats['maxBytes'])
+
+            # files left by an interrupted store are deleted once stale
+            fpTemp = os.path.join(parseCache.getDirectory(), 'interrupted.pgz.1.tmp')
+            with open(fpTemp, 'wb') as f:
+                f.write(b'x' * 10)
+            parseCache.evict()
+            self.assertTrue(os.path.exists(fpTemp))
+            staleTime = time.time() - parseCache.staleSeconds - 1
+            os.utime(fpTemp, (staleTime, staleTime))
+            self.assertEqual(parseCache.stats()['files'], 2)
+            evictions = parseCache.stats()['evictions']
+            parseCache.evict()
+            self.assertFalse(os.path.exists(fpTemp))
+            self.assertEqual(parseCache.stats()['files'], 1)
+            self.assertEqual(parseCache.stats()['evictions'], evictions + 1)
+
+            # long enough data is cached unless storePickle is False
+            parseCache.clear()
+            data = 'tinyNotation: 4/4 c4 d e f'
+            c = Converter()
+            c.minimumCachedDataLength = 1
+            c.parseData(data, storePickle=False)
+            self.assertEqual(parseCache.stats()['files'], 0)
+            c.parseData(data)
+            self.assertEqual(parseCache.stats()['files'], 1)
+            hits = parseCache.stats()['hits']
+            c.parseData(data)
+            self.assertEqual(parseCache.stats()['hits'], hits + 1)
+            self.assertEqual(len(c.stream.notes), 4)
+            c.parseData(data, forceSource=True)
+            self.assertEqual(parseCache.stats()['hits'], hits + 1)
+        finally:
+            parseCache = storedCache
+            shutil.rmtree(directory)
+
+    def testSubConverterKeywords(self):
+        from music21.humdrum import testFiles
+        # options that a format does not take are left out, as before they
+        # were passed to SubConverters
+        s = parse(testFiles.mazurka6, forceSource=True, importer='iterparse')
+        self.assertEqual(len(s.parts), 2)
+        fp = os.path.join(common.getSourceFilePath(), 'corpus', 'essenFolksong',
+                          'altdeu10.abc')
+        s = parse(fp, number=1, forceSource=True, importer='iterparse', unknownOption=True)
+        self.assertTrue(len(s.flat.notes) > 0)
+        c = Converter()
+        self.assertEqual(c.subConverterKeywords('abc', 'parseData', {'importer': 'iterparse'}),
+                         {})
+        self.assertEqual(c.subConverterKeywords('musicxml', 'parseData',
+                                                {'importer': 'iterparse', 'unknownOption': 1}),
+                         {'importer': 'iterparse'})
+
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [parse, parseFile, parseData, parseURL, freeze, thaw, freezeStr, thawStr, 
-              Converter, registerSubconverter, unregisterSubconverter]
+              Converter, ParseCache, registerSubconverter, unregisterSubconverter]
 
 
 if __name__ == "__main__":
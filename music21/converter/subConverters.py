@@ -88,6 +88,19 @@ class SubConverter(object):
                 dataStream = f.read()
         self.parseData(dataStream, number)
         return self.stream
+
+    def parseFileMetadataOnly(self, filePath, number=None):
+        '''
+        Called when only the metadata of a file is wanted, as when caching
+        metadata for a corpus.  The stream should then hold the
+        :class:`~music21.metadata.Metadata` of the file (or an Opus of
+        Scores holding the Metadata of each work), but need not hold any music.
+
+        By default, the whole file is parsed; subconverters that can read
+        just the header of their format override this.
+        '''
+        self.parseFile(filePath, number)
+        return self.stream
     
     def _getStream(self):
         return self._stream
@@ -408,6 +421,17 @@ class ConverterHumdrum(SubConverter):
         self.stream = self.data.stream
         return self.data
 
+    def parseFileMetadataOnly(self, filepath, number=None):
+        '''
+        Read only the reference records (!!!) of a Humdrum file, with
+        :func:`~music21.humdrum.spineParser.referencesToMetadata`.
+        '''
+        from music21.humdrum import spineParser
+        with open(filepath) as f:
+            md = spineParser.referencesToMetadata(f)
+        self.stream.insert(0, md)
+        return self.stream
+
 #-------------------------------------------------------------------------------
 class ConverterTinyNotation(SubConverter):
     '''
@@ -550,9 +574,37 @@ class ConverterMusicXML(SubConverter):
         #t.stop()
         #environLocal.printDebug(['music21 object creation time:', t])
 
+    def _parseSinglePass(self, methodName, source):
+        '''
+        Parse `source` with the single-pass importer of
+        :mod:`~music21.musicxml.xmlToM21`, calling its parseFile or parseData
+        method, named by `methodName`.
+
+        Returns False, leaving the stream empty, if that importer cannot
+        read the document.
+        '''
+        from music21.musicxml import xmlToM21
+        importer = xmlToM21.MusicXMLImporter(inputM21=self.stream)
+        try:
+            getattr(importer, methodName)(source)
+        except (xmlToM21.ETree.ParseError, xmlToM21.XMLToM21Exception) as e:
+            environLocal.printDebug(['using the standard MusicXML importer:', e])
+            self.stream = stream.Score()
+            return False
+        self._mxScore = importer.mxScore
+        return True
+
     #---------------------------------------------------------------------------
-    def parseData(self, xmlString, number=None):
-        '''Open MusicXML data from a string.'''
+    def parseData(self, xmlString, number=None, importer=None):
+        '''
+        Open MusicXML data from a string.
+
+        If `importer` is "iterparse", the data is read by the single-pass
+        importer in :mod:`~music21.musicxml.xmlToM21` rather than through
+        mxObjects.
+        '''
+        if importer == 'iterparse' and self._parseSinglePass('parseData', xmlString):
+            return
         from music21.musicxml import xmlHandler as musicxmlHandler
         c = musicxmlHandler.Document()
         c.read(xmlString)
@@ -562,12 +614,18 @@ class ConverterMusicXML(SubConverter):
             raise SubConverterException('score from xmlString (%s...) either has no parts defined or was incompletely parsed' % xmlString[:30])
         self.load()
 
-    def parseFile(self, fp, number=None):
+    def parseFile(self, fp, number=None, importer=None):
         '''
         Open from a file path; check to see if there is a pickled
         version available and up to date; if so, open that, otherwise
         open source.
+
+        If `importer` is "iterparse", the file is read by the single-pass
+        importer in :mod:`~music21.musicxml.xmlToM21` rather than through
+        mxObjects.
         '''
+        if importer == 'iterparse' and self._parseSinglePass('parseFile', fp):
+            return
         # return fp to load, if pickle needs to be written, fp pickle
         # this should be able to work on a .mxl file, as all we are doing
         # here is seeing which is more recent
@@ -603,6 +661,23 @@ class ConverterMusicXML(SubConverter):
                 self._mxScore.set('movementTitle', fn)
         self.load()
 
+    def parseFileMetadataOnly(self, fp, number=None):
+        '''
+        Read only the header of a MusicXML file, stopping at the first part,
+        and put its Metadata into the stream.  Falls back on a full parse
+        if the header cannot be read that way.
+        '''
+        from music21.musicxml import xmlToM21
+        importer = xmlToM21.MusicXMLImporter(inputM21=self.stream, metadataOnly=True)
+        try:
+            importer.parseFile(fp)
+        except (xmlToM21.ETree.ParseError, xmlToM21.XMLToM21Exception) as e:
+            environLocal.printDebug(['reading the whole MusicXML file:', e])
+            self.stream = stream.Score()
+            return SubConverter.parseFileMetadataOnly(self, fp, number)
+        self._mxScore = importer.mxScore
+        return self.stream
+
     def runThroughMusescore(self, fp, **keywords):
         import sys
         musescoreFile = environLocal['musescoreDirectPNGPath']
@@ -635,8 +710,11 @@ class ConverterMusicXML(SubConverter):
     
     def write(self, obj, fmt, fp=None, subformats=None, **keywords):
         from music21.musicxml import m21ToString
-        dataStr = m21ToString.fromMusic21Object(obj)
-        fp = self.writeDataStream(fp, dataStr)        
+        if fp is None:
+            fp = self.getTemporaryFile()
+        # write straight to the file rather than building the whole string
+        with open(fp, 'w') as f:
+            m21ToString.fromMusic21Object(obj, fileLike=f)
         
         if subformats is not None and 'png' in subformats:
             fp = self.runThroughMusescore(fp, **keywords)
@@ -670,6 +748,17 @@ class ConverterMidi(SubConverter):
         from music21.midi import translate as midiTranslate
         midiTranslate.midiFilePathToStream(fp, self.stream)
 
+    def parseFileMetadataOnly(self, fp, number=None):
+        '''
+        No metadata is read from MIDI files, so this only checks that `fp`
+        begins with a MIDI header, and leaves the stream empty.
+        '''
+        from music21 import midi as midiModule
+        with open(fp, 'rb') as f:
+            if f.read(4) != b'MThd':
+                raise midiModule.MidiException('not a MIDI file: %s' % fp)
+        return self.stream
+
     def write(self, obj, fmt, fp=None, subformats=None, **keywords):
         from music21.midi import translate as midiTranslate
         if fp is None:
@@ -736,6 +825,24 @@ class ConverterABC(SubConverter):
         else:
             abcFormat.translate.abcToStreamScore(abcHandler, self.stream)
 
+    def parseFileMetadataOnly(self, fp, number=None):
+        '''
+        Read only the information fields of an ABC file, with
+        :func:`~music21.abcFormat.translate.abcToStreamMetadataOnly`.
+        As with parseFile, an Opus is made if the file defines more than one
+        work and `number` is not given.
+        '''
+        from music21 import abcFormat
+        af = abcFormat.ABCFile()
+        af.open(fp)
+        strSrc = af.file.read()
+        af.close()
+        if number is not None:
+            strSrc = af.extractReferenceNumber(strSrc, number)
+        self.stream = abcFormat.translate.abcToStreamMetadataOnly(strSrc,
+                                                                  self.stream)
+        return self.stream
+
 
 class ConverterRomanText(SubConverter):
     '''Simple class wrapper for parsing roman text harmonic definitions.
@@ -203,15 +203,18 @@ def _updateMetadataBundle():
     corpora.Corpus._updateAllMetadataBundles()
 
 
-def cacheMetadata(corpusNames=('local',)):
+def cacheMetadata(corpusNames=('local',), metadataOnly=False):
     '''
     Rebuild the metadata cache.
+
+    If `metadataOnly` is True, only the headers of files are read, which is
+    much faster; see :func:`~music21.metadata.caching.cacheMetadata`.
     '''
     if not common.isListLike(corpusNames):
         corpusNames = [corpusNames]
     for name in corpusNames:
         corpora.Corpus._metadataBundles[name] = None
-    metadata.cacheMetadata(corpusNames)
+    metadata.cacheMetadata(corpusNames, metadataOnly=metadataOnly)
 
 
 def search(
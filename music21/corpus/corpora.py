@@ -67,7 +67,7 @@ class Corpus(object):
     ### PRIVATE METHODS ###
 
     def _removeNameFromCache(self, name):
-        for key in Corpus._pathsCache.keys():
+        for key in list(Corpus._pathsCache.keys()):
             if key[0] == name:
                 del(Corpus._pathsCache[key])
 
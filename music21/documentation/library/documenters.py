@@ -789,6 +789,7 @@ class ClassDocumenter(ObjectDocumenter):
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.spannerBundle>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.spanners>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.variants>
+            <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.view>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.voices>
 
         '''
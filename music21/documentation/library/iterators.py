@@ -231,15 +231,15 @@ class FunctionIterator(Iterator):
         ...     function.__module__, function.__name__
         ...
         ('music21.abcFormat.__init__', 'mergeLeadingMetaData')
+        ('music21.abcFormat.translate', 'abcToStreamMetadataOnly')
         ('music21.abcFormat.translate', 'abcToStreamOpus')
         ('music21.abcFormat.translate', 'abcToStreamPart')
         ('music21.abcFormat.translate', 'abcToStreamScore')
+        ('music21.abcFormat.translate', 'abcTokensToMetadata')
         ('music21.abcFormat.translate', 'parseTokens')
         ('music21.abcFormat.translate', 'reBar')
         ('music21.analysis.discrete', 'analyzeStream')
         ('music21.analysis.metrical', 'labelBeatDepth')
-        ('music21.analysis.metrical', 'thomassenMelodicAccent')
-        ('music21.analysis.neoRiemannian', 'L')
 
     '''
 
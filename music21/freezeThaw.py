@@ -1,2105 +1,3221 @@
-# -*- coding: utf-8 -*-
-#------------------------------------------------------------------------------
-# Name:         freezeThaw.py
-# Purpose:      Methods for storing any music21 object on disk.
-#               Uses pickle and json
-#
-# Authors:      Michael Scott Cuthbert
-#               Christopher Ariza
-#
-# Copyright:    Copyright © 2011-2012 Michael Scott Cuthbert and the music21
-#               Project
-# License:      LGPL or BSD, see license.txt
-#------------------------------------------------------------------------------
-
-r'''
-This module contains objects for storing complete `Music21Objects`, especially
-`Stream` and `Score` objects on disk.  Freezing (or "pickling") refers to
-writing the object to a file on disk (or to a string).  Thawing (or
-"unpickling") refers to reading in a string or file and returning a Music21
-object.
-
-This module offers alternatives to writing a `Score` to `MusicXML` with
-`s.write('musicxml')`.  `FreezeThaw` has some advantages over using `.write()`:
-virtually every aspect of a music21 object is retained when Freezing.  So
-objects like `medRen.Ligature`, which aren't supported by most formats, can be
-stored with `FreezeThaw` and then read back again.  Freezing is also much
-faster than most conversion methods.  But there's a big downside: only
-`music21` and `Python` can use the `Thaw` side to get back `Music21Objects`
-(though more information can be brought out of the JSONFreeze format through
-any .json reader).  In fact, there's not even a guarantee that future versions
-of music21 will be able to read a frozen version of a `Stream`.  So the
-advantages and disadvantages of this model definitely need to be kept in mind.
-
-There are two formats that `freezeThaw` can produce: "Pickle" or JSON (for
-JavaScript Object Notation -- essentially a string representation of the
-JavaScript equivalent of a Python dictionary).  
-
-Pickle is a Python-specific
-idea for storing objects.  The `pickle` module stores objects as a text file
-that can't be easily read by non-Python applications; it also isn't guaranteed
-to work across Python versions or even computers.  However, it works well, is
-fast, and is a standard part of python.  
-
-JSON was originally created to pass
-JavaScript objects from a web server to a web browser, but its utility
-(combining the power of XML with the ease of use of objects) has made it a
-growing standard for other languages.  (see
-http://docs.python.org/library/json.html).  Music21 has two implementations of JSON (confusing, no?)
-because we weren't sure and are still not sure which will be best in the long-run: the first approach
-uses explicit lists of attributes that need to be stored and just saves those. This uses a
-homemade set of methods that are specifically tailored for music21; but it misses some things that
-may be important to you.  The second approach uses the the freely distributable
-`jsonpickle` module found in `music21.ext.jsonpickle` (See that folder's
-"license.txt" for copyright information). This approach probably stores more data than
-someone not using music21 or python is likely to want, but can be used to get back an entire
-music21 Stream with no conversion.
-
-Both JSON and Pickle files can be huge, but `freezeThaw` can compress them with
-`gzip` or `ZipFile` and thus they're not that large at all.
-
-Streams need to be run through .setupSerializationScaffold and .teardownSerializationScaffold
-before and after either Pickle or jsonpickle in order to restore all the weakrefs that we use.
-
-The name freezeThaw comes from Perl's implementation of similar methods -- I
-like the idea of thawing something that's frozen; "unpickling" just doesn't
-seem possible.  In any event, I needed a name that wouldn't already
-exist in the Python namespace.
-'''
-
-import codecs
-import copy
-import fractions
-import inspect
-import json
-import os
-import time
-import unittest
-import zlib
-
-from music21 import base
-from music21 import common
-from music21 import derivation
-from music21 import exceptions21
-
-try:
-    from music21.ext import jsonpickle
-except:
-    pass
-
-from music21.ext import six
-
-from music21 import environment
-_MOD = "freezeThaw.py"
-environLocal = environment.Environment(_MOD)
-
-try:
-    import cPickle as pickleMod
-except ImportError:
-    import pickle as pickleMod
-#import pickle as pickleMod
-
-
-#------------------------------------------------------------------------------
-
-
-class FreezeThawException(exceptions21.Music21Exception):
-    pass
-
-#------------------------------------------------------------------------------
-
-
-class StreamFreezeThawBase(object):
-    '''
-    Contains a few methods that are used for both
-    StreamFreezer and StreamThawer
-    '''
-    def __init__(self):
-        self.stream = None
-
-    def getPickleFp(self, directory):
-        if directory == None:
-            raise ValueError
-        # cannot get data from stream, as offsets are broken
-        streamStr = str(time.time())
-        return os.path.join(directory, 'm21-' + common.getMd5(streamStr) + '.p')
-
-    def getJsonFp(self, directory):
-        return self.getPickleFp(directory) + '.json'
-
-    def findAllM21Objects(self, streamObj):
-        '''
-        find all M21 Objects in _elements and _endElements and in nested streams.
-        '''
-        allObjs = []
-        for x in streamObj._elements:
-            allObjs.append(x)
-            if x.isStream:
-                allObjs.extend(self.findAllM21Objects(x))
-        for x in streamObj._endElements:
-            allObjs.append(x)
-            if x.isStream:
-                allObjs.extend(self.findAllM21Objects(x))
-        return allObjs
-
-
-#------------------------------------------------------------------------------
-class StreamFreezer(StreamFreezeThawBase):
-    '''
-    This class is used to freeze a Stream, preparing it for serialization
-    and providing conversion routines.
-
-    In general, use :func:`~music21.converter.freeze`
-    for serializing to a file.
-
-    Use the :func:`~music21.converter.unfreeze` to read from a
-    serialized file
-
-    >>> from music21 import freezeThaw
-
-    >>> s = stream.Stream()
-    >>> s.repeatAppend(note.Note('C4'), 8)
-    >>> temp = [s[n].transpose(n, inPlace=True) for n in range(len(s))]
-
-    >>> sf = freezeThaw.StreamFreezer(s) # provide a Stream at init
-    >>> data = sf.writeStr(fmt='pickle') # pickle is default format
-
-    >>> st = freezeThaw.StreamThawer()
-    >>> st.openStr(data)
-    >>> s = st.stream
-    >>> s.show('t')
-    {0.0} <music21.note.Note C>
-    {1.0} <music21.note.Note D->
-    {2.0} <music21.note.Note D>
-    {3.0} <music21.note.Note E->
-    {4.0} <music21.note.Note E>
-    {5.0} <music21.note.Note F>
-    {6.0} <music21.note.Note G->
-    {7.0} <music21.note.Note G>
-
-    >>> sf2 = freezeThaw.StreamFreezer(s) # do not reuse StreamFreezers
-    >>> data2 = sf2.writeStr(fmt='jsonpickle')
-
-    >>> st2 = freezeThaw.StreamThawer()
-    >>> st2.openStr(data2)
-    >>> s2 = st2.stream
-    >>> s2.show('t')
-    {0.0} <music21.note.Note C>
-    {1.0} <music21.note.Note D->
-    {2.0} <music21.note.Note D>
-    {3.0} <music21.note.Note E->
-    {4.0} <music21.note.Note E>
-    {5.0} <music21.note.Note F>
-    {6.0} <music21.note.Note G->
-    {7.0} <music21.note.Note G>
-    
-    
-    >>> c = corpus.parse('luca/gloria')
-    >>> sf = freezeThaw.StreamFreezer(c)
-    >>> data = sf.writeStr(fmt='pickle')
-
-    >>> st = freezeThaw.StreamThawer()
-    >>> st.openStr(data)
-    >>> s2 = st.stream
-    >>> len(s2.parts[0].measure(7).notes) == 6
-    True
-
-
-
-    >>> sf2 = freezeThaw.StreamFreezer(c) # do not reuse StreamFreezers
-    >>> data2 = sf2.writeStr(fmt='jsonpickle')
-    >>> st2 = freezeThaw.StreamThawer()
-    >>> st2.openStr(data2)
-    >>> s3 = st.stream
-    >>> len(s3.parts[0].measure(7).notes) == 6
-    True
-
-    '''
-    def __init__(self, streamObj=None, fastButUnsafe=False, topLevel = True, streamIds = None):
-        # must make a deepcopy, as we will be altering Sites
-        self.stream = None
-        # clear all sites only if the top level.
-        self.topLevel = topLevel
-        self.streamIds = streamIds
-
-        if streamObj is not None and fastButUnsafe is False:
-            # deepcopy necessary because we mangle sites in the objects
-            # before serialization
-            self.stream = copy.deepcopy(streamObj)
-            #self.stream = streamObj
-        elif streamObj is not None:
-            self.stream = streamObj
-
-    def packStream(self, streamObj = None):
-        '''
-        Prepare the passed in Stream in place, return storage
-        dictionary format.
-
-        >>> s = stream.Stream()
-        >>> n = note.Note('D#4')
-        >>> s.append(n)
-        >>> sf = freezeThaw.StreamFreezer(s)
-        >>> #_DOCS_SHOW sf.packStream()
-        >>> print("{'m21Version': (1, 9, 3), 'stream': <music21.stream.Stream 4391393680>}") #_DOCS_HIDE
-        {'m21Version': (1, 9, 3), 'stream': <music21.stream.Stream 4391393680>}
-        
-        '''
-        # do all things necessary to setup the stream
-        if streamObj is None:
-            streamObj = self.stream
-        self.setupSerializationScaffold(streamObj)
-        storage = {'stream': streamObj, 'm21Version': base.VERSION}
-        return storage
-
-    def setupSerializationScaffold(self, streamObj = None):
-        '''
-        Prepare this stream and all of its contents for pickle/pickling, that
-        is, serializing and storing an object representation on file or as a string.
-
-        The `topLevel` and `streamIdsFound` arguments are used to keep track of recursive calls.
-
-        Note that this is a destructive process: elements contained within this Stream
-        will have their sites cleared of all contents not in the hierarchy
-        of the Streams. Thus, when doing a normal .write('pickle')
-        the Stream is deepcopied before this method is called. The
-        attribute `fastButUnsafe = True` setting of StreamFreezer ignores the destructive
-        effects of these processes and skips the deepcopy.
-
-        >>> from music21 import freezeThaw
-
-        >>> a = stream.Stream()
-        >>> n = note.Note()
-        >>> n.duration.type = "whole"
-        >>> a.repeatAppend(n, 10)
-        >>> sf = freezeThaw.StreamFreezer(a)
-        >>> sf.setupSerializationScaffold()
-        '''
-        if streamObj is None:
-            streamObj = self.stream
-            if streamObj is None:
-                raise FreezeThawException("You need to pass in a stream when creating to work")
-        allEls = streamObj.recurse(restoreActiveSites=False) # might not work when recurse yields...
-        if self.topLevel is True:
-            self.findActiveStreamIdsInHierarchy(streamObj)
-
-        for el in allEls:
-            if el.isVariant:
-                # works like a whole new hierarchy... # no need for deepcopy
-                subSF = StreamFreezer(
-                    el._stream,
-                    fastButUnsafe=True,
-                    streamIds=self.streamIds,
-                    topLevel=False,
-                    )
-                subSF.setupSerializationScaffold()
-            elif el.isSpanner:
-                # works like a whole new hierarchy... # no need for deepcopy
-                subSF = StreamFreezer(
-                    el.spannedElements,
-                    fastButUnsafe=True,
-                    streamIds=self.streamIds,
-                    topLevel=False,
-                    )
-                subSF.setupSerializationScaffold()
-            elif el.isStream:
-                self.removeStreamStatusClient(el)  # removing seems to create problems for jsonPickle with Spanners
-
-        self.removeStreamStatusClient(streamObj) # removing seems to create problems for jsonPickle with Spanners
-        self.setupStoredElementOffsetTuples(streamObj)
-
-        if self.topLevel is True:
-            self.recursiveClearSites(streamObj)
-
-    def removeStreamStatusClient(self, streamObj):
-        '''
-        if s is a stream then 
-        
-        s.streamStatus._client is s
-        
-        this can be hard to pickle, so this method removes the streamStatus._client from the
-        streamObj (not recursive).  Called by setupSerializationScaffold.
-        '''
-        if hasattr(streamObj, 'streamStatus'):
-            streamObj.streamStatus._client = None
-
-
-    def recursiveClearSites(self, startObj):
-        '''
-        recursively clear all sites, including activeSites, taking into account
-        that spanners and variants behave differently.
-        
-        Called by setupSerializationScaffold.
-
-        To be run after setupStoredElementOffsetTuples() has been run
-        
-        >>> n = note.Note('D#4')
-        >>> len(n.sites)
-        1
-        >>> s = stream.Stream()
-        >>> s.id = 'stream s'
-        >>> s.insert(10, n)
-        >>> len(n.sites)
-        2
-        >>> t = stream.Stream()
-        >>> t.insert(20, n)
-        >>> t.id = 'stream t'
-        >>> len(n.sites)
-        3
-
-        >>> n.getOffsetBySite(s)
-        10.0
-        >>> n.getOffsetBySite(t)
-        20.0
-        
-        >>> sf = freezeThaw.StreamFreezer()
-        
-        This will remove n from s but leave the rest of the sites intact...
-        
-        >>> sf.setupStoredElementOffsetTuples(s)
-        >>> len(n.sites)
-        2
-        >>> n.getOffsetBySite(s)
-        Traceback (most recent call last):
-        SitesException: The object <music21.note.Note D#> is not in site <music21.stream.Stream stream s>.
-        >>> n.getOffsetBySite(t)
-        20.0
-        
-
-        
-        After recursiveClearSites n will be not know its location anywhere...
-        
-        >>> sf.recursiveClearSites(s)
-        >>> len(n.sites)
-        0
-        >>> n.getOffsetBySite(t)
-        Traceback (most recent call last):
-        SitesException: The object <music21.note.Note D#> is not in site <music21.stream.Stream stream t>.
-        
-        This leaves n and t in strange positions, because n is in t.elements still....
-        
-        >>> n in t.elements
-        True
-        
-        This predicament is why when the standard freezeThaw call is made, what is frozen is a 
-        deepcopy of the Stream so that nothing is left in an unusable position
-        
-        
-        '''
-        if hasattr(startObj, '_storedElementOffsetTuples'):
-            seot = startObj._storedElementOffsetTuples
-            for el, unused_offset in seot:
-                if el.isStream:
-                    self.recursiveClearSites(el)
-                if el.isSpanner:
-                    self.recursiveClearSites(el.spannedElements)
-                if el.isVariant:
-                    self.recursiveClearSites(el._stream)
-                if hasattr(el, '_derivation'):
-                    el._derivation = derivation.Derivation() #reset
-
-                el.sites.clear()
-                el.activeSite = None
-            startObj._derivation = derivation.Derivation() #reset
-            startObj.sites.clear()
-            startObj.activeSite = None
-
-    def setupStoredElementOffsetTuples(self, streamObj):
-        '''
-        move all elements from ._elements and ._endElements
-        to a new attribute ._storedElementOffsetTuples
-        which contains a list of tuples of the form
-        (el, offset or 'end').
-        
-        Called by setupSerializationScaffold.
-
-        >>> s = stream.Measure()
-        >>> n1 = note.Note("C#")
-        >>> n2 = note.Note("E-")
-        >>> bl1 = bar.Barline()
-        >>> s.insert(0.0, n1)
-        >>> s.insert(1.0, n2)
-        >>> s.storeAtEnd(bl1)
-
-        >>> sfreeze = freezeThaw.StreamFreezer()
-        >>> sfreeze.setupStoredElementOffsetTuples(s)
-        >>> s._elements, s._endElements
-        ([], [])
-        >>> s._storedElementOffsetTuples
-        [(<music21.note.Note C#>, 0.0), (<music21.note.Note E->, 1.0), (<music21.bar.Barline style=regular>, 'end')]
-        >>> n1.getOffsetBySite(s)
-        Traceback (most recent call last):
-        SitesException: The object <music21.note.Note C#> is not in site <music21.stream.Measure 0 offset=0.0>.
-
-        Trying it again, but now with substreams:
-
-        >>> s2 = stream.Measure()
-        >>> n1 = note.Note("C#")
-        >>> n2 = note.Note("E-")
-        >>> bl1 = bar.Barline()
-        >>> v1 = stream.Voice()
-        >>> n3 = note.Note("F#")
-        >>> v1.insert(2.0, n3)
-        >>> s2.insert(0.0, n1)
-        >>> s2.insert(1.0, n2)
-        >>> s2.storeAtEnd(bl1)
-        >>> s2.insert(2.0, v1)
-        >>> sfreeze.setupStoredElementOffsetTuples(s2)
-
-        >>> v1._storedElementOffsetTuples
-        [(<music21.note.Note F#>, 2.0)]
-        >>> s2._storedElementOffsetTuples
-        [(<music21.note.Note C#>, 0.0), (<music21.note.Note E->, 1.0), (<music21.stream.Voice ...>, 2.0), (<music21.bar.Barline style=regular>, 'end')]
-        >>> s2._storedElementOffsetTuples[2][0] is v1
-        True
-
-        '''
-        if hasattr(streamObj, '_storedElementOffsetTuples'):
-            # in the case of a spanner storing a Stream, like a StaffGroup
-            # spanner, it is possible that the elements have already been
-            # transferred.  Thus, we should NOT do this again!
-            return
-
-        storedElementOffsetTuples = []
-        for e in streamObj._elements:
-            elementTuple = (e, e.getOffsetBySite(streamObj))
-            storedElementOffsetTuples.append(elementTuple)
-            if e.isStream:
-                self.setupStoredElementOffsetTuples(e)
-            e.removeLocationBySite(streamObj)
-#                e._preFreezeId = id(e)
-#                elementDict[id(e)] = e.getOffsetBySite(s)
-        for e in streamObj._endElements:
-            elementTuple = (e, 'end')
-            storedElementOffsetTuples.append(elementTuple)
-            if e.isStream:
-                self.setupStoredElementOffsetTuples(e)
-            e.removeLocationBySite(streamObj)
-
-        streamObj._storedElementOffsetTuples = storedElementOffsetTuples
-        streamObj._elements = []
-        streamObj._endElements = []
-        streamObj._elementsChanged()
-
-    def findActiveStreamIdsInHierarchy(self, hierarchyObject = None, getSpanners=True, getVariants=True):
-        '''
-        Return a list of all Stream ids anywhere in the hierarchy.
-
-        Stores them in .streamIds.
-
-        if hierarchyObject is None, uses self.stream.
-
-
-        >>> sc = stream.Score()
-        >>> p1 = stream.Part()
-        >>> p2 = stream.Part()
-        >>> m1 = stream.Measure()
-        >>> v1 = stream.Voice()
-        >>> m1.insert(0, v1)
-        >>> p2.insert(0, m1)
-        >>> sc.insert(0, p1)
-        >>> sc.insert(0, p2)
-        >>> shouldFindIds = [id(sc), id(p1), id(p2), id(m1), id(v1)]
-
-        fastButUnsafe is needed because it does not make a deepcopy
-        and thus lets you compare ids before and after.
-
-        >>> sf = freezeThaw.StreamFreezer(sc, fastButUnsafe=True)
-        >>> foundIds = sf.findActiveStreamIdsInHierarchy()
-        >>> for thisId in shouldFindIds:
-        ...     if thisId not in foundIds:
-        ...         raise Exception("Missing Id")
-        >>> for thisId in foundIds:
-        ...     if thisId not in shouldFindIds:
-        ...         raise Exception("Additional Id Found")
-
-        Spanners are included unless getSpanners is False
-
-        >>> staffGroup = layout.StaffGroup([p1, p2])
-        >>> sc.insert(0, staffGroup)
-
-        :class:`~music21.layout.StaffGroup` is a spanner, so
-        it should be found
-
-        >>> sf2 = freezeThaw.StreamFreezer(sc, fastButUnsafe=True)
-        >>> foundIds = sf2.findActiveStreamIdsInHierarchy()
-
-        But you won't find the id of the spanner itself in
-        the foundIds:
-
-        >>> id(staffGroup) in foundIds
-        False
-
-        instead it's the id of the storage object:
-
-        >>> staffGroup.getSpannerStorageId() in foundIds
-        True
-
-        Variants are treated similarly:
-
-        >>> s = stream.Stream()
-        >>> m = stream.Measure()
-        >>> m.append(note.Note(type="whole"))
-        >>> s.append(m)
-
-        >>> s2 = stream.Stream()
-        >>> m2 = stream.Measure()
-        >>> n2 = note.Note("D#4")
-        >>> n2.duration.type = "whole"
-        >>> m2.append(n2)
-        >>> s2.append(m2)
-        >>> v = variant.Variant(s2)
-        >>> s.insert(0, v)
-        >>> sf = freezeThaw.StreamFreezer(s, fastButUnsafe=True)
-        >>> allIds = sf.findActiveStreamIdsInHierarchy()
-        >>> len(allIds)
-        4
-        >>> for streamElement in [s, m, m2, v._stream]:
-        ...    if id(streamElement) not in allIds:
-        ...        print("this should not happen...", allIds, id(streamElement))
-
-        N.B. with variants:
-
-        >>> id(s2) == id(v._stream)
-        False
-
-        The method also sets self.streamIds to the returned list:
-
-        >>> sf.streamIds is allIds
-        True
-        '''
-        if hierarchyObject is None:
-            streamObj = self.stream
-        else:
-            streamObj = hierarchyObject
-        streamsFound = streamObj._yieldElementsDownward(streamsOnly=True,
-                       restoreActiveSites=False)
-        streamIds = [id(s) for s in streamsFound]
-
-        if getSpanners is True:
-            spannerBundle = streamObj.spannerBundle
-            streamIds += spannerBundle.getSpannerStorageIds()
-
-        if getVariants is True:
-            for el in streamObj.recurse():
-                if el.isVariant is True:
-                    streamIds += self.findActiveStreamIdsInHierarchy(el._stream)
-
-        # should not happen that there are duplicates, but possible with spanners...
-        # Python's uniq value...
-        streamIds = list(set(streamIds))
-
-        self.streamIds = streamIds
-        return streamIds
-
-
-    #---------------------------------------------------------------------------
-    def parseWriteFmt(self, fmt):
-        '''Parse a passed-in write format
-
-        >>> from music21 import freezeThaw
-
-        >>> sf = freezeThaw.StreamFreezer()
-        >>> sf.parseWriteFmt(None)
-        'pickle'
-        >>> sf.parseWriteFmt('JSON')
-        'jsonpickle'
-        '''
-        if fmt is None: # this is the default
-            return 'pickle'
-        fmt = fmt.strip().lower()
-        if fmt in ['p', 'pickle']:
-            return 'pickle'
-        elif fmt in ['jsonpickle', 'json']:
-            return 'jsonpickle'
-        #elif fmt in ['jsonnative']:
-        #    return 'jsonnative'
-        else:
-            return 'pickle'
-
-    def write(self, fmt='pickle', fp=None, zipType=None, **keywords):
-        '''
-        For a supplied Stream, write a serialized version to
-        disk in either 'pickle' or 'jsonpickle' format and
-        return the filepath to the file.
-
-        jsonpickle is the better format for transporting from
-        one computer to another, but slower and may have some bugs.
-        
-        If zipType == 'zlib' then zlib compression is done after serializing.
-        No other compression types are currently supported. 
-        '''
-        if zipType not in (None, 'zlib'):
-            raise FreezeThawException("Cannot zip files except zlib...")
-
-        fmt = self.parseWriteFmt(fmt)
-
-        if fp is None:
-            directory = environLocal.getRootTempDir()
-            if fmt.startswith('json'):
-                fp = self.getJsonFp(directory)
-            else:
-                fp = self.getPickleFp(directory)
-        elif os.sep in fp: # assume its a complete path
-            fp = fp
-        else:
-            directory = environLocal.getRootTempDir()
-            fp = os.path.join(directory, fp)
-
-        storage = self.packStream(self.stream)
-
-        environLocal.printDebug(['writing fp', fp])
-
-        if fmt == 'pickle':
-            # a negative protocol value will get the highest protocal;
-            # this is generally desirable
-            # packStream() returns a storage dictionary
-            pickleString = pickleMod.dumps(storage, protocol=-1)
-            if zipType == 'zlib':
-                pickleString = zlib.compress(pickleString)
-            with open(fp, 'wb') as f: # binary
-                f.write(pickleString)
-        elif fmt == 'jsonpickle':
-            data = jsonpickle.encode(storage, **keywords)
-            if zipType == 'zlib':
-                data = zlib.compress(data)
-            with open(fp, 'w') as f:
-                f.write(data)
-
-        else:
-            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
-
-        ## must restore the passed-in Stream
-        #self.teardownStream(self.stream)
-        return fp
-
-    def writeStr(self, fmt=None, **keywords):
-        '''
-        Convert the object to a pickled/jsonpickled string
-        and return the string
-        '''
-        fmt = self.parseWriteFmt(fmt)
-
-        storage = self.packStream(self.stream)
-
-        if fmt == 'pickle':
-            out = pickleMod.dumps(storage, protocol=-1)
-        elif fmt == 'jsonpickle':
-            out = jsonpickle.encode(storage, **keywords)
-        else:
-            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
-
-        #self.teardownStream(self.stream)
-        return out
-
-#    def findWeakRef(self, streamObj, memo=None):
-#        '''
-#        utility function for debugging.  Finds all weakrefs in the hierarchy and returns
-#        a list of tuples of the weakref and the name of the attribute, and the object
-#
-#
-#        >>> n = note.Note()
-#        >>> s = stream.Stream()
-#        >>> s2 = stream.Stream()
-#        >>> s.insert(0, n)
-#        >>> s2.insert(0, n)
-#        >>> ft = freezeThaw.StreamFreezer()
-#        >>> ft.findWeakRef(s)
-#        '''
-#        weakRefList = []
-#        if memo is None:
-#            memo = {}
-#        for x in dir(streamObj):
-#            xValue = getattr(streamObj, x)
-#            if id(xValue) in memo:
-#                continue
-#            else:
-#                memo[id(xValue)] = True
-#            if common.isWeakref(xValue):
-#                weakRefList.append(x, xValue, streamObj)
-#            if common.isIterable(xValue):
-#                for i in xValue:
-#                    if id(i) in memo:
-#                        pass
-#                    else:
-#                        memo[id(i)] = True
-#                        weakRefList.extend(self.findWeakRef(i), memo)
-#            else:
-#                weakRefList.extend(self.findWeakRef(xValue), memo)
-#        return weakRefList
-
-
-class StreamThawer(StreamFreezeThawBase):
-    '''
-    This class is used to thaw a data string into a Stream
-
-    In general user :func:`~music21.converter.parse` to read from a
-    serialized file.
-
-    >>> from music21 import freezeThaw
-
-    >>> s = stream.Stream()
-    >>> s.repeatAppend(note.Note('C4'), 8)
-    >>> temp = [s[n].transpose(n, inPlace=True) for n in range(len(s))]
-
-    >>> sf = freezeThaw.StreamFreezer(s) # provide a Stream at init
-    >>> data = sf.writeStr(fmt='pickle') # pickle is default format
-
-    >>> sfOut = freezeThaw.StreamThawer()
-    >>> sfOut.openStr(data)
-    >>> s = sfOut.stream
-    >>> s.show('t')
-    {0.0} <music21.note.Note C>
-    {1.0} <music21.note.Note D->
-    {2.0} <music21.note.Note D>
-    {3.0} <music21.note.Note E->
-    {4.0} <music21.note.Note E>
-    {5.0} <music21.note.Note F>
-    {6.0} <music21.note.Note G->
-    {7.0} <music21.note.Note G>
-
-
-#    >>> c = corpus.parse('luca/gloria')
-#    >>> sf = freezeThaw.StreamFreezer(c)
-#    >>> data = sf.writeStr(fmt='jsonpickle')
-#
-#    >>> sfOut = freezeThaw.StreamThawer()
-#    >>> sfOut.openStr(data)
-#    >>> s = sfOut.stream
-#    >>> #s.show('t')
-    '''
-    def __init__(self):
-        self.stream = None
-
-    def teardownSerializationScaffold(self, streamObj = None):
-        '''
-        After rebuilding this Stream from pickled storage, prepare this as a normal `Stream`.
-
-        If streamObj is None, runs it on the embedded stream
-
-        >>> from music21 import freezeThaw
-
-
-        >>> a = stream.Stream()
-        >>> n = note.Note()
-        >>> n.duration.type = "whole"
-        >>> a.repeatAppend(n, 10)
-        >>> sf = freezeThaw.StreamFreezer(a)
-        >>> sf.setupSerializationScaffold()
-
-        >>> st = freezeThaw.StreamThawer()
-        >>> st.teardownSerializationScaffold(a)
-        '''
-        if streamObj is None:
-            streamObj = self.stream
-            if streamObj is None:
-                raise FreezeThawException("You need to pass in a stream when creating to work")
-
-        storedAutoSort = streamObj.autoSort
-        streamObj.autoSort = False
-
-        self.restoreElementsFromTuples(streamObj)
-        streamObj.sites.add(None, 0.0)
-
-        self.restoreStreamStatusClient(streamObj) # removing seems to create problems for jsonPickle with Spanners
-        
-        allEls = self.findAllM21Objects(streamObj)
-
-        for e in allEls:
-            if e.isVariant:
-#                # works like a whole new hierarchy... # no need for deepcopy
-                subSF = StreamThawer()
-                subSF.teardownSerializationScaffold(e._stream)
-                e._stream._elementsChanged()
-                e._cache = {}
-                #for el in e._stream.flat:
-                #    print el, el.offset, el.sites.siteDict
-            elif e.isSpanner:
-                subSF = StreamThawer()
-                subSF.teardownSerializationScaffold(e.spannedElements)
-                e.spannedElements._elementsChanged()
-                e._cache = {}
-            elif e.isStream: 
-                self.restoreStreamStatusClient(e) # removing seems to create problems for jsonPickle with Spanners
-
-            #self.thawIds(e)
-            #e.wrapWeakref()
-
-        # restore to whatever it was
-        streamObj.autoSort = storedAutoSort
-        streamObj._elementsChanged()
-
-    def restoreElementsFromTuples(self, streamObj):
-        '''
-        Take a Stream with elements and offsets stored in
-        a list of tuples (element, offset or 'end') at
-        _storedElementOffsetTuples
-        and restore it to the ._elements and ._endElements lists
-        in the proper locations:
-
-
-        >>> s = stream.Measure()
-        >>> s._elements, s._endElements
-        ([], [])
-
-        >>> n1 = note.Note("C#")
-        >>> n2 = note.Note("E-")
-        >>> bl1 = bar.Barline()
-        >>> tupleList = [(n1, 0.0), (n2, 1.0), (bl1, 'end')]
-        >>> s._storedElementOffsetTuples = tupleList
-
-        >>> sthaw = freezeThaw.StreamThawer()
-        >>> sthaw.restoreElementsFromTuples(s)
-        >>> s.show('text')
-        {0.0} <music21.note.Note C#>
-        {1.0} <music21.note.Note E->
-        {2.0} <music21.bar.Barline style=regular>
-        >>> s._endElements
-        [<music21.bar.Barline style=regular>]
-        >>> s[1].getOffsetBySite(s)
-        1.0
-
-        Trying it again, but now with substreams:
-
-        >>> s2 = stream.Measure()
-        >>> v1 = stream.Voice()
-        >>> n3 = note.Note("F#")
-        >>> v1._storedElementOffsetTuples = [(n3, 2.0)]
-        >>> tupleList = [(n1, 0.0), (n2, 1.0), (bl1, 'end'), (v1, 2.0)]
-        >>> s2._storedElementOffsetTuples = tupleList
-        >>> sthaw.restoreElementsFromTuples(s2)
-        >>> s2.show('text')
-        {0.0} <music21.note.Note C#>
-        {1.0} <music21.note.Note E->
-        {2.0} <music21.stream.Voice ...>
-            {2.0} <music21.note.Note F#>
-        {5.0} <music21.bar.Barline style=regular>
-        '''
-        if hasattr(streamObj, '_storedElementOffsetTuples'):
-            for e, offset in streamObj._storedElementOffsetTuples:
-                if offset != 'end':
-                    streamObj._insertCore(offset, e)
-                else:
-                    streamObj._storeAtEndCore(e)
-                # add a None site as well...
-                e.sites.add(None, 0.0)
-            del(streamObj._storedElementOffsetTuples)
-            streamObj._elementsChanged()
-
-        for subElement in streamObj:
-            if subElement.isStream is True:
-                # note that the elements may have already been restored
-                # if the spanner stores a part or something in the Stream
-                # for instance in a StaffGroup object
-                self.restoreElementsFromTuples(subElement)
-
-    def restoreStreamStatusClient(self, streamObj):
-        if hasattr(streamObj, 'streamStatus'):
-            streamObj.streamStatus._client = streamObj
-
-
-    def unpackStream(self, storage):
-        '''
-        Convert from storage dictionary to Stream.
-        '''
-        version = storage['m21Version']
-        if version != base.VERSION:
-            environLocal.warn('this pickled file is out of date and may not function properly.')
-        streamObj = storage['stream']
-
-        self.teardownSerializationScaffold(streamObj)
-        return streamObj
-
-    def parseOpenFmt(self, storage):
-        '''Look at the file and determine the format
-        '''
-        if (six.PY3 and isinstance(storage, bytes)):
-            if storage.startswith(b'{"'): # was m21Version": {"py/tuple" but order of dict may change
-                return 'jsonpickle'
-            else:
-                return 'pickle'
-        else:            
-            if storage.startswith('{"'): # was m21Version": {"py/tuple" but order of dict may change
-                return 'jsonpickle'
-            else:
-                return 'pickle'
-
-    def open(self, fp, zipType=None):
-        '''
-        For a supplied file path to a pickled stream, unpickle
-        '''
-        if os.sep in fp: # assume it's a complete path
-            fp = fp
-        else:
-            directory = environLocal.getRootTempDir()
-            fp = os.path.join(directory, fp)
-
-        f = open(fp, 'rb')
-        fileData = f.read() # TODO: do not read entire file
-        f.close()
-
-        fmt = self.parseOpenFmt(fileData)
-        if fmt == 'pickle':
-            #environLocal.printDebug(['opening fp', fp])
-            f = open(fp, 'rb')
-            if zipType is None:
-                storage = pickleMod.load(f)
-            elif zipType == 'zlib':
-                compressedString = f.read()
-                uncompressed = zlib.decompress(compressedString)
-                storage = pickleMod.loads(uncompressed)
-            else:
-                raise FreezeThawException("Unknown zipType %s" % zipType)
-            f.close()
-        elif fmt == 'jsonpickle':
-            f = open(fp, 'r')
-            data = f.read()
-            f.close()
-            storage = jsonpickle.decode(data)
-        else:
-            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
-
-        self.stream = self.unpackStream(storage)
-
-    def openStr(self, fileData, pickleFormat = None):
-        '''
-        Take a string representing a Frozen(pickled/jsonpickled)
-        Stream and convert it to a normal Stream.
-
-        if format is None then the format is automatically
-        determined from the string contents.
-        '''
-        if pickleFormat is not None:
-            fmt = pickleFormat
-        else:
-            fmt = self.parseOpenFmt(fileData)
-
-        if fmt == 'pickle':
-            storage = pickleMod.loads(fileData)
-        elif fmt == 'jsonpickle':
-            storage = jsonpickle.decode(fileData)
-        else:
-            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
-        environLocal.printDebug("StreamThawer:openStr: storage is: %s" % storage)
-        self.stream = self.unpackStream(storage)
-
-#--------------------------------------------------------------------------------
-
-class JSONFreezerException(FreezeThawException):
-    pass
-class JSONThawerException(FreezeThawException):
-    pass
-
-class JSONFreezeThawBase(object):
-    '''
-    Shared functionality for JSONFreeze and JSONThaw
-    '''
-    # a list of attributes to store.  Also takes the following special attributes
-    # __AUTO_GATHER__ : place all autoGatherAttributes here
-    # __INHERIT__ : place all attributes from the inherited class here # NOT YET!
-    storedClassAttributes = {
-        'music21.base.Music21Object' : [
-            '_duration', '_priority', 'offset',                
-            ],
-        'music21.beam.Beam': [
-            'type', 'direction', 'independentAngle', 'number',
-            ],
-        'music21.beam.Beams': [
-            'beamsList', 'feathered',
-            ],
-        'music21.duration.DurationUnit': [
-            '__AUTO_GATHER__',
-            ],
-        'music21.duration.Duration': [
-            '__AUTO_GATHER__',
-            ],
-        'music21.editorial.NoteEditorial': [
-            'color', 'misc', 'comment',
-            ],
-        'music21.editorial.Comment': [
-            '__AUTO_GATHER__',
-            ],
-        'music21.key.KeySignature': [
-            'sharps', 'mode', '_alteredPitches',
-            ],
-        'music21.metadata.primitives.Contributor': [
-            '_role', 'relevance', '_names', '_dateRange',
-            ],
-        'music21.metadata.primitives.Date': [
-            'year', 'month', 'day', 'hour', 'minute', 'second',
-            'yearError', 'monthError', 'dayError', 'hourError', 'minuteError',
-            'secondError',
-            ],
-        'music21.metadata.primitives.DateSingle': [
-            '_relevance',  '_dataError', '_data',
-            ],
-        'music21.metadata.Metadata': [
-            '_date', '_imprint', '_copyright', '_workIds', '_urls',
-            '_contributors',
-            ],
-        'music21.metadata.bundles.MetadataBundle': [
-            '_metadataEntries', 'name',
-            ],
-        'music21.metadata.bundles.MetadataEntry': [
-            '_sourcePath', '_number', '_metadataPayload',
-            ],
-        'music21.metadata.RichMetadata': [
-            '__INHERIT__',
-            'ambitus',
-            'keySignatures',
-            'keySignatureFirst',
-            'noteCount',
-            'pitchHighest',
-            'pitchLowest',
-            'quarterLength',
-            'tempos',
-            'tempoFirst',
-            'timeSignatureFirst',
-            'timeSignatures',
-            ],
-        'music21.metadata.primitives.Text': [
-            '_data', '_language',
-            ],
-        'music21.meter.TimeSignature': [
-            'ratioString',
-            ],
-        'music21.note.Lyric': [
-            'text', 'syllabic', 'number', 'identifier',
-            ],
-        'music21.note.GeneralNote': [
-            '__INHERIT__', '_editorial', 'lyrics', 'expressions', 'articulations',
-            'tie',
-            ],
-        'music21.note.NotRest': [
-            '__INHERIT__', '_notehead', '_noteheadFill',
-            '_noteheadParenthesis', '_stemDirection', '_volume',
-            ],
-        'music21.note.Note': [
-            '__INHERIT__', 'pitch', 'beams',
-            ],
-        'music21.pitch.Accidental': [
-            '__AUTO_GATHER__',              
-            ],
-        
-        'music21.pitch.Pitch': [
-            '_accidental', '_microtone', '_octave', '_step', 
-            ],
-        'music21.stream.Stream': ['__INHERIT__',
-                                  '_atSoundingPitch',
-                                  '_elements',
-                                  '_endElements',
-                                  ],
-        'music21.tie.Tie': [
-                            'type', 'style'
-                            ],
-        'music21.volume.Volume': [
-                                  '_velocity'
-                                  ],
-        }
-
-    postClassCreateCall = {
-        #'music21.meter.TimeSignature': ('ratioChanged',),
-        }
-
-    def __init__(self, storedObject=None):
-        self.storedObject = storedObject
-        if storedObject is not None:
-            self.className = '.'.join((
-                storedObject.__class__.__module__,
-                storedObject.__class__.__name__,
-                ))
-        else:
-            self.className = None
-
-    def music21ObjectFromString(self, idStr):
-        '''
-        Given a stored string during JSON serialization, return an object.
-        This method effectively converts a string class specification into
-        a vanilla instance ready for specialization via stored data attributes.
-
-        A subclass that overrides this method will have access to all
-        modules necessary to create whatever objects necessary.
-
-
-        >>> jss = freezeThaw.JSONFreezer()
-        >>> n = jss.music21ObjectFromString('note.Note')
-        >>> n
-        <music21.note.Note C>
-
-        One can begin with "music21." if you'd like:
-
-        >>> d = jss.music21ObjectFromString('music21.duration.Duration')
-        >>> d
-        <music21.duration.Duration 0.0>
-
-        Undefined classes give a JSONFreezerException
-
-        >>> jss.music21ObjectFromString('blah.NotAClass')
-        Traceback (most recent call last):
-        JSONFreezerException: Cannot generate a new object from blah.NotAClass
-        '''
-        import music21
-        idStrOrig = idStr
-        if idStr.startswith('music21.'):
-            idStr = idStr[8:]
-        elif idStr.startswith("<class 'music21.") and idStr.endswith("'>"):
-            # old style JSON not used anymore:
-            # changes <class 'music21.metadata.RichMetadata'> to
-            # metadata.RichMetadata
-            idStr = idStr[16:]
-            idStr = idStr[0:len(idStr)-2]
-
-        idStrSplits = idStr.split('.')
-        lastInspect = music21
-        for thisMod in idStrSplits:
-            try:
-                nextMod = getattr(lastInspect, thisMod)
-            except AttributeError:
-                raise JSONFreezerException("Cannot generate a new object from %s" % idStrOrig)
-            if inspect.isclass(nextMod) is True:
-                lastInspect = nextMod()
-            elif inspect.ismodule(nextMod) is True:
-                lastInspect = nextMod
-            else:
-                raise JSONFreezerException("All the parts of %s must refer to modules or classes" % idStrOrig)
-
-        return lastInspect
-
-    def fullyQualifiedClassFromObject(self, obj):
-        '''
-        return a fullyQualified class name from an object.
-
-        for Music21Objects you can just do: ``obj.fullyQualifiedClasses[0]``, but
-        this works on any object (such as Durations which aren't Music21Objects)
-
-
-        >>> d = duration.DurationUnit()
-        >>> jsbase = freezeThaw.JSONFreezeThawBase()
-        >>> jsbase.fullyQualifiedClassFromObject(d)
-        'music21.duration.DurationUnit'
-
-        Works on class objects as well:
-
-        >>> dclass = duration.DurationUnit
-        >>> jsbase.fullyQualifiedClassFromObject(dclass)
-        'music21.duration.DurationUnit'
-        '''
-        if inspect.isclass(obj):
-            return obj.__module__ + '.' + obj.__name__
-        else:
-            c = obj.__class__
-            return c.__module__ + '.' + c.__name__
-
-class JSONFreezer(JSONFreezeThawBase):
-    '''
-    Class that provides JSON output from an object (whether
-    Music21Object or other).
-
-
-    >>> n = note.Note("C#4")
-    >>> jsonF = freezeThaw.JSONFreezer(n)
-    >>> jsonF.storedObject
-    <music21.note.Note C#>
-    >>> jsonF.className
-    'music21.note.Note'
-    '''
-    def __init__(self, storedObject=None):
-        JSONFreezeThawBase.__init__(self, storedObject)
-    #---------------------------------------------------------------------------
-    # override these methods for json functionality
-
-    def autoGatherAttributes(self):
-        '''
-        Gather just the instance data members that are proceeded by an underscore.
-
-        Returns a list of those data members
-
-        ::
-
-            >>> n = note.Note()
-            >>> jss = freezeThaw.JSONFreezer(n)
-            >>> for attr in jss.autoGatherAttributes():
-            ...     attr
-            ...
-            '_activeSite'
-            '_activeSiteId'
-            '_duration'
-            '_editorial'
-            '_idLastDeepCopyOf'
-            '_notehead'
-            '_noteheadFill'
-            '_noteheadParenthesis'
-            '_priority'
-            '_stemDirection'
-            '_volume'
-
-        '''
-        result = set()
-        if self.storedObject is None:
-            return []
-        # names that we always do not need
-        excludedNames = [
-            '_classes',
-            '_fullyQualifiedClasses',
-            '_derivation',
-            '_DOC_ATTR',
-            '_DOC_ORDER',
-            ]
-
-        for attr in inspect.classify_class_attrs(type(self.storedObject)):
-            if attr.kind == 'data' and inspect.ismemberdescriptor(attr.object):
-                if attr.name not in excludedNames and \
-                    attr.name.startswith('_') and \
-                    not attr.name.startswith('__'):
-                    result.add(attr.name)
-            else:
-                excludedNames.append(attr.name)
-        for name in dir(self.storedObject):
-            if not name.startswith('_') or name.startswith('__'):
-                continue
-            elif name in excludedNames:
-                continue
-            attr = getattr(self.storedObject, name)
-            if inspect.ismethod(attr) or \
-                inspect.isfunction(attr) or  \
-                inspect.isroutine(attr):
-                continue
-            result.add(name)
-
-#        # get class names that exclude instance names
-#        # these names will be rejected in final accumulation
-#        classNames = []
-#        for bundle in inspect.classify_class_attrs(obj.__class__):
-#            if (bundle.name.startswith('_') and not
-#                bundle.name.startswith('__')):
-#                classNames.append(bundle.name)
-#        #environLocal.printDebug(['classNames', classNames])
-#        for name in dir(obj):
-#            if name.startswith('_') and not name.startswith('__'):
-#                attr = getattr(obj, name)
-#                #environLocal.printDebug(['inspect.isroutine()', attr, inspect.isroutine(attr)])
-#                if (not inspect.ismethod(attr) and not
-#                    inspect.isfunction(attr) and not inspect.isroutine(attr)):
-#                    # class names stored are class attrs, not needed for
-#                    # reinstantiation
-#                    if name not in classNames and name not in exclude:
-#                        # store the name, not the attr
-#                        post.append(name)
-
-        result = sorted(result)
-        return result
-
-    def jsonAttributes(self, autoGather=True):
-        '''
-        Define all attributes of this object that should be JSON serialized for storage and re-instantiation. Attributes that name basic
-        Python objects or :class:`~music21.freezeThaw.JSONFreezer` subclasses,
-        or dictionaries or lists that contain Python objects or :class:`~music21.freezeThaw.JSONFreezer` subclasses, can be provided.
-
-        Should be overridden in subclasses.
-
-        For an object which does not define this, just returns all the _underscore attributes:
-
-        >>> ed = editorial.NoteEditorial()
-        >>> jsf = freezeThaw.JSONFreezer(ed)
-        >>> jsf.jsonAttributes()
-        ['color', 'misc', 'comment']
-
-        >>> l = note.Lyric()
-        >>> jsf = freezeThaw.JSONFreezer(l)
-        >>> jsf.jsonAttributes()
-        ['text', 'syllabic', 'number', 'identifier']
-
-        Has autoGatherAttributes and others:
-
-        >>> gn = note.GeneralNote()
-        >>> jsf = freezeThaw.JSONFreezer(gn)
-        >>> jsf.jsonAttributes()
-        ['_duration', '_priority', 'offset', '_editorial', 'lyrics', 'expressions', 'articulations', 'tie']
-        '''
-        if self.storedObject is None:
-            return []
-
-        attributeList = []
-        if hasattr(self.storedObject, 'fullyQualifiedClasses'):
-            fqClassList = self.storedObject.fullyQualifiedClasses
-        else: # same thing...
-            fqClassList = [self.fullyQualifiedClassFromObject(x) for x in self.storedObject.__class__.mro()]
-
-        for i, thisClass in enumerate(fqClassList):
-            inheritFrom = i + 1
-            if thisClass in self.storedClassAttributes:
-                attributeList = self.storedClassAttributes[thisClass]
-                while "__INHERIT__" in attributeList:
-                    inheritMarkerIndex = attributeList.index("__INHERIT__")
-                    attributeList2 = attributeList[0:inheritMarkerIndex]
-                    inheritClass = fqClassList[inheritFrom]
-                    inheritFrom += 1
-                    inheritAttributes = self.storedClassAttributes[inheritClass]
-                    attributeList2.extend(inheritAttributes)
-                    if inheritMarkerIndex != len(attributeList) - 1:
-                        attributeList2.extend(attributeList[inheritMarkerIndex+1:])
-                    attributeList = attributeList2
-
-                if "__AUTO_GATHER__" in attributeList:
-                    autoGathered = self.autoGatherAttributes()
-                    # slow way of doing this.
-                    autoGatherMarkerIndex = attributeList.index("__AUTO_GATHER__")
-                    attributeList2 = attributeList[0:autoGatherMarkerIndex]
-                    attributeList2.extend(autoGathered)
-                    if autoGatherMarkerIndex != len(attributeList) - 1:
-                        attributeList2.extend(attributeList[autoGatherMarkerIndex+1:])
-                    attributeList = attributeList2
-                return attributeList
-        if attributeList == [] and autoGather is True:
-            return self.autoGatherAttributes()
-
-
-    def canBeFrozen(self, possiblyFreezeable):
-        '''
-        Returns True or False if this attribute can
-        be frozen in a way that
-        is stronger than just storing the repr of it.
-
-
-        >>> jsf = freezeThaw.JSONFreezer()
-        >>> jsf.canBeFrozen(note.Note())
-        True
-        >>> jsf.canBeFrozen(345)
-        False
-        >>> jsf.canBeFrozen(None)
-        False
-
-        Lists and Tuples and Dicts return False, but they
-        are not just stored as __repr__, don't worry...
-
-        >>> jsf.canBeFrozen([7,8])
-        False
-        '''
-        if possiblyFreezeable is None:
-            return False
-        if hasattr(possiblyFreezeable, '_jsonFreezer') and possiblyFreezeable._jsonFreezer is not False:
-            return True
-        if isinstance(possiblyFreezeable, (list, tuple, dict)):
-            return False
-        if six.PY2 and isinstance(possiblyFreezeable, (int, str, unicode, float)):
-            return False
-        elif six.PY3 and isinstance(possiblyFreezeable, (int, str, bytes, float)):
-            return False 
-
-        if hasattr(possiblyFreezeable, 'fullyQualifiedClasses'):
-            fqClassList = possiblyFreezeable.fullyQualifiedClasses
-        else: # same thing...
-            fqClassList = [x.__module__ + '.' + x.__name__ for x in possiblyFreezeable.__class__.mro()]
-
-        for fqName in fqClassList:
-            if fqName in self.storedClassAttributes:
-                return True
-        return False
-
-    #---------------------------------------------------------------------------
-    # core methods for getting and setting
-
-    def getJSONDict(self, includeVersion=False):
-        '''
-        Return a dictionary representation for JSON processing.
-        All component objects are similarly encoded as dictionaries.
-        This method is recursively called as needed to store dictionaries
-        of component objects that are :class:`~music21.freezeThaw.JSONFreezer` subclasses.
-
-
-        >>> t = metadata.Text('my text')
-        >>> t.language = 'en'
-        >>> jsf = freezeThaw.JSONFreezer(t)
-        >>> jsdict = jsf.getJSONDict()
-        >>> jsdict['__class__']
-        'music21.metadata.primitives.Text'
-        >>> jsdict['__attr__']['_language']
-        'en'
-        '''
-        obj = self.storedObject
-        if obj is not None:
-            src = {'__class__': self.className}
-        else:
-            src = {}
-        # always store the version used to create this data
-        if includeVersion is True:
-            src['__version__'] = base.VERSION
-
-        if obj is None:
-            return src
-
-        # flat data attributes
-        flatData = {}
-        if self.storedObject is None:
-            return src
-
-        for attr in self.jsonAttributes():
-            attrValue = getattr(self.storedObject, attr)
-            if isinstance(attrValue, fractions.Fraction):
-                attrValue = float(attrValue)
-            #environLocal.printDebug(['_getJSON', attr, "hasattr(attrValue, 'json')", hasattr(attrValue, 'json')])
-
-            # do not store None values; assume initial/unset state
-            if attrValue is None:
-                continue
-
-            # if, stored on this object, is an object w/ a json method
-            if self.canBeFrozen(attrValue):
-                #environLocal.printDebug(['attrValue', attrValue])
-                internalJSONFreezer = JSONFreezer(attrValue)
-                flatData[attr] = internalJSONFreezer.getJSONDict()
-
-            # handle lists; look for objects that have json attributes
-            elif isinstance(attrValue, (list, tuple)):
-                flatData[attr] = []
-                for attrValueSub in attrValue:
-                    if self.canBeFrozen(attrValueSub):
-                        internalJSONFreezer = JSONFreezer(attrValueSub)
-                        flatData[attr].append(internalJSONFreezer.getJSONDict())
-                    else: # just store normal data
-                        flatData[attr].append(attrValueSub)
-
-            # handle dictionaries; look for objects that have json attributes
-            elif isinstance(attrValue, dict):
-                flatData[attr] = {}
-                for key in attrValue:
-                    attrValueSub = attrValue[key]
-                    # skip None values for efficiency
-                    if attrValueSub is None:
-                        continue
-                    # see if this object stores a json object or otherwise
-                    if self.canBeFrozen(attrValueSub):
-                        internalJSONFreezer = JSONFreezer(attrValueSub)
-                        flatData[attr][key] = internalJSONFreezer.getJSONDict()
-                    else: # just store normal data
-                        flatData[attr][key] = attrValueSub
-            else:
-                flatData[attr] = attrValue
-        src['__attr__'] = flatData
-        return src
-
-    @property
-    def json(self):
-        '''
-        Get string JSON data for this object.
-
-        This method is only available if a JSONFreezer subclass object has been
-        customized and configured by overriding the following methods:
-        :meth:`~music21.freezeThaw.JSONFreezer.jsonAttributes`,
-        :meth:`~music21.freezeThaw.JSONFreezer.music21ObjectFromString`.
-
-        Return the dictionary returned by self.getJSONDict() as a JSON string.
-        '''
-        # when called from json property, include version number;
-        # this should mean that only the outermost object has a version number
-        return json.dumps(
-            self.getJSONDict(includeVersion=True),
-            sort_keys=True,
-            )
-
-    @property
-    def prettyJson(self):
-        lines = json.dumps(
-            self.getJSONDict(includeVersion=True),
-            sort_keys=True,
-            indent=4,
-            ).splitlines()
-        return '\n'.join(line.rstrip() for line in lines)
-
-
-    def jsonPrint(self):
-        r'''
-        Prints out the json output for a given object:
-
-
-        >>> n = note.Note('D#5')
-        >>> jsf = freezeThaw.JSONFreezer(n)
-        >>> jsf.jsonPrint()
-        {
-          "__attr__": {
-            "_duration": {
-              "__attr__": {
-                "_cachedIsLinked": true, 
-                "_components": [
-                  {
-                    "__attr__": {
-                      "_componentsNeedUpdating": false, 
-                      "_dots": [
-                        0
-                      ], 
-                      "_link": true, 
-                      "_qtrLength": 1.0, 
-                      "_quarterLengthNeedsUpdating": false, 
-                      "_tuplets": [], 
-                      "_type": "quarter", 
-                      "_typeNeedsUpdating": false
-                    }, 
-                    "__class__": "music21.duration.DurationUnit"
-                  }
-                ], 
-                "_componentsNeedUpdating": false, 
-                "_qtrLength": 1.0, 
-                "_quarterLengthNeedsUpdating": false, 
-                "_typeNeedsUpdating": false
-              }, 
-              "__class__": "music21.duration.Duration"
-            }, 
-            "_notehead": "normal", 
-            "_noteheadFill": "default", 
-            "_noteheadParenthesis": false, 
-            "_priority": 0, 
-            "_stemDirection": "unspecified", 
-            "articulations": [], 
-            "beams": {
-              "__attr__": {
-                "beamsList": [], 
-                "feathered": false
-              }, 
-              "__class__": "music21.beam.Beams"
-            }, 
-            "expressions": [], 
-            "lyrics": [], 
-            "offset": 0.0, 
-            "pitch": {
-              "__attr__": {
-                "_accidental": {
-                  "__attr__": {
-                    "_alter": 1.0, 
-                    "_displayType": "normal", 
-                    "_modifier": "#", 
-                    "_name": "sharp" 
-                  }, 
-                  "__class__": "music21.pitch.Accidental"
-                }, 
-                "_microtone": {
-                  "__attr__": {
-                    "_centShift": 0, 
-                    "_harmonicShift": 1
-                  }, 
-                  "__class__": "music21.pitch.Microtone"
-                }, 
-                "_octave": 5, 
-                "_step": "D"
-              }, 
-              "__class__": "music21.pitch.Pitch"
-            }
-          }, 
-          "__class__": "music21.note.Note", 
-          "__version__": [
-            2, 
-            0, 
-            0
-          ]
-        }
-        '''
-        print(json.dumps(
-            self.getJSONDict(includeVersion=True),
-            sort_keys=True,
-            indent=2,
-            ))
-
-    def jsonWrite(self, fp, formatOutput=True):
-        '''
-        Given a file path, write JSON to a file
-        for this object.
-
-        File extension should be .json. File is opened
-        and closed within this method call.
-        '''
-        with codecs.open(fp, mode='w', encoding='utf-8') as f:
-            jsonDict = self.getJSONDict(includeVersion=True)
-            if formatOutput is False:
-                jsonString = json.dumps(
-                    jsonDict,
-                    sort_keys=False,
-                    )
-            else:
-                jsonString = json.dumps(
-                    jsonDict,
-                    sort_keys=True,
-                    indent=2,
-                    )
-            f.write(jsonString)
-
-class JSONThawer(JSONFreezeThawBase):
-    '''
-    Class that takes JSON input and makes a Music21Object.
-    '''
-    def __init__(self, storedObject=None):
-        JSONFreezeThawBase.__init__(self, storedObject)
-
-    def _isComponent(self, target):
-        '''
-        Return a boolean if the provided object is a
-        dictionary that defines a __class__ key, the necessary
-        conditions to try to instantiate a component object
-        with the music21ObjectFromString method.
-        '''
-        # on export, check for attribute
-        if isinstance(target, dict) and '__class__' in target:
-            return True
-        return False
-
-    def _buildComponent(self, src):
-        # get instance from subclass overridden method
-        obj = self.music21ObjectFromString(src['__class__'])
-        # assign dictionary (property takes dictionary or string)
-        self._setJSON(src, obj)
-        objFQClass = self.fullyQualifiedClassFromObject(obj)
-        if objFQClass in self.postClassCreateCall:
-            callMethodStr = self.postClassCreateCall[objFQClass][0]
-            # TODO: add args
-            callMethod = getattr(obj, callMethodStr)
-            callMethod(obj)
-
-        return obj
-
-    def _setJSON(self, jsonStr, inputObject = None):
-        '''
-        Set this object based on a JSON string
-        or instantiated dictionary representation.
-
-
-        >>> t = metadata.Text('my text')
-        >>> t.language = 'en'
-        >>> jsf = freezeThaw.JSONFreezer(t)
-        >>> jsfJSON = jsf.json
-
-        >>> tNew = metadata.Text()
-        >>> jsf2 = freezeThaw.JSONThawer(tNew)
-        >>> jsf2.json = jsfJSON
-        >>> str(tNew)
-        'my text'
-
-        Notice that some normal strings come back as unicode:
-
-        >>> tNew.language
-        u'en'
-
-
-        Notes are more complex. Let's not even give an
-        input object this time:
-
-        >>> n = note.Note("D#5")
-        >>> n.duration.quarterLength = 3.0
-        >>> jsf = freezeThaw.JSONFreezer(n)
-        >>> jsfJSON = jsf.json
-
-
-        >>> jsf2 = freezeThaw.JSONThawer()
-        >>> jsf2.json = jsfJSON
-        >>> n2 = jsf2.storedObject
-        >>> n2
-        <music21.note.Note D#>
-        >>> n2.octave
-        5
-
-        Test that other attributes get updated automatically
-
-        >>> n2.duration.dots
-        1
-        '''
-        #environLocal.printDebug(['_setJSON: srcStr', jsonStr])
-        if isinstance(jsonStr, dict):
-            d = jsonStr # do not loads
-        else:
-            d = json.loads(jsonStr)
-
-        if inputObject is not None:
-            obj = inputObject
-        elif self.storedObject is not None:
-            obj = self.storedObject
-        elif d['__class__'] is not None:
-            obj = self.music21ObjectFromString(d['__class__'])
-            self.storedObject = obj
-        else:
-            raise JSONThawerException("Cannot find an object class definition in the jsonStr; you must provide an input object")
-
-        for attr in d:
-            #environLocal.printDebug(['_setJSON: attr', attr, d[attr]])
-            if attr == '__class__':
-                pass
-            elif attr == '__version__':
-                pass
-            elif attr == '__attr__':
-                for key in d[attr]:
-                    attrValue = d[attr][key]
-                    if attrValue == None or isinstance(attrValue,
-                        (int, float)):
-                        try:
-                            setattr(obj, key, attrValue)
-                        except AttributeError:
-                            raise JSONThawerException("Cannot set attribute '%s' to %s for obj %r" % (key, attrValue, obj))
-                    # handle a list or tuple, looking for dicts that define objs
-                    elif isinstance(attrValue, (list, tuple)):
-                        subList = []
-                        for attrValueSub in attrValue:
-                            if self._isComponent(attrValueSub):
-                                subList.append(
-                                    self._buildComponent(attrValueSub))
-                            else:
-                                subList.append(attrValueSub)
-                        setattr(obj, key, subList)
-                    # handle a dictionary, looking for dicts that define objs
-                    elif isinstance(attrValue, dict):
-                        # could be a data dict or a dict of objects;
-                        # if an object, will have a __class__ key
-                        if self._isComponent(attrValue):
-                            setattr(obj, key, self._buildComponent(attrValue))
-                        # its a data dictionary; could contain objects as
-                        # dictionaries, or flat data
-                        else:
-                            subDict = {}
-                            for subKey in attrValue:
-                                # this could be flat data or a obj definition
-                                # in a dictionary
-                                attrValueSub = attrValue[subKey]
-                                # if a dictionary, and defines a __class__,
-                                # create an object
-                                if self._isComponent(attrValueSub):
-                                    subDict[subKey] = self._buildComponent(
-                                        attrValueSub)
-                                else:
-                                    subDict[subKey] = attrValueSub
-                            #setattr(self, key, subDict)
-                            try:
-                                dst = getattr(obj, key)
-                            except AttributeError as ae:
-                                if key == "_storage": # changed name; help older .json files...
-                                    dst = getattr(obj, "storage")
-                                else:
-                                    raise JSONFreezerException("Problem with key: %s for object %s: %s" % (key, obj, ae))
-
-                            # updating the dictionary preserves default
-                            # values created at init
-                            dst.update(subDict)
-                    else: # assume a string
-                        try:
-                            setattr(obj, key, attrValue)
-                        except AttributeError:
-                            pass
-            else:
-                raise JSONFreezerException('cannot handle json attr: %s'% attr)
-
-    json = property(fset=_setJSON,
-        doc = '''
-        Take string JSON data from :meth:`~music21.freezeThaw.JSONFreezer.json` and
-        produce an object and store it in
-        self.storedObject.`.
-        ''')
-
-    def jsonRead(self, fp):
-        '''
-        Given a file path, read JSON from a file to this object.
-        Default file extension should be .json. File is opened
-        and closed within this method call.
-
-        returns the stored object
-        '''
-        f = open(fp)
-        self.json = f.read()
-        f.close()
-        return self.storedObject
-
-#------------------------------------------------------------------------------
-class Test(unittest.TestCase):
-
-    def runTest(self):
-        pass
-
-    def testSimpleFreezeThaw(self):
-        from music21 import stream, note
-        s = stream.Stream()
-        sDummy = stream.Stream()
-        n = note.Note()
-        s.insert(2.0, n)
-        sDummy.insert(3.0, n)
-
-        sf = StreamFreezer(s)
-        out = sf.writeStr()
-
-        del(s)
-        del(sDummy)
-        del(n)
-
-        st = StreamThawer()
-        st.openStr(out)
-        outStream = st.stream
-        self.assertEqual(len(outStream), 1)
-        self.assertEqual(outStream[0].offset, 2.0)
-
-    def testFreezeThawWithSpanner(self):
-        from music21 import stream, note, spanner
-        s = stream.Stream()
-        sDummy = stream.Stream()
-        n = note.Note()
-        sl1 = spanner.Slur([n])
-        s.insert(0.0, sl1)
-        s.insert(2.0, n)
-        sDummy.insert(3.0, n)
-
-        sf = StreamFreezer(s)
-        out = sf.writeStr()
-
-        del(s)
-        del(sDummy)
-        del(n)
-
-        st = StreamThawer()
-        st.openStr(out)
-        outStream = st.stream
-        self.assertEqual(len(outStream), 2)
-        self.assertEqual(outStream.notes[0].offset, 2.0)
-        self.assertIs(outStream.spanners[0].getFirst(), outStream.notes[0])
-
-    def testFreezeThawCorpusFileWithSpanners(self):
-        from music21 import corpus
-        c = corpus.parse('luca/gloria')
-        sf = StreamFreezer(c)
-        data = sf.writeStr(fmt='pickle')
-
-        st = StreamThawer()
-        st.openStr(data)
-        s = st.stream
-        self.assertEqual(len(s.parts[0].measure(7).notes), 6)
-
-
-    def xtestSimplePickle(self):
-        from music21 import freezeThaw
-        from music21 import corpus
-
-        c = corpus.parse('bwv66.6').parts[0].measure(0).notes
-        #c.show('t')
-
-#        for el in c:
-#            storedIds.append(el.id)
-#            storedSitesIds.append(id(el.sites))
-#
-#        return
-
-        n1 = c[0]
-        n2 = c[1]
-        sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
-        sf.setupSerializationScaffold()
-        for dummy in n1.sites.siteDict:
-            pass
-            #print idKey
-            #print n1.sites.siteDict[idKey]['obj']
-        for dummy in n2.sites.siteDict:
-            pass
-            #print idKey
-            #print n2.sites.siteDict[idKey]['obj']
-
-        dummy_data = pickleMod.dumps(c, protocol=-1)
-
-
-        #data = sf.writeStr(fmt='pickle')
-
-        #st = freezeThaw.StreamThawer()
-        #st.openStr(data)
-        #s = st.stream
-#        for el in s._elements:
-#            idEl = el.id
-#            if idEl not in storedIds:
-#                print("Could not find ID %d for element %r at offset %f" %
-#                      (idEl, el, el.offset))
-#        print storedIds
-        #s.show('t')
-
-    def xtestFreezeThawPickle(self):
-        from music21 import freezeThaw
-        from music21 import corpus
-
-        c = corpus.parse('luca/gloria')
-        #c.show('t')
-
-        sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
-        d = sf.writeStr()
-        #print d
-
-        st = freezeThaw.StreamThawer()
-        st.openStr(d)
-        s = st.stream
-
-        # test to see if we can find everything
-        for dummy in s.recurse():
-            pass
-
-        #s.show()
-        #s.show('t')
-
-    def testFreezeThawSimpleVariant(self):
-        from music21 import freezeThaw
-        from music21 import variant
-        from music21 import stream
-        from music21 import note
-
-        s = stream.Stream()
-        m = stream.Measure()
-        m.append(note.Note(type="whole"))
-        s.append(m)
-
-        s2 = stream.Stream()
-        m2 = stream.Measure()
-        n2 = note.Note("D#4")
-        n2.duration.type = "whole"
-        m2.append(n2)
-        s2.append(m2)
-        v = variant.Variant(s2)
-
-        s.insert(0, v)
-
-        sf = freezeThaw.StreamFreezer(s)
-        d = sf.writeStr()
-
-        st = freezeThaw.StreamThawer()
-        st.openStr(d)
-        s = st.stream
-
-
-    def testFreezeThawVariant(self):
-        from music21 import freezeThaw
-        from music21 import corpus
-        from music21 import variant
-        from music21 import stream
-        from music21 import note
-
-        c = corpus.parse('luca/gloria')
-
-        data2M2 = [('f', 'eighth'), ('c', 'quarter'), ('a', 'eighth'), ('a', 'quarter')]
-        stream2 = stream.Stream()
-        m = stream.Measure()
-        for pitchName,durType in data2M2:
-            n = note.Note(pitchName)
-            n.duration.type = durType
-            m.append(n)
-#            stream2.append(n)
-        stream2.append(m)
-        #c.show('t')
-        variant.addVariant(c.parts[0], 6.0, stream2, variantName = 'rhythmic switch', replacementDuration = 3.0)
-
-        #test Variant is in stream
-        unused_v1 = c.parts[0].getElementsByClass('Variant')[0]
-
-        sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
-        #sf.v = v
-        d = sf.writeStr()
-        #print d
-
-        #print "thawing."
-
-        st = freezeThaw.StreamThawer()
-        st.openStr(d)
-        s = st.stream
-        #s.show('lily.pdf')
-        p0 = s.parts[0]
-        variants = p0.getElementsByClass('Variant')
-        v2 = variants[0]
-        self.assertEqual(v2._stream[0][1].offset, 0.5)
-        #v2.show('t')
-
-    def testSerializationScaffoldA(self):
-        from music21 import note, stream
-        from music21 import freezeThaw
-
-        n1 = note.Note()
-
-        s1 = stream.Stream()
-        s2 = stream.Stream()
-
-        s1.append(n1)
-        s2.append(n1)
-
-        sf = freezeThaw.StreamFreezer(s2, fastButUnsafe = False)
-        sf.setupSerializationScaffold()
-
-        # test safety
-        self.assertEqual(s2.hasElement(n1), True)
-        self.assertEqual(s1.hasElement(n1), True)
-
-#----------JSON Serialization------------------------------
-
-#    def testDurationJSONSerializationA(self):
-#        from music21 import duration
-#        d = duration.DurationUnit(1.5)
-#        self.assertEqual(str(d), '<music21.duration.DurationUnit 1.5>')
-#
-#        dAlt = duration.DurationUnit()
-#        dAlt.json = d.json
-#        self.assertEqual(str(dAlt), '<music21.duration.DurationUnit 1.5>')
-#
-#        d = duration.Duration(2.25)
-#        self.assertEqual(str(d), '<music21.duration.Duration 2.25>')
-#        dAlt = duration.Duration()
-#        dAlt.json = d.json
-#        self.assertEqual(str(dAlt), '<music21.duration.Duration 2.25>')
-
-#    def testJSONSerializationPitchA(self):
-#        from music21 import pitch
-#
-#        m = pitch.Microtone(40)
-#        self.assertEqual(str(m), '(+40c)')
-#
-#        mAlt = pitch.Microtone()
-#        mAlt.json = m.json
-#        self.assertEqual(str(mAlt), '(+40c)')
-#
-#        a = pitch.Accidental('##')
-#        self.assertEqual(str(a), '<accidental double-sharp>')
-#        aAlt = pitch.Accidental()
-#        aAlt.json = a.json
-#        self.assertEqual(str(aAlt), '<accidental double-sharp>')
-#
-#        p = pitch.Pitch(ps=61.2)
-#        self.assertEqual(str(p), 'C#4(+20c)')
-#        pAlt = pitch.Pitch()
-#        pAlt.json = p.json
-#        self.assertEqual(str(pAlt), 'C#4(+20c)')
-
-#    def testDerivationSerializationA(self):
-#        from music21 import derivation
-#
-#        d = derivation.Derivation()
-#        self.assertEqual(d.jsonAttributes(), ['_ancestor', '_ancestorId', '_container', '_containerId', '_method'])
-#
-#        self.assertEqual(hasattr(d, 'json'), True)
-
-    def testJSONPickleSpanner(self):
-        from music21 import converter, note, stream, spanner
-        n1 = note.Note('C')
-        n2 = note.Note('D')
-        s1 = stream.Stream()
-        sp = spanner.Line([n1, n2])
-        s1.insert(0, sp)
-        s1.append(n1)
-        s1.append(n2)
-        frozen = converter.freezeStr(s1, 'jsonPickle')
-        #print frozen
-        unused_thawed = converter.thawStr(frozen)
-        
-
-    def testPickleMidi(self):
-        from music21 import converter
-        a = os.path.join(common.getSourceFilePath(),
-                         'midi',
-                         'testPrimitive',
-                         'test03.mid')
-
-        #a = 'https://github.com/ELVIS-Project/vis/raw/master/test_corpus/prolationum-sanctus.midi'
-        c = converter.parse(a)
-        f = converter.freezeStr(c)
-        d = converter.thawStr(f)
-        self.assertEqual(d[1][20].volume._parent.__class__.__name__, 'weakref')
-
-#------------------------------------------------------------------------------
-if __name__ == "__main__":
-    import music21
-    #import sys
-    #sys.argv.append('testJSONPickleSpanner')
-    music21.mainTest(Test)
-    
-
-
-#------------------------------------------------------------------------------
-# eof
-
-
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         freezeThaw.py
+# Purpose:      Methods for storing any music21 object on disk.
+#               Uses pickle and json
+#
+# Authors:      Michael Scott Cuthbert
+#               Christopher Ariza
+#
+# Copyright:    Copyright © 2011-2012 Michael Scott Cuthbert and the music21
+#               Project
+# License:      LGPL or BSD, see license.txt
+#------------------------------------------------------------------------------
+
+r'''
+This module contains objects for storing complete `Music21Objects`, especially
+`Stream` and `Score` objects on disk.  Freezing (or "pickling") refers to
+writing the object to a file on disk (or to a string).  Thawing (or
+"unpickling") refers to reading in a string or file and returning a Music21
+object.
+
+This module offers alternatives to writing a `Score` to `MusicXML` with
+`s.write('musicxml')`.  `FreezeThaw` has some advantages over using `.write()`:
+virtually every aspect of a music21 object is retained when Freezing.  So
+objects like `medRen.Ligature`, which aren't supported by most formats, can be
+stored with `FreezeThaw` and then read back again.  Freezing is also much
+faster than most conversion methods.  But there's a big downside: only
+`music21` and `Python` can use the `Thaw` side to get back `Music21Objects`
+(though more information can be brought out of the JSONFreeze format through
+any .json reader).  In fact, there's not even a guarantee that future versions
+of music21 will be able to read a frozen version of a `Stream`.  So the
+advantages and disadvantages of this model definitely need to be kept in mind.
+
+There are two formats that `freezeThaw` can produce: "Pickle" or JSON (for
+JavaScript Object Notation -- essentially a string representation of the
+JavaScript equivalent of a Python dictionary).  
+
+Pickle is a Python-specific
+idea for storing objects.  The `pickle` module stores objects as a text file
+that can't be easily read by non-Python applications; it also isn't guaranteed
+to work across Python versions or even computers.  However, it works well, is
+fast, and is a standard part of python.  
+
+JSON was originally created to pass
+JavaScript objects from a web server to a web browser, but its utility
+(combining the power of XML with the ease of use of objects) has made it a
+growing standard for other languages.  (see
+http://docs.python.org/library/json.html).  Music21 has two implementations of JSON (confusing, no?)
+because we weren't sure and are still not sure which will be best in the long-run: the first approach
+uses explicit lists of attributes that need to be stored and just saves those. This uses a
+homemade set of methods that are specifically tailored for music21; but it misses some things that
+may be important to you.  The second approach uses the the freely distributable
+`jsonpickle` module found in `music21.ext.jsonpickle` (See that folder's
+"license.txt" for copyright information). This approach probably stores more data than
+someone not using music21 or python is likely to want, but can be used to get back an entire
+music21 Stream with no conversion.
+
+Both JSON and Pickle files can be huge, but `freezeThaw` can compress them with
+`gzip` or `ZipFile` and thus they're not that large at all.
+
+Streams need to be run through .setupSerializationScaffold and .teardownSerializationScaffold
+before and after either Pickle or jsonpickle in order to restore all the weakrefs that we use.
+
+The name freezeThaw comes from Perl's implementation of similar methods -- I
+like the idea of thawing something that's frozen; "unpickling" just doesn't
+seem possible.  In any event, I needed a name that wouldn't already
+exist in the Python namespace.
+'''
+
+import array
+import codecs
+import copy
+import fractions
+import gc
+import inspect
+import json
+import os
+import struct
+import time
+import unittest
+import zlib
+
+from music21 import base
+from music21 import common
+from music21 import derivation
+from music21 import exceptions21
+
+try:
+    from music21.ext import jsonpickle
+except:
+    pass
+
+from music21.ext import six
+
+from music21 import environment
+_MOD = "freezeThaw.py"
+environLocal = environment.Environment(_MOD)
+
+try:
+    import cPickle as pickleMod
+except ImportError:
+    import pickle as pickleMod
+#import pickle as pickleMod
+
+
+#------------------------------------------------------------------------------
+
+
+class FreezeThawException(exceptions21.Music21Exception):
+    pass
+
+#------------------------------------------------------------------------------
+
+
+class StreamFreezeThawBase(object):
+    '''
+    Contains a few methods that are used for both
+    StreamFreezer and StreamThawer
+    '''
+    def __init__(self):
+        self.stream = None
+
+    def getPickleFp(self, directory):
+        if directory == None:
+            raise ValueError
+        # cannot get data from stream, as offsets are broken
+        streamStr = str(time.time())
+        return os.path.join(directory, 'm21-' + common.getMd5(streamStr) + '.p')
+
+    def getJsonFp(self, directory):
+        return self.getPickleFp(directory) + '.json'
+
+    def findAllM21Objects(self, streamObj):
+        '''
+        find all M21 Objects in _elements and _endElements and in nested streams.
+        '''
+        allObjs = []
+        for x in streamObj._elements:
+            allObjs.append(x)
+            if x.isStream:
+                allObjs.extend(self.findAllM21Objects(x))
+        for x in streamObj._endElements:
+            allObjs.append(x)
+            if x.isStream:
+                allObjs.extend(self.findAllM21Objects(x))
+        return allObjs
+
+
+#------------------------------------------------------------------------------
+class StreamFreezer(StreamFreezeThawBase):
+    '''
+    This class is used to freeze a Stream, preparing it for serialization
+    and providing conversion routines.
+
+    In general, use :func:`~music21.converter.freeze`
+    for serializing to a file.
+
+    Use the :func:`~music21.converter.unfreeze` to read from a
+    serialized file
+
+    >>> from music21 import freezeThaw
+
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(note.Note('C4'), 8)
+    >>> temp = [s[n].transpose(n, inPlace=True) for n in range(len(s))]
+
+    >>> sf = freezeThaw.StreamFreezer(s) # provide a Stream at init
+    >>> data = sf.writeStr(fmt='pickle') # pickle is default format
+
+    >>> st = freezeThaw.StreamThawer()
+    >>> st.openStr(data)
+    >>> s = st.stream
+    >>> s.show('t')
+    {0.0} <music21.note.Note C>
+    {1.0} <music21.note.Note D->
+    {2.0} <music21.note.Note D>
+    {3.0} <music21.note.Note E->
+    {4.0} <music21.note.Note E>
+    {5.0} <music21.note.Note F>
+    {6.0} <music21.note.Note G->
+    {7.0} <music21.note.Note G>
+
+    >>> sf2 = freezeThaw.StreamFreezer(s) # do not reuse StreamFreezers
+    >>> data2 = sf2.writeStr(fmt='jsonpickle')
+
+    >>> st2 = freezeThaw.StreamThawer()
+    >>> st2.openStr(data2)
+    >>> s2 = st2.stream
+    >>> s2.show('t')
+    {0.0} <music21.note.Note C>
+    {1.0} <music21.note.Note D->
+    {2.0} <music21.note.Note D>
+    {3.0} <music21.note.Note E->
+    {4.0} <music21.note.Note E>
+    {5.0} <music21.note.Note F>
+    {6.0} <music21.note.Note G->
+    {7.0} <music21.note.Note G>
+    
+    
+    >>> c = corpus.parse('luca/gloria')
+    >>> sf = freezeThaw.StreamFreezer(c)
+    >>> data = sf.writeStr(fmt='pickle')
+
+    >>> st = freezeThaw.StreamThawer()
+    >>> st.openStr(data)
+    >>> s2 = st.stream
+    >>> len(s2.parts[0].measure(7).notes) == 6
+    True
+
+
+
+    >>> sf2 = freezeThaw.StreamFreezer(c) # do not reuse StreamFreezers
+    >>> data2 = sf2.writeStr(fmt='jsonpickle')
+    >>> st2 = freezeThaw.StreamThawer()
+    >>> st2.openStr(data2)
+    >>> s3 = st.stream
+    >>> len(s3.parts[0].measure(7).notes) == 6
+    True
+
+    '''
+    def __init__(self, streamObj=None, fastButUnsafe=False, topLevel = True, streamIds = None):
+        # must make a deepcopy, as we will be altering Sites
+        self.stream = None
+        # clear all sites only if the top level.
+        self.topLevel = topLevel
+        self.streamIds = streamIds
+
+        if streamObj is not None and fastButUnsafe is False:
+            # deepcopy necessary because we mangle sites in the objects
+            # before serialization
+            self.stream = copy.deepcopy(streamObj)
+            #self.stream = streamObj
+        elif streamObj is not None:
+            self.stream = streamObj
+
+    def packStream(self, streamObj = None):
+        '''
+        Prepare the passed in Stream in place, return storage
+        dictionary format.
+
+        >>> s = stream.Stream()
+        >>> n = note.Note('D#4')
+        >>> s.append(n)
+        >>> sf = freezeThaw.StreamFreezer(s)
+        >>> #_DOCS_SHOW sf.packStream()
+        >>> print("{'m21Version': (1, 9, 3), 'stream': <music21.stream.Stream 4391393680>}") #_DOCS_HIDE
+        {'m21Version': (1, 9, 3), 'stream': <music21.stream.Stream 4391393680>}
+        
+        '''
+        # do all things necessary to setup the stream
+        if streamObj is None:
+            streamObj = self.stream
+        self.setupSerializationScaffold(streamObj)
+        storage = {'stream': streamObj, 'm21Version': base.VERSION}
+        return storage
+
+    def packStreamColumnar(self, streamObj=None):
+        '''
+        Return a storage dictionary for the compact 'columnar' format.
+
+        Instead of pickling every object, the offsets, quarter lengths,
+        pitches, and ties of all the plain Notes, Rests, and Chords in the
+        hierarchy are stored in flat arrays, along with a small side table of
+        the Streams, Spanners, and other objects.  Thawing such a file creates
+        the notes directly, which is many times faster than unpickling them.
+
+        Unlike packStream, the Stream is not altered (so there is no need to
+        copy it first; fastButUnsafe=True is always safe with this format).
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('D#4', type='half'))
+        >>> s.append(chord.Chord(['C4', 'E-4']))
+        >>> s.append(note.Rest())
+        >>> sf = freezeThaw.StreamFreezer(s, fastButUnsafe=True)
+        >>> storage = sf.packStreamColumnar()
+        >>> list(storage['kind'])
+        [0, 2, 1]
+        >>> list(storage['quarterLength'])
+        [2.0, 1.0, 1.0]
+        >>> storage['pitchNames']
+        ['D#4', 'C4', 'E-4']
+
+        >>> data = sf.writeStr(fmt='columnar')
+        >>> st = freezeThaw.StreamThawer()
+        >>> st.openStr(data)
+        >>> st.stream.show('text')
+        {0.0} <music21.note.Note D#>
+        {2.0} <music21.chord.Chord C4 E-4>
+        {3.0} <music21.note.Rest rest>
+        '''
+        if streamObj is None:
+            streamObj = self.stream
+        return _ColumnarPacker().pack(streamObj)
+
+    def packStreamChunked(self, streamObj=None, measuresPerChunk=16):
+        '''
+        Return a storage dictionary for the 'chunked' format, which allows
+        thawing only some parts or some measures of a large score (see
+        :meth:`~music21.freezeThaw.StreamThawer.open`).
+
+        The Stream (a Score, or a Stream holding Measures) is split
+        into chunks, each stored in the columnar format: the first chunk has
+        the Stream and its Parts without their Measures; after it come the
+        Measures of each Part, `measuresPerChunk` at a time.
+        `storage['parts']` is the index of the chunks of each Part: its id,
+        its row in the first chunk (None if the Stream itself holds the
+        Measures), the number of the Part in the Streams of the first chunk,
+        and a list of (chunk number, first measure number, last measure number).
+
+        Spanners are stored in the same chunk as usual, but refer to the
+        elements they span that are in other chunks by (chunk number, row).
+
+        >>> s = converter.parse('tinyNotation: 4/4 c1 d1 e1 f1 g1').makeMeasures()
+        >>> sf = freezeThaw.StreamFreezer(s, fastButUnsafe=True)
+        >>> storage = sf.packStreamChunked(measuresPerChunk=2)
+        >>> len(storage['chunks'])
+        4
+        >>> storage['parts'][0]['chunks']
+        [(1, 1, 2), (2, 3, 4), (3, 5, 5)]
+
+        >>> data = sf.writeStr(fmt='chunked', measuresPerChunk=2)
+        >>> st = freezeThaw.StreamThawer()
+        >>> st.openStr(data, measures=(3, 4))
+        >>> st.stream.show('text')
+        {8.0} <music21.stream.Measure 3 offset=8.0>
+            {0.0} <music21.note.Note E>
+        {12.0} <music21.stream.Measure 4 offset=12.0>
+            {0.0} <music21.note.Note F>
+        '''
+        if streamObj is None:
+            streamObj = self.stream
+        if streamObj.hasPartLikeStreams():
+            partStreams = [p for p in streamObj.getElementsByClass('Stream')
+                            if p.hasMeasures()]
+        else:
+            partStreams = [streamObj]
+
+        skeleton = _ColumnarPacker()
+        partMeasures = []
+        for p in partStreams:
+            measures = list(p.getElementsByClass('Measure'))
+            skeleton.omittedIds.update(id(m) for m in measures)
+            partMeasures.append(measures)
+        skeleton.packStream(streamObj)
+
+        packers = [skeleton]
+        parts = []
+        for p, measures in zip(partStreams, partMeasures):
+            if p is streamObj:
+                row = None
+                streamNumber = 0
+            else:
+                row = skeleton._rowsByElementId[id(p)]
+                streamNumber = skeleton.ref[row]
+            chunks = []
+            for i in range(0, len(measures), measuresPerChunk):
+                block = measures[i:i + measuresPerChunk]
+                packer = _ColumnarPacker()
+                packer.packElements([(m, m.getOffsetBySite(p)) for m in block])
+                numbers = [m.number for m in block]
+                chunks.append((len(packers), min(numbers), max(numbers)))
+                packers.append(packer)
+            parts.append({'id': p.id if p is not streamObj else None,
+                          'row': row,
+                          'streamNumber': streamNumber,
+                          'chunks': chunks})
+
+        # an element spanned from another chunk is found by its chunk and row
+        rowsByElementId = {}
+        for chunkNumber, packer in enumerate(packers):
+            for elementId, row in packer._rowsByElementId.items():
+                rowsByElementId.setdefault(elementId, (chunkNumber, row))
+        for chunkNumber, packer in enumerate(packers):
+            packer.resolveSpanners(lambda e: rowsByElementId.get(id(e)))
+            # spanned elements found nowhere else now have rows here
+            for elementId, row in packer._rowsByElementId.items():
+                rowsByElementId.setdefault(elementId, (chunkNumber, row))
+
+        return {'m21Version': base.VERSION,
+                'parts': parts,
+                'chunks': [packer.getStorage() for packer in packers],
+                }
+
+    def setupSerializationScaffold(self, streamObj = None):
+        '''
+        Prepare this stream and all of its contents for pickle/pickling, that
+        is, serializing and storing an object representation on file or as a string.
+
+        The `topLevel` and `streamIdsFound` arguments are used to keep track of recursive calls.
+
+        Note that this is a destructive process: elements contained within this Stream
+        will have their sites cleared of all contents not in the hierarchy
+        of the Streams. Thus, when doing a normal .write('pickle')
+        the Stream is deepcopied before this method is called. The
+        attribute `fastButUnsafe = True` setting of StreamFreezer ignores the destructive
+        effects of these processes and skips the deepcopy.
+
+        >>> from music21 import freezeThaw
+
+        >>> a = stream.Stream()
+        >>> n = note.Note()
+        >>> n.duration.type = "whole"
+        >>> a.repeatAppend(n, 10)
+        >>> sf = freezeThaw.StreamFreezer(a)
+        >>> sf.setupSerializationScaffold()
+        '''
+        if streamObj is None:
+            streamObj = self.stream
+            if streamObj is None:
+                raise FreezeThawException("You need to pass in a stream when creating to work")
+        allEls = streamObj.recurse(restoreActiveSites=False) # might not work when recurse yields...
+        if self.topLevel is True:
+            self.findActiveStreamIdsInHierarchy(streamObj)
+
+        for el in allEls:
+            if el.isVariant:
+                # works like a whole new hierarchy... # no need for deepcopy
+                subSF = StreamFreezer(
+                    el._stream,
+                    fastButUnsafe=True,
+                    streamIds=self.streamIds,
+                    topLevel=False,
+                    )
+                subSF.setupSerializationScaffold()
+            elif el.isSpanner:
+                # works like a whole new hierarchy... # no need for deepcopy
+                subSF = StreamFreezer(
+                    el.spannedElements,
+                    fastButUnsafe=True,
+                    streamIds=self.streamIds,
+                    topLevel=False,
+                    )
+                subSF.setupSerializationScaffold()
+            elif el.isStream:
+                self.removeStreamStatusClient(el)  # removing seems to create problems for jsonPickle with Spanners
+
+        self.removeStreamStatusClient(streamObj) # removing seems to create problems for jsonPickle with Spanners
+        self.setupStoredElementOffsetTuples(streamObj)
+
+        if self.topLevel is True:
+            self.recursiveClearSites(streamObj)
+
+    def removeStreamStatusClient(self, streamObj):
+        '''
+        if s is a stream then 
+        
+        s.streamStatus._client is s
+        
+        this can be hard to pickle, so this method removes the streamStatus._client from the
+        streamObj (not recursive).  Called by setupSerializationScaffold.
+        '''
+        if hasattr(streamObj, 'streamStatus'):
+            streamObj.streamStatus._client = None
+
+
+    def recursiveClearSites(self, startObj):
+        '''
+        recursively clear all sites, including activeSites, taking into account
+        that spanners and variants behave differently.
+        
+        Called by setupSerializationScaffold.
+
+        To be run after setupStoredElementOffsetTuples() has been run
+        
+        >>> n = note.Note('D#4')
+        >>> len(n.sites)
+        1
+        >>> s = stream.Stream()
+        >>> s.id = 'stream s'
+        >>> s.insert(10, n)
+        >>> len(n.sites)
+        2
+        >>> t = stream.Stream()
+        >>> t.insert(20, n)
+        >>> t.id = 'stream t'
+        >>> len(n.sites)
+        3
+
+        >>> n.getOffsetBySite(s)
+        10.0
+        >>> n.getOffsetBySite(t)
+        20.0
+        
+        >>> sf = freezeThaw.StreamFreezer()
+        
+        This will remove n from s but leave the rest of the sites intact...
+        
+        >>> sf.setupStoredElementOffsetTuples(s)
+        >>> len(n.sites)
+        2
+        >>> n.getOffsetBySite(s)
+        Traceback (most recent call last):
+        SitesException: The object <music21.note.Note D#> is not in site <music21.stream.Stream stream s>.
+        >>> n.getOffsetBySite(t)
+        20.0
+        
+
+        
+        After recursiveClearSites n will be not know its location anywhere...
+        
+        >>> sf.recursiveClearSites(s)
+        >>> len(n.sites)
+        0
+        >>> n.getOffsetBySite(t)
+        Traceback (most recent call last):
+        SitesException: The object <music21.note.Note D#> is not in site <music21.stream.Stream stream t>.
+        
+        This leaves n and t in strange positions, because n is in t.elements still....
+        
+        >>> n in t.elements
+        True
+        
+        This predicament is why when the standard freezeThaw call is made, what is frozen is a 
+        deepcopy of the Stream so that nothing is left in an unusable position
+        
+        
+        '''
+        if hasattr(startObj, '_storedElementOffsetTuples'):
+            seot = startObj._storedElementOffsetTuples
+            for el, unused_offset in seot:
+                if el.isStream:
+                    self.recursiveClearSites(el)
+                if el.isSpanner:
+                    self.recursiveClearSites(el.spannedElements)
+                if el.isVariant:
+                    self.recursiveClearSites(el._stream)
+                if hasattr(el, '_derivation'):
+                    el._derivation = derivation.Derivation() #reset
+
+                el.sites.clear()
+                el.activeSite = None
+            startObj._derivation = derivation.Derivation() #reset
+            startObj.sites.clear()
+            startObj.activeSite = None
+
+    def setupStoredElementOffsetTuples(self, streamObj):
+        '''
+        move all elements from ._elements and ._endElements
+        to a new attribute ._storedElementOffsetTuples
+        which contains a list of tuples of the form
+        (el, offset or 'end').
+        
+        Called by setupSerializationScaffold.
+
+        >>> s = stream.Measure()
+        >>> n1 = note.Note("C#")
+        >>> n2 = note.Note("E-")
+        >>> bl1 = bar.Barline()
+        >>> s.insert(0.0, n1)
+        >>> s.insert(1.0, n2)
+        >>> s.storeAtEnd(bl1)
+
+        >>> sfreeze = freezeThaw.StreamFreezer()
+        >>> sfreeze.setupStoredElementOffsetTuples(s)
+        >>> s._elements, s._endElements
+        ([], [])
+        >>> s._storedElementOffsetTuples
+        [(<music21.note.Note C#>, 0.0), (<music21.note.Note E->, 1.0), (<music21.bar.Barline style=regular>, 'end')]
+        >>> n1.getOffsetBySite(s)
+        Traceback (most recent call last):
+        SitesException: The object <music21.note.Note C#> is not in site <music21.stream.Measure 0 offset=0.0>.
+
+        Trying it again, but now with substreams:
+
+        >>> s2 = stream.Measure()
+        >>> n1 = note.Note("C#")
+        >>> n2 = note.Note("E-")
+        >>> bl1 = bar.Barline()
+        >>> v1 = stream.Voice()
+        >>> n3 = note.Note("F#")
+        >>> v1.insert(2.0, n3)
+        >>> s2.insert(0.0, n1)
+        >>> s2.insert(1.0, n2)
+        >>> s2.storeAtEnd(bl1)
+        >>> s2.insert(2.0, v1)
+        >>> sfreeze.setupStoredElementOffsetTuples(s2)
+
+        >>> v1._storedElementOffsetTuples
+        [(<music21.note.Note F#>, 2.0)]
+        >>> s2._storedElementOffsetTuples
+        [(<music21.note.Note C#>, 0.0), (<music21.note.Note E->, 1.0), (<music21.stream.Voice ...>, 2.0), (<music21.bar.Barline style=regular>, 'end')]
+        >>> s2._storedElementOffsetTuples[2][0] is v1
+        True
+
+        '''
+        if hasattr(streamObj, '_storedElementOffsetTuples'):
+            # in the case of a spanner storing a Stream, like a StaffGroup
+            # spanner, it is possible that the elements have already been
+            # transferred.  Thus, we should NOT do this again!
+            return
+
+        storedElementOffsetTuples = []
+        for e in streamObj._elements:
+            elementTuple = (e, e.getOffsetBySite(streamObj))
+            storedElementOffsetTuples.append(elementTuple)
+            if e.isStream:
+                self.setupStoredElementOffsetTuples(e)
+            e.removeLocationBySite(streamObj)
+#                e._preFreezeId = id(e)
+#                elementDict[id(e)] = e.getOffsetBySite(s)
+        for e in streamObj._endElements:
+            elementTuple = (e, 'end')
+            storedElementOffsetTuples.append(elementTuple)
+            if e.isStream:
+                self.setupStoredElementOffsetTuples(e)
+            e.removeLocationBySite(streamObj)
+
+        streamObj._storedElementOffsetTuples = storedElementOffsetTuples
+        streamObj._elements = []
+        streamObj._endElements = []
+        streamObj._elementsChanged()
+
+    def findActiveStreamIdsInHierarchy(self, hierarchyObject = None, getSpanners=True, getVariants=True):
+        '''
+        Return a list of all Stream ids anywhere in the hierarchy.
+
+        Stores them in .streamIds.
+
+        if hierarchyObject is None, uses self.stream.
+
+
+        >>> sc = stream.Score()
+        >>> p1 = stream.Part()
+        >>> p2 = stream.Part()
+        >>> m1 = stream.Measure()
+        >>> v1 = stream.Voice()
+        >>> m1.insert(0, v1)
+        >>> p2.insert(0, m1)
+        >>> sc.insert(0, p1)
+        >>> sc.insert(0, p2)
+        >>> shouldFindIds = [id(sc), id(p1), id(p2), id(m1), id(v1)]
+
+        fastButUnsafe is needed because it does not make a deepcopy
+        and thus lets you compare ids before and after.
+
+        >>> sf = freezeThaw.StreamFreezer(sc, fastButUnsafe=True)
+        >>> foundIds = sf.findActiveStreamIdsInHierarchy()
+        >>> for thisId in shouldFindIds:
+        ...     if thisId not in foundIds:
+        ...         raise Exception("Missing Id")
+        >>> for thisId in foundIds:
+        ...     if thisId not in shouldFindIds:
+        ...         raise Exception("Additional Id Found")
+
+        Spanners are included unless getSpanners is False
+
+        >>> staffGroup = layout.StaffGroup([p1, p2])
+        >>> sc.insert(0, staffGroup)
+
+        :class:`~music21.layout.StaffGroup` is a spanner, so
+        it should be found
+
+        >>> sf2 = freezeThaw.StreamFreezer(sc, fastButUnsafe=True)
+        >>> foundIds = sf2.findActiveStreamIdsInHierarchy()
+
+        But you won't find the id of the spanner itself in
+        the foundIds:
+
+        >>> id(staffGroup) in foundIds
+        False
+
+        instead it's the id of the storage object:
+
+        >>> staffGroup.getSpannerStorageId() in foundIds
+        True
+
+        Variants are treated similarly:
+
+        >>> s = stream.Stream()
+        >>> m = stream.Measure()
+        >>> m.append(note.Note(type="whole"))
+        >>> s.append(m)
+
+        >>> s2 = stream.Stream()
+        >>> m2 = stream.Measure()
+        >>> n2 = note.Note("D#4")
+        >>> n2.duration.type = "whole"
+        >>> m2.append(n2)
+        >>> s2.append(m2)
+        >>> v = variant.Variant(s2)
+        >>> s.insert(0, v)
+        >>> sf = freezeThaw.StreamFreezer(s, fastButUnsafe=True)
+        >>> allIds = sf.findActiveStreamIdsInHierarchy()
+        >>> len(allIds)
+        4
+        >>> for streamElement in [s, m, m2, v._stream]:
+        ...    if id(streamElement) not in allIds:
+        ...        print("this should not happen...", allIds, id(streamElement))
+
+        N.B. with variants:
+
+        >>> id(s2) == id(v._stream)
+        False
+
+        The method also sets self.streamIds to the returned list:
+
+        >>> sf.streamIds is allIds
+        True
+        '''
+        if hierarchyObject is None:
+            streamObj = self.stream
+        else:
+            streamObj = hierarchyObject
+        streamsFound = streamObj._yieldElementsDownward(streamsOnly=True,
+                       restoreActiveSites=False)
+        streamIds = [id(s) for s in streamsFound]
+
+        if getSpanners is True:
+            spannerBundle = streamObj.spannerBundle
+            streamIds += spannerBundle.getSpannerStorageIds()
+
+        if getVariants is True:
+            for el in streamObj.recurse():
+                if el.isVariant is True:
+                    streamIds += self.findActiveStreamIdsInHierarchy(el._stream)
+
+        # should not happen that there are duplicates, but possible with spanners...
+        # Python's uniq value...
+        streamIds = list(set(streamIds))
+
+        self.streamIds = streamIds
+        return streamIds
+
+
+    #---------------------------------------------------------------------------
+    def parseWriteFmt(self, fmt):
+        '''Parse a passed-in write format
+
+        >>> from music21 import freezeThaw
+
+        >>> sf = freezeThaw.StreamFreezer()
+        >>> sf.parseWriteFmt(None)
+        'pickle'
+        >>> sf.parseWriteFmt('JSON')
+        'jsonpickle'
+        >>> sf.parseWriteFmt('columnar')
+        'columnar'
+        >>> sf.parseWriteFmt('chunked')
+        'chunked'
+        '''
+        if fmt is None: # this is the default
+            return 'pickle'
+        fmt = fmt.strip().lower()
+        if fmt in ['p', 'pickle']:
+            return 'pickle'
+        elif fmt in ['jsonpickle', 'json']:
+            return 'jsonpickle'
+        elif fmt in ['columnar']:
+            return 'columnar'
+        elif fmt in ['chunked']:
+            return 'chunked'
+        #elif fmt in ['jsonnative']:
+        #    return 'jsonnative'
+        else:
+            return 'pickle'
+
+    def write(self, fmt='pickle', fp=None, zipType=None, **keywords):
+        '''
+        For a supplied Stream, write a serialized version to
+        disk in either 'pickle', 'jsonpickle', or 'columnar' format and
+        return the filepath to the file.
+
+        jsonpickle is the better format for transporting from
+        one computer to another, but slower and may have some bugs.
+
+        columnar is much smaller and faster to thaw than pickle; see
+        :meth:`~music21.freezeThaw.StreamFreezer.packStreamColumnar`.
+        chunked is columnar split by part and measure so that some of it can be
+        thawed without reading the rest; `measuresPerChunk` can be given as a
+        keyword, see :meth:`~music21.freezeThaw.StreamFreezer.packStreamChunked`.
+        
+        If zipType == 'zlib' then zlib compression is done after serializing.
+        No other compression types are currently supported. 
+        '''
+        if zipType not in (None, 'zlib'):
+            raise FreezeThawException("Cannot zip files except zlib...")
+
+        fmt = self.parseWriteFmt(fmt)
+
+        if fp is None:
+            directory = environLocal.getRootTempDir()
+            if fmt.startswith('json'):
+                fp = self.getJsonFp(directory)
+            else:
+                fp = self.getPickleFp(directory)
+        elif os.sep in fp: # assume its a complete path
+            fp = fp
+        else:
+            directory = environLocal.getRootTempDir()
+            fp = os.path.join(directory, fp)
+
+        if fmt == 'columnar':
+            storage = self.packStreamColumnar(self.stream)
+        elif fmt == 'chunked':
+            storage = self.packStreamChunked(self.stream, **keywords)
+        else:
+            storage = self.packStream(self.stream)
+
+        environLocal.printDebug(['writing fp', fp])
+
+        if fmt == 'pickle':
+            # a negative protocol value will get the highest protocal;
+            # this is generally desirable
+            # packStream() returns a storage dictionary
+            pickleString = pickleMod.dumps(storage, protocol=-1)
+            if zipType == 'zlib':
+                pickleString = zlib.compress(pickleString)
+            with open(fp, 'wb') as f: # binary
+                f.write(pickleString)
+        elif fmt == 'jsonpickle':
+            data = jsonpickle.encode(storage, **keywords)
+            if zipType == 'zlib':
+                data = zlib.compress(data)
+            with open(fp, 'w') as f:
+                f.write(data)
+        elif fmt == 'columnar':
+            with open(fp, 'wb') as f:
+                f.write(_columnarDataFromStorage(storage, zipType))
+        elif fmt == 'chunked':
+            with open(fp, 'wb') as f:
+                f.write(_chunkedDataFromStorage(storage, zipType))
+        else:
+            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
+
+        ## must restore the passed-in Stream
+        #self.teardownStream(self.stream)
+        return fp
+
+    def writeStr(self, fmt=None, **keywords):
+        '''
+        Convert the object to a pickled/jsonpickled string
+        and return the string
+        '''
+        fmt = self.parseWriteFmt(fmt)
+
+        if fmt == 'columnar':
+            return _columnarDataFromStorage(self.packStreamColumnar(self.stream))
+        elif fmt == 'chunked':
+            return _chunkedDataFromStorage(self.packStreamChunked(self.stream, **keywords))
+
+        storage = self.packStream(self.stream)
+
+        if fmt == 'pickle':
+            out = pickleMod.dumps(storage, protocol=-1)
+        elif fmt == 'jsonpickle':
+            out = jsonpickle.encode(storage, **keywords)
+        else:
+            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
+
+        #self.teardownStream(self.stream)
+        return out
+
+#    def findWeakRef(self, streamObj, memo=None):
+#        '''
+#        utility function for debugging.  Finds all weakrefs in the hierarchy and returns
+#        a list of tuples of the weakref and the name of the attribute, and the object
+#
+#
+#        >>> n = note.Note()
+#        >>> s = stream.Stream()
+#        >>> s2 = stream.Stream()
+#        >>> s.insert(0, n)
+#        >>> s2.insert(0, n)
+#        >>> ft = freezeThaw.StreamFreezer()
+#        >>> ft.findWeakRef(s)
+#        '''
+#        weakRefList = []
+#        if memo is None:
+#            memo = {}
+#        for x in dir(streamObj):
+#            xValue = getattr(streamObj, x)
+#            if id(xValue) in memo:
+#                continue
+#            else:
+#                memo[id(xValue)] = True
+#            if common.isWeakref(xValue):
+#                weakRefList.append(x, xValue, streamObj)
+#            if common.isIterable(xValue):
+#                for i in xValue:
+#                    if id(i) in memo:
+#                        pass
+#                    else:
+#                        memo[id(i)] = True
+#                        weakRefList.extend(self.findWeakRef(i), memo)
+#            else:
+#                weakRefList.extend(self.findWeakRef(xValue), memo)
+#        return weakRefList
+
+
+class StreamThawer(StreamFreezeThawBase):
+    '''
+    This class is used to thaw a data string into a Stream
+
+    In general user :func:`~music21.converter.parse` to read from a
+    serialized file.
+
+    >>> from music21 import freezeThaw
+
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(note.Note('C4'), 8)
+    >>> temp = [s[n].transpose(n, inPlace=True) for n in range(len(s))]
+
+    >>> sf = freezeThaw.StreamFreezer(s) # provide a Stream at init
+    >>> data = sf.writeStr(fmt='pickle') # pickle is default format
+
+    >>> sfOut = freezeThaw.StreamThawer()
+    >>> sfOut.openStr(data)
+    >>> s = sfOut.stream
+    >>> s.show('t')
+    {0.0} <music21.note.Note C>
+    {1.0} <music21.note.Note D->
+    {2.0} <music21.note.Note D>
+    {3.0} <music21.note.Note E->
+    {4.0} <music21.note.Note E>
+    {5.0} <music21.note.Note F>
+    {6.0} <music21.note.Note G->
+    {7.0} <music21.note.Note G>
+
+
+#    >>> c = corpus.parse('luca/gloria')
+#    >>> sf = freezeThaw.StreamFreezer(c)
+#    >>> data = sf.writeStr(fmt='jsonpickle')
+#
+#    >>> sfOut = freezeThaw.StreamThawer()
+#    >>> sfOut.openStr(data)
+#    >>> s = sfOut.stream
+#    >>> #s.show('t')
+    '''
+    def __init__(self):
+        self.stream = None
+
+    def teardownSerializationScaffold(self, streamObj = None):
+        '''
+        After rebuilding this Stream from pickled storage, prepare this as a normal `Stream`.
+
+        If streamObj is None, runs it on the embedded stream
+
+        >>> from music21 import freezeThaw
+
+
+        >>> a = stream.Stream()
+        >>> n = note.Note()
+        >>> n.duration.type = "whole"
+        >>> a.repeatAppend(n, 10)
+        >>> sf = freezeThaw.StreamFreezer(a)
+        >>> sf.setupSerializationScaffold()
+
+        >>> st = freezeThaw.StreamThawer()
+        >>> st.teardownSerializationScaffold(a)
+        '''
+        if streamObj is None:
+            streamObj = self.stream
+            if streamObj is None:
+                raise FreezeThawException("You need to pass in a stream when creating to work")
+
+        storedAutoSort = streamObj.autoSort
+        streamObj.autoSort = False
+
+        self.restoreElementsFromTuples(streamObj)
+        streamObj.sites.add(None, 0.0)
+
+        self.restoreStreamStatusClient(streamObj) # removing seems to create problems for jsonPickle with Spanners
+        
+        allEls = self.findAllM21Objects(streamObj)
+
+        for e in allEls:
+            if e.isVariant:
+#                # works like a whole new hierarchy... # no need for deepcopy
+                subSF = StreamThawer()
+                subSF.teardownSerializationScaffold(e._stream)
+                e._stream._elementsChanged()
+                e._cache = {}
+                #for el in e._stream.flat:
+                #    print el, el.offset, el.sites.siteDict
+            elif e.isSpanner:
+                subSF = StreamThawer()
+                subSF.teardownSerializationScaffold(e.spannedElements)
+                e.spannedElements._elementsChanged()
+                e._cache = {}
+            elif e.isStream: 
+                self.restoreStreamStatusClient(e) # removing seems to create problems for jsonPickle with Spanners
+
+            #self.thawIds(e)
+            #e.wrapWeakref()
+
+        # restore to whatever it was
+        streamObj.autoSort = storedAutoSort
+        streamObj._elementsChanged()
+
+    def restoreElementsFromTuples(self, streamObj):
+        '''
+        Take a Stream with elements and offsets stored in
+        a list of tuples (element, offset or 'end') at
+        _storedElementOffsetTuples
+        and restore it to the ._elements and ._endElements lists
+        in the proper locations:
+
+
+        >>> s = stream.Measure()
+        >>> s._elements, s._endElements
+        ([], [])
+
+        >>> n1 = note.Note("C#")
+        >>> n2 = note.Note("E-")
+        >>> bl1 = bar.Barline()
+        >>> tupleList = [(n1, 0.0), (n2, 1.0), (bl1, 'end')]
+        >>> s._storedElementOffsetTuples = tupleList
+
+        >>> sthaw = freezeThaw.StreamThawer()
+        >>> sthaw.restoreElementsFromTuples(s)
+        >>> s.show('text')
+        {0.0} <music21.note.Note C#>
+        {1.0} <music21.note.Note E->
+        {2.0} <music21.bar.Barline style=regular>
+        >>> s._endElements
+        [<music21.bar.Barline style=regular>]
+        >>> s[1].getOffsetBySite(s)
+        1.0
+
+        Trying it again, but now with substreams:
+
+        >>> s2 = stream.Measure()
+        >>> v1 = stream.Voice()
+        >>> n3 = note.Note("F#")
+        >>> v1._storedElementOffsetTuples = [(n3, 2.0)]
+        >>> tupleList = [(n1, 0.0), (n2, 1.0), (bl1, 'end'), (v1, 2.0)]
+        >>> s2._storedElementOffsetTuples = tupleList
+        >>> sthaw.restoreElementsFromTuples(s2)
+        >>> s2.show('text')
+        {0.0} <music21.note.Note C#>
+        {1.0} <music21.note.Note E->
+        {2.0} <music21.stream.Voice ...>
+            {2.0} <music21.note.Note F#>
+        {5.0} <music21.bar.Barline style=regular>
+        '''
+        if hasattr(streamObj, '_storedElementOffsetTuples'):
+            for e, offset in streamObj._storedElementOffsetTuples:
+                if offset != 'end':
+                    streamObj._insertCore(offset, e)
+                else:
+                    streamObj._storeAtEndCore(e)
+                # add a None site as well...
+                e.sites.add(None, 0.0)
+            del(streamObj._storedElementOffsetTuples)
+            streamObj._elementsChanged()
+
+        for subElement in streamObj:
+            if subElement.isStream is True:
+                # note that the elements may have already been restored
+                # if the spanner stores a part or something in the Stream
+                # for instance in a StaffGroup object
+                self.restoreElementsFromTuples(subElement)
+
+    def restoreStreamStatusClient(self, streamObj):
+        if hasattr(streamObj, 'streamStatus'):
+            streamObj.streamStatus._client = streamObj
+
+
+    def unpackStream(self, storage):
+        '''
+        Convert from storage dictionary to Stream.
+        '''
+        version = storage['m21Version']
+        if version != base.VERSION:
+            environLocal.warn('this pickled file is out of date and may not function properly.')
+        streamObj = storage['stream']
+
+        self.teardownSerializationScaffold(streamObj)
+        return streamObj
+
+    def unpackStreamColumnar(self, storage):
+        '''
+        Convert from a columnar storage dictionary (see
+        :meth:`~music21.freezeThaw.StreamFreezer.packStreamColumnar`) to a Stream.
+        '''
+        version = storage['m21Version']
+        if version != base.VERSION:
+            environLocal.warn('this frozen file is out of date and may not function properly.')
+        # creating many objects that live on triggers many useless garbage
+        # collections of everything already in memory
+        gcWasEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            return _ColumnarUnpacker().unpack(storage)
+        finally:
+            if gcWasEnabled:
+                gc.enable()
+
+    def unpackStreamChunked(self, index, readChunk, parts=None, measures=None):
+        '''
+        Convert from the index of a chunked storage (see
+        :meth:`~music21.freezeThaw.StreamFreezer.packStreamChunked`) to a Stream,
+        calling `readChunk` with a chunk number to get the columnar storage
+        of each chunk needed.
+
+        `parts` is a list of Part numbers (counting from 0) or ids, or a
+        single one, and `measures` is a tuple of the first and last measure
+        number to thaw; either may be None to get everything.  Measures keep
+        their offsets in the full Stream.  Spanners only span the elements
+        that are thawed, and are left out if none are.  A FreezeThawException
+        is raised if a Part asked for is not in the Stream.
+        '''
+        version = index['m21Version']
+        if version != base.VERSION:
+            environLocal.warn('this frozen file is out of date and may not function properly.')
+        if parts is not None and not common.isListLike(parts):
+            parts = [parts]
+        if parts is not None:
+            partIds = [partEntry['id'] for partEntry in index['parts']]
+            for part in parts:
+                if part not in partIds and part not in range(len(partIds)):
+                    raise FreezeThawException(
+                        'cannot thaw part %r: the parts are numbered 0 to %d, with ids %r' %
+                        (part, len(partIds) - 1, partIds))
+        if measures is None:
+            measures = (None, None)
+        numberStart, numberEnd = measures
+
+        def inRange(first, last):
+            return ((numberStart is None or last >= numberStart)
+                    and (numberEnd is None or first <= numberEnd))
+
+        gcWasEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            skeletonStorage = readChunk(0)
+            skeleton = _ColumnarUnpacker()
+            droppedPartRows = set()
+            for i, partEntry in enumerate(index['parts']):
+                if (parts is not None and i not in parts and partEntry['id'] not in parts
+                        and partEntry['row'] is not None):
+                    droppedPartRows.add(partEntry['row'])
+            streamObj = skeleton.unpackElements(skeletonStorage, droppedRows=droppedPartRows)
+            # chunk number: (unpacker, storage, rows of its outermost elements left out)
+            loaded = {0: (skeleton, skeletonStorage, droppedPartRows)}
+
+            for partEntry in index['parts']:
+                if partEntry['row'] in droppedPartRows:
+                    continue
+                partStream = skeleton.streams[partEntry['streamNumber']]
+                for chunkNumber, first, last in partEntry['chunks']:
+                    if not inRange(first, last):
+                        continue
+                    storage = readChunk(chunkNumber)
+                    unpacker = _ColumnarUnpacker()
+                    droppedMeasureRows = set()
+                    if not inRange(first, first) or not inRange(last, last):
+                        for row, container in enumerate(storage['container']):
+                            if container != 0:
+                                continue
+                            streamClass, state = storage['streams'][storage['ref'][row]][:2]
+                            # a number the same as a new Measure's is not stored
+                            number = state.get('number', getattr(streamClass(), 'number', None))
+                            if number is not None and not inRange(number, number):
+                                droppedMeasureRows.add(row)
+                    unpacker.unpackElements(storage, partStream, droppedMeasureRows)
+                    loaded[chunkNumber] = (unpacker, storage, droppedMeasureRows)
+                partStream._elementsChanged()
+
+            for unused_chunkNumber, (unpacker, storage, droppedRows) in loaded.items():
+                def isKept(row, unpacker=unpacker, droppedRows=droppedRows):
+                    return unpacker.rowTops[row] not in droppedRows
+
+                def findElement(ref, unpacker=unpacker, isKept=isKept):
+                    if isinstance(ref, tuple):
+                        chunkNumber, row = ref
+                        if chunkNumber not in loaded:
+                            return None
+                        otherUnpacker, unused_storage, otherDroppedRows = loaded[chunkNumber]
+                        if otherUnpacker.rowTops[row] in otherDroppedRows:
+                            return None
+                        return otherUnpacker.elements[row]
+                    elif isKept(ref):
+                        return unpacker.elements[ref]
+                    return None
+
+                unpacker.resolveSpanners(storage, findElement, isKept)
+            streamObj._elementsChanged()
+        finally:
+            if gcWasEnabled:
+                gc.enable()
+        return streamObj
+
+    def parseOpenFmt(self, storage):
+        '''Look at the file and determine the format
+        '''
+        # the binary formats have byte string headers; jsonpickle gives a 
+        # unicode string on Python 3
+        if isinstance(storage, bytes) and storage.startswith(_COLUMNAR_HEADER):
+            return 'columnar'
+        elif isinstance(storage, bytes) and storage.startswith(_CHUNKED_HEADER):
+            return 'chunked'
+        elif (six.PY3 and isinstance(storage, bytes)):
+            if storage.startswith(b'{"'): # was m21Version": {"py/tuple" but order of dict may change
+                return 'jsonpickle'
+            else:
+                return 'pickle'
+        else:            
+            if storage.startswith('{"'): # was m21Version": {"py/tuple" but order of dict may change
+                return 'jsonpickle'
+            else:
+                return 'pickle'
+
+    def open(self, fp, zipType=None, parts=None, measures=None):
+        '''
+        For a supplied file path to a pickled stream, unpickle
+
+        A file in the 'chunked' format can be thawed in part, by giving a list
+        of Part numbers or ids as `parts`, or a tuple of the first and last
+        measure numbers as `measures`; only the chunks needed are read (see
+        :meth:`~music21.freezeThaw.StreamThawer.unpackStreamChunked`).
+        '''
+        if os.sep in fp: # assume it's a complete path
+            fp = fp
+        else:
+            directory = environLocal.getRootTempDir()
+            fp = os.path.join(directory, fp)
+
+        with open(fp, 'rb') as f:
+            header = f.read(len(_CHUNKED_HEADER) + 1)
+            if header.startswith(_CHUNKED_HEADER):
+                self.stream = self._unpackChunkedFile(f, header, parts, measures)
+                return
+            fileData = header + f.read()
+
+        fmt = self.parseOpenFmt(fileData)
+        if parts is not None or measures is not None:
+            raise FreezeThawException(
+                'only chunked frozen Streams can be thawed in part, not %s' % fmt)
+        if fmt == 'pickle':
+            #environLocal.printDebug(['opening fp', fp])
+            f = open(fp, 'rb')
+            if zipType is None:
+                storage = pickleMod.load(f)
+            elif zipType == 'zlib':
+                compressedString = f.read()
+                uncompressed = zlib.decompress(compressedString)
+                storage = pickleMod.loads(uncompressed)
+            else:
+                raise FreezeThawException("Unknown zipType %s" % zipType)
+            f.close()
+        elif fmt == 'jsonpickle':
+            f = open(fp, 'r')
+            data = f.read()
+            f.close()
+            storage = jsonpickle.decode(data)
+        elif fmt == 'columnar':
+            # zipType is ignored: the data says whether it is compressed
+            self.stream = self.unpackStreamColumnar(_columnarStorageFromData(fileData))
+            return
+        else:
+            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
+
+        self.stream = self.unpackStream(storage)
+
+    def openStr(self, fileData, pickleFormat = None, parts=None, measures=None):
+        '''
+        Take a string representing a Frozen(pickled/jsonpickled)
+        Stream and convert it to a normal Stream.
+
+        if format is None then the format is automatically
+        determined from the string contents.
+
+        `parts` and `measures` select what to thaw of a 'chunked' string, as in
+        :meth:`~music21.freezeThaw.StreamThawer.open`.
+        '''
+        if pickleFormat is not None:
+            fmt = pickleFormat
+        else:
+            fmt = self.parseOpenFmt(fileData)
+
+        if fmt == 'chunked':
+            index, dataStart = _chunkedIndexFromData(fileData)
+            compressed = fileData[len(_CHUNKED_HEADER):len(_CHUNKED_HEADER) + 1] == b'z'
+
+            def readChunk(chunkNumber):
+                offset, length = index['chunkPositions'][chunkNumber]
+                return _chunkStorageFromData(
+                    fileData[dataStart + offset:dataStart + offset + length], compressed)
+
+            self.stream = self.unpackStreamChunked(index, readChunk, parts, measures)
+            return
+        elif parts is not None or measures is not None:
+            raise FreezeThawException(
+                'only chunked frozen Streams can be thawed in part, not %s' % fmt)
+
+        if fmt == 'pickle':
+            storage = pickleMod.loads(fileData)
+        elif fmt == 'jsonpickle':
+            storage = jsonpickle.decode(fileData)
+        elif fmt == 'columnar':
+            self.stream = self.unpackStreamColumnar(_columnarStorageFromData(fileData))
+            return
+        else:
+            raise FreezeThawException('bad StreamFreezer format: %s' % fmt)
+        environLocal.printDebug("StreamThawer:openStr: storage is: %s" % storage)
+        self.stream = self.unpackStream(storage)
+
+    def _unpackChunkedFile(self, f, header, parts, measures):
+        '''
+        Thaw the chunked file `f`, which has been read up to the end of `header`,
+        reading only the chunks needed.
+        '''
+        compressed = header[len(_CHUNKED_HEADER):] == b'z'
+        indexLength = struct.unpack('<Q', f.read(8))[0]
+        index = _chunkStorageFromData(f.read(indexLength), True)
+        dataStart = len(header) + 8 + indexLength
+
+        def readChunk(chunkNumber):
+            offset, length = index['chunkPositions'][chunkNumber]
+            f.seek(dataStart + offset)
+            return _chunkStorageFromData(f.read(length), compressed)
+
+        return self.unpackStreamChunked(index, readChunk, parts, measures)
+
+#------------------------------------------------------------------------------
+# columnar format
+
+# every frozen columnar file or string starts with this; the byte after it
+# says whether the rest is zlib compressed ('z') or not ('-')
+_COLUMNAR_HEADER = b'M21COLUMNAR1'
+
+# kinds of rows in the columnar element table
+_COLUMNAR_NOTE = 0
+_COLUMNAR_REST = 1
+_COLUMNAR_CHORD = 2
+_COLUMNAR_STREAM = 3
+_COLUMNAR_OBJECT = 4
+_COLUMNAR_SAME = 5 # an element already stored in an earlier row
+
+_COLUMNAR_TIE_TYPES = (None, 'start', 'stop', 'continue')
+_COLUMNAR_DISPLAY_STATUSES = (None, False, True)
+
+# attributes that are never stored: they are rebuilt when the element is
+# inserted into its container or are caches
+_COLUMNAR_SKIP_ATTRIBUTES = ('_activeSite', '_activeSiteId',
+    '_idLastDeepCopyOf', '_classes', '_fullyQualifiedClasses', 'sites',
+    '_derivation', '_cache', '_elements', '_endElements', 'streamStatus',
+    'flattenedRepresentationOf', 'spannedElements',
+    '_chordTablesAddress', '_chordTablesAddressNeedsUpdating')
+
+# attributes of notes, rests, and chords kept in the columns themselves
+_COLUMNAR_NOTE_ATTRIBUTES = ('pitch', 'tie', '_duration', '_notes')
+
+
+class _ColumnarPacker(object):
+    '''
+    Walks a Stream hierarchy and packs it into the columnar storage
+    dictionary used by :meth:`StreamFreezer.packStreamColumnar`.
+
+    Every element found becomes a row of the element table (the arrays
+    `container`, `offset`, `atEnd`, `kind`, and `ref`).  Plain Notes, Rests,
+    and Chords are stored in note columns (`quarterLength`, `pitchCount`) and
+    per-pitch columns (`pitch`, an index into `pitchNames`, `tie`, and
+    `accidentalDisplay`, the displayStatus of the accidental); any
+    attribute of them that differs from a newly created object of the same
+    class is kept in `noteExtras`.  Streams and all other objects are stored
+    in the side tables `streams` and `objects` as their class and the
+    attributes that differ from a new object of that class;
+    Spanners additionally store the rows of the elements they span (and
+    their offsets in the SpannerStorage).  Spanned
+    elements that are not in the hierarchy are stored in rows whose container
+    is -1.
+
+    :meth:`pack` does everything at once; the chunked format instead calls
+    :meth:`packStream` or :meth:`packElements`, then :meth:`resolveSpanners`
+    once every chunk is packed, and finally :meth:`getStorage`.
+    '''
+    def __init__(self):
+        self.container = array.array('i')
+        self.offset = array.array('d')
+        self.atEnd = array.array('b')
+        self.kind = array.array('b')
+        self.ref = array.array('i')
+
+        self.quarterLength = array.array('d')
+        self.pitchCount = array.array('i')
+        self.noteExtras = {}
+
+        self.pitch = array.array('i')
+        self.tie = array.array('b')
+        self.accidentalDisplay = array.array('b')
+        self.pitchNames = []
+
+        self.streams = []
+        self.objects = []
+        self.spanners = []
+
+        self.omittedIds = set() # ids of elements left for another packer
+        self._pitchNameIndices = {}
+        self._rowsByElementId = {}
+        self._spannerObjects = []
+        self._prototypes = {}
+        self._plainPitches = {}
+        self._plainDurations = {}
+
+    def pack(self, streamObj):
+        '''
+        Pack `streamObj` and everything in it, returning the storage dictionary.
+        '''
+        self.packStream(streamObj)
+        self.resolveSpanners()
+        return self.getStorage()
+
+    def packStream(self, streamObj):
+        '''
+        Pack `streamObj` and everything in it that is not in `omittedIds`.
+        '''
+        self.streams.append(self._streamEntry(streamObj))
+        self._packElements(streamObj, 0)
+
+    def packElements(self, elementsAndOffsets):
+        '''
+        Pack a list of (element, offset) pairs as if they were in a
+        new, empty Stream.
+        '''
+        from music21 import stream
+        self.streams.append(self._streamEntry(stream.Stream()))
+        for e, offset in elementsAndOffsets:
+            self._packElement(e, 0, float(offset), 0)
+
+    def resolveSpanners(self, findExternal=None):
+        '''
+        Store the elements spanned by each Spanner packed so far.  An element
+        is referred to by its row, or, if it is not packed here and
+        `findExternal` (called with the element) returns something other than
+        None, by whatever that returns.  Anything else gets a row of its own.
+        '''
+        # packing an element not in the hierarchy may find more spanners
+        i = 0
+        while i < len(self._spannerObjects):
+            objectNumber, sp = self._spannerObjects[i]
+            refs = []
+            storage = sp.spannedElements
+            for e in storage._elements:
+                if id(e) in self._rowsByElementId:
+                    ref = self._rowsByElementId[id(e)]
+                else:
+                    ref = None
+                    if findExternal is not None:
+                        ref = findExternal(e)
+                    if ref is None:
+                        self._packElement(e, -1, 0.0, 0)
+                        ref = self._rowsByElementId[id(e)]
+                try:
+                    offset = float(e.getOffsetBySite(storage))
+                except base.SitesException: # element has lost this site
+                    offset = 0.0
+                refs.append((ref, offset))
+            self.spanners.append((objectNumber, refs))
+            i += 1
+        self._spannerObjects = []
+
+    def getStorage(self):
+        '''
+        Return the storage dictionary of everything packed.
+        '''
+        return {'m21Version': base.VERSION,
+                'container': self.container,
+                'offset': self.offset,
+                'atEnd': self.atEnd,
+                'kind': self.kind,
+                'ref': self.ref,
+                'quarterLength': self.quarterLength,
+                'pitchCount': self.pitchCount,
+                'noteExtras': self.noteExtras,
+                'pitch': self.pitch,
+                'tie': self.tie,
+                'accidentalDisplay': self.accidentalDisplay,
+                'pitchNames': self.pitchNames,
+                'streams': self.streams,
+                'objects': self.objects,
+                'spanners': self.spanners,
+                }
+
+    def _packElements(self, streamObj, streamNumber):
+        omittedIds = self.omittedIds
+        for e in streamObj._elements:
+            if omittedIds and id(e) in omittedIds:
+                continue
+            self._packElement(e, streamNumber, float(e.getOffsetBySite(streamObj)), 0)
+        for e in streamObj._endElements:
+            self._packElement(e, streamNumber, 0.0, 1)
+
+    def _packElement(self, e, streamNumber, offset, atEnd):
+        row = len(self.kind)
+        self.container.append(streamNumber)
+        self.offset.append(offset)
+        self.atEnd.append(atEnd)
+
+        if id(e) in self._rowsByElementId:
+            self.kind.append(_COLUMNAR_SAME)
+            self.ref.append(self._rowsByElementId[id(e)])
+            return
+        self._rowsByElementId[id(e)] = row
+
+        if e.isStream:
+            subStreamNumber = len(self.streams)
+            self.streams.append(self._streamEntry(e))
+            self.kind.append(_COLUMNAR_STREAM)
+            self.ref.append(subStreamNumber)
+            self._packElements(e, subStreamNumber)
+            return
+
+        kind = self._packNote(e)
+        if kind is None:
+            kind = _COLUMNAR_OBJECT
+            self.ref.append(len(self.objects))
+            if e.isSpanner:
+                self._spannerObjects.append((len(self.objects), e))
+            self.objects.append((e.__class__, self._getState(e, e.__class__)))
+        else:
+            self.ref.append(len(self.quarterLength) - 1)
+        self.kind.append(kind)
+
+    def _packNote(self, e):
+        '''
+        Store `e` in the note columns if it is a plain Note, Rest, or Chord
+        and return its kind, otherwise return None.
+        '''
+        from music21 import chord
+        from music21 import note
+
+        eClass = e.__class__
+        if eClass is note.Note:
+            kind = _COLUMNAR_NOTE
+            components = [e]
+        elif eClass is note.Rest:
+            kind = _COLUMNAR_REST
+            components = []
+        elif eClass is chord.Chord:
+            kind = _COLUMNAR_CHORD
+            components = e._notes
+            for n in components:
+                if (n.__class__ is not note.Note or
+                        self._getState(n, note.Note, _COLUMNAR_NOTE_ATTRIBUTES)):
+                    return None
+        else:
+            return None
+
+        quarterLength = e.duration.quarterLength
+        if not self._isPlainDuration(e.duration, quarterLength):
+            return None
+        pitchIndices = []
+        tieCodes = []
+        displayCodes = []
+        for n in components:
+            p = n.pitch
+            name = self._getPitchName(p)
+            if p.accidental is None:
+                displayCode = 0
+            else:
+                displayCode = _COLUMNAR_DISPLAY_STATUSES.index(p.accidental.displayStatus)
+            if not self._isPlainPitch(p, name, displayCode):
+                return None
+            tieCode = self._getTieCode(n.tie)
+            if tieCode is None:
+                return None
+            pitchIndices.append(self._getPitchIndex(name))
+            tieCodes.append(tieCode)
+            displayCodes.append(displayCode)
+
+        extras = self._getState(e, eClass, _COLUMNAR_NOTE_ATTRIBUTES)
+        if kind == _COLUMNAR_REST and e.tie is not None:
+            extras['tie'] = e.tie
+        if extras:
+            self.noteExtras[len(self.quarterLength)] = extras
+        self.quarterLength.append(float(quarterLength))
+        self.pitchCount.append(len(pitchIndices))
+        self.pitch.extend(pitchIndices)
+        self.tie.extend(tieCodes)
+        self.accidentalDisplay.extend(displayCodes)
+        return kind
+
+    def _getPitchName(self, p):
+        '''
+        Return a name from which a Pitch like `p` can be created; unlike
+        nameWithOctave, this keeps explicit naturals.
+        '''
+        if p.accidental is not None and p.accidental.name == 'natural':
+            if p.octave is None:
+                return p.step + 'n'
+            return p.step + 'n' + str(p.octave)
+        return p.nameWithOctave
+
+    def _getPitchIndex(self, name):
+        if name not in self._pitchNameIndices:
+            self._pitchNameIndices[name] = len(self.pitchNames)
+            self.pitchNames.append(name)
+        return self._pitchNameIndices[name]
+
+    def _getTieCode(self, t):
+        '''
+        Return the tie column value for `t`, or None if `t` needs to be stored
+        in full.
+        '''
+        if t is None:
+            return 0
+        if t.style != 'normal' or t.type not in _COLUMNAR_TIE_TYPES:
+            return None
+        return _COLUMNAR_TIE_TYPES.index(t.type)
+
+    def _pitchSignature(self, p):
+        signature = []
+        for name, value in sorted(p.__dict__.items()):
+            if isinstance(value, common.SlottedObject):
+                value = sorted(value.__getstate__().items())
+            signature.append((name, value))
+        return signature
+
+    def _isPlainPitch(self, p, name, displayCode):
+        '''
+        True if a Pitch created from `name`, with the accidental displayStatus
+        given by `displayCode`, is the same as `p`.
+        '''
+        from music21 import pitch
+        if p.__class__ is not pitch.Pitch:
+            return False
+        key = (name, displayCode)
+        if key not in self._plainPitches:
+            plainPitch = pitch.Pitch(name)
+            if displayCode:
+                plainPitch.accidental.displayStatus = _COLUMNAR_DISPLAY_STATUSES[displayCode]
+            self._plainPitches[key] = self._pitchSignature(plainPitch)
+        return self._pitchSignature(p) == self._plainPitches[key]
+
+    def _durationSignature(self, d):
+        components = d.components
+        signature = [(c.type, c.dots, c.isLinked) for c in components]
+        if len(components) > 1: # linkage only matters between components
+            signature.append(d.linkage)
+        return signature
+
+    def _isPlainDuration(self, d, quarterLength):
+        '''
+        True if a Duration created from `quarterLength` is the same as `d`.
+        Tuplets are never plain, so that their brackets are kept.
+        '''
+        from music21 import duration
+        if d.__class__ is not duration.Duration or d.tuplets:
+            return False
+        if quarterLength not in self._plainDurations:
+            self._plainDurations[quarterLength] = self._durationSignature(
+                duration.Duration(quarterLength))
+        return self._durationSignature(d) == self._plainDurations[quarterLength]
+
+    def _streamEntry(self, s):
+        # StreamStatus.__getstate__ would unwrap the weakref to its client
+        status = common.SlottedObject.__getstate__(s.streamStatus)
+        del status['_client']
+        return (s.__class__, self._getState(s, s.__class__), status)
+
+    def _getPrototype(self, prototypeClass):
+        '''
+        Return the attributes of a new object of `prototypeClass`, or None if
+        one cannot be made without arguments.
+        '''
+        if prototypeClass not in self._prototypes:
+            try:
+                self._prototypes[prototypeClass] = prototypeClass().__dict__
+            except TypeError:
+                self._prototypes[prototypeClass] = None
+        return self._prototypes[prototypeClass]
+
+    def _getState(self, obj, prototypeClass=None, skip=()):
+        '''
+        Return a dictionary of the attributes of `obj` that need to be stored.
+        If `prototypeClass` is given, attributes that are the same as on a new
+        object of that class are omitted.
+        '''
+        prototype = None
+        if prototypeClass is not None:
+            prototype = self._getPrototype(prototypeClass)
+        state = {}
+        for name, value in obj.__dict__.items():
+            if name in _COLUMNAR_SKIP_ATTRIBUTES or name in skip:
+                continue
+            if name == 'id' and isinstance(value, six.integer_types):
+                continue # an id() from this session means nothing later
+            if prototype is not None and self._isDefault(value, prototype.get(name, self)):
+                continue
+            state[name] = self._getFreezableValue(obj, name, value)
+        return state
+
+    def _isDefault(self, value, default):
+        from music21 import duration
+        if value is None or isinstance(value, (bool, float) + six.integer_types + six.string_types):
+            return value.__class__ is default.__class__ and value == default
+        if value.__class__ is duration.Duration and default is None:
+            # a Duration of zero is made when first asked for
+            return (value.quarterLength == 0 and
+                    self._durationSignature(value) == self._durationSignature(duration.Duration(0)))
+        if isinstance(value, list):
+            return not value and value.__class__ is default.__class__ and not default
+        if value.__class__.__name__ == 'Beams' and default.__class__ is value.__class__:
+            return not value.beamsList and value.feathered == default.feathered
+        return False
+
+    def _getFreezableValue(self, obj, name, value):
+        '''
+        Music21Objects stored as attributes (articulations, expressions, and the
+        like) are stored as their class and the attributes that differ from a
+        new object of that class (see :class:`_ColumnarObject`); those that
+        cannot be made without arguments are copied without their sites, which
+        would otherwise bring along the whole hierarchy they are in.
+        '''
+        from music21 import beam
+        from music21 import variant
+        from music21 import volume
+        if name == '_stream' and isinstance(obj, variant.Variant):
+            return _ColumnarPacker().pack(value)
+        elif (value.__class__ is beam.Beams and 
+                all(b.__class__ is beam.Beam for b in value.beamsList)):
+            return _ColumnarBeams(value)
+        elif (isinstance(value, base.Music21Object) and 
+                self._getPrototype(value.__class__) is not None):
+            return _ColumnarObject(value.__class__, 
+                                   self._getState(value, value.__class__))
+        elif isinstance(value, base.Music21Object):
+            value = copy.deepcopy(value)
+            value.sites.clear()
+            value.sites.add(None, 0.0)
+            value.activeSite = None
+            return value
+        elif isinstance(value, volume.Volume):
+            newValue = volume.Volume()
+            newValue.mergeAttributes(value)
+            return newValue
+        elif isinstance(value, list) and value and isinstance(value[0], base.Music21Object):
+            newValue = copy.copy(value)
+            newValue[:] = [self._getFreezableValue(obj, name, v) for v in value]
+            return newValue
+        return value
+
+
+class _ColumnarUnpacker(object):
+    '''
+    Rebuilds a Stream from the storage dictionary made by a
+    :class:`_ColumnarPacker`.
+
+    After :meth:`unpackElements`, `streams`, `objects`, and `elements` hold
+    what was built for each entry of the side tables and each row, and
+    `rowTops` holds, for each row, the row of the element directly in the
+    outermost Stream that contains it (or -1 for elements only in spanners).
+    '''
+    def __init__(self):
+        self.streams = []
+        self.objects = []
+        self.elements = []
+        self.rowTops = []
+        self.objectRows = {}
+
+    def unpack(self, storage):
+        '''
+        Return the Stream stored in `storage`.
+        '''
+        streamObj = self.unpackElements(storage)
+        self.resolveSpanners(storage)
+        return streamObj
+
+    def unpackElements(self, storage, streamObj=None, droppedRows=()):
+        '''
+        Build every element and insert it in its container, but do not yet
+        fill in Spanners.  If `streamObj` is given, the elements of the
+        outermost Stream are inserted into it instead of a new Stream, except
+        for those whose rows are in `droppedRows`.  Returns the outermost Stream.
+        '''
+        from music21 import chord
+        from music21 import note
+        from music21 import tie
+
+        streams = self.streams
+        for i, (streamClass, state, status) in enumerate(storage['streams']):
+            if i == 0 and streamObj is not None:
+                streams.append(streamObj)
+                continue
+            s = streamClass()
+            s.__dict__.update(state)
+            for name, value in status.items():
+                setattr(s.streamStatus, name, value)
+            streams.append(s)
+        objects = self.objects
+        objects.extend(self._buildObject(objClass, state)
+                       for objClass, state in storage['objects'])
+        objectRows = self.objectRows
+
+        pitchNames = storage['pitchNames']
+        tieTypes = _COLUMNAR_TIE_TYPES
+        quarterLengths = storage['quarterLength']
+        pitchCounts = storage['pitchCount']
+        pitches = storage['pitch']
+        ties = storage['tie']
+        displayStatuses = _COLUMNAR_DISPLAY_STATUSES
+        accidentalDisplays = storage['accidentalDisplay']
+        noteExtras = storage['noteExtras']
+        offsets = storage['offset']
+        atEnds = storage['atEnd']
+        refs = storage['ref']
+        containers = storage['container']
+
+        pitchNumber = 0
+        elements = self.elements
+        rowTops = self.rowTops
+        streamTops = {0: -1}
+        for row, kind in enumerate(storage['kind']):
+            ref = refs[row]
+            containerNumber = containers[row]
+            if containerNumber == 0:
+                rowTops.append(row)
+            elif containerNumber == -1:
+                rowTops.append(-1)
+            else:
+                rowTops.append(streamTops[containerNumber])
+
+            if kind == _COLUMNAR_STREAM:
+                e = streams[ref]
+                streamTops[ref] = rowTops[row]
+            elif kind == _COLUMNAR_OBJECT:
+                e = objects[ref]
+                objectRows[ref] = row
+            elif kind == _COLUMNAR_SAME:
+                e = elements[ref]
+            else:
+                quarterLength = quarterLengths[ref]
+                pitchCount = pitchCounts[ref]
+                if kind == _COLUMNAR_NOTE:
+                    e = note.Note(pitchNames[pitches[pitchNumber]],
+                                  quarterLength=quarterLength)
+                    if ties[pitchNumber]:
+                        e.tie = tie.Tie(tieTypes[ties[pitchNumber]])
+                    if accidentalDisplays[pitchNumber]:
+                        e.pitch.accidental.displayStatus = displayStatuses[
+                            accidentalDisplays[pitchNumber]]
+                elif kind == _COLUMNAR_REST:
+                    e = note.Rest(quarterLength=quarterLength)
+                else:
+                    e = chord.Chord([pitchNames[pitches[i]] for i in
+                                     range(pitchNumber, pitchNumber + pitchCount)],
+                                    quarterLength=quarterLength)
+                    for i, n in enumerate(e._notes):
+                        if ties[pitchNumber + i]:
+                            n.tie = tie.Tie(tieTypes[ties[pitchNumber + i]])
+                        if accidentalDisplays[pitchNumber + i]:
+                            n.pitch.accidental.displayStatus = displayStatuses[
+                                accidentalDisplays[pitchNumber + i]]
+                pitchNumber += pitchCount
+                if ref in noteExtras:
+                    self._setState(e, noteExtras[ref])
+            elements.append(e)
+
+            if containerNumber == -1: # only found in a spanner
+                continue
+            if containerNumber == 0 and droppedRows and row in droppedRows:
+                continue
+            container = streams[containerNumber]
+            if atEnds[row]:
+                container._storeAtEndCore(e)
+            else:
+                container._insertCore(offsets[row], e, ignoreSort=True)
+        return streams[0]
+
+    def resolveSpanners(self, storage, findElement=None, keepRow=None):
+        '''
+        Fill in the Spanners built by :meth:`unpackElements`.  `findElement`,
+        if given, is called with every reference to a spanned element and
+        returns the element or None to leave it out.  If `keepRow` is given,
+        only Spanners in rows for which it returns True are filled in, and a
+        Spanner that loses all of its elements is removed from its container.
+        '''
+        elements = self.elements
+        for objectNumber, spannedRefs in storage['spanners']:
+            row = self.objectRows.get(objectNumber, -1)
+            if keepRow is not None and not keepRow(row):
+                continue
+            sp = self.objects[objectNumber]
+            # not addSpannedElements, which would drop an element spanned twice
+            spannedElements = sp.spannedElements
+            for ref, offset in spannedRefs:
+                if findElement is None:
+                    e = elements[ref]
+                else:
+                    e = findElement(ref)
+                    if e is None:
+                        continue
+                spannedElements._insertCore(offset, e, ignoreSort=True)
+            if (keepRow is not None and spannedRefs and not spannedElements._elements
+                    and row != -1):
+                self.streams[storage['container'][row]].remove(sp)
+
+    def _buildObject(self, objClass, state):
+        from music21 import variant
+        obj = objClass()
+        if objClass is variant.Variant or issubclass(objClass, variant.Variant):
+            state = dict(state)
+            state['_stream'] = _ColumnarUnpacker().unpack(state['_stream'])
+        self._setState(obj, state)
+        return obj
+
+    def _setState(self, obj, state):
+        obj.__dict__.update(state)
+        if getattr(obj, '_volume', None) is not None:
+            obj._volume.parent = obj
+
+
+def _thawColumnarObject(objClass, state):
+    '''
+    Return a new object of `objClass` with the attributes in `state`.
+    '''
+    obj = objClass()
+    obj.__dict__.update(state)
+    if getattr(obj, '_volume', None) is not None:
+        obj._volume.parent = obj
+    return obj
+
+
+class _ColumnarObject(object):
+    '''
+    A Music21Object stored as an attribute of another, packed as its class
+    and the attributes that differ from a new object of that class.  It is
+    unpickled as the object itself, made by :func:`_thawColumnarObject`,
+    which is much faster than unpickling the object with all of its
+    attributes.
+    '''
+    __slots__ = ('objClass', 'state')
+
+    def __init__(self, objClass, state):
+        self.objClass = objClass
+        self.state = state
+
+    def __reduce__(self):
+        return (_thawColumnarObject, (self.objClass, self.state))
+
+
+def _thawColumnarBeams(feathered, beamValues):
+    '''
+    Return a new Beams object from the values stored by :class:`_ColumnarBeams`.
+    '''
+    from music21 import beam
+    beams = beam.Beams()
+    beams.feathered = feathered
+    for beamType, direction, independentAngle, number in beamValues:
+        b = beam.Beam(beamType, direction)
+        b.independentAngle = independentAngle
+        b.number = number
+        beams.beamsList.append(b)
+    return beams
+
+
+class _ColumnarBeams(object):
+    '''
+    A Beams object packed as a tuple of the values of each Beam, which
+    unpickles faster than the Beams object itself; see :class:`_ColumnarObject`.
+    '''
+    __slots__ = ('beams',)
+
+    def __init__(self, beams):
+        self.beams = beams
+
+    def __reduce__(self):
+        beamValues = tuple((b.type, b.direction, b.independentAngle, b.number)
+                           for b in self.beams.beamsList)
+        return (_thawColumnarBeams, (self.beams.feathered, beamValues))
+
+
+def _columnarDataFromStorage(storage, zipType=None):
+    data = pickleMod.dumps(storage, protocol=-1)
+    if zipType == 'zlib':
+        return _COLUMNAR_HEADER + b'z' + zlib.compress(data)
+    return _COLUMNAR_HEADER + b'-' + data
+
+def _columnarStorageFromData(data):
+    headerLength = len(_COLUMNAR_HEADER)
+    body = data[headerLength + 1:]
+    if data[headerLength:headerLength + 1] == b'z':
+        body = zlib.decompress(body)
+    return pickleMod.loads(body)
+
+# a chunked file or string is this header, 'z' or '-' for whether the chunks
+# are zlib compressed, the length of the index as an 8-byte little-endian
+# number, the (always compressed) index, and then the chunks one after another
+_CHUNKED_HEADER = b'M21CHUNKED1'
+
+def _chunkedDataFromStorage(storage, zipType=None):
+    chunkData = []
+    chunkPositions = []
+    offset = 0
+    for chunkStorage in storage['chunks']:
+        data = pickleMod.dumps(chunkStorage, protocol=-1)
+        if zipType == 'zlib':
+            data = zlib.compress(data)
+        chunkData.append(data)
+        chunkPositions.append((offset, len(data)))
+        offset += len(data)
+    index = dict(storage)
+    del index['chunks']
+    index['chunkPositions'] = chunkPositions
+    indexData = zlib.compress(pickleMod.dumps(index, protocol=-1))
+    flag = b'z' if zipType == 'zlib' else b'-'
+    return b''.join([_CHUNKED_HEADER, flag, struct.pack('<Q', len(indexData)),
+                     indexData] + chunkData)
+
+def _chunkedIndexFromData(data):
+    '''
+    Return the index of chunked `data` and where its first chunk starts.
+    '''
+    start = len(_CHUNKED_HEADER) + 1
+    indexLength = struct.unpack('<Q', data[start:start + 8])[0]
+    index = _chunkStorageFromData(data[start + 8:start + 8 + indexLength], True)
+    return index, start + 8 + indexLength
+
+def _chunkStorageFromData(data, compressed):
+    if compressed:
+        data = zlib.decompress(data)
+    return pickleMod.loads(data)
+
+#--------------------------------------------------------------------------------
+
+class JSONFreezerException(FreezeThawException):
+    pass
+class JSONThawerException(FreezeThawException):
+    pass
+
+class JSONFreezeThawBase(object):
+    '''
+    Shared functionality for JSONFreeze and JSONThaw
+    '''
+    # a list of attributes to store.  Also takes the following special attributes
+    # __AUTO_GATHER__ : place all autoGatherAttributes here
+    # __INHERIT__ : place all attributes from the inherited class here # NOT YET!
+    storedClassAttributes = {
+        'music21.base.Music21Object' : [
+            '_duration', '_priority', 'offset',                
+            ],
+        'music21.beam.Beam': [
+            'type', 'direction', 'independentAngle', 'number',
+            ],
+        'music21.beam.Beams': [
+            'beamsList', 'feathered',
+            ],
+        'music21.duration.DurationUnit': [
+            '__AUTO_GATHER__',
+            ],
+        'music21.duration.Duration': [
+            '__AUTO_GATHER__',
+            ],
+        'music21.editorial.NoteEditorial': [
+            'color', 'misc', 'comment',
+            ],
+        'music21.editorial.Comment': [
+            '__AUTO_GATHER__',
+            ],
+        'music21.key.KeySignature': [
+            'sharps', 'mode', '_alteredPitches',
+            ],
+        'music21.metadata.primitives.Contributor': [
+            '_role', 'relevance', '_names', '_dateRange',
+            ],
+        'music21.metadata.primitives.Date': [
+            'year', 'month', 'day', 'hour', 'minute', 'second',
+            'yearError', 'monthError', 'dayError', 'hourError', 'minuteError',
+            'secondError',
+            ],
+        'music21.metadata.primitives.DateSingle': [
+            '_relevance',  '_dataError', '_data',
+            ],
+        'music21.metadata.Metadata': [
+            '_date', '_imprint', '_copyright', '_workIds', '_urls',
+            '_contributors',
+            ],
+        'music21.metadata.bundles.MetadataBundle': [
+            '_metadataEntries', 'name',
+            ],
+        'music21.metadata.bundles.MetadataEntry': [
+            '_sourcePath', '_number', '_metadataPayload',
+            '_sourceModificationTime', '_sourceSize', '_sourceHash',
+            ],
+        'music21.metadata.RichMetadata': [
+            '__INHERIT__',
+            'ambitus',
+            'keySignatures',
+            'keySignatureFirst',
+            'noteCount',
+            'pitchHighest',
+            'pitchLowest',
+            'quarterLength',
+            'tempos',
+            'tempoFirst',
+            'timeSignatureFirst',
+            'timeSignatures',
+            ],
+        'music21.metadata.primitives.Text': [
+            '_data', '_language',
+            ],
+        'music21.meter.TimeSignature': [
+            'ratioString',
+            ],
+        'music21.note.Lyric': [
+            'text', 'syllabic', 'number', 'identifier',
+            ],
+        'music21.note.GeneralNote': [
+            '__INHERIT__', '_editorial', 'lyrics', 'expressions', 'articulations',
+            'tie',
+            ],
+        'music21.note.NotRest': [
+            '__INHERIT__', '_notehead', '_noteheadFill',
+            '_noteheadParenthesis', '_stemDirection', '_volume',
+            ],
+        'music21.note.Note': [
+            '__INHERIT__', 'pitch', 'beams',
+            ],
+        'music21.pitch.Accidental': [
+            '__AUTO_GATHER__',              
+            ],
+        
+        'music21.pitch.Pitch': [
+            '_accidental', '_microtone', '_octave', '_step', 
+            ],
+        'music21.stream.Stream': ['__INHERIT__',
+                                  '_atSoundingPitch',
+                                  '_elements',
+                                  '_endElements',
+                                  ],
+        'music21.tie.Tie': [
+                            'type', 'style'
+                            ],
+        'music21.volume.Volume': [
+                                  '_velocity'
+                                  ],
+        }
+
+    postClassCreateCall = {
+        #'music21.meter.TimeSignature': ('ratioChanged',),
+        }
+
+    def __init__(self, storedObject=None):
+        self.storedObject = storedObject
+        if storedObject is not None:
+            self.className = '.'.join((
+                storedObject.__class__.__module__,
+                storedObject.__class__.__name__,
+                ))
+        else:
+            self.className = None
+
+    def music21ObjectFromString(self, idStr):
+        '''
+        Given a stored string during JSON serialization, return an object.
+        This method effectively converts a string class specification into
+        a vanilla instance ready for specialization via stored data attributes.
+
+        A subclass that overrides this method will have access to all
+        modules necessary to create whatever objects necessary.
+
+
+        >>> jss = freezeThaw.JSONFreezer()
+        >>> n = jss.music21ObjectFromString('note.Note')
+        >>> n
+        <music21.note.Note C>
+
+        One can begin with "music21." if you'd like:
+
+        >>> d = jss.music21ObjectFromString('music21.duration.Duration')
+        >>> d
+        <music21.duration.Duration 0.0>
+
+        Undefined classes give a JSONFreezerException
+
+        >>> jss.music21ObjectFromString('blah.NotAClass')
+        Traceback (most recent call last):
+        JSONFreezerException: Cannot generate a new object from blah.NotAClass
+        '''
+        import music21
+        idStrOrig = idStr
+        if idStr.startswith('music21.'):
+            idStr = idStr[8:]
+        elif idStr.startswith("<class 'music21.") and idStr.endswith("'>"):
+            # old style JSON not used anymore:
+            # changes <class 'music21.metadata.RichMetadata'> to
+            # metadata.RichMetadata
+            idStr = idStr[16:]
+            idStr = idStr[0:len(idStr)-2]
+
+        idStrSplits = idStr.split('.')
+        lastInspect = music21
+        for thisMod in idStrSplits:
+            try:
+                nextMod = getattr(lastInspect, thisMod)
+            except AttributeError:
+                raise JSONFreezerException("Cannot generate a new object from %s" % idStrOrig)
+            if inspect.isclass(nextMod) is True:
+                lastInspect = nextMod()
+            elif inspect.ismodule(nextMod) is True:
+                lastInspect = nextMod
+            else:
+                raise JSONFreezerException("All the parts of %s must refer to modules or classes" % idStrOrig)
+
+        return lastInspect
+
+    def fullyQualifiedClassFromObject(self, obj):
+        '''
+        return a fullyQualified class name from an object.
+
+        for Music21Objects you can just do: ``obj.fullyQualifiedClasses[0]``, but
+        this works on any object (such as Durations which aren't Music21Objects)
+
+
+        >>> d = duration.DurationUnit()
+        >>> jsbase = freezeThaw.JSONFreezeThawBase()
+        >>> jsbase.fullyQualifiedClassFromObject(d)
+        'music21.duration.DurationUnit'
+
+        Works on class objects as well:
+
+        >>> dclass = duration.DurationUnit
+        >>> jsbase.fullyQualifiedClassFromObject(dclass)
+        'music21.duration.DurationUnit'
+        '''
+        if inspect.isclass(obj):
+            return obj.__module__ + '.' + obj.__name__
+        else:
+            c = obj.__class__
+            return c.__module__ + '.' + c.__name__
+
+class JSONFreezer(JSONFreezeThawBase):
+    '''
+    Class that provides JSON output from an object (whether
+    Music21Object or other).
+
+
+    >>> n = note.Note("C#4")
+    >>> jsonF = freezeThaw.JSONFreezer(n)
+    >>> jsonF.storedObject
+    <music21.note.Note C#>
+    >>> jsonF.className
+    'music21.note.Note'
+    '''
+    def __init__(self, storedObject=None):
+        JSONFreezeThawBase.__init__(self, storedObject)
+    #---------------------------------------------------------------------------
+    # override these methods for json functionality
+
+    def autoGatherAttributes(self):
+        '''
+        Gather just the instance data members that are proceeded by an underscore.
+
+        Returns a list of those data members
+
+        ::
+
+            >>> n = note.Note()
+            >>> jss = freezeThaw.JSONFreezer(n)
+            >>> for attr in jss.autoGatherAttributes():
+            ...     attr
+            ...
+            '_activeSite'
+            '_activeSiteId'
+            '_duration'
+            '_editorial'
+            '_idLastDeepCopyOf'
+            '_notehead'
+            '_noteheadFill'
+            '_noteheadParenthesis'
+            '_priority'
+            '_stemDirection'
+            '_volume'
+
+        '''
+        result = set()
+        if self.storedObject is None:
+            return []
+        # names that we always do not need
+        excludedNames = [
+            '_classes',
+            '_fullyQualifiedClasses',
+            '_derivation',
+            '_DOC_ATTR',
+            '_DOC_ORDER',
+            ]
+
+        for attr in inspect.classify_class_attrs(type(self.storedObject)):
+            if attr.kind == 'data' and inspect.ismemberdescriptor(attr.object):
+                if attr.name not in excludedNames and \
+                    attr.name.startswith('_') and \
+                    not attr.name.startswith('__'):
+                    result.add(attr.name)
+            else:
+                excludedNames.append(attr.name)
+        for name in dir(self.storedObject):
+            if not name.startswith('_') or name.startswith('__'):
+                continue
+            elif name in excludedNames:
+                continue
+            attr = getattr(self.storedObject, name)
+            if inspect.ismethod(attr) or \
+                inspect.isfunction(attr) or  \
+                inspect.isroutine(attr):
+                continue
+            result.add(name)
+
+#        # get class names that exclude instance names
+#        # these names will be rejected in final accumulation
+#        classNames = []
+#        for bundle in inspect.classify_class_attrs(obj.__class__):
+#            if (bundle.name.startswith('_') and not
+#                bundle.name.startswith('__')):
+#                classNames.append(bundle.name)
+#        #environLocal.printDebug(['classNames', classNames])
+#        for name in dir(obj):
+#            if name.startswith('_') and not name.startswith('__'):
+#                attr = getattr(obj, name)
+#                #environLocal.printDebug(['inspect.isroutine()', attr, inspect.isroutine(attr)])
+#                if (not inspect.ismethod(attr) and not
+#                    inspect.isfunction(attr) and not inspect.isroutine(attr)):
+#                    # class names stored are class attrs, not needed for
+#                    # reinstantiation
+#                    if name not in classNames and name not in exclude:
+#                        # store the name, not the attr
+#                        post.append(name)
+
+        result = sorted(result)
+        return result
+
+    def jsonAttributes(self, autoGather=True):
+        '''
+        Define all attributes of this object that should be JSON serialized for storage and re-instantiation. Attributes that name basic
+        Python objects or :class:`~music21.freezeThaw.JSONFreezer` subclasses,
+        or dictionaries or lists that contain Python objects or :class:`~music21.freezeThaw.JSONFreezer` subclasses, can be provided.
+
+        Should be overridden in subclasses.
+
+        For an object which does not define this, just returns all the _underscore attributes:
+
+        >>> ed = editorial.NoteEditorial()
+        >>> jsf = freezeThaw.JSONFreezer(ed)
+        >>> jsf.jsonAttributes()
+        ['color', 'misc', 'comment']
+
+        >>> l = note.Lyric()
+        >>> jsf = freezeThaw.JSONFreezer(l)
+        >>> jsf.jsonAttributes()
+        ['text', 'syllabic', 'number', 'identifier']
+
+        Has autoGatherAttributes and others:
+
+        >>> gn = note.GeneralNote()
+        >>> jsf = freezeThaw.JSONFreezer(gn)
+        >>> jsf.jsonAttributes()
+        ['_duration', '_priority', 'offset', '_editorial', 'lyrics', 'expressions', 'articulations', 'tie']
+        '''
+        if self.storedObject is None:
+            return []
+
+        attributeList = []
+        if hasattr(self.storedObject, 'fullyQualifiedClasses'):
+            fqClassList = self.storedObject.fullyQualifiedClasses
+        else: # same thing...
+            fqClassList = [self.fullyQualifiedClassFromObject(x) for x in self.storedObject.__class__.mro()]
+
+        for i, thisClass in enumerate(fqClassList):
+            inheritFrom = i + 1
+            if thisClass in self.storedClassAttributes:
+                attributeList = self.storedClassAttributes[thisClass]
+                while "__INHERIT__" in attributeList:
+                    inheritMarkerIndex = attributeList.index("__INHERIT__")
+                    attributeList2 = attributeList[0:inheritMarkerIndex]
+                    inheritClass = fqClassList[inheritFrom]
+                    inheritFrom += 1
+                    inheritAttributes = self.storedClassAttributes[inheritClass]
+                    attributeList2.extend(inheritAttributes)
+                    if inheritMarkerIndex != len(attributeList) - 1:
+                        attributeList2.extend(attributeList[inheritMarkerIndex+1:])
+                    attributeList = attributeList2
+
+                if "__AUTO_GATHER__" in attributeList:
+                    autoGathered = self.autoGatherAttributes()
+                    # slow way of doing this.
+                    autoGatherMarkerIndex = attributeList.index("__AUTO_GATHER__")
+                    attributeList2 = attributeList[0:autoGatherMarkerIndex]
+                    attributeList2.extend(autoGathered)
+                    if autoGatherMarkerIndex != len(attributeList) - 1:
+                        attributeList2.extend(attributeList[autoGatherMarkerIndex+1:])
+                    attributeList = attributeList2
+                return attributeList
+        if attributeList == [] and autoGather is True:
+            return self.autoGatherAttributes()
+
+
+    def canBeFrozen(self, possiblyFreezeable):
+        '''
+        Returns True or False if this attribute can
+        be frozen in a way that
+        is stronger than just storing the repr of it.
+
+
+        >>> jsf = freezeThaw.JSONFreezer()
+        >>> jsf.canBeFrozen(note.Note())
+        True
+        >>> jsf.canBeFrozen(345)
+        False
+        >>> jsf.canBeFrozen(None)
+        False
+
+        Lists and Tuples and Dicts return False, but they
+        are not just stored as __repr__, don't worry...
+
+        >>> jsf.canBeFrozen([7,8])
+        False
+        '''
+        if possiblyFreezeable is None:
+            return False
+        if hasattr(possiblyFreezeable, '_jsonFreezer') and possiblyFreezeable._jsonFreezer is not False:
+            return True
+        if isinstance(possiblyFreezeable, (list, tuple, dict)):
+            return False
+        if six.PY2 and isinstance(possiblyFreezeable, (int, str, unicode, float)):
+            return False
+        elif six.PY3 and isinstance(possiblyFreezeable, (int, str, bytes, float)):
+            return False 
+
+        if hasattr(possiblyFreezeable, 'fullyQualifiedClasses'):
+            fqClassList = possiblyFreezeable.fullyQualifiedClasses
+        else: # same thing...
+            fqClassList = [x.__module__ + '.' + x.__name__ for x in possiblyFreezeable.__class__.mro()]
+
+        for fqName in fqClassList:
+            if fqName in self.storedClassAttributes:
+                return True
+        return False
+
+    #---------------------------------------------------------------------------
+    # core methods for getting and setting
+
+    def getJSONDict(self, includeVersion=False):
+        '''
+        Return a dictionary representation for JSON processing.
+        All component objects are similarly encoded as dictionaries.
+        This method is recursively called as needed to store dictionaries
+        of component objects that are :class:`~music21.freezeThaw.JSONFreezer` subclasses.
+
+
+        >>> t = metadata.Text('my text')
+        >>> t.language = 'en'
+        >>> jsf = freezeThaw.JSONFreezer(t)
+        >>> jsdict = jsf.getJSONDict()
+        >>> jsdict['__class__']
+        'music21.metadata.primitives.Text'
+        >>> jsdict['__attr__']['_language']
+        'en'
+        '''
+        obj = self.storedObject
+        if obj is not None:
+            src = {'__class__': self.className}
+        else:
+            src = {}
+        # always store the version used to create this data
+        if includeVersion is True:
+            src['__version__'] = base.VERSION
+
+        if obj is None:
+            return src
+
+        # flat data attributes
+        flatData = {}
+        if self.storedObject is None:
+            return src
+
+        for attr in self.jsonAttributes():
+            attrValue = getattr(self.storedObject, attr)
+            if isinstance(attrValue, fractions.Fraction):
+                attrValue = float(attrValue)
+            #environLocal.printDebug(['_getJSON', attr, "hasattr(attrValue, 'json')", hasattr(attrValue, 'json')])
+
+            # do not store None values; assume initial/unset state
+            if attrValue is None:
+                continue
+
+            # if, stored on this object, is an object w/ a json method
+            if self.canBeFrozen(attrValue):
+                #environLocal.printDebug(['attrValue', attrValue])
+                internalJSONFreezer = JSONFreezer(attrValue)
+                flatData[attr] = internalJSONFreezer.getJSONDict()
+
+            # handle lists; look for objects that have json attributes
+            elif isinstance(attrValue, (list, tuple)):
+                flatData[attr] = []
+                for attrValueSub in attrValue:
+                    if self.canBeFrozen(attrValueSub):
+                        internalJSONFreezer = JSONFreezer(attrValueSub)
+                        flatData[attr].append(internalJSONFreezer.getJSONDict())
+                    else: # just store normal data
+                        flatData[attr].append(attrValueSub)
+
+            # handle dictionaries; look for objects that have json attributes
+            elif isinstance(attrValue, dict):
+                flatData[attr] = {}
+                for key in attrValue:
+                    attrValueSub = attrValue[key]
+                    # skip None values for efficiency
+                    if attrValueSub is None:
+                        continue
+                    # see if this object stores a json object or otherwise
+                    if self.canBeFrozen(attrValueSub):
+                        internalJSONFreezer = JSONFreezer(attrValueSub)
+                        flatData[attr][key] = internalJSONFreezer.getJSONDict()
+                    else: # just store normal data
+                        flatData[attr][key] = attrValueSub
+            else:
+                flatData[attr] = attrValue
+        src['__attr__'] = flatData
+        return src
+
+    @property
+    def json(self):
+        '''
+        Get string JSON data for this object.
+
+        This method is only available if a JSONFreezer subclass object has been
+        customized and configured by overriding the following methods:
+        :meth:`~music21.freezeThaw.JSONFreezer.jsonAttributes`,
+        :meth:`~music21.freezeThaw.JSONFreezer.music21ObjectFromString`.
+
+        Return the dictionary returned by self.getJSONDict() as a JSON string.
+        '''
+        # when called from json property, include version number;
+        # this should mean that only the outermost object has a version number
+        return json.dumps(
+            self.getJSONDict(includeVersion=True),
+            sort_keys=True,
+            )
+
+    @property
+    def prettyJson(self):
+        lines = json.dumps(
+            self.getJSONDict(includeVersion=True),
+            sort_keys=True,
+            indent=4,
+            ).splitlines()
+        return '\n'.join(line.rstrip() for line in lines)
+
+
+    def jsonPrint(self):
+        r'''
+        Prints out the json output for a given object:
+
+
+        >>> n = note.Note('D#5')
+        >>> jsf = freezeThaw.JSONFreezer(n)
+        >>> jsf.jsonPrint()
+        {
+          "__attr__": {
+            "_duration": {
+              "__attr__": {
+                "_cachedIsLinked": true, 
+                "_components": [
+                  {
+                    "__attr__": {
+                      "_componentsNeedUpdating": false, 
+                      "_dots": [
+                        0
+                      ], 
+                      "_link": true, 
+                      "_qtrLength": 1.0, 
+                      "_quarterLengthNeedsUpdating": false, 
+                      "_tuplets": [], 
+                      "_type": "quarter", 
+                      "_typeNeedsUpdating": false
+                    }, 
+                    "__class__": "music21.duration.DurationUnit"
+                  }
+                ], 
+                "_componentsNeedUpdating": false, 
+                "_qtrLength": 1.0, 
+                "_quarterLengthNeedsUpdating": false, 
+                "_typeNeedsUpdating": false
+              }, 
+              "__class__": "music21.duration.Duration"
+            }, 
+            "_notehead": "normal", 
+            "_noteheadFill": "default", 
+            "_noteheadParenthesis": false, 
+            "_priority": 0, 
+            "_stemDirection": "unspecified", 
+            "articulations": [], 
+            "beams": {
+              "__attr__": {
+                "beamsList": [], 
+                "feathered": false
+              }, 
+              "__class__": "music21.beam.Beams"
+            }, 
+            "expressions": [], 
+            "lyrics": [], 
+            "offset": 0.0, 
+            "pitch": {
+              "__attr__": {
+                "_accidental": {
+                  "__attr__": {
+                    "_alter": 1.0, 
+                    "_displayType": "normal", 
+                    "_modifier": "#", 
+                    "_name": "sharp" 
+                  }, 
+                  "__class__": "music21.pitch.Accidental"
+                }, 
+                "_microtone": {
+                  "__attr__": {
+                    "_centShift": 0, 
+                    "_harmonicShift": 1
+                  }, 
+                  "__class__": "music21.pitch.Microtone"
+                }, 
+                "_octave": 5, 
+                "_step": "D"
+              }, 
+              "__class__": "music21.pitch.Pitch"
+            }
+          }, 
+          "__class__": "music21.note.Note", 
+          "__version__": [
+            2, 
+            0, 
+            0
+          ]
+        }
+        '''
+        print(json.dumps(
+            self.getJSONDict(includeVersion=True),
+            sort_keys=True,
+            indent=2,
+            ))
+
+    def jsonWrite(self, fp, formatOutput=True):
+        '''
+        Given a file path, write JSON to a file
+        for this object.
+
+        File extension should be .json. File is opened
+        and closed within this method call.
+        '''
+        with codecs.open(fp, mode='w', encoding='utf-8') as f:
+            jsonDict = self.getJSONDict(includeVersion=True)
+            if formatOutput is False:
+                jsonString = json.dumps(
+                    jsonDict,
+                    sort_keys=False,
+                    )
+            else:
+                jsonString = json.dumps(
+                    jsonDict,
+                    sort_keys=True,
+                    indent=2,
+                    )
+            f.write(jsonString)
+
+class JSONThawer(JSONFreezeThawBase):
+    '''
+    Class that takes JSON input and makes a Music21Object.
+    '''
+    def __init__(self, storedObject=None):
+        JSONFreezeThawBase.__init__(self, storedObject)
+
+    def _isComponent(self, target):
+        '''
+        Return a boolean if the provided object is a
+        dictionary that defines a __class__ key, the necessary
+        conditions to try to instantiate a component object
+        with the music21ObjectFromString method.
+        '''
+        # on export, check for attribute
+        if isinstance(target, dict) and '__class__' in target:
+            return True
+        return False
+
+    def _buildComponent(self, src):
+        # get instance from subclass overridden method
+        obj = self.music21ObjectFromString(src['__class__'])
+        # assign dictionary (property takes dictionary or string)
+        self._setJSON(src, obj)
+        objFQClass = self.fullyQualifiedClassFromObject(obj)
+        if objFQClass in self.postClassCreateCall:
+            callMethodStr = self.postClassCreateCall[objFQClass][0]
+            # TODO: add args
+            callMethod = getattr(obj, callMethodStr)
+            callMethod(obj)
+
+        return obj
+
+    def _setJSON(self, jsonStr, inputObject = None):
+        '''
+        Set this object based on a JSON string
+        or instantiated dictionary representation.
+
+
+        >>> t = metadata.Text('my text')
+        >>> t.language = 'en'
+        >>> jsf = freezeThaw.JSONFreezer(t)
+        >>> jsfJSON = jsf.json
+
+        >>> tNew = metadata.Text()
+        >>> jsf2 = freezeThaw.JSONThawer(tNew)
+        >>> jsf2.json = jsfJSON
+        >>> str(tNew)
+        'my text'
+
+        Notice that some normal strings come back as unicode:
+
+        >>> tNew.language
+        u'en'
+
+
+        Notes are more complex. Let's not even give an
+        input object this time:
+
+        >>> n = note.Note("D#5")
+        >>> n.duration.quarterLength = 3.0
+        >>> jsf = freezeThaw.JSONFreezer(n)
+        >>> jsfJSON = jsf.json
+
+
+        >>> jsf2 = freezeThaw.JSONThawer()
+        >>> jsf2.json = jsfJSON
+        >>> n2 = jsf2.storedObject
+        >>> n2
+        <music21.note.Note D#>
+        >>> n2.octave
+        5
+
+        Test that other attributes get updated automatically
+
+        >>> n2.duration.dots
+        1
+        '''
+        #environLocal.printDebug(['_setJSON: srcStr', jsonStr])
+        if isinstance(jsonStr, dict):
+            d = jsonStr # do not loads
+        else:
+            d = json.loads(jsonStr)
+
+        if inputObject is not None:
+            obj = inputObject
+        elif self.storedObject is not None:
+            obj = self.storedObject
+        elif d['__class__'] is not None:
+            obj = self.music21ObjectFromString(d['__class__'])
+            self.storedObject = obj
+        else:
+            raise JSONThawerException("Cannot find an object class definition in the jsonStr; you must provide an input object")
+
+        for attr in d:
+            #environLocal.printDebug(['_setJSON: attr', attr, d[attr]])
+            if attr == '__class__':
+                pass
+            elif attr == '__version__':
+                pass
+            elif attr == '__attr__':
+                for key in d[attr]:
+                    attrValue = d[attr][key]
+                    if attrValue == None or isinstance(attrValue,
+                        (int, float)):
+                        try:
+                            setattr(obj, key, attrValue)
+                        except AttributeError:
+                            raise JSONThawerException("Cannot set attribute '%s' to %s for obj %r" % (key, attrValue, obj))
+                    # handle a list or tuple, looking for dicts that define objs
+                    elif isinstance(attrValue, (list, tuple)):
+                        subList = []
+                        for attrValueSub in attrValue:
+                            if self._isComponent(attrValueSub):
+                                subList.append(
+                                    self._buildComponent(attrValueSub))
+                            else:
+                                subList.append(attrValueSub)
+                        setattr(obj, key, subList)
+                    # handle a dictionary, looking for dicts that define objs
+                    elif isinstance(attrValue, dict):
+                        # could be a data dict or a dict of objects;
+                        # if an object, will have a __class__ key
+                        if self._isComponent(attrValue):
+                            setattr(obj, key, self._buildComponent(attrValue))
+                        # its a data dictionary; could contain objects as
+                        # dictionaries, or flat data
+                        else:
+                            subDict = {}
+                            for subKey in attrValue:
+                                # this could be flat data or a obj definition
+                                # in a dictionary
+                                attrValueSub = attrValue[subKey]
+                                # if a dictionary, and defines a __class__,
+                                # create an object
+                                if self._isComponent(attrValueSub):
+                                    subDict[subKey] = self._buildComponent(
+                                        attrValueSub)
+                                else:
+                                    subDict[subKey] = attrValueSub
+                            #setattr(self, key, subDict)
+                            try:
+                                dst = getattr(obj, key)
+                            except AttributeError as ae:
+                                if key == "_storage": # changed name; help older .json files...
+                                    dst = getattr(obj, "storage")
+                                else:
+                                    raise JSONFreezerException("Problem with key: %s for object %s: %s" % (key, obj, ae))
+
+                            # updating the dictionary preserves default
+                            # values created at init
+                            dst.update(subDict)
+                    else: # assume a string
+                        try:
+                            setattr(obj, key, attrValue)
+                        except AttributeError:
+                            pass
+            else:
+                raise JSONFreezerException('cannot handle json attr: %s'% attr)
+
+    json = property(fset=_setJSON,
+        doc = '''
+        Take string JSON data from :meth:`~music21.freezeThaw.JSONFreezer.json` and
+        produce an object and store it in
+        self.storedObject.`.
+        ''')
+
+    def jsonRead(self, fp):
+        '''
+        Given a file path, read JSON from a file to this object.
+        Default file extension should be .json. File is opened
+        and closed within this method call.
+
+        returns the stored object
+        '''
+        f = open(fp)
+        self.json = f.read()
+        f.close()
+        return self.storedObject
+
+#------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testSimpleFreezeThaw(self):
+        from music21 import stream, note
+        s = stream.Stream()
+        sDummy = stream.Stream()
+        n = note.Note()
+        s.insert(2.0, n)
+        sDummy.insert(3.0, n)
+
+        sf = StreamFreezer(s)
+        out = sf.writeStr()
+
+        del(s)
+        del(sDummy)
+        del(n)
+
+        st = StreamThawer()
+        st.openStr(out)
+        outStream = st.stream
+        self.assertEqual(len(outStream), 1)
+        self.assertEqual(outStream[0].offset, 2.0)
+
+    def testFreezeThawWithSpanner(self):
+        from music21 import stream, note, spanner
+        s = stream.Stream()
+        sDummy = stream.Stream()
+        n = note.Note()
+        sl1 = spanner.Slur([n])
+        s.insert(0.0, sl1)
+        s.insert(2.0, n)
+        sDummy.insert(3.0, n)
+
+        sf = StreamFreezer(s)
+        out = sf.writeStr()
+
+        del(s)
+        del(sDummy)
+        del(n)
+
+        st = StreamThawer()
+        st.openStr(out)
+        outStream = st.stream
+        self.assertEqual(len(outStream), 2)
+        self.assertEqual(outStream.notes[0].offset, 2.0)
+        self.assertIs(outStream.spanners[0].getFirst(), outStream.notes[0])
+
+    def testFreezeThawCorpusFileWithSpanners(self):
+        from music21 import corpus
+        c = corpus.parse('luca/gloria')
+        sf = StreamFreezer(c)
+        data = sf.writeStr(fmt='pickle')
+
+        st = StreamThawer()
+        st.openStr(data)
+        s = st.stream
+        self.assertEqual(len(s.parts[0].measure(7).notes), 6)
+
+    def testFreezeThawColumnarCorpusFileWithSpanners(self):
+        import re
+        from music21 import corpus
+        c = corpus.parse('luca/gloria')
+        sf = StreamFreezer(c)
+        data = sf.writeStr(fmt='columnar')
+
+        st = StreamThawer()
+        st.openStr(data)
+        s = st.stream
+        stripAddresses = lambda text: re.sub(r' at 0x[0-9a-f]+', '', text)
+        self.assertEqual(stripAddresses(s._reprText()), stripAddresses(c._reprText()))
+        self.assertEqual(len(s.parts[0].measure(7).notes), 6)
+        self.assertEqual(len(s.flat.getElementsByClass('Slur')),
+                         len(c.flat.getElementsByClass('Slur')))
+
+    def testFreezeThawColumnarAttributeObjects(self):
+        from music21 import articulations, bar, beam, note, stream
+        s = stream.Measure()
+        n = note.Note('C4', quarterLength=0.5)
+        n.articulations.append(articulations.Staccato())
+        n.articulations[0].placement = 'below'
+        n.beams.fill('16th', 'start')
+        n.beams.beamsList[1].independentAngle = 1.0
+        n.stemDirection = 'down'
+        s.append(n)
+        s.rightBarline = bar.Barline('final')
+        data = StreamFreezer(s).writeStr(fmt='columnar')
+
+        st = StreamThawer()
+        st.openStr(data)
+        nThawed = st.stream.notes[0]
+        self.assertEqual(repr(nThawed.articulations), '[<music21.articulations.Staccato>]')
+        self.assertEqual(nThawed.articulations[0].placement, 'below')
+        self.assertEqual(len(nThawed.articulations[0].sites), 1)
+        self.assertEqual(repr(nThawed.beams.beamsList), repr(n.beams.beamsList))
+        self.assertTrue(isinstance(nThawed.beams.beamsList[0], beam.Beam))
+        self.assertEqual(nThawed.beams.beamsList[1].independentAngle, 1.0)
+        self.assertEqual(nThawed.stemDirection, 'down')
+        self.assertEqual(st.stream.rightBarline.style, 'final')
+        self.assertEqual(st.stream.rightBarline.duration.quarterLength, 0.0)
+
+
+    def testFreezeThawChunkedCorpusFileWithSpanners(self):
+        import re
+        from music21 import corpus
+        c = corpus.parse('luca/gloria')
+        data = StreamFreezer(c).writeStr(fmt='chunked', measuresPerChunk=4)
+
+        st = StreamThawer()
+        st.openStr(data)
+        stripAddresses = lambda text: re.sub(r' at 0x[0-9a-f]+', '', text)
+        self.assertEqual(stripAddresses(st.stream._reprText()),
+                         stripAddresses(c._reprText()))
+
+        st.openStr(data, parts=[1], measures=(6, 9))
+        s = st.stream
+        self.assertEqual(len(s.parts), 1)
+        self.assertEqual([m.number for m in s.parts[0].getElementsByClass('Measure')],
+                         [6, 7, 8, 9])
+        source = c.parts[1].measures(6, 9).flat.notesAndRests
+        self.assertEqual([repr(n) for n in s.parts[0].flat.notesAndRests],
+                         [repr(n) for n in source])
+        # spanners only span what was thawed
+        for sp in s.parts[0].spanners:
+            self.assertTrue(len(sp.getSpannedElements()) > 0)
+            for n in sp.getSpannedElements():
+                self.assertTrue(6 <= n.measureNumber <= 9)
+
+        # parts that are not in the Stream are not quietly left out
+        self.assertRaises(FreezeThawException, st.openStr, data, parts=[5])
+        self.assertRaises(FreezeThawException, st.openStr, data, parts=[1, 'noSuchPart'])
+        try:
+            st.openStr(data, parts=[5])
+        except FreezeThawException as e:
+            self.assertTrue('5' in str(e))
+            self.assertTrue(repr(c.parts[0].id) in str(e))
+        self.assertEqual(len(st.stream.parts), 1)
+        st.openStr(data, parts=[c.parts[2].id])
+        self.assertEqual(st.stream.parts[0].id, c.parts[2].id)
+
+        pickleData = StreamFreezer(c).writeStr(fmt='pickle')
+        self.assertRaises(FreezeThawException, st.openStr, pickleData, parts=[1])
+
+
+    def xtestSimplePickle(self):
+        from music21 import freezeThaw
+        from music21 import corpus
+
+        c = corpus.parse('bwv66.6').parts[0].measure(0).notes
+        #c.show('t')
+
+#        for el in c:
+#            storedIds.append(el.id)
+#            storedSitesIds.append(id(el.sites))
+#
+#        return
+
+        n1 = c[0]
+        n2 = c[1]
+        sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
+        sf.setupSerializationScaffold()
+        for dummy in n1.sites.siteDict:
+            pass
+            #print idKey
+            #print n1.sites.siteDict[idKey]['obj']
+        for dummy in n2.sites.siteDict:
+            pass
+            #print idKey
+            #print n2.sites.siteDict[idKey]['obj']
+
+        dummy_data = pickleMod.dumps(c, protocol=-1)
+
+
+        #data = sf.writeStr(fmt='pickle')
+
+        #st = freezeThaw.StreamThawer()
+        #st.openStr(data)
+        #s = st.stream
+#        for el in s._elements:
+#            idEl = el.id
+#            if idEl not in storedIds:
+#                print("Could not find ID %d for element %r at offset %f" %
+#                      (idEl, el, el.offset))
+#        print storedIds
+        #s.show('t')
+
+    def xtestFreezeThawPickle(self):
+        from music21 import freezeThaw
+        from music21 import corpus
+
+        c = corpus.parse('luca/gloria')
+        #c.show('t')
+
+        sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
+        d = sf.writeStr()
+        #print d
+
+        st = freezeThaw.StreamThawer()
+        st.openStr(d)
+        s = st.stream
+
+        # test to see if we can find everything
+        for dummy in s.recurse():
+            pass
+
+        #s.show()
+        #s.show('t')
+
+    def testFreezeThawSimpleVariant(self):
+        from music21 import freezeThaw
+        from music21 import variant
+        from music21 import stream
+        from music21 import note
+
+        s = stream.Stream()
+        m = stream.Measure()
+        m.append(note.Note(type="whole"))
+        s.append(m)
+
+        s2 = stream.Stream()
+        m2 = stream.Measure()
+        n2 = note.Note("D#4")
+        n2.duration.type = "whole"
+        m2.append(n2)
+        s2.append(m2)
+        v = variant.Variant(s2)
+
+        s.insert(0, v)
+
+        sf = freezeThaw.StreamFreezer(s)
+        d = sf.writeStr()
+
+        st = freezeThaw.StreamThawer()
+        st.openStr(d)
+        s = st.stream
+
+
+    def testFreezeThawVariant(self):
+        from music21 import freezeThaw
+        from music21 import corpus
+        from music21 import variant
+        from music21 import stream
+        from music21 import note
+
+        c = corpus.parse('luca/gloria')
+
+        data2M2 = [('f', 'eighth'), ('c', 'quarter'), ('a', 'eighth'), ('a', 'quarter')]
+        stream2 = stream.Stream()
+        m = stream.Measure()
+        for pitchName,durType in data2M2:
+            n = note.Note(pitchName)
+            n.duration.type = durType
+            m.append(n)
+#            stream2.append(n)
+        stream2.append(m)
+        #c.show('t')
+        variant.addVariant(c.parts[0], 6.0, stream2, variantName = 'rhythmic switch', replacementDuration = 3.0)
+
+        #test Variant is in stream
+        unused_v1 = c.parts[0].getElementsByClass('Variant')[0]
+
+        sf = freezeThaw.StreamFreezer(c, fastButUnsafe=True)
+        #sf.v = v
+        d = sf.writeStr()
+        #print d
+
+        #print "thawing."
+
+        st = freezeThaw.StreamThawer()
+        st.openStr(d)
+        s = st.stream
+        #s.show('lily.pdf')
+        p0 = s.parts[0]
+        variants = p0.getElementsByClass('Variant')
+        v2 = variants[0]
+        self.assertEqual(v2._stream[0][1].offset, 0.5)
+        #v2.show('t')
+
+    def testSerializationScaffoldA(self):
+        from music21 import note, stream
+        from music21 import freezeThaw
+
+        n1 = note.Note()
+
+        s1 = stream.Stream()
+        s2 = stream.Stream()
+
+        s1.append(n1)
+        s2.append(n1)
+
+        sf = freezeThaw.StreamFreezer(s2, fastButUnsafe = False)
+        sf.setupSerializationScaffold()
+
+        # test safety
+        self.assertEqual(s2.hasElement(n1), True)
+        self.assertEqual(s1.hasElement(n1), True)
+
+#----------JSON Serialization------------------------------
+
+#    def testDurationJSONSerializationA(self):
+#        from music21 import duration
+#        d = duration.DurationUnit(1.5)
+#        self.assertEqual(str(d), '<music21.duration.DurationUnit 1.5>')
+#
+#        dAlt = duration.DurationUnit()
+#        dAlt.json = d.json
+#        self.assertEqual(str(dAlt), '<music21.duration.DurationUnit 1.5>')
+#
+#        d = duration.Duration(2.25)
+#        self.assertEqual(str(d), '<music21.duration.Duration 2.25>')
+#        dAlt = duration.Duration()
+#        dAlt.json = d.json
+#        self.assertEqual(str(dAlt), '<music21.duration.Duration 2.25>')
+
+#    def testJSONSerializationPitchA(self):
+#        from music21 import pitch
+#
+#        m = pitch.Microtone(40)
+#        self.assertEqual(str(m), '(+40c)')
+#
+#        mAlt = pitch.Microtone()
+#        mAlt.json = m.json
+#        self.assertEqual(str(mAlt), '(+40c)')
+#
+#        a = pitch.Accidental('##')
+#        self.assertEqual(str(a), '<accidental double-sharp>')
+#        aAlt = pitch.Accidental()
+#        aAlt.json = a.json
+#        self.assertEqual(str(aAlt), '<accidental double-sharp>')
+#
+#        p = pitch.Pitch(ps=61.2)
+#        self.assertEqual(str(p), 'C#4(+20c)')
+#        pAlt = pitch.Pitch()
+#        pAlt.json = p.json
+#        self.assertEqual(str(pAlt), 'C#4(+20c)')
+
+#    def testDerivationSerializationA(self):
+#        from music21 import derivation
+#
+#        d = derivation.Derivation()
+#        self.assertEqual(d.jsonAttributes(), ['_ancestor', '_ancestorId', '_container', '_containerId', '_method'])
+#
+#        self.assertEqual(hasattr(d, 'json'), True)
+
+    def testJSONPickleSpanner(self):
+        from music21 import converter, note, stream, spanner
+        n1 = note.Note('C')
+        n2 = note.Note('D')
+        s1 = stream.Stream()
+        sp = spanner.Line([n1, n2])
+        s1.insert(0, sp)
+        s1.append(n1)
+        s1.append(n2)
+        frozen = converter.freezeStr(s1, 'jsonPickle')
+        #print frozen
+        unused_thawed = converter.thawStr(frozen)
+        
+
+    def testPickleMidi(self):
+        from music21 import converter
+        a = os.path.join(common.getSourceFilePath(),
+                         'midi',
+                         'testPrimitive',
+                         'test03.mid')
+
+        #a = 'https://github.com/ELVIS-Project/vis/raw/master/test_corpus/prolationum-sanctus.midi'
+        c = converter.parse(a)
+        f = converter.freezeStr(c)
+        d = converter.thawStr(f)
+        self.assertEqual(d[1][20].volume._parent.__class__.__name__, 'weakref')
+
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+    import music21
+    #import sys
+    #sys.argv.append('testJSONPickleSpanner')
+    music21.mainTest(Test)
+    
+
+
+#------------------------------------------------------------------------------
+# eof
+
+
@@ -2488,6 +2488,12 @@ class PlotWindowedAnalysis(PlotStream):
         else:
             self.compressLegend = True
 
+        # number of processes analyzing window sizes
+        if 'processCount' in keywords:
+            self.processCount = keywords['processCount']
+        else:
+            self.processCount = 1
+
         # create a color grid
         self.graph = GraphColorGrid(*args, **keywords)
         # uses self.processor
@@ -2514,7 +2520,8 @@ class PlotWindowedAnalysis(PlotStream):
         '''
         wa = windowed.WindowedAnalysis(self.streamObj, self.processor)
         unused_solutionMatrix, colorMatrix, metaMatrix = wa.process(self.minWindow, 
-            self.maxWindow, self.windowStep, windowType=self.windowType)
+            self.maxWindow, self.windowStep, windowType=self.windowType,
+            processCount=self.processCount)
                 
         # get dictionaries of meta data for each row
         pos = 0
@@ -2390,6 +2390,49 @@ def kernTandemToObject(tandem):
 # TODO: Parse editorial signifiers
 
 
+def referencesToMetadata(lines):
+    r'''
+    Make a :class:`~music21.metadata.Metadata` object from the global reference
+    records (!!! lines) among `lines`, without parsing any spines.  This is
+    much faster than a full parse when only the metadata of a file is wanted.
+
+    Codes for work ids (OTL, OPR, OMV, etc.) and for contributors (COM, LYR,
+    etc.) are used; the first record of a work id wins, and every
+    contributor record is added.  Other records are ignored.
+
+    >>> lines = ['!!!COM: Palestrina, Giovanni Perluigi da\n',
+    ...          '!!!OTL: Kyrie\n',
+    ...          '!!!OPR: Missa Brevis\n',
+    ...          '!!!OTL@LAT: Kyrie eleison\n',
+    ...          '**kern\n', '4c\n', '*-\n']
+    >>> md = humdrum.spineParser.referencesToMetadata(lines)
+    >>> print(md.title)
+    Kyrie
+    >>> print(md.parentTitle)
+    Missa Brevis
+    >>> print(md.composer)
+    Palestrina, Giovanni Perluigi da
+    '''
+    from music21 import metadata
+    md = metadata.Metadata()
+    foundWorkIds = []
+    for line in lines:
+        if not line.startswith('!!!'):
+            continue
+        try:
+            ref = GlobalReferenceLine(0, line.rstrip())
+        except (HumdrumException, ValueError): # no code given
+            continue
+        code = ref.code.strip().lower()
+        if code in metadata.Metadata.workIdAbbreviationDict:
+            if code not in foundWorkIds:
+                md.setWorkId(code, ref.value)
+                foundWorkIds.append(code)
+        elif code in metadata.Contributor.roleAbbreviationsDict:
+            md.addContributor(metadata.Contributor(role=code, name=ref.value))
+    return md
+
+
 class MiscTandem(base.Music21Object):
     def __init__(self, tandem = ""):
         base.Music21Object.__init__(self)
@@ -13,6 +13,8 @@
 #------------------------------------------------------------------------------
 
 
+import hashlib
+import json
 import os
 import time
 import unittest
@@ -74,6 +76,11 @@ class MetadataEntry(object):
         >>> metadataEntry.parse()
         <music21.stream.Score ...>
 
+    An entry can also store the modification time, size and md5 hash of its
+    source file when its metadata was read (see :meth:`getSourceStatus`), so
+    that :meth:`MetadataBundle.update` can tell whether the file has changed
+    since.
+
     '''
 
     ### INITIALIZER ###
@@ -82,10 +89,16 @@ class MetadataEntry(object):
         sourcePath=None,
         number=None,
         metadataPayload=None,
+        sourceModificationTime=None,
+        sourceSize=None,
+        sourceHash=None,
         ):
         self._sourcePath = sourcePath
         self._number = number
         self._metadataPayload = metadataPayload
+        self._sourceModificationTime = sourceModificationTime
+        self._sourceSize = sourceSize
+        self._sourceHash = sourceHash
 
     ### SPECIAL METHODS ###
 
@@ -119,6 +132,85 @@ class MetadataEntry(object):
     def search(self, query, field=None):
         return self.metadataPayload.search(query, field)
 
+    def sourceChanged(self, filePath):
+        r'''
+        Return True if the file (or directory) at `filePath`, the absolute
+        path of this entry's source, differs from when this entry was made,
+        and False if it does not.  The hash of the file is only computed if
+        its modification time has changed but its size has not; if the hash
+        is unchanged, the new modification time is recorded so that the file
+        is not hashed again.
+
+        Returns None if this entry does not store the status of its source.
+
+        ::
+
+            >>> import os
+            >>> from music21 import metadata
+            >>> fp = os.path.join(common.getSourceFilePath(), 'musedata',
+            ...     'testZip.zip')
+            >>> mtime, size, md5 = metadata.MetadataEntry.getSourceStatus(fp)
+            >>> entry = metadata.MetadataEntry('testZip.zip', None, None,
+            ...     mtime, size, md5)
+            >>> entry.sourceChanged(fp)
+            False
+            >>> entry = metadata.MetadataEntry('testZip.zip', None, None,
+            ...     mtime - 10, size, md5)
+            >>> entry.sourceChanged(fp)
+            False
+            >>> entry.sourceModificationTime == mtime
+            True
+            >>> entry = metadata.MetadataEntry('testZip.zip', None, None,
+            ...     mtime - 10, size, 'x' + md5[1:])
+            >>> entry.sourceChanged(fp)
+            True
+            >>> print(metadata.MetadataEntry('testZip.zip').sourceChanged(fp))
+            None
+        '''
+        if self._sourceModificationTime is None or self._sourceSize is None:
+            return None
+        mtime, size, unused_md5 = self.getSourceStatus(filePath,
+                                                       includeHash=False)
+        if size != self._sourceSize:
+            return True
+        if mtime == self._sourceModificationTime:
+            return False
+        if self._sourceHash is None:
+            return True
+        unused_mtime, unused_size, md5 = self.getSourceStatus(filePath)
+        if md5 != self._sourceHash:
+            return True
+        self._sourceModificationTime = mtime
+        return False
+
+    @staticmethod
+    def getSourceStatus(filePath, includeHash=True):
+        r'''
+        Return a tuple of the modification time, size in bytes, and md5 hash
+        (as a hex string, or None if `includeHash` is False) of the file at
+        `filePath`.  For a directory of files (a musedata work), the latest
+        modification time, total size, and the hash of all the files in it
+        are given.  For a URL, all three are None.
+        '''
+        if filePath.startswith('http'):
+            return (None, None, None)
+        if os.path.isdir(filePath):
+            paths = [os.path.join(filePath, fn)
+                     for fn in sorted(os.listdir(filePath))]
+            paths = [path for path in paths if os.path.isfile(path)]
+        else:
+            paths = [filePath]
+        mtime = max([os.path.getmtime(path) for path in paths] or [0])
+        size = sum([os.path.getsize(path) for path in paths])
+        if includeHash is False:
+            return (mtime, size, None)
+        contentHash = hashlib.md5()
+        for path in paths:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    contentHash.update(block)
+        return (mtime, size, contentHash.hexdigest())
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -133,10 +225,244 @@ class MetadataEntry(object):
     def number(self):
         return self._number
 
+    @property
+    def sourceHash(self):
+        return self._sourceHash
+
+    @property
+    def sourceModificationTime(self):
+        return self._sourceModificationTime
+
     @property
     def sourcePath(self):
         return self._sourcePath
 
+    @property
+    def sourceSize(self):
+        return self._sourceSize
+
+
+#------------------------------------------------------------------------------
+
+
+class MetadataSearchIndex(object):
+    r'''
+    An inverted index over the search fields of the entries in a metadata
+    bundle, used by :meth:`MetadataBundle.search` to find candidate entries
+    without scanning the whole bundle.
+
+    For each search field, every three-character run (trigram) of each
+    entry's lower-cased string value maps to the positions of the entries
+    containing it.  An entry can only contain a plain string query if it
+    contains all of the query's trigrams:
+
+    ::
+
+        >>> from music21 import corpus, metadata
+        >>> metadataBundle = metadata.MetadataBundle()
+        >>> metadataBundle.addFromPaths(
+        ...     corpus.getWorkList('ciconia') + corpus.getWorkList('bwv66.6'),
+        ...     useCorpus=True,
+        ...     useMultiprocessing=False,
+        ...     storeOnDisk=False,
+        ...     )
+        []
+        >>> searchIndex = metadata.bundles.MetadataSearchIndex.fromMetadataBundle(
+        ...     metadataBundle)
+        >>> searchIndex
+        <music21.metadata.bundles.MetadataSearchIndex {2 entries}>
+        >>> for key in searchIndex.getCandidateKeys('cicon', field='composer'):
+        ...     print(key)
+        ciconia_quod_jactatur_xml
+        >>> for key in searchIndex.getCandidateKeys('CICON'):
+        ...     print(key)
+        ciconia_quod_jactatur_xml
+        >>> searchIndex.getCandidateKeys('schubert')
+        []
+
+    Queries the index cannot answer -- regular expressions, callables,
+    non-string values, queries shorter than three characters, or fields that
+    are not search fields -- return None, and the whole bundle must be
+    scanned:
+
+    ::
+
+        >>> searchIndex.getCandidateKeys('cic|bach') is None
+        True
+        >>> searchIndex.getCandidateKeys('ci') is None
+        True
+        >>> searchIndex.getCandidateKeys('cicon', field='compose') is None
+        True
+
+    '''
+
+    ### CLASS VARIABLES ###
+
+    # bump whenever the stored format or the way values are indexed changes
+    version = 1
+
+    ### INITIALIZER ###
+
+    def __init__(self, keys=None, postings=None):
+        # metadata bundle keys, in bundle order
+        self.keys = keys or []
+        # field name -> trigram -> set of positions in self.keys
+        self.postings = postings or {}
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        return '<{0}.{1} {{{2} entr{3}}}>'.format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            len(self),
+            'y' if len(self) == 1 else 'ies',
+            )
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def fromMetadataBundle(cls, metadataBundle):
+        r'''
+        Index the string values of the search fields of every entry in
+        `metadataBundle`.
+        '''
+        fields = MetadataBundle.listSearchFields()
+        postings = dict((field, {}) for field in fields)
+        keys = list(metadataBundle._metadataEntries.keys())
+        for position, key in enumerate(keys):
+            metadataPayload = \
+                metadataBundle._metadataEntries[key].metadataPayload
+            # ignore stub entries
+            if metadataPayload is None:
+                continue
+            for field in fields:
+                try:
+                    value = getattr(metadataPayload, field)
+                except AttributeError:
+                    continue
+                if not common.isStr(value):
+                    continue
+                fieldPostings = postings[field]
+                for trigram in cls.getTrigrams(value):
+                    if trigram not in fieldPostings:
+                        fieldPostings[trigram] = set()
+                    fieldPostings[trigram].add(position)
+        return cls(keys=keys, postings=postings)
+
+    @classmethod
+    def fromFile(cls, filePath, metadataBundle):
+        r'''
+        Read an index written with :meth:`write`.
+
+        Return None if there is no index at `filePath`, or if it was written
+        by a different version or does not match the entries of
+        `metadataBundle`.
+        '''
+        if not os.path.exists(filePath):
+            return None
+        try:
+            with open(filePath) as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return None
+        if data.get('version') != cls.version:
+            return None
+        keys = list(metadataBundle._metadataEntries.keys())
+        if len(data['keys']) != len(keys) or set(data['keys']) != set(keys):
+            return None
+        # entries are not necessarily thawed in the order they were written
+        newPositions = dict((key, position)
+            for position, key in enumerate(keys))
+        newPositions = [newPositions[key] for key in data['keys']]
+        postings = {}
+        for field, fieldPostings in data['postings'].items():
+            postings[field] = dict(
+                (trigram, set(newPositions[x] for x in positions))
+                for trigram, positions in fieldPostings.items())
+        return cls(keys=keys, postings=postings)
+
+    def getCandidateKeys(self, query, field=None):
+        r'''
+        Return, in bundle order, the keys of the entries that may match
+        `query` in `field` (or in any search field if `field` is None), or
+        None if the index cannot answer the query.
+
+        The candidates still need to be checked with
+        :meth:`MetadataEntry.search`.
+        '''
+        if not common.isStr(query) or len(query) < 3:
+            return None
+        # the characters which make Metadata.search() treat a query as a
+        # regular expression
+        if any(character in query for character in '*.|+?{}'):
+            return None
+        if field is None:
+            fields = sorted(self.postings)
+        elif field in self.postings:
+            fields = [field]
+        else:
+            return None
+        trigrams = self.getTrigrams(query)
+        positions = set()
+        for searchField in fields:
+            fieldPostings = self.postings[searchField]
+            matches = None
+            for trigram in sorted(trigrams,
+                key=lambda x: len(fieldPostings.get(x, ()))):
+                if trigram not in fieldPostings:
+                    matches = set()
+                    break
+                if matches is None:
+                    matches = set(fieldPostings[trigram])
+                else:
+                    matches.intersection_update(fieldPostings[trigram])
+                if not matches:
+                    break
+            positions.update(matches)
+        return [self.keys[position] for position in sorted(positions)]
+
+    @staticmethod
+    def getTrigrams(value):
+        r'''
+        Return the set of three-character runs in the lower-cased `value`:
+
+        ::
+
+            >>> getTrigrams = metadata.bundles.MetadataSearchIndex.getTrigrams
+            >>> for trigram in sorted(getTrigrams('Bach')):
+            ...     print(trigram)
+            ach
+            bac
+            >>> len(getTrigrams('JS'))
+            0
+
+        '''
+        if isinstance(value, six.binary_type):
+            value = value.decode('utf-8', 'replace')
+        value = value.lower()
+        return set(value[i:i + 3] for i in range(len(value) - 2))
+
+    def write(self, filePath):
+        r'''
+        Write the index to `filePath` as JSON.
+        '''
+        postings = {}
+        for field, fieldPostings in self.postings.items():
+            postings[field] = dict(
+                (trigram, sorted(positions))
+                for trigram, positions in fieldPostings.items())
+        data = {
+            'version': self.version,
+            'keys': self.keys,
+            'postings': postings,
+            }
+        with open(filePath, 'w') as f:
+            json.dump(data, f)
+
 
 #------------------------------------------------------------------------------
 
@@ -248,6 +574,7 @@ class MetadataBundle(object):
     def __init__(self, expr=None):
         from music21 import corpus
         self._metadataEntries = OrderedDict()
+        self._searchIndex = None
         assert isinstance(expr, (str, corpus.corpora.Corpus, type(None)))
         if isinstance(expr, corpus.corpora.Corpus):
             self._name = expr.name
@@ -586,6 +913,17 @@ class MetadataBundle(object):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _getAbsoluteSourcePath(sourcePath):
+        # MetadataEntries for core corpus items use a path relative to the
+        # corpus as their source path
+        if sourcePath.startswith('http') or os.path.isabs(sourcePath):
+            return sourcePath
+        return os.path.abspath(os.path.join(
+            common.getCorpusFilePath(),
+            sourcePath,
+            ))
+
     def _apply_set_operation(self, metadataBundle, operator):
         assert isinstance(metadataBundle, type(self))
         selfKeys = set(self._metadataEntries.keys())
@@ -658,6 +996,25 @@ class MetadataBundle(object):
                 )
         return filePath
 
+    @property
+    def searchIndexFilePath(self):
+        r'''
+        The filesystem name of the search index stored alongside the cached
+        metadata bundle, if the metadata bundle's name is not None:
+
+        ::
+
+            >>> from music21 import metadata
+            >>> metadata.MetadataBundle('local').searchIndexFilePath
+            '...local-index.json'
+            >>> metadata.MetadataBundle().searchIndexFilePath is None
+            True
+
+        '''
+        if self.filePath is None:
+            return None
+        return os.path.splitext(self.filePath)[0] + '-index.json'
+
     @property
     def name(self):
         r'''
@@ -688,6 +1045,7 @@ class MetadataBundle(object):
         useCorpus=False,
         useMultiprocessing=True,
         storeOnDisk=True,
+        metadataOnly=False,
         ):
         '''
         Parse and store metadata from numerous files.
@@ -695,6 +1053,13 @@ class MetadataBundle(object):
         If any files cannot be loaded, their file paths will be collected in a
         list that is returned.
 
+        If `metadataOnly` is True, only the headers of the files are read;
+        see :class:`~music21.metadata.MetadataCachingJob`.
+
+        Files that already have entries are skipped unless they have changed
+        since (see :meth:`MetadataEntry.sourceChanged`).  When a file is
+        parsed again, all of its old entries are replaced.
+
         Returns a list of file paths with errors and stores the extracted
         metadata in `self._metadataEntries`.
 
@@ -732,8 +1097,12 @@ class MetadataBundle(object):
                 path = os.path.abspath(path)
             key = self.corpusPathToKey(path)
             if key in self._metadataEntries and not key.startswith('http'):
-                pathModificationTime = os.path.getctime(path)
-                if pathModificationTime < metadataBundleModificationTime:
+                sourceChanged = self._metadataEntries[key].sourceChanged(path)
+                if sourceChanged is None: # an entry from an older cache
+                    pathModificationTime = os.path.getctime(path)
+                    sourceChanged = (pathModificationTime >=
+                                     metadataBundleModificationTime)
+                if not sourceChanged:
                     skippedJobsCount += 1
                     continue
             currentJobNumber += 1
@@ -741,6 +1110,7 @@ class MetadataBundle(object):
                 path,
                 jobNumber=currentJobNumber,
                 useCorpus=useCorpus,
+                metadataOnly=metadataOnly,
                 )
             jobs.append(job)
         currentIteration = 0
@@ -750,6 +1120,13 @@ class MetadataBundle(object):
             jobProcessor = metadata.JobProcessor.process_parallel
         else:
             jobProcessor = metadata.JobProcessor.process_serial
+        # the keys of the entries already made from each source path, which
+        # are removed when that source is parsed again
+        oldKeysBySourcePath = {}
+        if jobs:
+            for key, metadataEntry in self._metadataEntries.items():
+                oldKeysBySourcePath.setdefault(
+                    metadataEntry.sourcePath, []).append(key)
         for result in jobProcessor(jobs):
             metadata.JobProcessor._report(
                 len(jobs),
@@ -760,12 +1137,20 @@ class MetadataBundle(object):
             currentIteration += 1
             accumulatedResults.extend(result['metadataEntries'])
             accumulatedErrors.extend(result['errors'])
+            if result['metadataEntries']:
+                self._searchIndex = None
             for metadataEntry in result['metadataEntries']:
+                oldKeys = oldKeysBySourcePath.pop(metadataEntry.sourcePath, ())
+                for key in oldKeys:
+                    self._metadataEntries.pop(key, None)
                 self._metadataEntries[metadataEntry.corpusPath] = metadataEntry
             if (currentIteration % 50) and (storeOnDisk is True) == 0:
                 self.write()
         self.validate()
         if storeOnDisk is True:
+            if self.filePath is not None and self._searchIndex is None:
+                self._searchIndex = MetadataSearchIndex.fromMetadataBundle(
+                    self)
             self.write()
         return accumulatedErrors
 
@@ -793,6 +1178,7 @@ class MetadataBundle(object):
         Return none.
         '''
         self._metadataEntries.clear()
+        self._searchIndex = None
 
     @staticmethod
     def corpusPathToKey(filePath, number=None):
@@ -831,15 +1217,17 @@ class MetadataBundle(object):
 
     def delete(self):
         r'''
-        Delete the filesystem cache of a named metadata bundle.
+        Delete the filesystem cache of a named metadata bundle, and its search
+        index.
 
         Does not delete the in-memory metadata bundle.
 
         Return none.
         '''
         if self.filePath is not None:
-            if os.path.exists(self.filePath):
-                os.remove(self.filePath)
+            for filePath in (self.filePath, self.searchIndexFilePath):
+                if os.path.exists(filePath):
+                    os.remove(filePath)
         return self
 
     def difference(self, metadataBundle):
@@ -1196,6 +1584,10 @@ class MetadataBundle(object):
             return self
         jst = freezeThaw.JSONThawer(self)
         jst.jsonRead(filePath)
+        self._searchIndex = None
+        if filePath == self.filePath:
+            self._searchIndex = MetadataSearchIndex.fromFile(
+                self.searchIndexFilePath, self)
         environLocal.printDebug([
             'MetadataBundle: loading time:',
             self.name,
@@ -1230,11 +1622,61 @@ class MetadataBundle(object):
             )
         return self
 
+    def update(self, useMultiprocessing=True, metadataOnly=False):
+        r'''
+        Bring a named bundle up to date with its associated corpus, parsing
+        only files that were added to the corpus or have changed since their
+        entries were made, and dropping the entries of files that are no
+        longer in the corpus.  Everything else is kept as it is, so this is
+        much faster than :meth:`rebuild` when little has changed.
+
+        The bundle is then written to disk.  If `metadataOnly` is True, only
+        the headers of files are read; see
+        :class:`~music21.metadata.MetadataCachingJob`.
+
+        Return the updated metadata bundle.
+        '''
+        from music21 import corpus
+        if self.filePath is None:
+            return self
+        paths = self.corpus.getPaths()
+        currentPaths = set()
+        for path in paths:
+            if not path.startswith('http'):
+                path = os.path.abspath(path)
+            currentPaths.add(path)
+        droppedKeys = []
+        for key, metadataEntry in self._metadataEntries.items():
+            sourcePath = self._getAbsoluteSourcePath(metadataEntry.sourcePath)
+            if sourcePath not in currentPaths:
+                droppedKeys.append(key)
+        for key in droppedKeys:
+            del self._metadataEntries[key]
+        if droppedKeys:
+            self._searchIndex = None
+        environLocal.printDebug('Dropped {0} entries no longer in {1}.'.format(
+            len(droppedKeys), self.name))
+        useCorpus = False
+        if isinstance(self.corpus, corpus.corpora.CoreCorpus):
+            useCorpus = True
+        self.addFromPaths(
+            paths,
+            useCorpus=useCorpus,
+            useMultiprocessing=useMultiprocessing,
+            metadataOnly=metadataOnly,
+            )
+        return self
+
     def search(self, query, field=None, fileExtensions=None):
         r'''
         Perform search, on all stored metadata, permit regular expression
         matching.
 
+        Plain string queries are first looked up in the bundle's
+        :class:`MetadataSearchIndex`, built on the first search (or read from
+        disk with a cached bundle), so only the entries that may match are
+        checked.  Regular expressions and other queries scan every entry.
+
         ::
 
             >>> from music21 import corpus, metadata
@@ -1276,8 +1718,14 @@ class MetadataBundle(object):
             1
 
         '''
+        if self._searchIndex is None or \
+            len(self._searchIndex) != len(self._metadataEntries):
+            self._searchIndex = MetadataSearchIndex.fromMetadataBundle(self)
+        keys = self._searchIndex.getCandidateKeys(query, field)
+        if keys is None:
+            keys = self._metadataEntries
         newMetadataBundle = MetadataBundle()
-        for key in self._metadataEntries:
+        for key in keys:
             metadataEntry = self._metadataEntries[key]
             # ignore stub entries
             if metadataEntry.metadataPayload is None:
@@ -1383,16 +1831,14 @@ class MetadataBundle(object):
             if sourcePath.startswith('http:'):
                 validatedPaths.add(metadataEntry.sourcePath)
                 continue
-            if not os.path.isabs(sourcePath):
-                sourcePath = os.path.abspath(os.path.join(
-                    common.getCorpusFilePath(),
-                    sourcePath,
-                    ))
+            sourcePath = self._getAbsoluteSourcePath(sourcePath)
             if not os.path.exists(sourcePath):
                 invalidatedKeys.append(key)
             validatedPaths.add(metadataEntry.sourcePath)
         for key in invalidatedKeys:
             del(self._metadataEntries[key])
+        if invalidatedKeys:
+            self._searchIndex = None
         message = 'MetadataBundle: finished validating in {0} seconds.'.format(
             timer)
         environLocal.printDebug(message)
@@ -1429,7 +1875,13 @@ class MetadataBundle(object):
             filePath = self.filePath
             environLocal.printDebug(['MetadataBundle: writing:', filePath])
             jsf = freezeThaw.JSONFreezer(self)
-            return jsf.jsonWrite(filePath)
+            jsf.jsonWrite(filePath)
+            # never leave an index on disk that may not match the bundle
+            if self._searchIndex is not None and \
+                len(self._searchIndex) == len(self._metadataEntries):
+                self._searchIndex.write(self.searchIndexFilePath)
+            elif os.path.exists(self.searchIndexFilePath):
+                os.remove(self.searchIndexFilePath)
         return self
 
 
@@ -1441,6 +1893,145 @@ class Test(unittest.TestCase):
     def runTest(self):
         pass
 
+    def testAddFromPathsChangedOnly(self):
+        import shutil
+        import tempfile
+        directory = tempfile.mkdtemp()
+        try:
+            paths = []
+            for i, title in enumerate(['First', 'Second']):
+                fp = os.path.join(directory, 'tune%d.abc' % i)
+                with open(fp, 'w') as f:
+                    f.write('T:%s\nM:2/4\nL:1/8\nK:G\nB2 A2 | G4 |]\n' % title)
+                paths.append(fp)
+            mb = MetadataBundle()
+            errors = mb.addFromPaths(paths, useMultiprocessing=False,
+                                     storeOnDisk=False)
+            self.assertEqual(errors, [])
+            self.assertEqual(len(mb), 2)
+            firstEntry, secondEntry = mb._metadataEntries.values()
+            self.assertEqual(secondEntry.sourceSize, os.path.getsize(paths[1]))
+            self.assertEqual(len(secondEntry.sourceHash), 32)
+
+            # rewrite the second tune with a new title and an older time
+            with open(paths[1], 'w') as f:
+                f.write('T:Changed\nM:2/4\nL:1/8\nK:G\nB2 A2 | G4 |]\n')
+            os.utime(paths[1], (secondEntry.sourceModificationTime - 100,
+                                secondEntry.sourceModificationTime - 100))
+            # touch the first tune without changing it
+            os.utime(paths[0], (firstEntry.sourceModificationTime + 100,
+                                firstEntry.sourceModificationTime + 100))
+            mb.addFromPaths(paths, useMultiprocessing=False, storeOnDisk=False)
+            self.assertEqual(len(mb), 2)
+            newFirstEntry, newSecondEntry = [
+                mb._metadataEntries[mb.corpusPathToKey(fp)] for fp in paths]
+            self.assertTrue(newFirstEntry is firstEntry)
+            self.assertEqual(firstEntry.sourceModificationTime,
+                             os.path.getmtime(paths[0]))
+            self.assertFalse(newSecondEntry is secondEntry)
+            self.assertEqual(str(newSecondEntry.metadataPayload.title),
+                             'Changed')
+        finally:
+            shutil.rmtree(directory)
+
+    def testUpdate(self):
+        import shutil
+        import tempfile
+        from music21 import corpus
+        from music21 import metadata
+        directory = tempfile.mkdtemp()
+        localCorpus = corpus.corpora.LocalCorpus('metadataBundleUpdateTest')
+        # the bundle is written with the class names of the music21 package
+        mb = metadata.MetadataBundle(localCorpus)
+
+        def writeTune(i, title):
+            fp = os.path.join(directory, 'tune%d.abc' % i)
+            with open(fp, 'w') as f:
+                f.write('T:%s\nM:2/4\nL:1/8\nK:G\nB2 A2 | G4 |]\n' % title)
+            return fp
+
+        try:
+            paths = [writeTune(i, title) for i, title in
+                enumerate(['First', 'Second', 'Third'])]
+            localCorpus.addPath(directory)
+            mb.update(useMultiprocessing=False)
+            self.assertEqual(len(mb), 3)
+            self.assertTrue(os.path.exists(mb.filePath))
+
+            # drop a tune, change one and add one
+            firstEntry = mb._metadataEntries[mb.corpusPathToKey(paths[0])]
+            os.remove(paths[2])
+            writeTune(1, 'Changed')
+            writeTune(3, 'Fourth')
+            mb.update(useMultiprocessing=False)
+            self.assertTrue(
+                mb._metadataEntries[mb.corpusPathToKey(paths[0])] is firstEntry)
+            self.assertEqual(
+                sorted(str(metadataEntry.metadataPayload.title)
+                    for metadataEntry in mb._metadataEntries.values()),
+                ['Changed', 'First', 'Fourth'])
+            self.assertEqual(len(mb.search('Third')), 0)
+            self.assertEqual(len(mb.search('Fourth')), 1)
+
+            # the updated bundle is what is stored on disk
+            storedBundle = metadata.MetadataBundle(localCorpus).read()
+            self.assertEqual(sorted(storedBundle._metadataEntries),
+                             sorted(mb._metadataEntries))
+        finally:
+            localCorpus.removePath(directory)
+            for fp in (mb.filePath, mb.searchIndexFilePath):
+                if os.path.exists(fp):
+                    os.remove(fp)
+            shutil.rmtree(directory)
+
+    def testSearchIndex(self):
+        import tempfile
+        from music21 import corpus
+        mb = MetadataBundle()
+        mb.addFromPaths(
+            corpus.getWorkList('ciconia') + corpus.getWorkList('bwv66.6') +
+                corpus.getWorkList('luca/gloria'),
+            useCorpus=True,
+            useMultiprocessing=False,
+            storeOnDisk=False,
+            )
+        self.assertEqual(len(mb), 3)
+        searchIndex = MetadataSearchIndex.fromMetadataBundle(mb)
+        # every plain query gives the same result as a full scan
+        for query, field in (('cicon', 'composer'), ('glo', None),
+            ('Luca', None), ('bach', 'title'), ('xyz', None)):
+            mb._searchIndex = None
+            keys = searchIndex.getCandidateKeys(query, field)
+            self.assertTrue(keys is not None)
+            expected = [key for key, metadataEntry in
+                mb._metadataEntries.items()
+                if metadataEntry.search(query, field)[0]]
+            self.assertEqual([key for key in keys
+                if mb._metadataEntries[key].search(query, field)[0]],
+                expected)
+            self.assertEqual(list(mb.search(query, field)._metadataEntries),
+                sorted(expected,
+                    key=lambda key: mb._metadataEntries[key].sourcePath))
+
+        fp = tempfile.mkstemp(suffix='.json')[1]
+        try:
+            searchIndex.write(fp)
+            storedIndex = MetadataSearchIndex.fromFile(fp, mb)
+            self.assertEqual(storedIndex.keys, searchIndex.keys)
+            self.assertEqual(storedIndex.postings, searchIndex.postings)
+            # positions follow the order of the entries being read
+            mb._metadataEntries = OrderedDict(
+                reversed(list(mb._metadataEntries.items())))
+            storedIndex = MetadataSearchIndex.fromFile(fp, mb)
+            self.assertEqual(storedIndex.keys, list(mb._metadataEntries))
+            self.assertEqual(storedIndex.getCandidateKeys('Luca'),
+                searchIndex.getCandidateKeys('Luca'))
+            # an index for other entries is not used
+            mb._metadataEntries.popitem()
+            self.assertEqual(MetadataSearchIndex.fromFile(fp, mb), None)
+        finally:
+            os.remove(fp)
+
 
 #------------------------------------------------------------------------------
 
@@ -42,12 +42,16 @@ class MetadataCacheException(exceptions21.Music21Exception):
 def cacheMetadata(
     corpusNames=('local', 'core', 'virtual'),
     useMultiprocessing=True,
+    metadataOnly=False,
     ):
     '''
     Cache metadata from corpuses in `corpusNames` as local cache files:
 
     Call as ``metadata.cacheMetadata()``
 
+    If `metadataOnly` is True, only the headers of files are read (see
+    :class:`~music21.metadata.MetadataCachingJob`), which is much faster,
+    but the analytical fields of RichMetadata are not filled in.
     '''
     from music21 import corpus
     from music21 import metadata
@@ -86,6 +90,7 @@ def cacheMetadata(
             paths,
             useCorpus=useCorpus,
             useMultiprocessing=useMultiprocessing,
+            metadataOnly=metadataOnly,
             )
         message = 'cache: writing time: {0} md items: {1}'.format(
             timer, len(metadataBundle))
@@ -118,22 +123,45 @@ class MetadataCachingJob(object):
         >>> results = job.getResults()
         >>> errors = job.getErrors()
 
+    If `metadataOnly` is True, the file is read with
+    :func:`~music21.converter.parseMetadataOnly`, which for most formats
+    reads just the header of the file, rather than being parsed in full.
+    The entries then hold the metadata of the file alone: the fields that
+    RichMetadata computes from the music (time and key signatures, note
+    count, ambitus, etc.) are left empty.
+
+    ::
+
+        >>> job = metadata.MetadataCachingJob(
+        ...     'bach/bwv66.6',
+        ...     useCorpus=True,
+        ...     metadataOnly=True,
+        ...     )
+        >>> job()
+        ((<music21.metadata.bundles.MetadataEntry: bach_bwv66_6>,), ())
+        >>> print(job.getResults()[0].metadataPayload.noteCount)
+        None
+
     '''
 
     ### INITIALIZER ###
 
-    def __init__(self, filePath, jobNumber=0, useCorpus=True):
+    def __init__(self, filePath, jobNumber=0, useCorpus=True,
+                 metadataOnly=False):
         self.filePath = filePath
         self.filePathErrors = []
         self.jobNumber = int(jobNumber)
         self.results = []
         self.useCorpus = bool(useCorpus)
+        self.metadataOnly = bool(metadataOnly)
+        self.sourceStatus = (None, None, None)
 
     ### SPECIAL METHODS ###
 
     def __call__(self):
         import gc
         self.results = []
+        self.sourceStatus = self._getSourceStatus()
         parsedObject = self._parseFilePath()
         environLocal.printDebug('Got ParsedObject %r' % parsedObject)
         if parsedObject is not None:
@@ -147,12 +175,43 @@ class MetadataCachingJob(object):
 
     ### PRIVATE METHODS ###
 
+    def _getSourceStatus(self):
+        '''
+        Get the modification time, size and hash of the file, to store
+        with its entries, before it is parsed.
+        '''
+        from music21 import metadata
+        if not self.filePath.startswith('http') and \
+            not os.path.exists(self.filePath):
+            return (None, None, None) # a corpus work name, not a path
+        try:
+            return metadata.MetadataEntry.getSourceStatus(self.filePath)
+        except (IOError, OSError):
+            return (None, None, None)
+
+    def _makeMetadataEntry(self, metadataPayload, number=None):
+        from music21 import metadata
+        sourceModificationTime, sourceSize, sourceHash = self.sourceStatus
+        return metadata.MetadataEntry(
+            sourcePath=self.cleanFilePath,
+            number=number,
+            metadataPayload=metadataPayload,
+            sourceModificationTime=sourceModificationTime,
+            sourceSize=sourceSize,
+            sourceHash=sourceHash,
+            )
+
     def _parseFilePath(self):
         from music21 import converter
         from music21 import corpus
         parsedObject = None
         try:
-            if self.useCorpus is False:
+            if self.metadataOnly is True:
+                filePath = self.filePath
+                if self.useCorpus is True and not os.path.exists(filePath):
+                    filePath = corpus.getWork(filePath)
+                parsedObject = converter.parseMetadataOnly(filePath)
+            elif self.useCorpus is False:
                 parsedObject = converter.parse(
                     self.filePath, forceSource=True)
             else:
@@ -173,23 +232,18 @@ class MetadataCachingJob(object):
             if parsedObject.metadata is not None:
                 richMetadata = metadata.RichMetadata()
                 richMetadata.merge(parsedObject.metadata)
-                richMetadata.update(parsedObject)  # update based on Stream
+                if self.metadataOnly is False:
+                    richMetadata.update(parsedObject)  # update based on Stream
                 environLocal.printDebug(
                     'updateMetadataCache: storing: {0}'.format(corpusPath))
-                metadataEntry = metadata.MetadataEntry(
-                    sourcePath=self.cleanFilePath,
-                    metadataPayload=richMetadata,
-                    )
+                metadataEntry = self._makeMetadataEntry(richMetadata)
                 self.results.append(metadataEntry)
             else:
                 environLocal.printDebug(
                     'addFromPaths: got stream without metadata, '
                     'creating stub: {0}'.format(
                         common.relativepath(self.cleanFilePath)))
-                metadataEntry = metadata.MetadataEntry(
-                    sourcePath=self.cleanFilePath,
-                    metadataPayload=None,
-                    )
+                metadataEntry = self._makeMetadataEntry(None)
                 self.results.append(metadataEntry)
         except Exception:
             environLocal.printDebug('Had a problem with extracting metadata '
@@ -197,7 +251,6 @@ class MetadataCachingJob(object):
             environLocal.printDebug(traceback.format_exc())
 
     def _parseOpus(self, parsedObject):
-        from music21 import metadata
         # need to get scores from each opus?
         # problem here is that each sub-work has metadata, but there
         # is only a single source file
@@ -214,10 +267,7 @@ class MetadataCachingJob(object):
         # Create a dummy metadata entry, representing the entire opus.
         # This lets the metadata bundle know it has already processed this
         # entire opus on the next cache update.
-        metadataEntry = metadata.MetadataEntry(
-            sourcePath=self.cleanFilePath,
-            metadataPayload=None,
-            )
+        metadataEntry = self._makeMetadataEntry(None)
         self.results.append(metadataEntry)
 
     def _parseOpusScore(self, score, scoreNumber):
@@ -229,7 +279,8 @@ class MetadataCachingJob(object):
             # updgrade metadata to richMetadata
             richMetadata = metadata.RichMetadata()
             richMetadata.merge(score.metadata)
-            richMetadata.update(score)  # update based on Stream
+            if self.metadataOnly is False:
+                richMetadata.update(score)  # update based on Stream
             if score.metadata is None or score.metadata.number is None:
                 environLocal.printDebug(
                     'addFromPaths: got Opus that contains '
@@ -244,11 +295,8 @@ class MetadataCachingJob(object):
                 environLocal.printDebug(
                     'addFromPaths: storing: {0}'.format(
                         corpusPath))
-                metadataEntry = metadata.MetadataEntry(
-                    sourcePath=self.cleanFilePath,
-                    number=score.metadata.number,
-                    metadataPayload=richMetadata,
-                    )
+                metadataEntry = self._makeMetadataEntry(richMetadata,
+                    number=score.metadata.number)
                 self.results.append(metadataEntry)
         except Exception as exception:
             environLocal.printDebug(
@@ -376,7 +424,7 @@ class JobProcessor(object):
         job_queue.close()
         for worker in workers:
             worker.join()
-        raise StopIteration
+        return
 
     @staticmethod
     def process_serial(jobs):
@@ -394,7 +442,7 @@ class JobProcessor(object):
                 'filePath': job.filePath,
                 'remainingJobs': remainingJobs,
                 }
-        raise StopIteration
+        return
 
 
 #------------------------------------------------------------------------------
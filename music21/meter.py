@@ -55,6 +55,11 @@ _meterSequenceAccentArchetypes = {}
 # level dictionary
 _meterSequenceDivisionOptions = {}
 
+# store the default MeterSequences of TimeSignatures, keyed by their
+# string value, to be shared by later TimeSignatures of the same value;
+# see TimeSignature.load()
+_timeSignatureTemplates = {}
+
 
 def slashToFraction(value):
     '''
@@ -2495,6 +2500,31 @@ class MeterSequence(MeterTerminal):
 #------------------------------------------------------------------------------
 
 
+class _TimeSignatureTemplate(object):
+    '''
+    The default display, beam, beat and accent MeterSequences of a
+    TimeSignature value, shared by all TimeSignatures loaded with that value
+    until they need copies of their own, and the results of reading them
+    at each offset.
+
+    Neither these MeterSequences nor the stored results are ever changed,
+    so a template is shared, not copied, when a TimeSignature is deepcopied.
+    '''
+    def __init__(self, ts):
+        self.displaySequence = copy.deepcopy(ts.displaySequence)
+        self.beamSequence = copy.deepcopy(ts.beamSequence)
+        self.beatSequence = copy.deepcopy(ts.beatSequence)
+        self.accentSequence = copy.deepcopy(ts.accentSequence)
+        self.summedNumerator = ts.summedNumerator
+        # results of getAccentWeight(), getBeat(), and getBeatProportion()
+        self.accentWeights = {}
+        self.beats = {}
+        self.beatProportions = {}
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+
 class TimeSignature(base.Music21Object):
     r'''
     The `TimeSignature` object representes time signatures in musical scores
@@ -2730,6 +2760,18 @@ class TimeSignature(base.Music21Object):
         base.Music21Object.__init__(self)
         self.resetValues(value, partitionRequest)
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # TimeSignatures pickled before MeterSequences could be shared
+        # store them as attributes
+        if '_meterSequences' not in state:
+            self._meterSequences = {}
+            self._meterTemplate = None
+            for name in ('displaySequence', 'beamSequence', 'beatSequence',
+                         'accentSequence'):
+                if name in self.__dict__:
+                    self._meterSequences[name] = self.__dict__.pop(name)
+
     def resetValues(self, value='4/4', partitionRequest=None):
         '''
         reset all values according to a new value and partitionRequest
@@ -2948,7 +2990,29 @@ class TimeSignature(base.Music21Object):
 
     def load(self, value, partitionRequest=None):
         '''Loading a meter destroys all internal representations
+
+        The default MeterSequences made for a string value are kept and
+        shared by all TimeSignatures later loaded with that value.  Values
+        such as barDuration, beatCount and the beat at an offset are read
+        from the shared MeterSequences; a TimeSignature only copies one
+        when it is accessed directly (as in `.beamSequence`) or changed
+        (as by setting `beatCount`), as it may then be changed.
+
+        >>> ts1 = meter.TimeSignature('5/8')
+        >>> ts2 = meter.TimeSignature('5/8')
+        >>> ts2.getAccentWeight(1.0)
+        0.5
+        >>> ts2.beamSequence.partition(['3/8', '2/8'])
+        >>> ts2.beamSequence
+        <MeterSequence {3/8+2/8}>
+        >>> meter.TimeSignature('5/8').beamSequence
+        <MeterSequence {2/8+3/8}>
         '''
+        # MeterSequences of this TimeSignature, made or copied from
+        # a template when first accessed
+        self._meterSequences = {}
+        self._meterTemplate = None
+
         # create parallel MeterSequence objects to provide all data
         # these all refer to the same .numerator/.denominator
         # relationship
@@ -2962,6 +3026,14 @@ class TimeSignature(base.Music21Object):
             value = '2/2'
             self.symbol = 'cut'
 
+        if common.isStr(value) and partitionRequest is None:
+            templateKey = value
+            if templateKey in _timeSignatureTemplates:
+                self._meterTemplate = _timeSignatureTemplates[templateKey]
+                self.summedNumerator = self._meterTemplate.summedNumerator
+                return
+        else:
+            templateKey = None
 
         self.displaySequence = MeterSequence(value)
         self.summedNumerator = self.displaySequence.summedNumerator
@@ -3002,6 +3074,9 @@ class TimeSignature(base.Music21Object):
                 environLocal.printDebug(['cannot set default accents for:', self])
                 pass
 
+        if templateKey is not None:
+            _timeSignatureTemplates[templateKey] = _TimeSignatureTemplate(self)
+
     def loadRatio(self, numerator, denominator, partitionRequest=None):
         '''
         Change the numerator and denominator for a given partition.
@@ -3009,6 +3084,77 @@ class TimeSignature(base.Music21Object):
         value = '%s/%s' % (numerator, denominator)
         self.load(value, partitionRequest)
 
+    def _getMeterSequence(self, name):
+        '''
+        Return this TimeSignature's own MeterSequence called `name`, copying
+        it from the template first if necessary.
+        '''
+        if name not in self._meterSequences:
+            self._meterSequences[name] = copy.deepcopy(
+                getattr(self._meterTemplate, name))
+        return self._meterSequences[name]
+
+    def _getSharedMeterSequence(self, name):
+        '''
+        Return the MeterSequence called `name`, which may be shared with the
+        template and other TimeSignatures, so must only be read.
+        '''
+        if name in self._meterSequences:
+            return self._meterSequences[name]
+        return getattr(self._meterTemplate, name)
+
+    def _getReadableDuration(self, name, durationObj):
+        '''
+        Return `durationObj`, a Duration read from the MeterSequence called
+        `name`, or, if that MeterSequence is shared, a new Duration equal to
+        it, as callers may change the Duration returned.
+        '''
+        if name in self._meterSequences:
+            return durationObj
+        return duration.Duration(durationObj.quarterLength)
+
+    def _getSharedTemplate(self, name):
+        '''
+        Return the template if the MeterSequence called `name` is still
+        shared with it, so that results of reading it may be stored there;
+        otherwise, return None.
+        '''
+        if name in self._meterSequences:
+            return None
+        return self._meterTemplate
+
+    def _getDisplaySequence(self):
+        return self._getMeterSequence('displaySequence')
+
+    def _setDisplaySequence(self, value):
+        self._meterSequences['displaySequence'] = value
+
+    displaySequence = property(_getDisplaySequence, _setDisplaySequence)
+
+    def _getBeamSequence(self):
+        return self._getMeterSequence('beamSequence')
+
+    def _setBeamSequence(self, value):
+        self._meterSequences['beamSequence'] = value
+
+    beamSequence = property(_getBeamSequence, _setBeamSequence)
+
+    def _getBeatSequence(self):
+        return self._getMeterSequence('beatSequence')
+
+    def _setBeatSequence(self, value):
+        self._meterSequences['beatSequence'] = value
+
+    beatSequence = property(_getBeatSequence, _setBeatSequence)
+
+    def _getAccentSequence(self):
+        return self._getMeterSequence('accentSequence')
+
+    def _setAccentSequence(self, value):
+        self._meterSequences['accentSequence'] = value
+
+    accentSequence = property(_getAccentSequence, _setAccentSequence)
+
     #---------------------------------------------------------------------------
     # properties
 
@@ -3032,7 +3178,8 @@ class TimeSignature(base.Music21Object):
 
     # temp for backward compat
     def _getTotalLength(self):
-        return self.beamSequence.duration.quarterLength
+        return self._getSharedMeterSequence(
+            'beamSequence').duration.quarterLength
 
     totalLength = property(_getTotalLength,
         doc = '''Total length of the TimeSignature, in Quarter Lengths.
@@ -3044,7 +3191,7 @@ class TimeSignature(base.Music21Object):
         ''')
 
     def _getNumerator(self):
-        return self.beamSequence.numerator
+        return self._getSharedMeterSequence('beamSequence').numerator
 
     def _setNumerator(self, value):
         denom = self.denominator
@@ -3079,7 +3226,7 @@ class TimeSignature(base.Music21Object):
         ''')
 
     def _getDenominator(self):
-        return self.beamSequence.denominator
+        return self._getSharedMeterSequence('beamSequence').denominator
 
     def _setDenominator(self, value):
         nummy = self.numerator
@@ -3130,7 +3277,8 @@ class TimeSignature(base.Music21Object):
             return self._overriddenBarDuration
         else:
             # could come from self.beamSequence, self.accentSequence, self.displaySequence, self.accentSequence
-            return self.beamSequence.duration
+            return self._getReadableDuration('beamSequence',
+                self._getSharedMeterSequence('beamSequence').duration)
 
     def _setBarDuration(self, value):
         self._overriddenBarDuration = value
@@ -3170,7 +3318,7 @@ class TimeSignature(base.Music21Object):
     def _getBeatCount(self):
         # the default is for the beat to be defined by the first, not zero,
         # level partition.
-        return len(self.beatSequence)
+        return len(self._getSharedMeterSequence('beatSequence'))
 
     def _setBeatCount(self, value):
         '''Setting a beat-count directly is a simple, high-level way to configure the beatSequence. Note that his may not configure lower level partitions correctly, and will raise an error if the provided beat count is not supported by the overall duration of the .beatSequence MeterSequence.
@@ -3225,7 +3373,7 @@ class TimeSignature(base.Music21Object):
 
     def _getBeatCountName(self):
         # this will use the top-level partitions as the cuunt
-        return self.beatSequence.partitionStr
+        return self._getSharedMeterSequence('beatSequence').partitionStr
 
     beatCountName = property(_getBeatCountName,
         doc = '''Return the beat count name, or the name given for the number of beat units. For example, 2/4 is duple; 9/4 is triple.
@@ -3245,12 +3393,15 @@ class TimeSignature(base.Music21Object):
         '''Return a Duration object for the beat unit of this TimeSignature if the beat unit is constant for all top-level beat partitions; otherwise, return None
         '''
         post = []
-        if len(self.beatSequence) == 1:
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        if len(beatSequence) == 1:
             raise TimeSignatureException('cannot determine beat unit for an unpartitioned beat')
-        for ms in self.beatSequence._partition:
+        for ms in beatSequence._partition:
             post.append(ms.duration.quarterLength)
         if len(set(post)) == 1:
-            return self.beatSequence[0].duration # all are the same
+            # all are the same
+            return self._getReadableDuration('beatSequence',
+                beatSequence[0].duration)
         else:
             raise TimeSignatureException('non uniform beat unit: %s' % post)
 
@@ -3274,20 +3425,21 @@ class TimeSignature(base.Music21Object):
     def _getBeatDivisionCount(self):
         # first, find if there is more than one beat and if all beats are uniformly partitioned
         post = []
-        if len(self.beatSequence) == 1:
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        if len(beatSequence) == 1:
             raise TimeSignatureException('cannot determine beat background for an unpartitioned beat')
 
         # need to see if first-level subdivisions are partitioned
-        if not isinstance(self.beatSequence[0], MeterSequence):
+        if not isinstance(beatSequence[0], MeterSequence):
             raise TimeSignatureException('cannot determine beat backgrond when each beat is not partitioned')
 
         # getting length here gives number of subdivisions
-        for ms in self.beatSequence._partition:
+        for ms in beatSequence._partition:
             post.append(len(ms))
 
         # convert this to a set; if length is 1, then all beats are uniform
         if len(set(post)) == 1:
-            return len(self.beatSequence[0]) # all are the same
+            return len(beatSequence[0]) # all are the same
         else:
             raise TimeSignatureException('non uniform beat background: %s' % post)
 
@@ -3343,15 +3495,17 @@ class TimeSignature(base.Music21Object):
 
     def _getBeatDivisionDurations(self):
         post = []
-        if len(self.beatSequence) == 1:
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        if len(beatSequence) == 1:
             raise TimeSignatureException('cannot determine beat division for an unpartitioned beat')
-        for mt in self.beatSequence._partition:
+        for mt in beatSequence._partition:
             for subMt in mt:
                 post.append(subMt.duration.quarterLength)
         if len(set(post)) == 1: # all the same
             out = [] # could be a Stream, but stream.py imports meter.py
-            for subMt in self.beatSequence[0]._partition:
-                out.append(subMt.duration)
+            for subMt in beatSequence[0]._partition:
+                out.append(self._getReadableDuration('beatSequence',
+                    subMt.duration))
             return out
         else:
             raise TimeSignatureException('non uniform beat division: %s' % post)
@@ -3544,7 +3698,8 @@ class TimeSignature(base.Music21Object):
 
                 # get an archetype of the MeterSequence for this level
                 # level is depth, starting at zero
-                archetype = self.beamSequence.getLevel(depth)
+                archetype = self._getSharedMeterSequence(
+                    'beamSequence').getLevel(depth)
                 # span is the quarter note duration points for each partition
                 # at this level
                 archetypeSpan = archetype.offsetToSpan(start)
@@ -3728,10 +3883,11 @@ class TimeSignature(base.Music21Object):
         '''
         pos = 0
         qLenPos = opFrac(qLenPos)
-        for i in range(len(self.accentSequence)):
+        accentSequence = self._getSharedMeterSequence('accentSequence')
+        for i in range(len(accentSequence)):
             if (pos == qLenPos):
                 return True
-            pos += self.accentSequence[i].duration.quarterLength
+            pos += accentSequence[i].duration.quarterLength
         return False
 
     def setAccentWeight(self, weightList, level=0):
@@ -3830,11 +3986,27 @@ class TimeSignature(base.Music21Object):
 
         '''
         qLenPos = opFrac(qLenPos)
+        template = self._getSharedTemplate('accentSequence')
+        if permitMeterModulus and (self._overriddenBarDuration is not None or
+                self._getSharedTemplate('beamSequence') is None):
+            template = None # bar duration may differ from the template's
+        if template is not None:
+            cacheKey = (qLenPos, level, forcePositionMatch, permitMeterModulus)
+            if cacheKey not in template.accentWeights:
+                template.accentWeights[cacheKey] = self._getAccentWeight(
+                    qLenPos, level, forcePositionMatch, permitMeterModulus)
+            return template.accentWeights[cacheKey]
+        return self._getAccentWeight(qLenPos, level, forcePositionMatch,
+                                     permitMeterModulus)
+
+    def _getAccentWeight(self, qLenPos, level, forcePositionMatch,
+        permitMeterModulus):
+        accentSequence = self._getSharedMeterSequence('accentSequence')
         # might store this weight every time it is set, rather than
         # getting it here
         minWeight = min(
-                    [mt.weight for mt in self.accentSequence._partition]) * .5
-        msLevel = self.accentSequence.getLevel(level)
+                    [mt.weight for mt in accentSequence._partition]) * .5
+        msLevel = accentSequence.getLevel(level)
 
         if permitMeterModulus:
             environLocal.printDebug([' self.duration.quarterLength',  self.duration.quarterLength, 'self.barDuration.quar', self.barDuration.quarterLength])
@@ -3868,7 +4040,13 @@ class TimeSignature(base.Music21Object):
         >>> a.getBeat(2.5)
         2
         '''
-        return self.beatSequence.offsetToIndex(offset) + 1
+        template = self._getSharedTemplate('beatSequence')
+        if template is None:
+            return self.beatSequence.offsetToIndex(offset) + 1
+        if offset not in template.beats:
+            template.beats[offset] = template.beatSequence.offsetToIndex(
+                offset) + 1
+        return template.beats[offset]
 
     def getBeatOffsets(self):
         '''Return offset positions in a list for the start of each beat, assuming this object is found at offset zero.
@@ -3882,12 +4060,13 @@ class TimeSignature(base.Music21Object):
         '''
         post = []
         post.append(0.0)
-        if len(self.beatSequence) == 1:
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        if len(beatSequence) == 1:
             return post
         else:
             endOffset = self.barDuration.quarterLength
             o = 0.0
-            for ms in self.beatSequence._partition:
+            for ms in beatSequence._partition:
                 o = opFrac(o + ms.duration.quarterLength)
                 if o >= endOffset:
                     return post # do not add offset for end of bar
@@ -3939,7 +4118,9 @@ class TimeSignature(base.Music21Object):
         >>> ts3.getBeatDuration(1.5)
         <music21.duration.Duration 1.0>
         '''
-        return self.beatSequence[self.beatSequence.offsetToIndex(qLenPos)].duration
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        return self._getReadableDuration('beatSequence',
+            beatSequence[beatSequence.offsetToIndex(qLenPos)].duration)
 
     def getOffsetFromBeat(self, beat):
         '''
@@ -4003,12 +4184,13 @@ class TimeSignature(base.Music21Object):
         # resolve .33 to .3333333
         beatFraction = common.nearestCommonFraction(beatFraction)
 
-        if beatInt-1 > len(self.beatSequence)-1:
-            raise TimeSignatureException('requested beat value (%s) not found in beat partitions (%s) of ts %s' % (beatInt, self.beatSequence, self))
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        if beatInt-1 > len(beatSequence)-1:
+            raise TimeSignatureException('requested beat value (%s) not found in beat partitions (%s) of ts %s' % (beatInt, beatSequence, self))
         # get a duration object for the beat; will translate into quarterLength
         # beat int counts from 1; subtrack 1 to get index
-        beatDur = self.beatSequence[beatInt-1].duration
-        oStart, unused_oEnd = self.beatSequence.getLevelSpan()[beatInt-1]
+        beatDur = beatSequence[beatInt-1].duration
+        oStart, unused_oEnd = beatSequence.getLevelSpan()[beatInt-1]
         post = oStart + (beatDur.quarterLength * beatFraction)
         # round to 3 values
         return round(post, 4)
@@ -4039,8 +4221,9 @@ class TimeSignature(base.Music21Object):
         >>> a.getBeatProgress(2.5)
         (2, 1.0)
         '''
-        beatIndex = self.beatSequence.offsetToIndex(qLenPos)
-        start, unused_end = self.beatSequence.offsetToSpan(qLenPos)
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        beatIndex = beatSequence.offsetToIndex(qLenPos)
+        start, unused_end = beatSequence.offsetToSpan(qLenPos)
         return beatIndex + 1, qLenPos - start
 
     def getBeatProportion(self, qLenPos):
@@ -4066,11 +4249,18 @@ class TimeSignature(base.Music21Object):
         >>> ts3.getBeatProportion(2.0)
         2.5
         '''
-        beatIndex = self.beatSequence.offsetToIndex(qLenPos)
-        start, end = self.beatSequence.offsetToSpan(qLenPos)
+        template = self._getSharedTemplate('beatSequence')
+        if template is not None and qLenPos in template.beatProportions:
+            return template.beatProportions[qLenPos]
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        beatIndex = beatSequence.offsetToIndex(qLenPos)
+        start, end = beatSequence.offsetToSpan(qLenPos)
         totalRange = end - start
         progress = qLenPos - start # how far in QL
-        return beatIndex + 1 + (progress / totalRange)
+        post = beatIndex + 1 + (progress / totalRange)
+        if template is not None:
+            template.beatProportions[qLenPos] = post
+        return post
 
     def getBeatProportionStr(self, qLenPos):
         '''Return a string presentation of the beat.
@@ -4090,8 +4280,9 @@ class TimeSignature(base.Music21Object):
 
         >>> ts4 = meter.TimeSignature(['6/8']) # will partition as 2 beat
         '''
-        beatIndex = int(self.beatSequence.offsetToIndex(qLenPos))
-        start, end = self.beatSequence.offsetToSpan(qLenPos)
+        beatSequence = self._getSharedMeterSequence('beatSequence')
+        beatIndex = int(beatSequence.offsetToIndex(qLenPos))
+        start, end = beatSequence.offsetToSpan(qLenPos)
         totalRange = end - start
         progress = qLenPos - start # how far in QL
 
@@ -4127,7 +4318,8 @@ class TimeSignature(base.Music21Object):
         >>> b.getBeatDepth(1)
         2
         '''
-        return self.beatSequence.offsetToDepth(qLenPos, align)
+        return self._getSharedMeterSequence('beatSequence').offsetToDepth(
+            qLenPos, align)
 
     def quarteroffsetToBeat(self, currentQtrPosition=0):
         '''For backward compatibility. Ultimately, remove.
@@ -4614,6 +4806,42 @@ class Test(unittest.TestCase):
         ts6 = bestTimeSignature(m6)
         self.assertEqual(repr(ts6), '<music21.meter.TimeSignature 11/32>')
 
+    def testReadingDoesNotCopyTemplate(self):
+        TimeSignature('6/8')
+        ts = TimeSignature('6/8')
+        # a TimeSignature with copies of its own
+        owned = TimeSignature('6/8')
+        for name in ('displaySequence', 'beamSequence', 'beatSequence',
+                     'accentSequence'):
+            getattr(owned, name)
+
+        def read(ts):
+            return [ts.barDuration.quarterLength, ts.beatCount,
+                ts.beatCountName, ts.beatDuration.quarterLength,
+                ts.beatDivisionCount,
+                [d.quarterLength for d in ts.beatDivisionDurations],
+                ts.getBeatOffsets(), ts.getBeatDuration(2.0).quarterLength,
+                ts.getOffsetFromBeat(2.5), ts.getBeatProgress(2.0),
+                ts.getBeatDepth(0.5), ts.getAccent(1.5)]
+
+        self.assertEqual(read(ts), read(owned))
+        self.assertEqual(read(ts)[:5], [3.0, 2, 'Duple', 1.5, 3])
+        self.assertEqual(ts._meterSequences, {})
+
+        # Durations returned can be changed without changing the template
+        ts.barDuration.quarterLength = 1.0
+        ts.beatDuration.quarterLength = 1.0
+        self.assertEqual(TimeSignature('6/8').barDuration.quarterLength, 3.0)
+        self.assertEqual(TimeSignature('6/8').beatDuration.quarterLength, 1.5)
+
+        # changing a MeterSequence copies it first
+        ts.beatCount = 6
+        self.assertEqual(list(ts._meterSequences.keys()), ['beatSequence'])
+        self.assertEqual(ts.beatCount, 6)
+        self.assertEqual(ts.beatDuration.quarterLength, 0.5)
+        self.assertTrue(ts.beatDuration is ts.beatSequence[0].duration)
+        self.assertEqual(TimeSignature('6/8').beatCount, 2)
+
 
 #------------------------------------------------------------------------------
 # define presented order in documentation
@@ -33,6 +33,7 @@ see http://groups.google.com/group/alt.sources/msg/0c5fc523e050c35e
 
 import unittest
 import unicodedata
+import mmap
 import os, string
 import struct
 
@@ -229,6 +230,9 @@ def getNumbersAsList(midiStr):
             post.append(ord(midiStr[i]))
     return post
 
+# struct formats for the common lengths of putNumber
+_putNumberFormats = {1: '>B', 2: '>H', 4: '>I'}
+
 def putNumber(num, length): 
     '''
     Put a single number as a hex number at the end of a string `length` bytes long.
@@ -237,7 +241,18 @@ def putNumber(num, length):
     b'\\x00\\x00\\x00\\x03'
     >>> midi.putNumber(0, 1)
     b'\\x00'
+    >>> midi.putNumber(3, 3)
+    b'\\x00\\x00\\x03'
+
+    Numbers that do not fit in `length` bytes are wrapped:
+
+    >>> midi.putNumber(257, 1)
+    b'\\x01'
     '''
+    if length in _putNumberFormats:
+        # the mask wraps numbers that do not fit, as below
+        return struct.pack(_putNumberFormats[length], 
+                           num & ((1 << (8 * length)) - 1))
     if six.PY2:
         lst = [] 
     else:
@@ -256,6 +271,11 @@ def putNumber(num, length):
     else:
         return bytes(lst)
 
+# encodings of the numbers below _variableLengthNumberCacheSize found by
+# putVariableLengthNumber, which are the numbers encoded in two bytes or less
+_variableLengthNumberCache = {}
+_variableLengthNumberCacheSize = 0x4000
+
 def putVariableLengthNumber(x): 
     '''
     >>> midi.putVariableLengthNumber(4)
@@ -276,9 +296,14 @@ def putVariableLengthNumber(x):
     MidiException: cannot putVariableLengthNumber() when number is negative: -1
     '''
     #environLocal.printDebug(['calling putVariableLengthNumber(x) with', x])
+    try:
+        return _variableLengthNumberCache[x]
+    except (KeyError, TypeError): # TypeError for unhashable numbers
+        pass
     # note: negative numbers will cause an infinite loop here
     if x < 0:
         raise MidiException('cannot putVariableLengthNumber() when number is negative: %s' % x)
+    number = x
     if six.PY2:
         lst = [] 
     else:
@@ -294,10 +319,14 @@ def putVariableLengthNumber(x):
     lst.reverse() 
     if six.PY2:
         lst[-1] = chr(ord(lst[-1]) & 0x7f) 
-        return string.join(lst, "") 
+        post = string.join(lst, "") 
     else:
         lst[-1] = lst[-1] & 0x7f 
-        return bytes(lst)
+        post = bytes(lst)
+    # delta times and data lengths are mostly small and often repeated
+    if number < _variableLengthNumberCacheSize:
+        _variableLengthNumberCache[number] = post
+    return post
 
 def putNumbersAsList(numList):
     '''
@@ -323,6 +352,176 @@ def putNumbersAsList(numList):
         post.append(chr(n))
     return ''.join(post)
 
+#-------------------------------------------------------------------------------
+class MidiReader(object):
+    '''
+    A cursor over MIDI data for reading numbers and bytes from it in order.
+
+    Unlike :func:`~music21.midi.getNumber` and
+    :func:`~music21.midi.getVariableLengthNumber`, which return a copy of
+    the remaining data after each read, a MidiReader only advances its
+    `position`; the data is never copied except for the bytes returned by
+    :meth:`readBytes`. Thus reading a track takes time proportional to its
+    length.
+
+    The data can be a byte string, a bytearray, or anything else supporting
+    the buffer protocol, such as an `mmap` of a MIDI file.
+
+    >>> mr = midi.MidiReader(b'MThd\\x00\\x00\\x00\\x06\\x81\\x00')
+    >>> mr.readBytes(4) == b'MThd'
+    True
+    >>> mr.readNumber(4)
+    6
+    >>> mr.position
+    8
+    >>> mr.readVariableLengthNumber()
+    128
+    >>> mr.atEnd()
+    True
+
+    Reading past the end of the data raises a MidiException:
+
+    >>> mr.readNumber(1)
+    Traceback (most recent call last):
+    MidiException: cannot read 1 byte(s) at position 10 of 10
+    '''
+    def __init__(self, data, position=0, end=None):
+        if isinstance(data, MidiReader):
+            # share the data of another reader
+            data = data.data
+        elif six.PY3:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            # indexing a memoryview gives ints and slicing it does not copy
+            data = memoryview(data)
+        else:
+            # on Python 2, indexing a memoryview gives single characters;
+            # a bytearray (a single copy) gives ints
+            data = bytearray(data)
+        self.data = data
+        self.position = position
+        if end is None:
+            self.end = len(data)
+        else:
+            self.end = min(end, len(data))
+
+    def __repr__(self):
+        return '<MidiReader position=%d end=%d>' % (self.position, self.end)
+
+    def atEnd(self):
+        '''
+        Return True if all the data has been read.
+        '''
+        return self.position >= self.end
+
+    def remaining(self):
+        '''
+        Return the number of bytes not yet read.
+
+        >>> mr = midi.MidiReader(b'\\x00\\x01\\x02')
+        >>> mr.position = 1
+        >>> mr.remaining()
+        2
+        '''
+        return max(self.end - self.position, 0)
+
+    def getByte(self, offset=0):
+        '''
+        Return the byte `offset` bytes after the current position as an
+        integer, without advancing the position.
+
+        >>> mr = midi.MidiReader(b'\\x90<x')
+        >>> mr.getByte(0), mr.getByte(1)
+        (144, 60)
+        >>> mr.position
+        0
+        '''
+        i = self.position + offset
+        if i >= self.end:
+            raise MidiException('cannot read 1 byte(s) at position %d of %d' %
+                                (i, self.end))
+        return self.data[i]
+
+    def readNumber(self, length):
+        '''
+        Read a big-endian number `length` bytes long, as
+        :func:`~music21.midi.getNumber` does.
+
+        >>> midi.MidiReader(b'test').readNumber(2)
+        29797
+        '''
+        end = self.position + length
+        if end > self.end:
+            raise MidiException('cannot read %d byte(s) at position %d of %d' %
+                                (length, self.position, self.end))
+        data = self.data
+        summation = 0
+        for i in range(self.position, end):
+            summation = (summation << 8) + data[i]
+        self.position = end
+        return summation
+
+    def readVariableLengthNumber(self):
+        r'''
+        Read a number stored in the MIDI variable-length format, as
+        :func:`~music21.midi.getVariableLengthNumber` does.
+
+        >>> mr = midi.MidiReader(b'\xff\x7fA')
+        >>> mr.readVariableLengthNumber()
+        16383
+        >>> mr.position
+        2
+        '''
+        data = self.data
+        summation = 0
+        i = self.position
+        end = min(self.end, i + 999)
+        while i < end:
+            x = data[i]
+            summation = (summation << 7) + (x & 0x7F)
+            i += 1
+            if not (x & 0x80):
+                self.position = i
+                return summation
+        raise MidiException('did not find the end of the number!')
+
+    def readBytes(self, length):
+        '''
+        Return the next `length` bytes as a byte string. If fewer bytes
+        remain, return those.
+
+        >>> mr = midi.MidiReader(b'abcdef')
+        >>> mr.readBytes(2) == b'ab'
+        True
+        >>> mr.readBytes(10) == b'cdef'
+        True
+        '''
+        start = self.position
+        self.position = min(start + length, self.end)
+        return bytes(self.data[start:self.position])
+
+    def readRemainder(self):
+        '''
+        Return all data not yet read as a byte string.
+        '''
+        return self.readBytes(self.remaining())
+
+    def readChunk(self, length):
+        '''
+        Return a new MidiReader over the next `length` bytes (or fewer, if
+        fewer remain), sharing the data of this reader, and advance past them.
+
+        >>> mr = midi.MidiReader(b'abcdef')
+        >>> chunk = mr.readChunk(3)
+        >>> chunk.readRemainder() == b'abc'
+        True
+        >>> mr.readRemainder() == b'def'
+        True
+        '''
+        chunk = MidiReader(self, self.position, self.position + length)
+        self.position = chunk.end
+        return chunk
+
 #-------------------------------------------------------------------------------
 class Enumeration(object): 
     '''
@@ -636,21 +835,22 @@ class MidiEvent(object):
         >>> me1.velocity
         120
         '''
+        reader = MidiReader(midiStr)
+        x = reader.getByte(0)
+        reader.position += 1
+        self._readChannelVoiceMessage(x, reader)
+        return reader.readRemainder()
+
+    def _readChannelVoiceMessage(self, x, reader):
+        '''
+        Read the data bytes of a channel voice message with the status byte
+        `x` from a :class:`~music21.midi.MidiReader` positioned after the
+        status byte.
+        '''
         # x, y, and z define characteristics of the first two chars
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        if common.isNum(midiStr[0]):
-            x = midiStr[0]
-        else:
-            x = ord(midiStr[0])  # given a string representation, get decimal number
         y = x & 0xF0  # bitwise and to derive channel number
-        if common.isNum(midiStr[1]):
-            z = midiStr[1]
-        else:
-            z = ord(midiStr[1])  # given a string representation, get decimal number
-        if common.isNum(midiStr[2]):
-            thirdByte = midiStr[2]
-        else:
-            thirdByte = ord(midiStr[2])  # given a string representation, get decimal number
+        z = reader.getByte(0)
 
         self.channel = (x & 0x0F) + 1  # this is same as y + 1
         self.type = channelVoiceMessages.whatis(y) 
@@ -658,21 +858,21 @@ class MidiEvent(object):
         if (self.type == "PROGRAM_CHANGE" or 
             self.type == "CHANNEL_KEY_PRESSURE"): 
             self.data = z 
-            return midiStr[2:] 
+            reader.position += 1
         elif (self.type == "CONTROLLER_CHANGE"):
             # for now, do nothing with this data
             # for a note, str[2] is velocity; here, it is the control value
             self.pitch = z # this is the controller id
-            self.velocity = thirdByte # this is the controller value
-            return midiStr[3:] 
+            self.velocity = reader.getByte(1) # this is the controller value
+            reader.position += 2
         else: 
             self.pitch = z # the second byte
             # read the third chart toi get velocity 
-            self.velocity = thirdByte
+            self.velocity = reader.getByte(1)
             # each MidiChannel object is accessed here
             # using that channel, data for each event is added or 
             # removed 
-            return midiStr[3:] 
+            reader.position += 2
 
     def read(self, time, midiStr): 
         '''
@@ -696,75 +896,89 @@ class MidiEvent(object):
         >>> (159 & 0x0F) + 1 # getting the channel
         16
         '''
-        if len(midiStr) < 2:
+        reader = MidiReader(midiStr)
+        self.readFromReader(time, reader)
+        return reader.readRemainder()
+
+    def readFromReader(self, time, reader):
+        '''
+        Read this event from a :class:`~music21.midi.MidiReader`, advancing
+        it to the start of the next event.
+
+        The `time` value is the number of ticks into the Track 
+        at which this event happens.
+
+        >>> mt = midi.MidiTrack(1)
+        >>> me1 = midi.MidiEvent(mt)
+        >>> mr = midi.MidiReader(midi.intsToHexString([144, 60, 120, 0]))
+        >>> me1.readFromReader(0, mr)
+        >>> me1
+        <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=120>
+        >>> mr.position
+        3
+
+        If the status byte is omitted (running status), the status byte of the
+        previous event, stored in `lastStatusByte`, is used:
+
+        >>> me2 = midi.MidiEvent(mt)
+        >>> me2.lastStatusByte = me1.lastStatusByte
+        >>> me2.readFromReader(0, midi.MidiReader(midi.intsToHexString([62, 0])))
+        >>> me2
+        <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=62, velocity=0>
+        '''
+        if reader.remaining() < 2:
             # often what we have here are null events:
             # the string is simply: 0x00
-            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(midiStr)])
-            return ''
+            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(reader.readRemainder())])
+            return
 
         # x, y, and z define characteristics of the first two chars
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        if common.isNum(midiStr[0]):
-            x = midiStr[0]
-        else:
-            x = ord(midiStr[0])  # given a string representation, get decimal number
+        x = reader.getByte(0)
 
         # detect running status: if the status byte is less than 128, its 
         # not a status byte, but a data byte
         if x < 128:
             # environLocal.printDebug(['MidiEvent.read(): found running status even data', 'self.lastStatusByte:', self.lastStatusByte])
-
             if self.lastStatusByte is not None:
-                rsb = self.lastStatusByte
-                if common.isNum(rsb):
-                    rsb = bytes([rsb])
+                x = self.lastStatusByte
+                if not common.isNum(x):
+                    x = ord(x)
             else: # provide a default
-                if six.PY3:
-                    rsb = bytes([0x90])
-                else:
-                    rsb = chr(0x90)
-            #post = self._parseChannelVoiceMessage(str, runningStatusByte=rsb)
-            #return post
-            # add the running status byte to the front of the string 
-            # and process as before
-            midiStr = rsb + midiStr
-            if common.isNum(midiStr[0]):
-                x = midiStr[0]
-            else:
-                x = ord(midiStr[0]) # given a string representation, get decimal number
+                x = 0x90
+            # the data bytes start at the current position
+            dataStart = 0
         else:
             # store last status byte
-            self.lastStatusByte = midiStr[0]
+            self.lastStatusByte = x
+            dataStart = 1
 
         y = x & 0xF0  # bitwise and to derive message type
-
-        if common.isNum(midiStr[1]):
-            z = midiStr[1]
-        else:
-            z = ord(midiStr[1])  # given a string representation, get decimal number
+        z = reader.getByte(dataStart)
 
         #environLocal.printDebug(['MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:', 'repr(x)', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
 
         if channelVoiceMessages.hasValue(y): 
-            return self._parseChannelVoiceMessage(midiStr)
+            reader.position += dataStart
+            self._readChannelVoiceMessage(x, reader)
 
         elif y == 0xB0 and channelModeMessages.hasValue(z): 
             self.channel = (x & 0x0F) + 1 
             self.type = channelModeMessages.whatis(z) 
             if self.type == "LOCAL_CONTROL": 
-                self.data = (ord(midiStr[2]) == 0x7F) 
+                self.data = (reader.getByte(dataStart + 1) == 0x7F) 
             elif self.type == "MONO_MODE_ON": 
-                self.data = ord(midiStr[2]) 
+                self.data = reader.getByte(dataStart + 1) 
             else:
-                environLocal.printDebug(['unhandled message:', midiStr[2]])
-            return midiStr[3:]
+                environLocal.printDebug(['unhandled message:', reader.getByte(dataStart + 1)])
+            reader.position += dataStart + 2
 
         elif x == 0xF0 or x == 0xF7: 
             self.type = {0xF0: "F0_SYSEX_EVENT", 
                          0xF7: "F7_SYSEX_EVENT"}[x] 
-            length, midiStr = getVariableLengthNumber(midiStr[1:]) 
-            self.data = midiStr[:length] 
-            return midiStr[length:]
+            reader.position += dataStart
+            length = reader.readVariableLengthNumber() 
+            self.data = reader.readBytes(length) 
 
         # SEQUENCE_TRACK_NAME and other MetaEvents are here
         elif x == 0xFF: 
@@ -774,17 +988,14 @@ class MidiEvent(object):
                 sys.stdout.flush() 
                 raise MidiException("Unknown midi event type: %r, %r" % (x, z))
             self.type = metaEvents.whatis(z) 
-            length, midiStr = getVariableLengthNumber(midiStr[2:]) 
-            self.data = midiStr[:length] 
-            # return remainder
-            return midiStr[length:] 
+            reader.position += dataStart + 1
+            length = reader.readVariableLengthNumber() 
+            self.data = reader.readBytes(length) 
         else:
             # an uncaught message
-            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(midiStr[0]), 'charToBinary(midiStr[1])', charToBinary(midiStr[1])])
+            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(chr(x))', charToBinary(chr(x)), 'charToBinary(chr(z))', charToBinary(chr(z))])
 
             raise MidiException("Unknown midi event type")
-            #return everything but the first character
-            return midiStr[1:] # 
 
 
     def getBytes(self): 
@@ -983,8 +1194,21 @@ class DeltaTime(MidiEvent):
         self.type = "DeltaTime" 
 
     def read(self, oldstr): 
-        self.time, newstr = getVariableLengthNumber(oldstr) 
-        return self.time, newstr 
+        reader = MidiReader(oldstr)
+        self.readFromReader(reader)
+        return self.time, reader.readRemainder() 
+
+    def readFromReader(self, reader):
+        '''
+        Read the time from a :class:`~music21.midi.MidiReader` and return it.
+
+        >>> mt = midi.MidiTrack(1)
+        >>> dt = midi.DeltaTime(mt)
+        >>> dt.readFromReader(midi.MidiReader(b'\\x88\\x00'))
+        1024
+        '''
+        self.time = reader.readVariableLengthNumber() 
+        return self.time
 
     def getBytes(self): 
         midiStr = putVariableLengthNumber(self.time) 
@@ -1029,27 +1253,49 @@ class MidiTrack(object):
         Creates and stores :class:`~music21.midi.base.DeltaTime` 
         and :class:`~music21.midi.base.MidiEvent` objects. 
         '''
+        reader = MidiReader(midiStr)
+        self.readFromReader(reader)
+        return reader.readRemainder() # remainder string after extracting track data
+
+    def readFromReader(self, reader):
+        '''
+        Read this track from a :class:`~music21.midi.MidiReader` positioned
+        at the `MTrk` chunk, advancing it to the end of the track.
+
+        Creates and stores :class:`~music21.midi.base.DeltaTime` 
+        and :class:`~music21.midi.base.MidiEvent` objects. 
+
+        >>> mt = midi.MidiTrack(1)
+        >>> mr = midi.MidiReader(b'MTrk\\x00\\x00\\x00\\x07\\x00\\x90<x\\x10<\\x00')
+        >>> mt.readFromReader(mr)
+        >>> mt.events
+        [<MidiEvent DeltaTime, t=0, track=1, channel=None>, 
+         <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=120>, 
+         <MidiEvent DeltaTime, t=16, track=1, channel=None>, 
+         <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=0>]
+        >>> mr.atEnd()
+        True
+        '''
         time = 0 # a running counter of ticks
 
-        if not midiStr[:4] == b"MTrk":
+        if not reader.readBytes(4) == b"MTrk":
             raise MidiException('badly formed midi string: missing leading MTrk')
         # get the 4 chars after the MTrk encoding
-        length, midiStr = getNumber(midiStr[4:], 4)      
+        length = reader.readNumber(4)
         #environLocal.printDebug(['MidiTrack.read(): got chunk size', length])   
         self.length = length 
 
-        # all event data is in the track str
-        trackStr = midiStr[:length] 
-        remainder = midiStr[length:] 
+        # all event data is in the track chunk
+        trackReader = reader.readChunk(length)
 
         ePrevious = None
-        while trackStr: 
+        while not trackReader.atEnd(): 
             # shave off the time stamp from the event
             delta_t = DeltaTime(self) 
-            # return extracted time, as well as remaining string
-            dt, trackStrCandidate = delta_t.read(trackStr) 
+            dt = delta_t.readFromReader(trackReader) 
             # this is the offset that this event happens at, in ticks
             timeCandidate = time + dt 
+            eventStart = trackReader.position
     
             # pass self to event, set this MidiTrack as the track for this event
             e = MidiEvent(self) 
@@ -1057,22 +1303,19 @@ class MidiTrack(object):
                 e.lastStatusByte = ePrevious.lastStatusByte
             # some midi events may raise errors; simply skip for now
             try:
-                trackStrCandidate = e.read(timeCandidate, trackStrCandidate) 
+                e.readFromReader(timeCandidate, trackReader) 
             except MidiException:
-                # assume that trackStr, after delta extraction, is still correct
+                # assume that the data, after delta extraction, is still correct
                 #environLocal.printDebug(['forced to skip event; delta_t:', delta_t])
-                # set to result after taking delta time
-                trackStr = trackStrCandidate
+                # go back to the position after taking delta time
+                trackReader.position = eventStart
                 continue
             # only set after trying to read, which may raise exception
             time = timeCandidate
-            trackStr = trackStrCandidate # remainder string
             # only append if we get this far
             self.events.append(delta_t) 
             self.events.append(e) 
             ePrevious = e
-
-        return remainder # remainder string after extracting track data
     
     def getBytes(self): 
         '''
@@ -1081,13 +1324,14 @@ class MidiTrack(object):
         
         # set time to the first event
         # time = self.events[0].time 
-        # build str using MidiEvents 
-        midiStr = b""
+        # collect the bytes of all MidiEvents and join them once at the end,
+        # rather than building a new string for each event
+        chunks = []
         for e in self.events: 
             # this writes both delta time and message events
             try:
                 ew = e.getBytes()
-                if six.PY3:
+                if six.PY3 and not isinstance(ew, bytes):
                     intArray = []
                     for x in ew:
                         if common.isNum(x):
@@ -1095,9 +1339,10 @@ class MidiTrack(object):
                         else:
                             intArray.append(ord(x))
                     ew = bytes(bytearray(intArray)) 
-                midiStr = midiStr + ew
+                chunks.append(ew)
             except MidiException as me:
                 environLocal.warn("Conversion error for %s: %s; ignored." % (e, me))
+        midiStr = b"".join(chunks)
         return b"MTrk" + putNumber(len(midiStr), 4) + midiStr
     
     def __repr__(self): 
@@ -1200,10 +1445,29 @@ class MidiFile(object):
         '''
         self.file.close() 
     
-    def read(self): 
+    def read(self, useMmap=False): 
         '''
         Read and parse MIDI data stored in a file.
+
+        If `useMmap` is True and the file is a file on disk, it is mapped
+        into memory and parsed in place rather than read into a string
+        first; this saves memory when reading large files.
         '''
+        if useMmap:
+            try:
+                fileno = self.file.fileno()
+            except (AttributeError, IOError, OSError, ValueError):
+                fileno = None # a file-like object
+            if fileno is not None:
+                mappedFile = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                try:
+                    self.readstr(mappedFile)
+                finally:
+                    try:
+                        mappedFile.close()
+                    except BufferError: # still referenced by a failed read
+                        pass
+                return
         self.readstr(self.file.read()) 
     
     def readstr(self, midiStr): 
@@ -1211,23 +1475,27 @@ class MidiFile(object):
         Read and parse MIDI data as a string, putting the
         data in `.ticksPerQuarterNote` and a list of
         `MidiTrack` objects in the attribute `.tracks`. 
+
+        The data can also be a bytearray, an `mmap`, or any other object
+        supporting the buffer protocol; it is read with a
+        :class:`~music21.midi.MidiReader` and is never copied as a whole.
         '''
-        if not midiStr[:4] == b"MThd":
+        reader = MidiReader(midiStr)
+        if not reader.readBytes(4) == b"MThd":
             raise MidiException('badly formated midi string, got: %s' % midiStr[:20])
 
-        # we step through the str src, chopping off characters as we go
-        # and reassigning to str
-        length, midiStr = getNumber(midiStr[4:], 4) 
+        # we step through the data, advancing the reader as we go
+        length = reader.readNumber(4) 
         if not length == 6:
             raise MidiException('badly formated midi string')
 
-        midiFormatType, midiStr = getNumber(midiStr, 2) 
+        midiFormatType = reader.readNumber(2) 
         self.format = midiFormatType
         if not midiFormatType in [0, 1]:
-            raise MidiException('cannot handle midi file format: %s' % format)
+            raise MidiException('cannot handle midi file format: %s' % midiFormatType)
 
-        numTracks, midiStr = getNumber(midiStr, 2) 
-        division, midiStr = getNumber(midiStr, 2) 
+        numTracks = reader.readNumber(2) 
+        division = reader.readNumber(2) 
 
         # very few midi files seem to define ticksPerSecond
         if division & 0x8000: 
@@ -1245,7 +1513,7 @@ class MidiFile(object):
 
         for i in range(numTracks): 
             trk = MidiTrack(i) # sets the MidiTrack index parameters
-            midiStr = trk.read(midiStr) # pass all the remaining string, reassing
+            trk.readFromReader(reader) # advances the reader past the track
             self.tracks.append(trk) 
     
     def write(self): 
@@ -1260,10 +1528,10 @@ class MidiFile(object):
         Generate the MIDI data header and convert the list of
         MidiTrack objects in self.tracks into MIDI data and return it as a string.
         '''
-        midiStr = self.writeMThdStr()
+        chunks = [self.writeMThdStr()]
         for trk in self.tracks: 
-            midiStr = midiStr + trk.getBytes() 
-        return midiStr 
+            chunks.append(trk.getBytes()) 
+        return b"".join(chunks) 
 
 
     def writeMThdStr(self): 
@@ -1614,6 +1882,34 @@ class Test(unittest.TestCase):
         #    print n, n.quarterLength
         #s.show()
 
+    def testReadWithMmap(self):
+        directory = common.getPackageDir(relative=False, remapSep=os.sep)
+        for fp in directory:
+            if fp.endswith('midi'):
+                break
+        dirLib = os.path.join(fp, 'testPrimitive')
+        fp = os.path.join(dirLib, 'test09.mid')
+
+        mf = MidiFile()
+        mf.open(fp)
+        mf.read()
+        mf.close()
+
+        mfMapped = MidiFile()
+        mfMapped.open(fp)
+        mfMapped.read(useMmap=True)
+        mfMapped.close()
+
+        self.assertEqual(len(mfMapped.tracks), len(mf.tracks))
+        self.assertEqual(mfMapped.writestr(), mf.writestr())
+
+        # reading the remainder of a track returns the data after it
+        midiStr = mf.writestr()
+        trk = MidiTrack(0)
+        remainder = trk.read(midiStr[14:])
+        self.assertEqual(len(trk.events), len(mf.tracks[0].events))
+        self.assertEqual(remainder, midiStr[14 + 8 + trk.length:])
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
@@ -18,6 +18,7 @@ notes takes place in the :meth:`~music21.stream.Stream.quantize` method not here
 import unittest
 import math
 import copy
+import heapq
 
 from music21 import defaults
 from music21 import common
@@ -1041,12 +1042,23 @@ def _streamToPackets(s, trackId=1):
     In converting from a Stream to MIDI, this is called first, 
     resulting in a collection of packets by offset. 
     Then, packets to events is called.
+
+    If the Stream is sorted, the packets are put in order as they are
+    created and are not sorted again.
     '''
     # store all events by offset by offset without delta times
     # as (absTime, event)
     packetsByOffset = []
     lastInstrument = None
 
+    # note-offs come after the following events in a sorted Stream; they wait
+    # in a heap until all events before them have been stored, so that
+    # packetsInOrder gets the order that sorting packetsByOffset would give
+    packetsInOrder = []
+    pendingNoteOffs = [] # a heap of (offset, sortOrder, count, packet)
+    lastSortKey = None
+    inOrder = True
+
     # probably already flat and sorted
     for obj in s:
         classes = obj.classes
@@ -1092,6 +1104,19 @@ def _streamToPackets(s, trackId=1):
                             offsetToMidi(obj.getOffsetBySite(s)), 
                             midiEvent, obj=obj, lastInstrument=lastInstrument)
                 packets.append(p)
+                if inOrder:
+                    sortKey = (p['offset'], p['midiEvent'].sortOrder)
+                    # ties go to the earlier packet, as in a stable sort
+                    while pendingNoteOffs and pendingNoteOffs[0][:2] <= sortKey:
+                        noteOffSortKey = pendingNoteOffs[0][:2]
+                        if lastSortKey is not None and noteOffSortKey < lastSortKey:
+                            inOrder = False
+                        lastSortKey = noteOffSortKey
+                        packetsInOrder.append(heapq.heappop(pendingNoteOffs)[3])
+                    if lastSortKey is not None and sortKey < lastSortKey:
+                        inOrder = False
+                    lastSortKey = sortKey
+                    packetsInOrder.append(p)
             # if its a note_off, use the duration to shift offset
             # midi events have already been created; 
             else: 
@@ -1099,8 +1124,22 @@ def _streamToPackets(s, trackId=1):
                     offsetToMidi(obj.getOffsetBySite(s)) + durationToMidi(obj.duration), 
                     midiEvent, obj=obj, lastInstrument=lastInstrument)
                 packets.append(p)
+                if inOrder:
+                    heapq.heappush(pendingNoteOffs, (p['offset'], 
+                        p['midiEvent'].sortOrder, len(packetsByOffset) + i, p))
         packetsByOffset += packets
 
+    if inOrder:
+        while pendingNoteOffs:
+            noteOffSortKey = pendingNoteOffs[0][:2]
+            if lastSortKey is not None and noteOffSortKey < lastSortKey:
+                inOrder = False
+                break
+            lastSortKey = noteOffSortKey
+            packetsInOrder.append(heapq.heappop(pendingNoteOffs)[3])
+    if inOrder:
+        return packetsInOrder
+
     # sorting is useful here, as we need these to be in order to assign last
     # instrument
     packetsByOffset.sort(
@@ -1706,7 +1745,11 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
     for s in substreamList:
         s = s.stripTies(inPlace=True, matchByPitch=False, 
                         retainContainers=True)
-        s = s.flat.sorted
+        s = s.flat
+        # a Stream with autoSort is sorted in place when iterated; 
+        # only make a sorted copy otherwise
+        if not s.autoSort and not s.isSorted:
+            s = s.sorted
 
         # get a first instrument; iterate over rest
         instrumentStream = s.getElementsByClass('Instrument')
@@ -2774,6 +2817,32 @@ class Test(unittest.TestCase):
         s = converter.parse(fp)
         #s.show('t')
         self.assertEqual(len(s.flat.getElementsByClass('Chord')), 4)
+
+    def testStreamToPacketsOrder(self):
+        from music21 import stream, note, chord, meter
+
+        def sortedPackets(packets):
+            return sorted(packets, 
+                key=lambda x: (x['offset'], x['midiEvent'].sortOrder))
+
+        s = stream.Stream()
+        s.insert(0, meter.TimeSignature('3/4'))
+        for i, ql in enumerate([1, 0.5, 2, 0.25, 0.25, 3]):
+            s.append(note.Note(60 + i, quarterLength=ql))
+        s.insert(1, chord.Chord(['C4', 'E4', 'G4'], quarterLength=4))
+        s.insert(1, note.Note('D5', quarterLength=1))
+        packets = _streamToPackets(s)
+        self.assertEqual(len(packets), 1 + 2 * 6 + 2 * 3 + 2)
+        self.assertEqual([id(p) for p in packets], 
+                         [id(p) for p in sortedPackets(packets)])
+
+        # a zero-length note puts its note-off before earlier note-ons
+        n = note.Note('E5')
+        n.duration.quarterLength = 0
+        s.insert(1, n)
+        packets = _streamToPackets(s)
+        self.assertEqual([id(p) for p in packets], 
+                         [id(p) for p in sortedPackets(packets)])
         
 
 #-------------------------------------------------------------------------------
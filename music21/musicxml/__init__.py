@@ -10,7 +10,7 @@
 # License:      LGPL or BSD, see license.txt
 #-------------------------------------------------------------------------------
 
-_all_ = ['mxObjects', 'm21ToString', 'toMxObjects', 'fromMxObjects', 'xmlHandler']
+_all_ = ['mxObjects', 'm21ToString', 'toMxObjects', 'fromMxObjects', 'xmlHandler', 'xmlToM21']
 
 import sys
 from music21.musicxml import mxObjects
@@ -18,6 +18,7 @@ from music21.musicxml import m21ToString
 from music21.musicxml import toMxObjects
 from music21.musicxml import fromMxObjects
 from music21.musicxml import xmlHandler
+from music21.musicxml import xmlToM21
 #------------------------------------------------------------------------------
 # eof
 
@@ -398,27 +398,38 @@ def mxToAccidental(mxAccidental, inputM21Object = None):
     else:
         acc = inputM21Object
  
-    mxName = mxAccidental.get('charData')
-    if mxName == "quarter-sharp": 
-        name = "half-sharp"
-    elif mxName == "three-quarters-sharp": 
-        name = "one-and-a-half-sharp"
-    elif mxName == "quarter-flat": 
-        name = "half-flat"
-    elif mxName == "three-quarters-flat": 
-        name = "one-and-a-half-flat"
-    elif mxName == "flat-flat": 
-        name = "double-flat"
-    elif mxName == "sharp-sharp": 
-        name = "double-sharp"
-    else:
-        name = mxName
+    name = musicXMLAccidentalToName(mxAccidental.get('charData'))
     # need to use set here to get all attributes up to date
     acc.set(name)
 
     return acc
 
 
+def musicXMLAccidentalToName(value):
+    '''
+    Convert a MusicXML accidental to the name of a music21 accidental.
+
+    >>> musicxml.fromMxObjects.musicXMLAccidentalToName('quarter-flat')
+    'half-flat'
+    >>> musicxml.fromMxObjects.musicXMLAccidentalToName('sharp')
+    'sharp'
+    '''
+    if value == "quarter-sharp": 
+        return "half-sharp"
+    elif value == "three-quarters-sharp": 
+        return "one-and-a-half-sharp"
+    elif value == "quarter-flat": 
+        return "half-flat"
+    elif value == "three-quarters-flat": 
+        return "one-and-a-half-flat"
+    elif value == "flat-flat": 
+        return "double-flat"
+    elif value == "sharp-sharp": 
+        return "double-sharp"
+    else:
+        return value
+
+
 def mxToPitch(mxNote, inputM21=None):
     '''
     Given a MusicXML Note object, set this Pitch object to its values.
@@ -1954,6 +1965,315 @@ def addToStaffReference(mxObjectOrNumber, music21Object, staffReference):
     staffReference[key].append(music21Object)
 
 
+def addMxAttributesToMeasure(mxAttributes, m, staffReference):
+    '''
+    Insert the time signatures, clefs, key signatures, and staff layouts
+    defined in an mxAttributes object at the start of the Measure `m`,
+    noting the staff of each in the `staffReference` dictionary.
+
+    Returns a list of the StaffLayout objects inserted, as <print> tags
+    later in the measure can add to them.
+    '''
+    staffLayoutObjects = []
+
+    if len(mxAttributes.timeList) != 0:
+        for mxSub in mxAttributes.timeList:
+            ts = mxToTimeSignature(mxSub)
+            addToStaffReference(mxSub, ts, staffReference)
+            m._insertCore(0, ts)
+    if len(mxAttributes.clefList) != 0:
+        for mxClef in mxAttributes.clefList:
+            cl = mxClefToClef(mxClef)
+            addToStaffReference(mxClef, cl, staffReference)
+            m._insertCore(0, cl)
+    if len(mxAttributes.keyList) != 0:
+        for mxSub in mxAttributes.keyList:
+            ks = mxKeyListToKeySignature(mxSub)
+            addToStaffReference(mxSub, ks, staffReference)
+            m._insertCore(0, ks)
+    if len(mxAttributes.staffDetailsList) != 0:
+        for mxStaffDetails in mxAttributes.staffDetailsList:
+            foundMatch = False
+            # perhaps we've already put a staffLayout into the measure?
+            if mxStaffDetails._attr['number'] is not None:
+                for stl in staffLayoutObjects:
+                    if stl.staffNumber == int(mxStaffDetails._attr['number']):
+                        try:
+                            stl.staffSize = float(mxStaffDetails.staffSize)
+                        except TypeError:
+                            if mxStaffDetails.staffSize is None:
+                                pass
+                            else:
+                                raise TypeError("Incorrect number for mxStaffDetails.staffSize: %s", mxStaffDetails.staffSize)
+                        foundMatch = True
+                        break
+            else:
+                for stl in staffLayoutObjects:
+                    if stl.staffSize is None:
+                        stl.staffSize = float(mxStaffDetails.staffSize)
+                        foundMatch = True
+                    if stl.staffLines is None:
+                        stl.staffLines = int(mxStaffDetails.staffLines)
+                        foundMatch = True
+
+
+            if foundMatch is False:
+                staffSize = None
+                try:
+                    staffSize = float(mxStaffDetails.staffSize)
+                except TypeError:
+                    staffSize = None     
+
+                staffLines = None
+                try:
+                    staffLines = int(mxStaffDetails.staffLines)
+                except TypeError:
+                    staffLines = 5     
+
+                if mxStaffDetails._attr['number'] is not None:
+                    stl = layout.StaffLayout(staffSize = staffSize, staffLines = staffLines, staffNumber=int(mxStaffDetails._attr['number']))
+                else:
+                    stl = layout.StaffLayout(staffSize = staffSize, staffLines = staffLines)
+
+                if 'print-object' in mxStaffDetails._attr:
+                    staffPrinted = mxStaffDetails._attr['print-object']
+                    if staffPrinted == 'no' or staffPrinted is False:
+                        stl.hidden = True
+                    elif staffPrinted == 'yes' or staffPrinted is True:
+                        stl.hidden = False
+                #else:
+                #    print mxStaffDetails._attr
+
+                addToStaffReference(mxStaffDetails, stl, staffReference)
+                m._insertCore(0, stl)
+                staffLayoutObjects.append(stl)
+                #staffLayoutsAlreadySetList.append(stl)
+                #print "Got an mxStaffDetails %r" % mxStaffDetails
+
+    return staffLayoutObjects
+
+
+def addMxPrintToMeasure(mxPrint, m, staffReference, staffLayoutObjects):
+    '''
+    Insert the page, system, and staff layouts defined in an mxPrint
+    object at the start of the Measure `m`.  Staff layouts already inserted
+    from the measure's attributes (`staffLayoutObjects`) are updated instead.
+    '''
+    addPageLayout = False
+    addSystemLayout = False
+    addStaffLayout = False
+    try:
+        addPageLayout = mxPrint.get('new-page')
+        if addPageLayout is not None:
+            addPageLayout = True # false for No??
+        else:
+            addPageLayout = False
+    except xmlnode.XMLNodeException:
+        pass
+    if not addPageLayout:
+        try:
+            addPageLayout = mxPrint.get('page-number')
+            if addPageLayout is not None:
+                addPageLayout = True
+            else:
+                addPageLayout = False
+        except xmlnode.XMLNodeException:
+            addPageLayout = False
+    if not addPageLayout:
+        for layoutType in mxPrint.componentList:
+            if isinstance(layoutType, mxObjects.PageLayout):
+                addPageLayout = True
+                break
+    try:
+        addSystemLayout = mxPrint.get('new-system')
+        if addSystemLayout is not None:
+            addSystemLayout = True # false for No?
+        else:
+            addSystemLayout = False
+    except xmlnode.XMLNodeException:
+        pass
+    if not addSystemLayout:
+        for layoutType in mxPrint.componentList:
+            if isinstance(layoutType, mxObjects.SystemLayout):
+                addSystemLayout = True
+                break
+
+    for layoutType in mxPrint.componentList:
+        if isinstance(layoutType, mxObjects.StaffLayout):
+            addStaffLayout = True
+            break
+
+    #--- now we know what we need to add, add em
+    if addPageLayout:
+        pl = mxPrintToPageLayout(mxPrint)
+        # store at zero position
+        m._insertCore(0, pl)
+    if addSystemLayout or not addPageLayout:
+        sl = mxPrintToSystemLayout(mxPrint)
+        # store at zero position
+        m._insertCore(0, sl)
+    if addStaffLayout:
+        stlList = mxPrintToStaffLayoutList(mxPrint)
+        for stl in stlList:
+            foundPrevious = False
+            for stlSetFromAttributes in staffLayoutObjects:
+                if stlSetFromAttributes.staffNumber == stl.staffNumber or stlSetFromAttributes.staffNumber is None or stl.staffNumber is None:
+                    foundPrevious = True
+                    stlSetFromAttributes.distance = stl.distance
+                    if stlSetFromAttributes.hidden is None:
+                        stlSetFromAttributes.hidden = stl.hidden
+                    break
+            if foundPrevious is False:
+                addToStaffReference(str(stl.staffNumber), stl, staffReference)
+                m._insertCore(0, stl)
+
+
+def addMxBarlineToMeasure(mxBarline, m, spannerBundle):
+    '''
+    Set the left or right barline of the Measure `m` from an mxBarline
+    object, starting or completing RepeatBracket spanners in the
+    `spannerBundle` for any ending it marks.
+    '''
+    # repeat is a tag found in the barline object
+    mxRepeatObj = mxBarline.get('repeatObj')
+    if mxRepeatObj is not None:
+        barline = mxToRepeat(mxBarline)
+    else:
+        barline = mxToBarline(mxBarline)
+
+    # barline objects also store ending objects, that mark begin
+    # and end of repeat bracket designations
+    mxEndingObj = mxBarline.get('endingObj')
+    if mxEndingObj is not None:
+        #environLocal.printDebug(['found mxEndingObj', mxEndingObj, 'm', m]) 
+        # get all incomplete spanners of the appropriate class that are
+        # not complete
+        rbSpanners = spannerBundle.getByClass('RepeatBracket').getByCompleteStatus(False)
+        # if we have no complete bracket objects, must start a new one
+        if len(rbSpanners) == 0:
+            # create with this measure as the object
+            rb = spanner.RepeatBracket(m)
+            # there may just be an ending marker, and no start
+            # this implies just one measure
+            if mxEndingObj.get('type') in ['stop', 'discontinue']:
+                rb.completeStatus = True
+                rb.number = mxEndingObj.get('number')
+            # set number; '' or None is interpreted as 1
+            spannerBundle.append(rb)
+        # if we have any incomplete, this must be the end
+        else:
+            #environLocal.printDebug(['matching RepeatBracket spanner', 'len(rbSpanners)', len(rbSpanners)])
+            rb = rbSpanners[0] # get RepeatBracket
+            # try to add this measure; may be the same
+            rb.addSpannedElements(m)
+            # in general, any rb found should be the opening, and thus
+            # this is the closing; can check
+            if mxEndingObj.get('type') in ['stop', 'discontinue']:
+                rb.completeStatus = True
+                rb.number = mxEndingObj.get('number')
+            else:
+                environLocal.warn('found mxEnding object that is not stop message, even though there is still an open start message. -- ignoring it')
+
+    if barline.location == 'left':
+        #environLocal.printDebug(['setting left barline', barline])
+        m.leftBarline = barline
+    elif barline.location == 'right':
+        #environLocal.printDebug(['setting right barline', barline])
+        m.rightBarline = barline
+    else:
+        environLocal.printDebug(['not handling barline that is neither left nor right', barline, barline.location])
+
+
+def addMxDirectionToMeasure(mxDirection, m, offsetMeasureNote, divisions,
+                            nLast, staffReference, spannerBundle):
+    '''
+    Insert the dynamics, segni, codas, tempo indications, and text
+    expressions of an mxDirection object into the Measure `m` at
+    `offsetMeasureNote` (plus the direction's own offset), and start or
+    complete the spanners it defines, such as wedges, which may end on
+    the last note or chord created, `nLast`.
+    '''
+    offsetDirection = mxToOffset(mxDirection, divisions)
+    if mxDirection.getDynamicMark() is not None:
+        # in rare cases there may be more than one dynamic in the same
+        # direction, so we iterate
+        for d in mxToDynamicList(mxDirection):
+            addToStaffReference(mxDirection, d, staffReference)
+            #m.insert(offsetMeasureNote, d)
+            m._insertCore(offsetMeasureNote + offsetDirection, d)
+
+    mxDirectionToSpanners(nLast, mxDirection, spannerBundle)
+    # TODO: multiple spanners
+#             if mxDirection.getWedge() is not None:
+#                 w = mxToWedge(mxDirection)
+#                 addToStaffReference(mxDirection, w, staffReference)
+#                 m._insertCore(offsetMeasureNote, w)
+
+    if mxDirection.getSegno() is not None:
+        rm = mxToSegno(mxDirection.getSegno())
+        addToStaffReference(mxDirection, rm, staffReference)
+        m._insertCore(offsetMeasureNote, rm)
+    if mxDirection.getCoda() is not None:
+        rm = mxToCoda(mxDirection.getCoda())
+        addToStaffReference(mxDirection, rm, staffReference)
+        m._insertCore(offsetMeasureNote, rm)
+
+    if mxDirection.getMetronome() is not None:
+        #environLocal.printDebug(['got getMetronome', mxDirection.getMetronome()])
+        mm = mxToTempoIndication(mxDirection.getMetronome())
+        addToStaffReference(mxDirection, mm, staffReference)
+        # need to look for metronome marks defined above
+        # and look for text defined below
+        m._insertCore(offsetMeasureNote, mm)
+
+    if mxDirection.getWords() is not None:
+        # TODO: need to look for tempo words if we have a metro
+        #environLocal.printDebug(['found mxWords object', mxDirection])
+        # convert into a list of TextExpression objects
+        # this may be a TextExpression, or a RepeatExpression
+        for te in mxToTextExpression(mxDirection):
+            #environLocal.printDebug(['got TextExpression object', repr(te)])
+            # offset here is a combination of the current position
+            # (offsetMeasureNote) and and the direction's offset
+
+            re = te.getRepeatExpression()
+            if re is not None:
+                # the repeat expression stores a copy of the text
+                # expression within it; replace it here on insertion
+                addToStaffReference(mxDirection, re, staffReference)
+                m._insertCore(offsetMeasureNote + offsetDirection, re)
+            else:
+                addToStaffReference(mxDirection, te, staffReference)
+                m._insertCore(offsetMeasureNote + offsetDirection, te)
+
+
+def finishMeasure(m, useVoices, restAndNoteCount):
+    '''
+    Called once all the components of an mxMeasure have been put into the
+    Measure `m`: fills gaps in voices with rests and notes in
+    `m._fullMeasureRest` whether the measure holds just one rest, as
+    counted in `restAndNoteCount`.
+    '''
+    # if we have voices and/or if we used backup/forward, we may have
+    # empty space in the stream
+    if useVoices:
+        for v in m.voices:
+            if len(v) > 0: # do not bother with empty voices
+                v.makeRests(inPlace=True)
+            v._elementsChanged()
+    m._elementsChanged()
+
+    if restAndNoteCount['rest'] == 1 and restAndNoteCount['note'] == 0:
+        # full measure rest with no notes...
+        if useVoices:
+            pass # should do this on a per voice basis...
+            m._fullMeasureRest = False
+        else:
+            m._fullMeasureRest = True
+    else:
+        m._fullMeasureRest = False
+
+
 def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=None):
     '''
     Translate an mxMeasure (a MusicXML :class:`~music21.musicxml.mxObjects.Measure` object)
@@ -2038,84 +2358,10 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
     #environLocal.printDebug(['mxAttriutes clefList', mxAttributes.clefList, 
     #                        mxAttributesInternal])
 
-    staffLayoutObjects = []
-
-    # getting first for each of these for now
     if mxAttributesInternal:
-        if len(mxAttributes.timeList) != 0:
-            for mxSub in mxAttributes.timeList:
-                ts = mxToTimeSignature(mxSub)
-                addToStaffReference(mxSub, ts, staffReference)
-                m._insertCore(0, ts)
-        if len(mxAttributes.clefList) != 0:
-            for mxClef in mxAttributes.clefList:
-                cl = mxClefToClef(mxClef)
-                addToStaffReference(mxClef, cl, staffReference)
-                m._insertCore(0, cl)
-        if len(mxAttributes.keyList) != 0:
-            for mxSub in mxAttributes.keyList:
-                ks = mxKeyListToKeySignature(mxSub)
-                addToStaffReference(mxSub, ks, staffReference)
-                m._insertCore(0, ks)
-        if len(mxAttributes.staffDetailsList) != 0:
-            for mxStaffDetails in mxAttributes.staffDetailsList:
-                foundMatch = False
-                # perhaps we've already put a staffLayout into the measure?
-                if mxStaffDetails._attr['number'] is not None:
-                    for stl in staffLayoutObjects:
-                        if stl.staffNumber == int(mxStaffDetails._attr['number']):
-                            try:
-                                stl.staffSize = float(mxStaffDetails.staffSize)
-                            except TypeError:
-                                if mxStaffDetails.staffSize is None:
-                                    pass
-                                else:
-                                    raise TypeError("Incorrect number for mxStaffDetails.staffSize: %s", mxStaffDetails.staffSize)
-                            foundMatch = True
-                            break
-                else:
-                    for stl in staffLayoutObjects:
-                        if stl.staffSize is None:
-                            stl.staffSize = float(mxStaffDetails.staffSize)
-                            foundMatch = True
-                        if stl.staffLines is None:
-                            stl.staffLines = int(mxStaffDetails.staffLines)
-                            foundMatch = True
-                            
-                        
-                if foundMatch is False:
-                    staffSize = None
-                    try:
-                        staffSize = float(mxStaffDetails.staffSize)
-                    except TypeError:
-                        staffSize = None     
-                    
-                    staffLines = None
-                    try:
-                        staffLines = int(mxStaffDetails.staffLines)
-                    except TypeError:
-                        staffLines = 5     
-                                       
-                    if mxStaffDetails._attr['number'] is not None:
-                        stl = layout.StaffLayout(staffSize = staffSize, staffLines = staffLines, staffNumber=int(mxStaffDetails._attr['number']))
-                    else:
-                        stl = layout.StaffLayout(staffSize = staffSize, staffLines = staffLines)
-                    
-                    if 'print-object' in mxStaffDetails._attr:
-                        staffPrinted = mxStaffDetails._attr['print-object']
-                        if staffPrinted == 'no' or staffPrinted is False:
-                            stl.hidden = True
-                        elif staffPrinted == 'yes' or staffPrinted is True:
-                            stl.hidden = False
-                    #else:
-                    #    print mxStaffDetails._attr
-                    
-                    addToStaffReference(mxStaffDetails, stl, staffReference)
-                    m._insertCore(0, stl)
-                    staffLayoutObjects.append(stl)
-                    #staffLayoutsAlreadySetList.append(stl)
-                    #print "Got an mxStaffDetails %r" % mxStaffDetails
-                
+        staffLayoutObjects = addMxAttributesToMeasure(mxAttributes, m, staffReference)
+    else:
+        staffLayoutObjects = []
 
     # transposition may be defined for a Part in the Measure attributes
     transposition = None
@@ -2179,130 +2425,14 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
         elif isinstance(mxObj, mxObjects.Print):
             # mxPrint objects may be found in a Measure's components
             # contain page or system layout information among others
-            mxPrint = mxObj
-            addPageLayout = False
-            addSystemLayout = False
-            addStaffLayout = False
-            try:
-                addPageLayout = mxPrint.get('new-page')
-                if addPageLayout is not None:
-                    addPageLayout = True # false for No??
-                else:
-                    addPageLayout = False
-            except xmlnode.XMLNodeException:
-                pass
-            if not addPageLayout:
-                try:
-                    addPageLayout = mxPrint.get('page-number')
-                    if addPageLayout is not None:
-                        addPageLayout = True
-                    else:
-                        addPageLayout = False
-                except xmlnode.XMLNodeException:
-                    addPageLayout = False
-            if not addPageLayout:
-                for layoutType in mxPrint.componentList:
-                    if isinstance(layoutType, mxObjects.PageLayout):
-                        addPageLayout = True
-                        break
-            try:
-                addSystemLayout = mxPrint.get('new-system')
-                if addSystemLayout is not None:
-                    addSystemLayout = True # false for No?
-                else:
-                    addSystemLayout = False
-            except xmlnode.XMLNodeException:
-                pass
-            if not addSystemLayout:
-                for layoutType in mxPrint.componentList:
-                    if isinstance(layoutType, mxObjects.SystemLayout):
-                        addSystemLayout = True
-                        break
-
-            for layoutType in mxPrint.componentList:
-                if isinstance(layoutType, mxObjects.StaffLayout):
-                    addStaffLayout = True
-                    break
-            
-            #--- now we know what we need to add, add em
-            if addPageLayout:
-                pl = mxPrintToPageLayout(mxPrint)
-                # store at zero position
-                m._insertCore(0, pl)
-            if addSystemLayout or not addPageLayout:
-                sl = mxPrintToSystemLayout(mxPrint)
-                # store at zero position
-                m._insertCore(0, sl)
-            if addStaffLayout:
-                stlList = mxPrintToStaffLayoutList(mxPrint)
-                for stl in stlList:
-                    foundPrevious = False
-                    for stlSetFromAttributes in staffLayoutObjects:
-                        if stlSetFromAttributes.staffNumber == stl.staffNumber or stlSetFromAttributes.staffNumber is None or stl.staffNumber is None:
-                            foundPrevious = True
-                            stlSetFromAttributes.distance = stl.distance
-                            if stlSetFromAttributes.hidden is None:
-                                stlSetFromAttributes.hidden = stl.hidden
-                            break
-                    if foundPrevious is False:
-                        addToStaffReference(str(stl.staffNumber), stl, staffReference)
-                        m._insertCore(0, stl)
-
+            addMxPrintToMeasure(mxObj, m, staffReference, staffLayoutObjects)
 
         # <sound> tags may be found in the Measure, used to define tempo
         elif isinstance(mxObj, mxObjects.Sound):
             pass
 
         elif isinstance(mxObj, mxObjects.Barline):
-            # repeat is a tag found in the barline object
-            mxBarline = mxObj
-            mxRepeatObj = mxBarline.get('repeatObj')
-            if mxRepeatObj is not None:
-                barline = mxToRepeat(mxBarline)
-            else:
-                barline = mxToBarline(mxBarline)
-
-            # barline objects also store ending objects, that mark begin
-            # and end of repeat bracket designations
-            mxEndingObj = mxBarline.get('endingObj')
-            if mxEndingObj is not None:
-                #environLocal.printDebug(['found mxEndingObj', mxEndingObj, 'm', m]) 
-                # get all incomplete spanners of the appropriate class that are
-                # not complete
-                rbSpanners = spannerBundle.getByClass('RepeatBracket').getByCompleteStatus(False)
-                # if we have no complete bracket objects, must start a new one
-                if len(rbSpanners) == 0:
-                    # create with this measure as the object
-                    rb = spanner.RepeatBracket(m)
-                    # there may just be an ending marker, and no start
-                    # this implies just one measure
-                    if mxEndingObj.get('type') in ['stop', 'discontinue']:
-                        rb.completeStatus = True
-                        rb.number = mxEndingObj.get('number')
-                    # set number; '' or None is interpreted as 1
-                    spannerBundle.append(rb)
-                # if we have any incomplete, this must be the end
-                else:
-                    #environLocal.printDebug(['matching RepeatBracket spanner', 'len(rbSpanners)', len(rbSpanners)])
-                    rb = rbSpanners[0] # get RepeatBracket
-                    # try to add this measure; may be the same
-                    rb.addSpannedElements(m)
-                    # in general, any rb found should be the opening, and thus
-                    # this is the closing; can check
-                    if mxEndingObj.get('type') in ['stop', 'discontinue']:
-                        rb.completeStatus = True
-                        rb.number = mxEndingObj.get('number')
-                    else:
-                        environLocal.warn('found mxEnding object that is not stop message, even though there is still an open start message. -- ignoring it')
-
-            if barline.location == 'left':
-                #environLocal.printDebug(['setting left barline', barline])
-                m.leftBarline = barline
-            elif barline.location == 'right':
-                #environLocal.printDebug(['setting right barline', barline])
-                m.rightBarline = barline
-            else:
-                environLocal.printDebug(['not handling barline that is neither left nor right', barline, barline.location])
+            addMxBarlineToMeasure(mxObj, m, spannerBundle)
 
         elif isinstance(mxObj, mxObjects.Note):
             mxNote = mxObj
@@ -2437,58 +2567,8 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
 
         # mxDirections can be dynamics, repeat expressions, text expressions
         elif isinstance(mxObj, mxObjects.Direction):
-            offsetDirection = mxToOffset(mxObj, divisions)
-            if mxObj.getDynamicMark() is not None:
-                # in rare cases there may be more than one dynamic in the same
-                # direction, so we iterate
-                for d in mxToDynamicList(mxObj):
-                    addToStaffReference(mxObj, d, staffReference)
-                    #m.insert(offsetMeasureNote, d)
-                    m._insertCore(offsetMeasureNote + offsetDirection, d)
-
-            mxDirectionToSpanners(nLast, mxObj, spannerBundle)
-            # TODO: multiple spanners
-#             if mxObj.getWedge() is not None:
-#                 w = mxToWedge(mxObj)
-#                 addToStaffReference(mxObj, w, staffReference)
-#                 m._insertCore(offsetMeasureNote, w)
-
-            if mxObj.getSegno() is not None:
-                rm = mxToSegno(mxObj.getSegno())
-                addToStaffReference(mxObj, rm, staffReference)
-                m._insertCore(offsetMeasureNote, rm)
-            if mxObj.getCoda() is not None:
-                rm = mxToCoda(mxObj.getCoda())
-                addToStaffReference(mxObj, rm, staffReference)
-                m._insertCore(offsetMeasureNote, rm)
-
-            if mxObj.getMetronome() is not None:
-                #environLocal.printDebug(['got getMetronome', mxObj.getMetronome()])
-                mm = mxToTempoIndication(mxObj.getMetronome())
-                addToStaffReference(mxObj, mm, staffReference)
-                # need to look for metronome marks defined above
-                # and look for text defined below
-                m._insertCore(offsetMeasureNote, mm)
-
-            if mxObj.getWords() is not None:
-                # TODO: need to look for tempo words if we have a metro
-                #environLocal.printDebug(['found mxWords object', mxObj])
-                # convert into a list of TextExpression objects
-                # this may be a TextExpression, or a RepeatExpression
-                for te in mxToTextExpression(mxObj):
-                    #environLocal.printDebug(['got TextExpression object', repr(te)])
-                    # offset here is a combination of the current position
-                    # (offsetMeasureNote) and and the direction's offset
-
-                    re = te.getRepeatExpression()
-                    if re is not None:
-                        # the repeat expression stores a copy of the text
-                        # expression within it; replace it here on insertion
-                        addToStaffReference(mxObj, re, staffReference)
-                        m._insertCore(offsetMeasureNote + offsetDirection, re)
-                    else:
-                        addToStaffReference(mxObj, te, staffReference)
-                        m._insertCore(offsetMeasureNote + offsetDirection, te)
+            addMxDirectionToMeasure(mxObj, m, offsetMeasureNote, divisions,
+                                    nLast, staffReference, spannerBundle)
 
         elif isinstance(mxObj, mxObjects.Harmony):
             mxHarmony = mxObj
@@ -2498,24 +2578,7 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
 
 
     #environLocal.printDebug(['staffReference', staffReference])
-    # if we have voices and/or if we used backup/forward, we may have
-    # empty space in the stream
-    if useVoices:
-        for v in m.voices:
-            if len(v) > 0: # do not bother with empty voices
-                v.makeRests(inPlace=True)
-            v._elementsChanged()
-    m._elementsChanged()
-
-    if restAndNoteCount['rest'] == 1 and restAndNoteCount['note'] == 0:
-        # full measure rest with no notes...
-        if useVoices:
-            pass # should do this on a per voice basis...
-            m._fullMeasureRest = False
-        else:
-            m._fullMeasureRest = True
-    else:
-        m._fullMeasureRest = False
+    finishMeasure(m, useVoices, restAndNoteCount)
 
     return m, staffReference, transposition
 
@@ -2551,12 +2614,44 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     # in some cases there may be more than one instrument defined
     # in each score part; this has not been tested
     mxInstrument = mxScore.getScorePart(partId)
+    streamPart, instrumentObj = createPartFromMxScorePart(mxInstrument, partId)
+
+    def translateMeasure(mxMeasure, lastMeasureInfo):
+        try:
+            return mxToMeasure(mxMeasure,
+                               spannerBundle=spannerBundle,
+                               lastMeasureInfo=lastMeasureInfo)
+        except Exception as e:
+            import sys
+            measureNumber = "unknown"
+            try:
+                measureNumber = mxMeasure.get('number')
+            except:
+                pass
+            # see http://stackoverflow.com/questions/6062576/adding-information-to-a-python-exception
+            execInfoTuple = sys.exc_info()
+            if hasattr(e, 'message'):
+                emessage = e.message
+            else:
+                emessage = execInfoTuple[0].__name__ + " : " #+ execInfoTuple[1].__name__
+            message = "In measure (" + measureNumber + "): " + emessage
+            raise type(e)(type(e)(message), pprint.pformat(traceback.extract_tb(execInfoTuple[2])))
 
+    staffReferenceList = addMeasuresToPart(streamPart, instrumentObj, mxPart, translateMeasure)
+    return addPartToScore(s, streamPart, staffReferenceList, mxPart.getStavesCount(),
+                          spannerBundle, partId)
+
+
+def createPartFromMxScorePart(mxScorePart, partId):
+    '''
+    Return a new Part, holding an Instrument made from the mxScorePart
+    (which may be None) with the given `partId`, and that Instrument.
+    '''
     # create a new music21 instrument
     instrumentObj = instrument.Instrument()
-    if mxInstrument is not None: # mxInstrument is a ScorePart
+    if mxScorePart is not None: # mxInstrument is a ScorePart
         # need an mxScorePart here   
-        mxToInstrument(mxInstrument, instrumentObj)
+        mxToInstrument(mxScorePart, instrumentObj)
     # add part id as group
     instrumentObj.groups.append(partId)
 
@@ -2568,7 +2663,23 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     if instrumentObj.bestName() is not None:
         streamPart.id = instrumentObj.bestName()
     streamPart._insertCore(0, instrumentObj) # add instrument at zero offset
+    return streamPart, instrumentObj
+
+
+def addMeasuresToPart(streamPart, instrumentObj, measureSources, translateMeasure):
+    '''
+    Translate each of `measureSources` into a Measure and add it to
+    `streamPart` after the one before, allowing for pickups and for
+    measures that are shorter or longer than their time signature.
+
+    `translateMeasure` is called with a source and the (number, suffix) of
+    the last measure, and returns a tuple of the Measure, its staff
+    reference dictionary, and a transposition interval or None, as
+    :func:`mxToMeasure` does.  A transposition sets that of `instrumentObj`
+    or, after the first measure, of a copy of it placed in the part.
 
+    Returns the list of staff reference dictionaries, one for each measure.
+    '''
     staffReferenceList = []
     # offset is in quarter note length
     oMeasure = 0.0
@@ -2579,27 +2690,10 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     lastMeasureNumber = 0
     lastMeasureSuffix = None
 
-    for i, mxMeasure in enumerate(mxPart):
+    for i, measureSource in enumerate(measureSources):
         # t here is transposition, if defined; otherwise it is None
-        try:
-            m, staffReference, t = mxToMeasure(mxMeasure,
-                                   spannerBundle=spannerBundle,
-                                   lastMeasureInfo=(lastMeasureNumber, lastMeasureSuffix))
-        except Exception as e:
-            import sys
-            measureNumber = "unknown"
-            try:
-                measureNumber = mxMeasure.get('number')
-            except:
-                pass
-            # see http://stackoverflow.com/questions/6062576/adding-information-to-a-python-exception
-            execInfoTuple = sys.exc_info()
-            if hasattr(e, 'message'):
-                emessage = e.message
-            else:
-                emessage = execInfoTuple[0].__name__ + " : " #+ execInfoTuple[1].__name__
-            message = "In measure (" + measureNumber + "): " + emessage
-            raise type(e)(type(e)(message), pprint.pformat(traceback.extract_tb(execInfoTuple[2])))
+        m, staffReference, t = translateMeasure(measureSource,
+                                    (lastMeasureNumber, lastMeasureSuffix))
         if t is not None:
             if lastTransposition is None and i == 0: # if this is the first
                 #environLocal.printDebug(['transposition', t])
@@ -2694,7 +2788,17 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
                         lastMeasureWasShort = False
                         
         oMeasure += mOffsetShift
+    return staffReferenceList
+
+
+def addPartToScore(s, streamPart, staffReferenceList, stavesCount, spannerBundle, partId):
+    '''
+    Insert `streamPart`, once all its measures are in it, into the Score `s`
+    -- as one PartStaff for each staff if `stavesCount` is more than one --
+    along with the spanners in `spannerBundle` that are complete.
 
+    Returns the part inserted.
+    '''
     # if we have multiple staves defined, add more parts, and transfer elements
     # note: this presently has to look at _idLastDeepCopyOf to get matches
     # to find removed elements after copying; this is probably not the
@@ -2704,8 +2808,8 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     # then then we need to update the spannerBundle after the part is copied
 
     streamPartStaff = None
-    if mxPart.getStavesCount() > 1:
-        separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId)
+    if stavesCount > 1:
+        separateOutPartStaffs(streamPart, spannerBundle, s, staffReferenceList, partId)
     else:
         streamPart.addGroupForElements(partId) # set group for components 
         streamPart.groups.append(partId) # set group for stream itself
@@ -2735,9 +2839,9 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     else:
         return streamPart
 
-def separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId):
+def separateOutPartStaffs(streamPart, spannerBundle, s, staffReferenceList, partId):
     '''
-    given an mxPart and other necessary information, insert into the score (s) multiple
+    given a Part and other necessary information, insert into the score (s) multiple
     PartStaff objects separating the information for one part from the other
     '''
     # transfer all spanners to the streamPart such that they get
@@ -2874,6 +2978,19 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
         m21PartIdDictionary[partId] = part
         #print("%r %s %r" % (m21PartIdDictionary, partId, part))
 
+    configureScoreFromMxScore(s, mxScore, m21PartIdDictionary, spannerBundle)
+    return s
+
+
+def configureScoreFromMxScore(s, mxScore, m21PartIdDictionary, spannerBundle):
+    '''
+    Once its parts are in the Score `s`, add what an mxScore defines for the
+    whole score: staff groups, metadata, layout, credits, and whether
+    system and page breaks are explicit, along with all the spanners in
+    `spannerBundle` that are complete.
+
+    `m21PartIdDictionary` maps MusicXML part ids to the parts in `s`.
+    '''
     # get part/staff groups
     #environLocal.printDebug(['partgroups:', mxScore.getPartGroupData()])
     partGroupData = mxScore.getPartGroupData()
@@ -2933,7 +3050,6 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
         spannerBundle.remove(sp)
 
     s._elementsChanged()
-    return s
 
 #------------------------------------------------------------------------------
 # beam and beams
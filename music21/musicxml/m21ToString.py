@@ -39,41 +39,56 @@ from music21 import note
 from music21 import stream
 from music21.musicxml import toMxObjects
 
-def fromMusic21Object(m21Object):
+def fromMusic21Object(m21Object, fileLike=None):
     '''
     Translate an arbitrary music21 object to a musicxml
     string and return it
     
     This function is called by music21.base.write()
     and is the most important function here.
+
+    If a file-like object is given as `fileLike`, the musicxml is
+    written to it as it is made, and None is returned; see
+    :meth:`~music21.xmlnode.XMLNode.writeXml` for what it must accept.
+    This is much lighter on memory for large scores.
+
+    >>> from music21.ext import six
+    >>> s = converter.parse('tinyNotation: 3/4 C4 D E').makeMeasures()
+    >>> f = six.BytesIO() if six.PY2 else six.StringIO()
+    >>> musicxml.m21ToString.fromMusic21Object(s, fileLike=f)
+    >>> xmlOut = f.getvalue()
+    >>> xmlOut.count('<note>')
+    3
+    >>> xmlOut.strip().endswith('</score-partwise>')
+    True
     '''
     classes = m21Object.classes
     
     if 'Measure' in classes: # must go before Stream
-        return fromMeasure(m21Object)
+        return fromMeasure(m21Object, fileLike)
     elif 'Stream' in classes:
-        return fromStream(m21Object)
+        return fromStream(m21Object, fileLike)
     elif 'GeneralNote' in classes:
-        return fromGeneralNote(m21Object)
+        return fromGeneralNote(m21Object, fileLike)
     elif 'Pitch' in classes:
-        return fromPitch(m21Object)
+        return fromPitch(m21Object, fileLike)
     elif 'Duration' in classes:
-        return fromDuration(m21Object)
+        return fromDuration(m21Object, fileLike)
     elif 'Dynamic' in classes:
-        return fromDynamic(m21Object)
+        return fromDynamic(m21Object, fileLike)
     elif 'DiatonicScale' in classes:
-        return fromDiatonicScale(m21Object)
+        return fromDiatonicScale(m21Object, fileLike)
     elif 'Scale' in classes:
-        return fromScale(m21Object)
+        return fromScale(m21Object, fileLike)
     elif 'TimeSignature' in classes:
-        return fromTimeSignature(m21Object)
+        return fromTimeSignature(m21Object, fileLike)
     else:
         raise M21ToStringException("Cannot translate the object %s to a complete musicXML document; put it in a Stream first!" % m21Object)
 
-def fromStream(streamObject):
+def fromStream(streamObject, fileLike=None):
     '''
     return a complete musicxml string
-    from a music21 Stream object
+    from a music21 Stream object, or write it to `fileLike`
     '''
     # always make a deepcopy before processing musicxml
     # this should only be done once
@@ -81,9 +96,11 @@ def fromStream(streamObject):
     post.makeImmutable()
     mxScore = toMxObjects.streamToMx(post)
     del post
-    return mxScore.xmlStr()
+    if fileLike is None:
+        return mxScore.xmlStr()
+    mxScore.writeXml(fileLike)
 
-def fromMeasure(m):
+def fromMeasure(m, fileLike=None):
     '''Translate a music21 Measure into a 
     complete MusicXML string representation.
 
@@ -107,10 +124,10 @@ def fromMeasure(m):
     out = stream.Part()
     out.append(m)
     # call the musicxml property on Stream
-    return fromMusic21Object(out)
+    return fromMusic21Object(out, fileLike)
 
 
-def fromDuration(d):
+def fromDuration(d, fileLike=None):
     '''
     Translate a music21 :class:`~music21.duration.Duration` into 
     a complete MusicXML representation.
@@ -179,9 +196,9 @@ def fromDuration(d):
     n = note.Note()
     n.duration = dCopy
     # call the musicxml property on Stream
-    return fromGeneralNote(n)
+    return fromGeneralNote(n, fileLike)
 
-def fromDynamic(dynamicObject):
+def fromDynamic(dynamicObject, fileLike=None):
     '''
     Provide a complete MusicXML string from a single dynamic by
     putting it into a Stream first.
@@ -190,9 +207,9 @@ def fromDynamic(dynamicObject):
     out = stream.Stream()
     out.append(dCopy)
     # call the musicxml property on Stream
-    return fromStream(out)
+    return fromStream(out, fileLike)
  
-def fromScale(scaleObject):
+def fromScale(scaleObject, fileLike=None):
     '''
     Generate the pitches from this scale
     and put it into a stream.Measure, then call 
@@ -212,9 +229,9 @@ def fromScale(scaleObject):
             n.quarterLength = 1
         m.append(n)
     m.timeSignature = m.bestTimeSignature()
-    return fromMeasure(m)
+    return fromMeasure(m, fileLike)
 
-def fromDiatonicScale(diatonicScaleObject):
+def fromDiatonicScale(diatonicScaleObject, fileLike=None):
     '''
     Return a complete musicxml of the DiatonicScale
 
@@ -237,10 +254,10 @@ def fromDiatonicScale(diatonicScaleObject):
             n.quarterLength = 1
         m.append(n)
     m.timeSignature = m.bestTimeSignature()
-    return fromMeasure(m)
+    return fromMeasure(m, fileLike)
 
 
-def fromTimeSignature(ts):
+def fromTimeSignature(ts, fileLike=None):
     '''
     return a single TimeSignature as a musicxml document
     '''
@@ -252,9 +269,9 @@ def fromTimeSignature(ts):
 #         m.append(note.Rest())
     out = stream.Stream()
     out.append(tsCopy)
-    return fromMusic21Object(out)
+    return fromMusic21Object(out, fileLike)
 
-def fromGeneralNote(n):
+def fromGeneralNote(n, fileLike=None):
     '''
     Translate a music21 :class:`~music21.note.Note` into a 
     complete MusicXML representation.
@@ -278,15 +295,15 @@ def fromGeneralNote(n):
     out.append(nCopy)
 
     # call the musicxml property on Stream
-    return fromMusic21Object(out)
+    return fromMusic21Object(out, fileLike)
 
-def fromPitch(p):
+def fromPitch(p, fileLike=None):
     n = note.Note()
     n.pitch = copy.deepcopy(p)
     out = stream.Stream()
     out.append(n)
     # call the musicxml property on Stream
-    return fromStream(out)
+    return fromStream(out, fileLike)
 
 
 class M21ToStringException(exceptions21.Music21Exception):
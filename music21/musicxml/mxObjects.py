@@ -658,6 +658,9 @@ class Score(MusicXMLElementList):
     partwise or timewise scores. This object includes all MusicXML score 
     information.
     '''
+    # parts are written to a file one at a time; see xmlnode.XMLNode.writeXml
+    _writeIncrementally = True
+
     def __init__(self, m21Version=None):
         '''
                 
@@ -1205,6 +1208,9 @@ class Part(MusicXMLElementList):
     '''
     This assumes a part-wise part
     '''
+    # measures are written to a file one at a time
+    _writeIncrementally = True
+
     def __init__(self):
         MusicXMLElementList.__init__(self)
         self._tag = 'part'
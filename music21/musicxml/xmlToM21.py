@@ -0,0 +1,1152 @@
+# -*- coding: utf-8 -*-
+#-------------------------------------------------------------------------------
+# Name:         musicxml/xmlToM21.py
+# Purpose:      Translate MusicXML directly to music21 objects in a single pass
+#
+# Copyright:    Copyright © 2026 The music21 Project
+# License:      LGPL or BSD, see license.txt
+#-------------------------------------------------------------------------------
+'''
+A single-pass MusicXML importer.
+
+The standard importer first parses a whole MusicXML document with xml.sax into
+a tree of :mod:`~music21.musicxml.mxObjects`, and only then translates that
+tree into music21 objects (see :mod:`~music21.musicxml.fromMxObjects`).  For
+a large score, most of the time and memory go into building the mxObjects
+tree, and all of it is kept until the last part has been translated.
+
+The :class:`MusicXMLImporter` here reads the document incrementally with
+ElementTree's `iterparse` and builds each :class:`~music21.stream.Measure` as
+soon as its `<measure>` tag is closed, after which the tag is discarded.
+Notes, rests, and chords -- nearly all of any score -- are built directly from
+their tags.  Everything else in a measure (attributes, directions, barlines,
+print and harmony tags), notes that use rarer MusicXML features, and the
+header of the score are passed tag by tag through the same
+:class:`~music21.musicxml.xmlHandler.Handler` that the standard importer uses,
+and the resulting mxObjects translated with the routines in
+:mod:`~music21.musicxml.fromMxObjects`, so that both importers produce the
+same Streams.
+
+The importer is used when "iterparse" is given as the `importer` keyword of
+:func:`~music21.converter.parse` or the other parsing functions of
+:mod:`~music21.converter`:
+
+>>> #_DOCS_SHOW s = converter.parse('/Users/cuthbert/bigScore.xml', importer='iterparse')
+
+Timewise scores, and documents that this importer cannot read, are handed to
+the standard importer.
+'''
+import io
+import os
+import pprint
+import re
+import sys
+import traceback
+import unittest
+
+try:
+    import xml.etree.cElementTree as ETree
+except ImportError:
+    import xml.etree.ElementTree as ETree
+
+from music21.musicxml import fromMxObjects
+from music21.musicxml import mxObjects
+from music21.musicxml import xmlHandler
+
+from music21 import beam
+from music21 import chord
+from music21 import common
+from music21 import duration
+from music21 import exceptions21
+from music21 import note
+from music21 import pitch
+from music21 import spanner
+from music21 import stream
+from music21 import tie
+
+from music21.ext import six
+
+from music21 import environment
+_MOD = "musicxml.xmlToM21"
+environLocal = environment.Environment(_MOD)
+
+
+class XMLToM21Exception(exceptions21.Music21Exception):
+    pass
+
+
+# tags in a <note> that are translated directly; a note with any other
+# tag is passed to the Handler and translated with fromMxObjects.mxToNote
+_DIRECT_NOTE_TAGS = set(['pitch', 'rest', 'chord', 'duration', 'tie', 'type',
+    'dot', 'accidental', 'time-modification', 'stem', 'beam', 'voice',
+    'staff', 'lyric', 'notehead', 'notations', 'grace'])
+
+# the same for the tags in <notations>, <lyric>, and <time-modification>
+_DIRECT_NOTATIONS_TAGS = set(['tied', 'tuplet'])
+_DIRECT_LYRIC_TAGS = set(['syllabic', 'text'])
+_DIRECT_TIME_MODIFICATION_TAGS = set(['actual-notes', 'normal-notes',
+    'normal-type'])
+
+_BEAM_TYPES = {
+    'begin': ('start', None),
+    'continue': ('continue', None),
+    'end': ('stop', None),
+    'forward hook': ('partial', 'right'),
+    'backward hook': ('partial', 'left'),
+    }
+
+_ENCODING_DECLARATION = re.compile(r'''^\s*<\?xml[^>]*encoding=["']([^"']+)["']''')
+
+
+def _getText(element):
+    '''
+    Return the character data of a tag, as the Handler would store it.
+    '''
+    if element.text is None:
+        return u''
+    return element.text
+
+def _getAttribute(element, name):
+    '''
+    Return an attribute of a tag, or None if it is not defined or is empty,
+    as the loadAttrs method of mxObjects does.
+    '''
+    value = element.get(name)
+    if value is None or value.strip() == '':
+        return None
+    return value
+
+
+#-------------------------------------------------------------------------------
+class MxObjectHandler(xmlHandler.Handler):
+    '''
+    A :class:`~music21.musicxml.xmlHandler.Handler` that is given the tags of
+    an ElementTree one at a time, rather than by an xml.sax parser.
+    '''
+    def sendElement(self, element):
+        '''
+        Send a complete tag, with everything in it, to the handler, as if
+        it had been read by xml.sax.
+        '''
+        self.startElement(element.tag, element.attrib)
+        if element.text and self._currentTag is not None:
+            self.characters(element.text)
+        for child in element:
+            self.sendElement(child)
+            if child.tail and self._currentTag is not None:
+                self.characters(child.tail)
+        self.endElement(element.tag)
+
+    def startMeasure(self, element):
+        '''
+        Start a new mxObjects Measure from a `<measure>` tag, to which the
+        tags sent later will be added, and return it.
+
+        Unlike the xml.sax Handler, the Measure is not added to a Part.
+        '''
+        mxMeasure = mxObjects.Measure()
+        mxMeasure.external['attributes'] = self._attributesObjLast
+        mxMeasure.external['divisions'] = self._divisionsLast
+        mxMeasure.external['time'] = self._timeObjLast
+        mxMeasure.loadAttrs(element.attrib)
+        self._mxObjs['measure'] = mxMeasure
+        return mxMeasure
+
+    def getDivisions(self):
+        '''
+        Return the divisions per quarter note most recently defined.
+        '''
+        return self._divisionsLast
+
+
+#-------------------------------------------------------------------------------
+class NoteInfo(object):
+    '''
+    The contents of a `<note>` tag that are needed to create a music21 Note,
+    Rest, or Chord, read from the tag directly.
+
+    If the tag uses anything not read here, `direct` is False, and the note
+    is instead translated from an mxObjects Note (see :meth:`getMxNote`).
+    '''
+    __slots__ = ('element', 'direct', 'divisions', 'chord', 'isRest',
+                 'printObject', 'color', 'defaultX', 'voice', 'staff',
+                 'step', 'alter', 'octave', 'accidental', 'duration', 'type',
+                 'dots', 'timeModification', 'tuplets', 'stem', 'beams',
+                 'ties', 'notehead', 'grace', 'lyrics', 'mxNote')
+
+    def __init__(self, element, divisions):
+        self.element = element
+        self.direct = True
+        self.divisions = divisions
+        self.chord = False
+        self.isRest = False
+        self.printObject = _getAttribute(element, 'print-object')
+        self.color = _getAttribute(element, 'color')
+        self.defaultX = _getAttribute(element, 'default-x')
+        self.voice = None
+        self.staff = None
+        self.step = None
+        self.alter = None
+        self.octave = None
+        self.accidental = None
+        self.duration = None
+        self.type = None
+        self.dots = 0
+        self.timeModification = None
+        self.tuplets = []
+        self.stem = None
+        self.beams = []
+        self.ties = []
+        self.notehead = None
+        self.grace = None
+        self.lyrics = []
+        self.mxNote = None
+
+        for child in element:
+            tag = child.tag
+            if tag not in _DIRECT_NOTE_TAGS:
+                self.direct = False
+            elif tag == 'pitch':
+                for sub in child:
+                    if sub.tag == 'step':
+                        self.step = _getText(sub)
+                    elif sub.tag == 'alter':
+                        self.alter = _getText(sub)
+                    elif sub.tag == 'octave':
+                        self.octave = _getText(sub)
+                    else:
+                        self.direct = False
+            elif tag == 'duration':
+                self.duration = _getText(child)
+            elif tag == 'type':
+                self.type = _getText(child)
+            elif tag == 'voice':
+                self.voice = _getText(child)
+            elif tag == 'beam':
+                self.beams.append(_getText(child))
+            elif tag == 'stem':
+                self.stem = _getText(child)
+            elif tag == 'staff':
+                self.staff = _getText(child)
+            elif tag == 'dot':
+                self.dots += 1
+            elif tag == 'chord':
+                self.chord = True
+            elif tag == 'rest':
+                self.isRest = True
+            elif tag == 'tie':
+                self.ties.append(_getAttribute(child, 'type'))
+            elif tag == 'accidental':
+                self.accidental = _getText(child)
+            elif tag == 'notations':
+                # only the last <notations> tag is used, as by the Handler
+                self.tuplets = []
+                for sub in child:
+                    if sub.tag not in _DIRECT_NOTATIONS_TAGS:
+                        self.direct = False
+                    elif sub.tag == 'tuplet':
+                        if len(sub) > 0:
+                            self.direct = False
+                        self.tuplets.append(sub)
+            elif tag == 'time-modification':
+                self.timeModification = {}
+                for sub in child:
+                    if sub.tag not in _DIRECT_TIME_MODIFICATION_TAGS:
+                        self.direct = False
+                    else:
+                        self.timeModification[sub.tag] = _getText(sub)
+            elif tag == 'lyric':
+                text = None
+                syllabic = None
+                for sub in child:
+                    if sub.tag not in _DIRECT_LYRIC_TAGS:
+                        self.direct = False
+                    elif sub.tag == 'text':
+                        text = _getText(sub)
+                    else:
+                        syllabic = _getText(sub)
+                self.lyrics.append((text, _getAttribute(child, 'number'),
+                                    syllabic))
+            elif tag == 'notehead':
+                self.notehead = (_getText(child), _getAttribute(child, 'color'))
+            elif tag == 'grace':
+                self.grace = child
+
+    def get(self, name):
+        '''
+        Get the value of `chord`, `voice`, or `staff` in the way that
+        mxObjects Notes are read by fromMxObjects.addToStaffReference.
+        '''
+        return getattr(self, name)
+
+    def getMxNote(self, handler):
+        '''
+        Return an mxObjects Note made by sending the tag to the `handler`.
+        '''
+        if self.mxNote is None:
+            handler.sendElement(self.element)
+            mxNote = handler._mxObjs['measure'].componentList.pop()
+            mxNote.external['divisions'] = self.divisions
+            self.mxNote = mxNote
+        return self.mxNote
+
+
+#-------------------------------------------------------------------------------
+class MusicXMLImporter(object):
+    '''
+    Translate a partwise MusicXML document into a music21
+    :class:`~music21.stream.Score` (or into the Stream given as `inputM21`)
+    in a single pass.
+
+    >>> from music21.musicxml import testPrimitive
+    >>> mi = musicxml.xmlToM21.MusicXMLImporter()
+    >>> s = mi.parseData(testPrimitive.chordsThreeNotesDuration21c)
+    >>> s.parts[0].flat.notes[0]
+    <music21.chord.Chord F4 A4 C5>
+    >>> s is mi.stream
+    True
+
+    If `metadataOnly` is True, reading stops at the first part, and the
+    Score holds just the :class:`~music21.metadata.Metadata` of the header.
+    Timewise documents can be read this way, as their headers are the same.
+
+    >>> mi = musicxml.xmlToM21.MusicXMLImporter(metadataOnly=True)
+    >>> s = mi.parseData(testPrimitive.pitches01a)
+    >>> s.metadata.movementName
+    'Pitches and accidentals'
+    >>> len(s.parts)
+    0
+    '''
+    def __init__(self, inputM21=None, metadataOnly=False):
+        if inputM21 is None:
+            self.stream = stream.Score()
+        else:
+            self.stream = inputM21
+        self.metadataOnly = metadataOnly
+        self.spannerBundle = spanner.SpannerBundle()
+        self.handler = MxObjectHandler()
+        self.mxScore = None
+        self.defaultTitle = None
+
+    def parseFile(self, fp):
+        '''
+        Translate a MusicXML or compressed MusicXML (.mxl) file.
+
+        As with the standard importer, the file name is used as the
+        movement title if the document has no title.
+        '''
+        from music21 import converter
+        arch = converter.ArchiveManager(fp)
+        junk, self.defaultTitle = os.path.split(fp)
+        if arch.isArchive():
+            return self.parseData(arch.getData())
+        with open(fp, 'rb') as f:
+            return self.parseSource(f)
+
+    def parseData(self, xmlString):
+        '''
+        Translate MusicXML in a string.
+
+        A unicode string is encoded as its XML declaration says, so that
+        the parser reads it back correctly.
+        '''
+        if isinstance(xmlString, six.text_type):
+            match = _ENCODING_DECLARATION.match(xmlString)
+            encoding = 'utf-8' if match is None else match.group(1)
+            try:
+                xmlString = xmlString.encode(encoding)
+            except (LookupError, UnicodeEncodeError):
+                raise XMLToM21Exception(
+                    'cannot read a unicode string declared as %s' % encoding)
+        return self.parseSource(io.BytesIO(xmlString))
+
+    def parseSource(self, source):
+        '''
+        Translate MusicXML read from the file-like object `source`, and
+        return the Stream.
+        '''
+        s = self.stream
+        handler = self.handler
+        events = iter(ETree.iterparse(source, events=('start', 'end')))
+
+        event, root = next(events)
+        if self.metadataOnly and root.tag in ('score-partwise', 'score-timewise'):
+            return self._parseHeader(root, events)
+        if root.tag != 'score-partwise':
+            raise XMLToM21Exception(
+                'can only read score-partwise documents, not %s' % root.tag)
+        handler.startElement(root.tag, root.attrib)
+
+        mxPartIds = None
+        m21PartIdDictionary = {}
+        depth = 1
+        for event, element in events:
+            if event == 'start':
+                depth += 1
+                if depth == 2 and element.tag == 'part':
+                    if mxPartIds is None:
+                        self.mxScore = handler.getContent()
+                        mxPartIds = self.mxScore.getPartIdsFromPartListObj()
+                    pNum = len(m21PartIdDictionary)
+                    partId = element.get('id')
+                    if pNum >= len(mxPartIds) or mxPartIds[pNum] != partId:
+                        raise XMLToM21Exception(
+                            'part %s is not in the order of the part-list' % partId)
+                    try:
+                        pp = PartParser(self, partId,
+                                        self._measureElements(element, events))
+                        m21PartIdDictionary[partId] = pp.parse()
+                    except Exception as e:
+                        # see http://stackoverflow.com/questions/6062576/adding-information-to-a-python-exception
+                        execInfoTuple = sys.exc_info()
+                        if hasattr(e, 'message'):
+                            emessage = e.message
+                        else:
+                            emessage = str(execInfoTuple[1])
+                        message = ("For part number " + str(pNum + 1) +
+                                   ", with Id (" + partId + "): " + emessage)
+                        raise type(e)(type(e)(message),
+                            pprint.pformat(traceback.extract_tb(execInfoTuple[2])))
+                    # the end of the part has been read
+                    depth -= 1
+                    root.clear()
+            else:
+                depth -= 1
+                if depth == 1:
+                    # a complete tag of the header
+                    handler.sendElement(element)
+                    root.clear()
+
+        if mxPartIds is None or len(m21PartIdDictionary) != len(mxPartIds):
+            raise XMLToM21Exception('the parts do not match the part-list')
+
+        self._setDefaultTitle()
+        fromMxObjects.configureScoreFromMxScore(s, self.mxScore,
+                                    m21PartIdDictionary, self.spannerBundle)
+        return s
+
+    def _parseHeader(self, root, events):
+        '''
+        Read the tags of the header that follow `root`, up to the first
+        part (or measure, in a timewise document), and put the Metadata
+        they define into the stream.
+        '''
+        handler = self.handler
+        handler.startElement(root.tag, root.attrib)
+        depth = 1
+        for event, element in events:
+            if event == 'start':
+                depth += 1
+                if depth == 2 and element.tag in ('part', 'measure'):
+                    break
+            else:
+                depth -= 1
+                if depth == 1:
+                    handler.sendElement(element)
+                    root.clear()
+        self.mxScore = handler.getContent()
+        self._setDefaultTitle()
+        md = fromMxObjects.mxScoreToMetadata(self.mxScore)
+        self.stream._insertCore(0, md)
+        self.stream._elementsChanged()
+        return self.stream
+
+    def _setDefaultTitle(self):
+        '''
+        Use the file name as the movement title if the document has no title.
+        '''
+        if self.defaultTitle is not None and self.mxScore.get('movementTitle') is None:
+            mxWork = self.mxScore.get('workObj')
+            if mxWork is None or mxWork.get('workTitle') is None:
+                self.mxScore.set('movementTitle', self.defaultTitle)
+
+    def _measureElements(self, part, events):
+        '''
+        Yield each complete `<measure>` tag of the `part` tag just started
+        in `events`, and discard it once it has been used.
+        '''
+        depth = 1
+        for event, element in events:
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0: # the end of the part
+                return
+            if depth == 1:
+                if element.tag == 'measure':
+                    yield element
+                # the part holds all the tags read so far
+                element.clear()
+                part.remove(element)
+
+#-------------------------------------------------------------------------------
+class PartParser(object):
+    '''
+    Translate the `<measure>` tags of a part into a Part, and add it to the
+    Score of the :class:`MusicXMLImporter`.
+    '''
+    def __init__(self, importer, partId, measureElements):
+        self.importer = importer
+        self.partId = partId
+        self.measureElements = measureElements
+        self.stavesCount = 1
+
+    def parse(self):
+        importer = self.importer
+        mxScorePart = importer.mxScore.getScorePart(self.partId)
+        streamPart, instrumentObj = fromMxObjects.createPartFromMxScorePart(
+                                            mxScorePart, self.partId)
+        staffReferenceList = fromMxObjects.addMeasuresToPart(streamPart,
+                    instrumentObj, self.measureElements, self.translateMeasure)
+        return fromMxObjects.addPartToScore(importer.stream, streamPart,
+                    staffReferenceList, self.stavesCount,
+                    importer.spannerBundle, self.partId)
+
+    def translateMeasure(self, element, lastMeasureInfo):
+        try:
+            mp = MeasureParser(self.importer, element, lastMeasureInfo)
+            post = mp.parse()
+        except Exception as e:
+            measureNumber = element.get('number')
+            if measureNumber is None:
+                measureNumber = "unknown"
+            execInfoTuple = sys.exc_info()
+            if hasattr(e, 'message'):
+                emessage = e.message
+            else:
+                emessage = execInfoTuple[0].__name__ + " : "
+            message = "In measure (" + measureNumber + "): " + emessage
+            raise type(e)(type(e)(message),
+                pprint.pformat(traceback.extract_tb(execInfoTuple[2])))
+
+        mxAttributes = mp.mxMeasure.attributesObj
+        if mxAttributes is not None and mxAttributes.staves is not None:
+            self.stavesCount = max(self.stavesCount, int(mxAttributes.staves))
+        return post
+
+
+#-------------------------------------------------------------------------------
+class MeasureParser(object):
+    '''
+    Translate a `<measure>` tag into a Measure, as
+    :func:`~music21.musicxml.fromMxObjects.mxToMeasure` translates an
+    mxObjects Measure.
+
+    :meth:`parse` returns a tuple of the Measure, its staff reference
+    dictionary, and a transposition or None.
+    '''
+    def __init__(self, importer, element, lastMeasureInfo=None):
+        self.importer = importer
+        self.handler = importer.handler
+        self.spannerBundle = importer.spannerBundle
+        self.element = element
+        self.lastMeasureInfo = lastMeasureInfo
+        self.mxMeasure = None
+        self.voicesById = {}
+
+    def parse(self):
+        handler = self.handler
+        spannerBundle = self.spannerBundle
+        m = stream.Measure()
+        staffReference = {}
+
+        # read all the tags first, as the voices and divisions of the
+        # measure are needed before any note can be placed
+        mxMeasure = handler.startMeasure(self.element)
+        self.mxMeasure = mxMeasure
+        components = []
+        voiceIds = set()
+        for child in self.element:
+            if child.tag == 'note':
+                info = NoteInfo(child, handler.getDivisions())
+                if info.voice is not None:
+                    voiceIds.add(info.voice)
+                components.append(info)
+            else:
+                componentCount = len(mxMeasure.componentList)
+                handler.sendElement(child)
+                components.extend(mxMeasure.componentList[componentCount:])
+        mxMeasure.update()
+        if len(mxMeasure._attributesObjList) > 1:
+            mergedDivisions = mxMeasure.attributesObj.divisions
+            if mergedDivisions is not None:
+                for info in components:
+                    if isinstance(info, NoteInfo):
+                        info.divisions = mergedDivisions
+
+        if self.lastMeasureInfo is not None:
+            lastMNum, lastMSuffix = self.lastMeasureInfo
+        else:
+            lastMNum, lastMSuffix = (None, None)
+
+        mNumRaw = mxMeasure.get('number')
+        if mNumRaw is None:
+            mNum = None
+            mSuffix = None
+        else:
+            mNum, mSuffix = common.getNumFromStr(mNumRaw)
+
+        if mNum not in [None, '']:
+            m.number = int(mNum)
+        if mSuffix not in [None, '']:
+            m.numberSuffix = mSuffix
+
+        # fix for Finale which calls unnumbered measures X1, X2, etc.
+        if lastMNum is not None:
+            if m.numberSuffix == 'X' and m.number != lastMNum + 1:
+                newSuffix = m.numberSuffix + str(m.number)
+                if lastMSuffix is not None:
+                    newSuffix = lastMSuffix + newSuffix
+                m.number = lastMNum
+                m.numberSuffix = newSuffix
+
+        data = mxMeasure.get('width')
+        if data != None:
+            m.layoutWidth = data
+
+        mxAttributes = mxMeasure.get('attributesObj')
+        mxAttributesInternal = True
+        if mxAttributes is None:
+            mxAttributesInternal = False
+            mxAttributes = mxMeasure.external['attributes']
+            if mxAttributes is None:
+                raise fromMxObjects.FromMxObjectsException(
+                    'no mxAttribues available for this measure')
+
+        transposition = None
+        if mxAttributesInternal:
+            staffLayoutObjects = fromMxObjects.addMxAttributesToMeasure(
+                                    mxAttributes, m, staffReference)
+            if mxAttributes.transposeObj is not None:
+                transposition = fromMxObjects.mxTransposeToInterval(
+                                    mxAttributes.transposeObj)
+        else:
+            staffLayoutObjects = []
+
+        if mxAttributes.divisions is not None:
+            divisions = mxAttributes.divisions
+        else:
+            divisions = mxMeasure.external['divisions']
+        if divisions is None:
+            raise fromMxObjects.FromMxObjectsException(
+                'cannot get a division from mxObject')
+
+        voiceIds.update(mxMeasure._voiceIndices)
+        if len(voiceIds) > 1:
+            useVoices = True
+            for voiceId in sorted(voiceIds):
+                v = stream.Voice()
+                v.id = voiceId
+                m._insertCore(0, v)
+                self.voicesById[voiceId] = v
+        else:
+            useVoices = False
+
+        offsetMeasureNote = 0
+        chordNotes = [] # for accumulating notes in chords
+        nLast = None # store the last-create music21 note for Spanners
+        restAndNoteCount = {'rest': 0, 'note': 0}
+        chordVoice = None # the voice of the first note of a chord
+
+        for i, mxObj in enumerate(components):
+            if i < len(components) - 1:
+                mxObjNext = components[i + 1]
+            else:
+                mxObjNext = None
+
+            if isinstance(mxObj, NoteInfo):
+                info = mxObj
+                if isinstance(mxObjNext, NoteInfo):
+                    infoNext = mxObjNext
+                else:
+                    infoNext = None
+                if info.printObject == 'no':
+                    continue
+
+                # the first note of a chord is only known by the next note
+                if infoNext is not None and infoNext.chord is True:
+                    info.chord = True
+                    if info.voice is not None:
+                        chordVoice = info.voice
+
+                if not info.isRest:
+                    if info.chord is True:
+                        chordNotes.append(info)
+                        offsetIncrement = 0
+                    else:
+                        restAndNoteCount['note'] += 1
+                        try:
+                            n = self.makeNote(info)
+                        except fromMxObjects.FromMxObjectsException as strerror:
+                            raise fromMxObjects.FromMxObjectsException(
+                                'cannot translate note in measure %s: %s' % (mNumRaw, strerror))
+                        fromMxObjects.addToStaffReference(info.staff, n, staffReference)
+                        self.insertInVoice(m, useVoices, info, chordVoice,
+                                           offsetMeasureNote, n)
+                        offsetIncrement = n.quarterLength
+                        nLast = n
+                else: # its a rest
+                    restAndNoteCount['rest'] += 1
+                    n = self.makeRest(info)
+                    fromMxObjects.addToStaffReference(info.staff, n, staffReference)
+                    if useVoices:
+                        vCurrent = self.getVoice(m, info.voice)
+                        if vCurrent is not None:
+                            vCurrent._insertCore(offsetMeasureNote, n)
+                        else:
+                            m._insertCore(offsetMeasureNote, n)
+                    else:
+                        m._insertCore(offsetMeasureNote, n)
+                    offsetIncrement = n.quarterLength
+                    nLast = n
+
+                # a chord is complete if the next note is not in it
+                if len(chordNotes) > 0 and (infoNext is None
+                    or infoNext.chord is False):
+                    c = self.makeChord(chordNotes)
+                    fromMxObjects.addToStaffReference(chordNotes[0].staff, c,
+                                                      staffReference)
+                    self.insertInVoice(m, useVoices, info, chordVoice,
+                                       offsetMeasureNote, c)
+                    chordNotes = []
+                    offsetIncrement = c.quarterLength
+                    nLast = c
+
+                offsetMeasureNote += offsetIncrement
+
+            elif isinstance(mxObj, mxObjects.Backup):
+                offsetMeasureNote -= float(mxObj.duration) / float(divisions)
+            elif isinstance(mxObj, mxObjects.Forward):
+                offsetMeasureNote += float(mxObj.duration) / float(divisions)
+            elif isinstance(mxObj, mxObjects.Print):
+                fromMxObjects.addMxPrintToMeasure(mxObj, m, staffReference,
+                                                  staffLayoutObjects)
+            elif isinstance(mxObj, mxObjects.Sound):
+                pass
+            elif isinstance(mxObj, mxObjects.Barline):
+                fromMxObjects.addMxBarlineToMeasure(mxObj, m, spannerBundle)
+            elif isinstance(mxObj, mxObjects.Direction):
+                fromMxObjects.addMxDirectionToMeasure(mxObj, m,
+                    offsetMeasureNote, divisions, nLast, staffReference,
+                    spannerBundle)
+            elif isinstance(mxObj, mxObjects.Harmony):
+                h = fromMxObjects.mxToChordSymbol(mxObj)
+                fromMxObjects.addToStaffReference(mxObj, h, staffReference)
+                m._insertCore(offsetMeasureNote, h)
+
+        fromMxObjects.finishMeasure(m, useVoices, restAndNoteCount)
+        return m, staffReference, transposition
+
+    #---------------------------------------------------------------------------
+    def getVoice(self, m, voiceId):
+        '''
+        Return the Voice of `m` with the id `voiceId`, which is looked up
+        as `m.voices[voiceId]` if it is not one of the voices created here.
+        '''
+        try:
+            return self.voicesById[voiceId]
+        except (KeyError, TypeError):
+            return m.voices[voiceId]
+
+    def insertInVoice(self, m, useVoices, info, chordVoice, offset, n):
+        '''
+        Insert a Note or Chord into the voice of `info` in `m`, or into
+        `m` if voices are not used.
+        '''
+        if not useVoices:
+            m._insertCore(offset, n)
+            return
+        useVoice = info.voice
+        if useVoice is None:
+            useVoice = chordVoice
+            if useVoice is None:
+                environLocal.warn("Cannot translate a note with a missing voice tag when no previous voice tag was given.  Assuming voice 1... Object is %r " % n)
+                useVoice = 1
+        thisVoice = self.getVoice(m, useVoice)
+        if thisVoice is None:
+            environLocal.warn('Cannot find voice %r for Note %r; putting outside of voices...' % (info.voice, n))
+            m._insertCore(offset, n)
+        else:
+            thisVoice._insertCore(offset, n)
+
+    def addLyrics(self, n, infoList):
+        '''
+        Add the lyrics of each NoteInfo in `infoList` to `n`, numbering
+        them as fromMxObjects.mxToMeasure does.
+        '''
+        currentLyricNumber = 1
+        for info in infoList:
+            if info.direct:
+                for text, number, syllabic in info.lyrics:
+                    lyricObj = note.Lyric()
+                    lyricObj.text = text
+                    if common.isNum(number):
+                        lyricObj.number = number
+                    else:
+                        lyricObj.number = 0
+                        lyricObj.identifier = number
+                    lyricObj.syllabic = syllabic
+                    if lyricObj.number == 0:
+                        lyricObj.number = currentLyricNumber
+                    n.lyrics.append(lyricObj)
+                    currentLyricNumber += 1
+            else:
+                for mxLyric in info.getMxNote(self.handler).lyricList:
+                    lyricObj = fromMxObjects.mxToLyric(mxLyric)
+                    if lyricObj.number == 0:
+                        lyricObj.number = currentLyricNumber
+                    n.lyrics.append(lyricObj)
+                    currentLyricNumber += 1
+
+    #---------------------------------------------------------------------------
+    def makeNote(self, info):
+        '''
+        Return a Note (or grace Note) with its lyrics from a NoteInfo.
+        '''
+        if not info.direct:
+            n = fromMxObjects.mxToNote(info.getMxNote(self.handler),
+                                       spannerBundle=self.spannerBundle)
+            self.addLyrics(n, [info])
+            return n
+
+        n = note.Note()
+        self.spannerBundle.freePendingSpannedElementAssignment(n)
+        self.setPitch(info, n.pitch)
+        if info.grace is not None and info.type is None:
+            # grace notes may not have an assigned duration type
+            info.type = 'eighth'
+        self.setDuration(info, n.duration)
+        n.beams = self.makeBeams(info)
+        if info.stem is not None:
+            n.stemDirection = info.stem
+        if info.color is not None:
+            n.color = info.color
+        if info.defaultX is not None:
+            n.xPosition = info.defaultX
+        if len(info.ties) > 0:
+            n.tie = self.makeTie(info)
+        if info.notehead is not None:
+            noteheadText, noteheadColor = info.notehead
+            if noteheadText not in ['', None]:
+                n.notehead = noteheadText
+            if noteheadColor is not None:
+                n.color = noteheadColor
+        n = self.makeGrace(n, info)
+        self.addLyrics(n, [info])
+        return n
+
+    def makeChord(self, infoList):
+        '''
+        Return a Chord (or grace Chord) with its lyrics from a list of
+        NoteInfo objects.
+        '''
+        if not all(info.direct for info in infoList):
+            c = fromMxObjects.mxToChord(
+                    [info.getMxNote(self.handler) for info in infoList],
+                    spannerBundle=self.spannerBundle)
+            self.addLyrics(c, infoList)
+            return c
+
+        c = chord.Chord()
+        self.spannerBundle.freePendingSpannedElementAssignment(c)
+        # assume that the first note has the duration of the chord
+        self.setDuration(infoList[0], c.duration)
+        pitches = []
+        ties = []
+        for info in infoList:
+            p = pitch.Pitch()
+            self.setPitch(info, p)
+            pitches.append(p)
+            if len(info.ties) > 0:
+                ties.append(self.makeTie(info))
+            else:
+                ties.append(None)
+        c.pitches = pitches
+        c.beams = self.makeBeams(infoList[0])
+        for i, t in enumerate(ties):
+            if t is not None:
+                c.setTie(t, pitches[i])
+        for i, info in enumerate(infoList):
+            if info.notehead is not None:
+                noteheadText, noteheadColor = info.notehead
+                c.setNotehead(noteheadText, c.pitches[i])
+                c.setColor(noteheadColor, c.pitches[i])
+        for i, info in enumerate(infoList):
+            if info.stem != 'unspecified':
+                c.setStemDirection(info.stem, c.pitches[i])
+        c = self.makeGrace(c, infoList[0])
+        self.addLyrics(c, infoList)
+        return c
+
+    def makeRest(self, info):
+        '''
+        Return a Rest from a NoteInfo.
+        '''
+        r = note.Rest()
+        self.setDuration(info, r.duration)
+        if info.color is not None:
+            r.color = info.color
+        return r
+
+    #---------------------------------------------------------------------------
+    def setPitch(self, info, p):
+        '''
+        Set the Pitch `p` from a NoteInfo, as fromMxObjects.mxToPitch does.
+        '''
+        p.step = info.step
+        acc = info.alter
+        if acc is not None or info.accidental is not None:
+            if info.accidental is not None:
+                try:
+                    accObj = pitch.Accidental()
+                    accObj.set(fromMxObjects.musicXMLAccidentalToName(
+                                                        info.accidental))
+                    p.accidental = accObj
+                    p.accidental.displayStatus = True
+                except pitch.AccidentalException:
+                    # MuseScore 0.9.6 generates Accidentals with empty objects
+                    pass
+            else:
+                try:
+                    p.accidental = pitch.Accidental(float(acc))
+                except pitch.AccidentalException:
+                    raise fromMxObjects.FromMxObjectsException(
+                        'incorrect accidental %s for pitch %s' % (str(acc), p))
+                p.accidental.displayStatus = False
+        p.octave = int(info.octave)
+
+    def setDuration(self, info, d):
+        '''
+        Set the Duration `d` from a NoteInfo, as fromMxObjects.mxToDuration
+        does.
+        '''
+        if info.duration is not None:
+            if info.type is not None:
+                durationType = fromMxObjects.musicXMLTypeToType(info.type)
+                forceRaw = False
+            else: # some rests do not define type, and only define duration
+                durationType = None
+                forceRaw = True
+            qLen = float(info.duration) / float(info.divisions)
+            if info.timeModification is not None:
+                tup = self.makeTuplet(info)
+            else:
+                tup = None
+            if forceRaw:
+                durRaw = duration.Duration()
+                durRaw.quarterLength = qLen
+                try:
+                    d.components = durRaw.components
+                except duration.DurationException:
+                    environLocal.warn(['mxToDuration', 'supplying quarterLength of 1 as type is not ' +
+                                       'defined and raw quarterlength (%s) is not a computable duration' % qLen])
+                    durRaw.quarterLength = 1.
+            else:
+                durUnit = duration.DurationUnit()
+                durUnit.type = durationType
+                durUnit.dots = info.dots
+                if tup is not None:
+                    durUnit.appendTuplet(tup)
+                d.components = [durUnit]
+        else:
+            # a grace note: the duration is based entirely on type
+            durUnit = duration.DurationUnit()
+            durUnit.type = fromMxObjects.musicXMLTypeToType(info.type)
+            durUnit.dots = info.dots
+            d.components = [durUnit]
+
+    def makeTuplet(self, info):
+        '''
+        Return a Tuplet from a NoteInfo, as fromMxObjects.mxToTuplet does.
+        '''
+        t = duration.Tuplet()
+        timeModification = info.timeModification
+        t.numberNotesActual = int(timeModification.get('actual-notes'))
+        t.numberNotesNormal = int(timeModification.get('normal-notes'))
+        normalType = timeModification.get('normal-type')
+        if normalType is not None:
+            t.setDurationType(fromMxObjects.musicXMLTypeToType(normalType))
+        else:
+            t.setDurationType(fromMxObjects.musicXMLTypeToType(info.type))
+        if len(info.tuplets) > 0:
+            mxTuplet = info.tuplets[0] # only use the first
+            t.type = _getAttribute(mxTuplet, 'type')
+            t.bracket = mxObjects.yesNoToBoolean(
+                                _getAttribute(mxTuplet, 'bracket'))
+            t.placement = _getAttribute(mxTuplet, 'placement')
+        return t
+
+    def makeBeams(self, info):
+        '''
+        Return the Beams of a NoteInfo, as fromMxObjects.mxToBeams does.
+        '''
+        beamsOut = beam.Beams()
+        for i, mxType in enumerate(info.beams):
+            try:
+                beamType, direction = _BEAM_TYPES[mxType]
+            except KeyError:
+                raise fromMxObjects.FromMxObjectsException(
+                    'unexpected beam type encountered (%s)' % mxType)
+            beamObj = beam.Beam()
+            beamObj.type = beamType
+            if direction is not None:
+                beamObj.direction = direction
+            beamObj.number = i + 1
+            beamsOut.beamsList.append(beamObj)
+        return beamsOut
+
+    def makeTie(self, info):
+        '''
+        Return the Tie of a NoteInfo, as fromMxObjects.mxToTie does.
+        '''
+        t = tie.Tie()
+        typesFound = info.ties
+        if len(typesFound) == 1:
+            t.type = typesFound[0]
+        elif typesFound == ['stop', 'start']:
+            t.type = 'continue'
+        else:
+            environLocal.printDebug(['found unexpected arrangement of multiple tie types when ' +
+                                     'importing from musicxml:', typesFound])
+        return t
+
+    def makeGrace(self, noteOrChord, info):
+        '''
+        Return a grace version of `noteOrChord` if the NoteInfo is a grace
+        note, as fromMxObjects.mxGraceToGrace does.
+        '''
+        mxGrace = info.grace
+        if mxGrace is None:
+            return noteOrChord
+        post = noteOrChord.getGrace()
+        if _getAttribute(mxGrace, 'slash') in ['yes', None]:
+            post.duration.slash = True
+        else:
+            post.duration.slash = False
+        post.duration.stealTimePrevious = _getAttribute(mxGrace, 'steal-time-previous')
+        post.duration.stealTimeFollowing = _getAttribute(mxGrace, 'steal-time-following')
+        return post
+
+
+#-------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def compareStreams(self, classic, single, name):
+        '''
+        Check that two Scores imported from the same document are the same.
+        '''
+        self.assertEqual(len(classic.parts), len(single.parts), name)
+        for pClassic, pSingle in zip(classic.parts, single.parts):
+            self.assertEqual(pClassic.id, pSingle.id, name)
+            self.assertEqual(pClassic.highestTime, pSingle.highestTime, name)
+            mClassic = pClassic.getElementsByClass('Measure')
+            mSingle = pSingle.getElementsByClass('Measure')
+            self.assertEqual([(m.number, m.numberSuffix, m.offset, len(m.voices))
+                              for m in mClassic],
+                             [(m.number, m.numberSuffix, m.offset, len(m.voices))
+                              for m in mSingle], name)
+            self.assertEqual(self.describe(pClassic), self.describe(pSingle), name)
+        self.assertEqual(len(classic.flat.spanners), len(single.flat.spanners), name)
+        self.assertEqual(classic.metadata.title, single.metadata.title, name)
+
+    def describe(self, part):
+        post = []
+        for e in part.recurse():
+            if isinstance(e, (stream.Measure, stream.Voice)):
+                post.append((e.classes[0], e.offset))
+                continue
+            row = [e.classes[0], e.offset, repr(e)]
+            if isinstance(e, note.GeneralNote):
+                row.append(e.quarterLength)
+                row.append(repr([c.tuplets for c in e.duration.components]))
+                row.append(e.duration.isGrace)
+                row.append([(l.number, l.identifier, l.text, l.syllabic)
+                            for l in e.lyrics])
+                row.append(repr(e.tie))
+                row.append(e.color)
+                row.append([repr(a) for a in e.articulations])
+                row.append([repr(x) for x in e.expressions])
+            if isinstance(e, note.NotRest):
+                row.append(repr(e.beams))
+                row.append(e.stemDirection)
+            if isinstance(e, note.Note):
+                row.append(e.pitch.nameWithOctave)
+                row.append(repr(e.pitch.accidental))
+                if e.pitch.accidental is not None:
+                    row.append(e.pitch.accidental.displayStatus)
+                row.append(e.notehead)
+            if isinstance(e, chord.Chord):
+                row.append([(p.nameWithOctave, repr(p.accidental),
+                             repr(c.getTie(p)), c.getNotehead(p),
+                             c.getStemDirection(p))
+                            for c in [e] for p in e.pitches])
+            post.append(tuple(row))
+        return post
+
+    def testParityPrimitive(self):
+        from music21.musicxml import testPrimitive
+        from music21.musicxml import xmlHandler as musicxmlHandler
+        for name in sorted(dir(testPrimitive)):
+            if name.startswith('_'):
+                continue
+            data = getattr(testPrimitive, name)
+            if not isinstance(data, six.string_types) or 'score-partwise' not in data:
+                continue
+            doc = musicxmlHandler.Document()
+            doc.read(data)
+            classic = fromMxObjects.mxScoreToScore(doc.score)
+            single = MusicXMLImporter().parseData(data)
+            self.compareStreams(classic, single, name)
+
+    def testParityCorpus(self):
+        from music21 import corpus
+        for work in ['bach/bwv66.6', 'luca/gloria']:
+            fp = corpus.getWorkList(work)[0]
+            classic = corpus.parse(work, forceSource=True)
+            single = MusicXMLImporter().parseFile(fp)
+            self.compareStreams(classic, single, work)
+
+    def testConverterImporter(self):
+        from music21 import converter
+        from music21.musicxml import testPrimitive
+        data = testPrimitive.beams01
+        classic = converter.parse(data, forceSource=True)
+        single = converter.parse(data, forceSource=True, importer='iterparse')
+        self.compareStreams(classic, single, 'beams01')
+
+        # unicode strings are encoded as declared
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        latinData = data.replace('encoding="UTF-8"', 'encoding="ISO-8859-1"')
+        self.compareStreams(classic, MusicXMLImporter().parseData(latinData), 'beams01')
+
+        # documents that cannot be read in a single pass use mxObjects
+        data = testPrimitive.mixedVoices1b
+        scoreParts = re.findall(r'<score-part .*?</score-part>', data, re.DOTALL)
+        data = data.replace(scoreParts[0], '@').replace(scoreParts[1], scoreParts[0])
+        data = data.replace('@', scoreParts[1])
+        self.assertRaises(XMLToM21Exception, MusicXMLImporter().parseData, data)
+        classic = converter.parse(data, forceSource=True)
+        c = converter.Converter()
+        c.parseData(data, format='musicxml', forceSource=True, importer='iterparse')
+        self.compareStreams(classic, c.stream, 'mixedVoices1b')
+
+    def testTimewise(self):
+        data = '<?xml version="1.0"?><score-timewise></score-timewise>'
+        self.assertRaises(XMLToM21Exception, MusicXMLImporter().parseData, data)
+
+
+#-------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [MusicXMLImporter]
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
+
+#------------------------------------------------------------------------------
+# eof
@@ -31,9 +31,12 @@ from music21 import environment
 _MOD = 'search.segment.py'
 environLocal = environment.Environment(_MOD)
 import os
+import bisect
 import math
 import json
 import difflib
+import multiprocessing
+import unittest
 from collections import OrderedDict
 
 def translateMonophonicPartToSegments(
@@ -267,12 +270,15 @@ def scoreSimilarity(
     giveUpdates=False, 
     includeReverse=False,
     forceDifflib=False,
+    minimumRatio=None,
+    processCount=1,
     ):
     r'''
     Find the level of similarity between each pair of segments in a scoreDict.
     
-    This takes twice as long as it should because it does not cache the
-    pairwise similarity.
+    Each segment is compared only once with each distinct segment string of 
+    the later scores, and segments that repeat within a score share those 
+    comparisons.
     
     ::
  
@@ -300,66 +306,372 @@ def scoreSimilarity(
         (...'bwv197.5.mxl', 0, 2, 9, ...'bwv190.7.mxl', 0, 0, 0, 0.07547...)
         (...'bwv197.5.mxl', 0, 2, 9, ...'bwv190.7.mxl', 0, 1, 5, 0.07547...)
         
+    If `minimumRatio` is given, only pairs with at least that similarity are 
+    returned. Pairs that cannot be that similar, given the characters and 
+    pairs of adjacent characters the segments have in common, are not 
+    compared at all.
+
+    ::
+
+        >>> scoreSimHigh = search.segment.scoreSimilarity(scoreDict, forceDifflib=True, 
+        ...     minimumRatio=0.8)
+        >>> scoreSimHigh == [result for result in scoreSim if result[-1] >= 0.8]
+        True
+
+    If `processCount` is greater than 1, the segments of each score are 
+    compared in parallel by that many processes; if it is None, one process 
+    for each available core is used. Results are returned in the same order.
+
+    ::
+
+        >>> scoreSimParallel = search.segment.scoreSimilarity(scoreDict, forceDifflib=True, 
+        ...     processCount=2)
+        >>> scoreSimParallel == scoreSim
+        True
+
     Return tuple.
     '''
+    comparer = _SegmentComparer(scoreDict, 
+                                minimumLength=minimumLength, 
+                                minimumRatio=minimumRatio,
+                                forceDifflib=forceDifflib)
+    totalScores = len(comparer.scoreKeys)
+
+    if processCount is None:
+        processCount = multiprocessing.cpu_count()
+    if processCount > 1 and totalScores > 1:
+        pool = multiprocessing.Pool(processes=min(processCount, totalScores), 
+                                    initializer=_initializeWorker, 
+                                    initargs=(comparer,))
+        try:
+            scoreResults = pool.imap(_compareScoreInWorker, 
+                                     [(scoreNumber, includeReverse) 
+                                      for scoreNumber in range(totalScores)], 
+                                     chunksize=1)
+            similarityScores = _collectScoreResults(comparer, scoreResults, 
+                                                    giveUpdates)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        scoreResults = (comparer.compareScore(scoreNumber, includeReverse) 
+                        for scoreNumber in range(totalScores))
+        similarityScores = _collectScoreResults(comparer, scoreResults, 
+                                                giveUpdates)
+
+    #import pprint
+    #pprint.pprint(similarityScores)
+    return similarityScores
+
+
+def _collectScoreResults(comparer, scoreResults, giveUpdates=False):
+    '''
+    Join the lists of similarity tuples for each score, in order.
+    '''
     similarityScores = []
-    scoreIndex = 0
-    totalScores = len(scoreDict)
-    scoreDictKeys = list(scoreDict.keys())
-    for thisScoreNumber in range(totalScores):
-        thisScoreKey = scoreDictKeys[thisScoreNumber]
-        thisScore = scoreDict[thisScoreKey]
-        scoreIndex += 1 
+    totalScores = len(comparer.scoreKeys)
+    for scoreIndex, thisScoreKey in enumerate(comparer.scoreKeys):
         if giveUpdates is True:
             print("Comparing {0} ({1}/{2})".format(
-                thisScoreKey, scoreIndex, totalScores))
-        for pNum in range(len(thisScore)):
-            for segmentNumber, thisSegment in enumerate(thisScore[pNum]['segmentList']):
-                if len(thisSegment) < minimumLength:
+                thisScoreKey, scoreIndex + 1, totalScores))
+        similarityScores.extend(next(scoreResults))
+    return similarityScores
+
+
+class _SegmentComparer(object):
+    '''
+    Compares the segments of a scoreDict for :func:`scoreSimilarity`.
+
+    Segments shorter than `minimumLength` are dropped and the rest are kept 
+    in one list, in the order of scores, parts, and segments. If 
+    `minimumRatio` is given, an inverted index from each pair of adjacent 
+    characters (bigram) to the segments that have it is made, so that the 
+    number of bigrams two segments share can be found without comparing 
+    the segments.
+
+    >>> scoreDict = {'a': [{'segmentList': ['ABCD', 'AB'], 'measureList': [1, 3]}], 
+    ...              'b': [{'segmentList': ['ABCE'], 'measureList': [1]}]}
+    >>> comparer = search.segment._SegmentComparer(scoreDict, minimumLength=3, 
+    ...     minimumRatio=0.5, forceDifflib=True)
+    >>> comparer.segments
+    ['ABCD', 'ABCE']
+    >>> comparer.compareScore(comparer.scoreKeys.index('a'))
+    [('a', 0, 0, 1, 'b', 0, 0, 1, 0.75)]
+    '''
+    def __init__(self, scoreDict, minimumLength=20, minimumRatio=None, 
+                 forceDifflib=False):
+        self.minimumRatio = minimumRatio
+        self.forceDifflib = forceDifflib
+        self.ngramLength = 2
+
+        self.scoreKeys = list(scoreDict.keys())
+        # for each segment, the score number, score key, part number, 
+        # segment number, and measure number
+        self.segmentInfo = []
+        self.segments = []
+        # the index of the first segment of each score, and of the end
+        self.scoreStarts = []
+        for scoreNumber, scoreKey in enumerate(self.scoreKeys):
+            self.scoreStarts.append(len(self.segments))
+            thisScore = scoreDict[scoreKey]
+            for pNum in range(len(thisScore)):
+                measureList = thisScore[pNum]['measureList']
+                for segmentNumber, thisSegment in enumerate(
+                        thisScore[pNum]['segmentList']):
+                    if len(thisSegment) < minimumLength:
+                        continue
+                    self.segmentInfo.append((scoreNumber, scoreKey, pNum, 
+                        segmentNumber, measureList[segmentNumber]))
+                    self.segments.append(thisSegment)
+        self.scoreStarts.append(len(self.segments))
+
+        self.characterCounts = None
+        self.ngramPostings = None
+        if minimumRatio is not None:
+            self.characterCounts = [self._countNgrams(seg, 1) 
+                                    for seg in self.segments]
+            # for each bigram, a list of segment indices and counts, in order
+            self.ngramPostings = {}
+            for i, seg in enumerate(self.segments):
+                for ngram, count in self._countNgrams(seg, 
+                        self.ngramLength).items():
+                    if ngram not in self.ngramPostings:
+                        self.ngramPostings[ngram] = []
+                    self.ngramPostings[ngram].append((i, count))
+
+    def _countNgrams(self, segment, ngramLength):
+        '''
+        Return a dictionary of the number of times each substring of 
+        `ngramLength` appears in `segment`.
+
+        >>> comparer = search.segment._SegmentComparer({})
+        >>> sorted(comparer._countNgrams('ABAB', 2).items())
+        [('AB', 2), ('BA', 1)]
+        '''
+        counts = {}
+        for i in range(len(segment) - ngramLength + 1):
+            ngram = segment[i:i + ngramLength]
+            counts[ngram] = counts.get(ngram, 0) + 1
+        return counts
+
+    def _getSharedNgramCounts(self, i, start):
+        '''
+        Return a dictionary of the number of bigrams the segment at index 
+        `i` shares with each segment from index `start` on that shares any.
+        '''
+        shared = {}
+        for ngram, count in self._countNgrams(self.segments[i], 
+                                              self.ngramLength).items():
+            postings = self.ngramPostings[ngram]
+            for j, otherCount in postings[bisect.bisect_left(postings, 
+                                                             (start, 0)):]:
+                shared[j] = shared.get(j, 0) + min(count, otherCount)
+        return shared
+
+    def _canReachMinimumRatio(self, i, j, sharedNgrams):
+        '''
+        Return False if the segments at `i` and `j`, sharing `sharedNgrams` 
+        bigrams, cannot have a ratio of at least `minimumRatio`.
+
+        The ratio is twice the number of matching characters divided by the 
+        total length, and no more characters can match than the two segments 
+        share. Deleting the characters that do not match from one segment 
+        breaks at most `ngramLength` of its bigrams each, and inserting 
+        those of the other segment breaks at most `ngramLength` - 1.
+        '''
+        lenA = len(self.segments[i])
+        lenB = len(self.segments[j])
+        # matching characters needed to reach minimumRatio
+        minimumMatches = math.ceil(
+            self.minimumRatio * (lenA + lenB) / 2.0 - 1e-9)
+        if min(lenA, lenB) < minimumMatches:
+            return False
+
+        q = self.ngramLength
+        for lenThis, lenThat in ((lenA, lenB), (lenB, lenA)):
+            minimumShared = ((lenThis - q + 1) 
+                             - q * (lenThis - minimumMatches) 
+                             - (q - 1) * (lenThat - minimumMatches))
+            if sharedNgrams < minimumShared:
+                return False
+
+        countsA = self.characterCounts[i]
+        countsB = self.characterCounts[j]
+        sharedCharacters = 0
+        for character, count in countsA.items():
+            if character in countsB:
+                sharedCharacters += min(count, countsB[character])
+        if sharedCharacters < minimumMatches:
+            return False
+        return True
+
+    def compareScore(self, scoreNumber, includeReverse=False):
+        '''
+        Return the similarity tuples, as given by :func:`scoreSimilarity`, 
+        of each segment of the score at `scoreNumber` with the segments of 
+        all later scores.
+        '''
+        similarityScores = []
+        start = self.scoreStarts[scoreNumber + 1]
+        end = self.scoreStarts[-1]
+        # ratios found for each segment string of this score, by the string
+        # of the other segment; the ratios of a string are kept only while
+        # it appears again in this score
+        remainingCounts = {}
+        for i in range(self.scoreStarts[scoreNumber], start):
+            thisSegment = self.segments[i]
+            remainingCounts[thisSegment] = remainingCounts.get(thisSegment, 0) + 1
+        ratioCache = {}
+        for i in range(self.scoreStarts[scoreNumber], start):
+            thisSegment = self.segments[i]
+            remainingCounts[thisSegment] -= 1
+            if thisSegment in ratioCache:
+                ratios = ratioCache[thisSegment]
+            else:
+                ratios = {}
+            if remainingCounts[thisSegment] > 0:
+                ratioCache[thisSegment] = ratios
+            else:
+                ratioCache.pop(thisSegment, None)
+            (unused_scoreNumber, thisScoreKey, pNum, segmentNumber, 
+                thisMeasureNumber) = self.segmentInfo[i]
+            if self.minimumRatio is not None:
+                sharedNgrams = self._getSharedNgramCounts(i, start)
+            dl = None
+            for j in range(start, end):
+                if self.minimumRatio is not None:
+                    if not self._canReachMinimumRatio(i, j, 
+                                                      sharedNgrams.get(j, 0)):
+                        continue
+                thatSegment = self.segments[j]
+                # the ratio may differ if the segments are swapped, so only
+                # ratios with thisSegment in the same place are reused
+                if thatSegment in ratios:
+                    ratio = ratios[thatSegment]
+                else:
+                    if dl is None:
+                        dl = getDifflibOrPyLev(thisSegment, 
+                                               forceDifflib=self.forceDifflib)
+                    dl.set_seq1(thatSegment)
+                    ratio = dl.ratio()
+                    ratios[thatSegment] = ratio
+                if self.minimumRatio is not None and ratio < self.minimumRatio:
                     continue
-                thisMeasureNumber = thisScore[pNum]['measureList'][segmentNumber]
-                dl = getDifflibOrPyLev(thisSegment, forceDifflib = forceDifflib)
-                #dl = difflib.SequenceMatcher(None, '', thisSegment)
-                for thatScoreNumber in range(scoreIndex, totalScores):
-                    thatScoreKey = scoreDictKeys[thatScoreNumber]
-                    thatScore = scoreDict[thatScoreKey]
-                    for pNum2 in range(len(thatScore)):
-                        for thatSegmentNumber, thatSegment in enumerate(thatScore[pNum2]['segmentList']):
-                            if len(thatSegment) < minimumLength:
-                                continue
-                            dl.set_seq1(thatSegment)
-                            ratio = dl.ratio()
-                            thatMeasureNumber = thatScore[pNum2]['measureList'][thatSegmentNumber]
-                            similarityTuple = (
-                                thisScoreKey, 
-                                pNum, 
-                                segmentNumber, 
-                                thisMeasureNumber, 
-                                thatScoreKey, 
-                                pNum2, 
-                                thatSegmentNumber, 
-                                thatMeasureNumber, 
-                                ratio,
-                                )
-                            similarityScores.append(similarityTuple)
-                            if includeReverse is True:
-                                similarityTupleReversed = (
-                                    thatScoreKey, 
-                                    pNum2, 
-                                    thatSegmentNumber, 
-                                    thatMeasureNumber, 
-                                    thisScoreKey, 
-                                    pNum, 
-                                    segmentNumber, 
-                                    thisMeasureNumber, 
-                                    ratio,
-                                    )
-                                similarityScores.append(similarityTupleReversed)
 
-    #import pprint
-    #pprint.pprint(similarityScores)
-    return similarityScores
+                (unused_scoreNumber, thatScoreKey, pNum2, thatSegmentNumber, 
+                    thatMeasureNumber) = self.segmentInfo[j]
+                similarityTuple = (
+                    thisScoreKey, 
+                    pNum, 
+                    segmentNumber, 
+                    thisMeasureNumber, 
+                    thatScoreKey, 
+                    pNum2, 
+                    thatSegmentNumber, 
+                    thatMeasureNumber, 
+                    ratio,
+                    )
+                similarityScores.append(similarityTuple)
+                if includeReverse is True:
+                    similarityTupleReversed = (
+                        thatScoreKey, 
+                        pNum2, 
+                        thatSegmentNumber, 
+                        thatMeasureNumber, 
+                        thisScoreKey, 
+                        pNum, 
+                        segmentNumber, 
+                        thisMeasureNumber, 
+                        ratio,
+                        )
+                    similarityScores.append(similarityTupleReversed)
+        return similarityScores
+
+
+# the _SegmentComparer used by a worker process of scoreSimilarity()
+_workerComparer = None
+
+def _initializeWorker(comparer):
+    '''
+    Store, in a worker process, the _SegmentComparer of scoreSimilarity().
+    '''
+    global _workerComparer
+    _workerComparer = comparer
+
+def _compareScoreInWorker(arguments):
+    '''
+    Compare, in a worker process, the segments of one score.
+    '''
+    scoreNumber, includeReverse = arguments
+    return _workerComparer.compareScore(scoreNumber, includeReverse)
+
     
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def _getScoreDict(self):
+        import random
+        randomGenerator = random.Random(5)
+        scoreDict = OrderedDict()
+        for scoreNumber in range(6):
+            segmentList = []
+            for unused_i in range(8):
+                if segmentList and randomGenerator.random() < 0.3:
+                    # repeated segments within a score
+                    segmentList.append(randomGenerator.choice(segmentList))
+                else:
+                    segmentList.append(''.join(randomGenerator.choice('ABCD') 
+                        for unused_j in range(randomGenerator.randint(4, 12))))
+            scoreDict['score%d' % scoreNumber] = [{
+                'segmentList': segmentList,
+                'measureList': list(range(1, len(segmentList) + 1)),
+                }]
+        return scoreDict
+
+    def testCanReachMinimumRatio(self):
+        scoreDict = self._getScoreDict()
+        for minimumRatio in (0.3, 0.6, 0.8):
+            comparer = _SegmentComparer(scoreDict, minimumLength=5, 
+                minimumRatio=minimumRatio, forceDifflib=True)
+            segments = comparer.segments
+            for i in range(len(segments)):
+                sharedNgrams = comparer._getSharedNgramCounts(i, 0)
+                for j in range(len(segments)):
+                    dl = difflib.SequenceMatcher(None, segments[j], segments[i])
+                    if dl.ratio() >= minimumRatio:
+                        self.assertTrue(comparer._canReachMinimumRatio(i, j, 
+                            sharedNgrams.get(j, 0)))
+
+    def testFilteredResultsMatchUnfiltered(self):
+        scoreDict = self._getScoreDict()
+        unfiltered = scoreSimilarity(scoreDict, minimumLength=5, 
+            forceDifflib=True)
+        for minimumRatio in (0.3, 0.6, 0.8):
+            filtered = scoreSimilarity(scoreDict, minimumLength=5, 
+                forceDifflib=True, minimumRatio=minimumRatio)
+            self.assertEqual(filtered, 
+                [result for result in unfiltered 
+                    if result[-1] >= minimumRatio])
+
+        parallel = scoreSimilarity(scoreDict, minimumLength=5, 
+            forceDifflib=True, minimumRatio=0.6, includeReverse=True, 
+            processCount=2)
+        serial = scoreSimilarity(scoreDict, minimumLength=5, 
+            forceDifflib=True, minimumRatio=0.6, includeReverse=True)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(scoreSimilarity(scoreDict, minimumLength=5, 
+            forceDifflib=True, processCount=2), unfiltered)
+
+        # ratios match those found without reusing any comparison
+        for result in unfiltered:
+            thisSegment = scoreDict[result[0]][0]['segmentList'][result[2]]
+            thatSegment = scoreDict[result[4]][0]['segmentList'][result[6]]
+            dl = difflib.SequenceMatcher(None, thatSegment, thisSegment)
+            self.assertEqual(result[-1], dl.ratio())
+
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
@@ -367,7 +679,7 @@ _DOC_ORDER = []
 
 if __name__ == "__main__":
     import music21
-    music21.mainTest()
+    music21.mainTest(Test)
 
 #------------------------------------------------------------------------------
 # eof
@@ -1408,11 +1408,12 @@ class Sites(common.SlottedObject):
             siteId = id(site)
         # will raise an index error if the siteId does not exist
         try:
-            self.siteDict[siteId].offset = value
-            self._lastID = siteId
-            self._lastOffset = value
+            siteRef = self.siteDict[siteId]
         except KeyError:
             raise SitesException('an entry for this object (%s) is not stored in Sites' % site)
+        self._setSiteRefOffset(siteRef, value)
+        self._lastID = siteId
+        self._lastOffset = value
 
     def setOffsetBySiteId(self, siteId, value):
         '''
@@ -1422,11 +1423,42 @@ class Sites(common.SlottedObject):
         The `siteId` parameter can be None.
         '''
         try:
-            self.siteDict[siteId].offset = value
-            self._lastID = siteId
-            self._lastOffset = value
+            siteRef = self.siteDict[siteId]
         except KeyError:
             raise SitesException('an entry for this object (%s) is not stored in Sites' % siteId)
+        self._setSiteRefOffset(siteRef, value)
+        self._lastID = siteId
+        self._lastOffset = value
+
+    def _setSiteRefOffset(self, siteRef, value):
+        '''
+        Set the offset of a SiteRef. If the offset changes and the site is
+        a Stream, the Stream can no longer be assumed to be sorted, and the
+        values it has cached that depend on offsets are cleared.
+
+        >>> from music21 import note, stream
+        >>> s = stream.Stream()
+        >>> n1 = note.Note()
+        >>> n2 = note.Note()
+        >>> s.insert(0, n1)
+        >>> s.insert(1, n2)
+        >>> s.isSorted
+        True
+        >>> n1.sites.setOffsetBySite(s, 2)
+        >>> s.isSorted
+        False
+        >>> [n.offset for n in s]
+        [1.0, 2.0]
+        >>> n2.offset = 3
+        >>> s.getElementsByOffset(2.5, 3.5)[0] is n2
+        True
+        '''
+        site = None
+        if siteRef.offset != value and siteRef.siteWeakref is not None:
+            site = siteRef.site
+        siteRef.offset = value
+        if site is not None and getattr(site, 'isStream', False):
+            site._elementsChanged(updateIsFlat=False, changes=['offsets'])
 
 
 class Test(unittest.TestCase):
@@ -20,6 +20,7 @@ as the :class:`~music21.stream.Measure`
 and :class:`~music21.stream.Score` objects, are defined in
 this module.
 '''
+import bisect
 import collections
 import copy
 import unittest
@@ -48,7 +49,9 @@ from music21 import tie
 from music21 import repeat
 from music21 import tempo
 
+from music21.stream import filters
 from music21.stream import makeNotation
+from music21.stream import streamIndex
 from music21.stream import streamStatus
 from music21.stream import timespans
 from music21.stream import timespanAnalysis
@@ -167,6 +170,400 @@ class StreamIterator(object):
         return self.srcStream.__getitem__(key)
 
 
+class StreamView(object):
+    '''
+    A read-only, lazily evaluated view of the elements of a Stream that
+    pass a chain of :mod:`~music21.stream.filters`.
+
+    A StreamView is obtained from the :attr:`~music21.stream.Stream.view`
+    property of a Stream.  Calling the filtering methods of a view
+    (`getElementsByClass`, `getElementsNotOfClass`, `getElementsByGroup`,
+    `getElementsByOffset`, `notes`, `notesAndRests`) returns a new view
+    with one more filter, without creating a new Stream or adding any
+    sites to the elements found.  Offsets of the elements found are
+    always those in the source Stream.
+
+    >>> s = stream.Stream()
+    >>> s.append(meter.TimeSignature('2/4'))
+    >>> s.repeatAppend(note.Note('C'), 4)
+    >>> s.append(note.Rest())
+    >>> s.append(chord.Chord(['D', 'F']))
+    >>> v = s.view.notes.getElementsByOffset(1, 4)
+    >>> v
+    <music21.stream.StreamView of <music21.stream.Stream ...>
+        [<music21.stream.filters.ClassFilter NotRest>,
+         <music21.stream.filters.OffsetFilter 1.0-4.0>]>
+    >>> len(v)
+    3
+    >>> [(e.offset, e.name) for e in v]
+    [(1.0, 'C'), (2.0, 'C'), (3.0, 'C')]
+    >>> v[-1].offset
+    3.0
+
+    Nothing is copied, and the elements found have no new sites:
+
+    >>> n = s.notes[0]
+    >>> numSites = len(n.sites)
+    >>> len(s.view.getElementsByClass('Note'))
+    4
+    >>> len(n.sites) == numSites
+    True
+
+    A real Stream, with the same class as the source, is created with
+    `.stream()`:
+
+    >>> found = s.view.getElementsByClass('GeneralNote').stream()
+    >>> found
+    <music21.stream.Stream ...>
+    >>> found.derivation.method
+    'getElementsByClass'
+    >>> found.highestTime
+    6.0
+
+    Other attributes and methods of a Stream are read from a Stream
+    created as by `.stream()`:
+
+    >>> v = s.view.getElementsByClass('Rest')
+    >>> v.highestTime
+    5.0
+
+    A view is always of the current elements of its source, and cannot
+    itself be changed.  Only methods of a Stream that do not change the
+    Stream they are called on (or, by default, its elements) can be called,
+    as others would only change the Stream created from the view and not
+    the source Stream; nor can attributes be set:
+
+    >>> v.append(note.Rest())
+    Traceback (most recent call last):
+    AttributeError: a StreamView cannot be changed; call append() on the
+        Stream returned by .stream() or on the source Stream
+    >>> v.elements = ()
+    Traceback (most recent call last):
+    AttributeError: a StreamView cannot be changed; set elements on the
+        Stream returned by .stream() or on the source Stream
+    >>> s.append(note.Rest())
+    >>> len(v)
+    2
+    '''
+    # the attributes of a StreamView itself
+    _viewAttributes = ('srcStream', 'filters', '_storeMatches', '_matches',
+        '_matchesIndex', '_stream', '_streamMatches')
+
+    # methods of Stream (other than those a StreamView defines) that change
+    # neither the Stream they are called on nor, called with their default
+    # arguments, its elements; other methods cannot be called on a view
+    _readOnlyMethods = frozenset([
+        'allPlayingWhileSounding',
+        'analyze',
+        'asTimespans',
+        'attributeCount',
+        'augmentOrDiminish',
+        'beatAndMeasureFromOffset',
+        'bestClef',
+        'chordify',
+        'expandRepeats',
+        'explode',
+        'extractContext',
+        'findConsecutiveNotes',
+        'findGaps',
+        'getAllContextsByClass',
+        'getClefs',
+        'getContextAttr',
+        'getContextByClass',
+        'getElementAfterElement',
+        'getElementAtOrBefore',
+        'getElementBeforeOffset',
+        'getElementById',
+        'getInstrument',
+        'getInstruments',
+        'getKeySignatures',
+        'getMetricalAttributes',
+        'getOffsetByElement',
+        'getOffsetBySite',
+        'getOverlaps',
+        'getSimultaneous',
+        'getSpannerSites',
+        'getTimeSignatures',
+        'groupElementsByOffset',
+        'hasContext',
+        'hasElement',
+        'hasElementOfClass',
+        'hasMeasures',
+        'hasPartLikeStreams',
+        'hasSite',
+        'hasVariantSite',
+        'hasVoices',
+        'haveAccidentalsBeenMade',
+        'haveBeamsBeenMade',
+        'index',
+        'isClassOrSubclass',
+        'isSequence',
+        'isTwelveTone',
+        'isWellFormedNotation',
+        'lyrics',
+        'makeBeams',
+        'makeChords',
+        'makeMeasures',
+        'makeNotation',
+        'makeTupletBrackets',
+        'measure',
+        'measureOffsetMap',
+        'measureTemplate',
+        'measures',
+        'melodicIntervals',
+        'metronomeMarkBoundaries',
+        'next',
+        'pitchAttributeCount',
+        'playingWhenAttacked',
+        'plot',
+        'previous',
+        'quantize',
+        'recurse',
+        'show',
+        'simultaneousAttacks',
+        'sliceAtOffsets',
+        'sliceByBeat',
+        'sliceByQuarterLengths',
+        'sortTuple',
+        'splitByClass',
+        'stripTies',
+        'transpose',
+        'trimPlayingWhileSounding',
+        'voicesToParts',
+        'write',
+        'yieldSiteSearchOrder',
+        ])
+
+    def __init__(self, srcStream, filterList=None):
+        self.srcStream = srcStream
+        if filterList is None:
+            filterList = ()
+        self.filters = tuple(filterList)
+        # results are stored with the class index they were found with,
+        # which is replaced whenever the source Stream changes, if no
+        # filter can give different results without such a change
+        self._storeMatches = all(f.dependsOnlyOnElements for f in self.filters)
+        self._matches = None
+        self._matchesIndex = None
+        # the Stream created to read other attributes from, and the list
+        # of matches it was created from
+        self._stream = None
+        self._streamMatches = None
+
+    def __repr__(self):
+        return '<%s.%s of %r %r>' % (self.__module__, self.__class__.__name__,
+            self.srcStream, list(self.filters))
+
+    def __iter__(self):
+        return self._iterMatches()
+
+    def _iterMatches(self):
+        srcStream = self.srcStream
+        for e in self._getMatches():
+            # as with StreamIterator, the source is the activeSite of
+            # elements returned
+            e.activeSite = srcStream
+            yield e
+
+    def __len__(self):
+        return len(self._getMatches())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.stream()[key]
+        try:
+            e = self._getMatches()[key]
+        except IndexError:
+            raise StreamException(
+                'attempting to access index %s while view is of size %s' %
+                (key, len(self)))
+        e.activeSite = self.srcStream
+        return e
+
+    def __getattr__(self, attr):
+        # only called for attributes not found on the view: read them from
+        # a Stream of the elements found, made again whenever they change
+        if attr.startswith('__') or attr in self._viewAttributes:
+            raise AttributeError(attr)
+        matches = self._getMatches()
+        if self._stream is None or self._streamMatches is not matches:
+            self._stream = self.stream()
+            self._streamMatches = matches
+        value = getattr(self._stream, attr)
+        if callable(value) and attr not in self._readOnlyMethods:
+            raise AttributeError('a StreamView cannot be changed; call ' +
+                '%s() on the Stream returned by .stream() ' % attr +
+                'or on the source Stream')
+        return value
+
+    def __setattr__(self, attr, value):
+        if attr not in self._viewAttributes:
+            raise AttributeError('a StreamView cannot be changed; set ' +
+                '%s on the Stream returned by .stream() ' % attr +
+                'or on the source Stream')
+        object.__setattr__(self, attr, value)
+
+    def _getMatches(self):
+        '''
+        Return a list of the elements of the source Stream, in order,
+        that pass every filter.
+        '''
+        srcStream = self.srcStream
+        if not srcStream.isSorted and srcStream.autoSort:
+            srcStream.sort() # will set isSorted to True
+        classIndex = srcStream._getClassIndex()
+        if self._matches is not None and self._matchesIndex is classIndex:
+            return self._matches
+
+        # combine the candidate positions of all filters that can use an
+        # index; only remaining filters need to be called on each element
+        positions = None
+        filtersToCall = []
+        for f in self.filters:
+            fPositions = f.candidatePositions(srcStream)
+            if fPositions is None:
+                filtersToCall.append(f)
+                continue
+            if not f.exactPositions:
+                filtersToCall.append(f)
+            if positions is None:
+                positions = fPositions
+            else:
+                fPositionSet = set(fPositions)
+                positions = [i for i in positions if i in fPositionSet]
+
+        indexedElements = classIndex.elements
+        if positions is None:
+            candidates = indexedElements
+        else:
+            candidates = [indexedElements[i] for i in positions]
+        if filtersToCall:
+            matches = []
+            for e in candidates:
+                for f in filtersToCall:
+                    if not f(e, srcStream):
+                        break
+                else:
+                    matches.append(e)
+        else:
+            matches = list(candidates)
+
+        if self._storeMatches:
+            self._matches = matches
+            self._matchesIndex = classIndex
+        return matches
+
+    def addFilter(self, newFilter):
+        '''
+        Return a new StreamView of the same source Stream with `newFilter`
+        added to the filters of this view.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> s.append(note.Rest())
+        >>> v = s.view.addFilter(stream.filters.ClassFilter('Rest'))
+        >>> [e.name for e in v]
+        ['rest']
+        '''
+        return StreamView(self.srcStream, self.filters + (newFilter,))
+
+    def getElementsByClass(self, classFilterList):
+        '''
+        Return a new view keeping only elements that match one or more
+        classes in `classFilterList`.  See
+        :meth:`~music21.stream.Stream.getElementsByClass`.
+        '''
+        return self.addFilter(filters.ClassFilter(classFilterList))
+
+    def getElementsNotOfClass(self, classFilterList):
+        '''
+        Return a new view keeping only elements that match no class in
+        `classFilterList`.  See
+        :meth:`~music21.stream.Stream.getElementsNotOfClass`.
+        '''
+        return self.addFilter(filters.ClassNotFilter(classFilterList))
+
+    def getElementsByGroup(self, groupFilterList):
+        '''
+        Return a new view keeping only elements in one or more groups in
+        `groupFilterList`.  See
+        :meth:`~music21.stream.Stream.getElementsByGroup`.
+        '''
+        return self.addFilter(filters.GroupFilter(groupFilterList))
+
+    def getElementsByOffset(self, offsetStart, offsetEnd=None,
+        includeEndBoundary=True, mustFinishInSpan=False,
+        mustBeginInSpan=True, includeElementsThatEndAtStart=True):
+        '''
+        Return a new view keeping only elements found at an offset or
+        within a range of offsets of the source Stream.  See
+        :meth:`~music21.stream.Stream.getElementsByOffset`.
+        '''
+        return self.addFilter(filters.OffsetFilter(offsetStart, offsetEnd,
+            includeEndBoundary=includeEndBoundary,
+            mustFinishInSpan=mustFinishInSpan,
+            mustBeginInSpan=mustBeginInSpan,
+            includeElementsThatEndAtStart=includeElementsThatEndAtStart))
+
+    @property
+    def notes(self):
+        '''
+        A new view keeping only NotRest objects.
+        See :attr:`~music21.stream.Stream.notes`.
+        '''
+        return self.getElementsByClass('NotRest')
+
+    @property
+    def notesAndRests(self):
+        '''
+        A new view keeping only GeneralNote objects.
+        See :attr:`~music21.stream.Stream.notesAndRests`.
+        '''
+        return self.getElementsByClass('GeneralNote')
+
+    def stream(self, returnStreamSubClass=True):
+        '''
+        Create a Stream containing the elements of this view at their
+        offsets in the source Stream.  The new Stream has the class of the
+        source unless `returnStreamSubClass` is False.
+
+        >>> m = stream.Measure()
+        >>> m.number = 3
+        >>> m.append(note.Note())
+        >>> found = m.view.notes.stream()
+        >>> found
+        <music21.stream.Measure 3 offset=0.0>
+        >>> m.view.notes.stream(returnStreamSubClass=False)
+        <music21.stream.Stream ...>
+        '''
+        srcStream = self.srcStream
+        found = None
+        if returnStreamSubClass:
+            try:
+                found = srcStream.__class__()
+                if srcStream.isMeasure:
+                    found.number = srcStream.number
+            except TypeError:
+                found = None
+        if found is None:
+            found = Stream()
+        found.derivation.origin = srcStream
+        if self.filters:
+            found.derivation.method = self.filters[-1].derivationMethod
+        found.autoSort = srcStream.autoSort
+
+        endIds = set(id(e) for e in srcStream._endElements)
+        for e in self._getMatches():
+            if id(e) in endIds:
+                found._storeAtEndCore(e)
+            else:
+                found._insertCore(e.getOffsetBySite(srcStream), e,
+                    ignoreSort=True)
+        found._elementsChanged()
+        found.isSorted = srcStream.isSorted
+        return found
+
+
 #------------------------------------------------------------------------------
 
 
@@ -250,6 +647,58 @@ class Stream(base.Music21Object):
     isMeasure = False
     classSortOrder = -20
 
+    # the most elements that insert() will move to keep a sorted Stream
+    # sorted; see _insertCore()
+    _maximumSortedInsertShift = 1024
+
+    # the kinds of change to a Stream that each value stored in _cache
+    # depends on; see _elementsChanged(). Values not named here are
+    # cleared on every change.
+    #   'membership': elements are added or removed
+    #   'offsets': the offsets of elements change
+    #   'durations': the durations of elements change
+    #   'sortOrder': the order of the elements changes
+    #   'descendants': the contents of Streams in this Stream change
+    # _insertCore(), _appendCore() and _storeAtEndCore() store
+    # 'unannouncedChanges' until _elementsChanged() is called; a sort()
+    # before then clears every value.
+    _cacheDependencies = {
+        'elements': ('membership', 'sortOrder'),
+        'elementIds': ('membership',),
+        'index': ('membership', 'sortOrder'),
+        'sortKeys': ('membership', 'offsets', 'durations', 'sortOrder'),
+        'classIndex': ('membership', 'sortOrder'),
+        'offsetIndex': ('membership', 'offsets', 'durations', 'sortOrder',
+                        'descendants'),
+        'offsetIndexRequested': ('membership', 'offsets', 'durations',
+                                 'sortOrder', 'descendants'),
+        'hasMeasures': ('membership',),
+        'hasVoices': ('membership',),
+        'notes': ('membership', 'offsets', 'durations'),
+        'notesAndRests': ('membership', 'offsets', 'durations'),
+        # contained Streams are often changed while their activeSite is
+        # another Stream, so this one is not told; the next sort() of this
+        # one is taken to mean that its contents may have changed
+        'flat': ('membership', 'offsets', 'durations', 'sortOrder',
+                 'descendants'),
+        'semiFlat': ('membership', 'offsets', 'durations', 'sortOrder',
+                     'descendants'),
+        # the flat and semiFlat Streams made before elements were inserted
+        # or appended, with those elements; see _storeFlatAdditions()
+        'flatAdditions': ('membership', 'offsets', 'durations', 'sortOrder',
+                          'descendants'),
+        'semiFlatAdditions': ('membership', 'offsets', 'durations',
+                              'sortOrder', 'descendants'),
+        'HighestOffset': ('membership', 'offsets'),
+        'LowestOffset': ('membership', 'offsets'),
+        'HighestTime': ('membership', 'offsets', 'durations', 'descendants'),
+        'Duration': ('membership', 'offsets', 'durations', 'descendants'),
+        'contextIndex': ('membership', 'offsets', 'sortOrder',
+                         'descendants'),
+        'timespanCollections': ('membership', 'offsets', 'durations',
+                                'sortOrder', 'descendants'),
+        }
+
     # define order to present names in documentation; use strings
     _DOC_ORDER = ['append', 'insert', 'insertAndShift',
         'notes', 'pitches',
@@ -379,6 +828,21 @@ class Stream(base.Music21Object):
         '''
         return StreamIterator(self)
 
+    @property
+    def view(self):
+        '''
+        Return a :class:`~music21.stream.StreamView` of all the elements of
+        this Stream.  Filtering methods called on the view return further
+        views rather than new Streams, so chains of searches create no
+        Streams until one is requested.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('E'), 8)
+        >>> [n.offset for n in s.view.getElementsByOffset(2, 4)]
+        [2.0, 3.0, 4.0]
+        '''
+        return StreamView(self)
+
 
     def __getitem__(self, key):
         '''
@@ -484,7 +948,7 @@ class Stream(base.Music21Object):
     # most will set isSorted to False
 
     def _elementsChanged(self, updateIsFlat=True, clearIsSorted=True,
-        memo=None, keepIndex=False):
+        memo=None, keepIndex=False, changes=None):
         '''
         This method is called any time the elements in the Stream are changed.
 
@@ -498,6 +962,28 @@ class Stream(base.Music21Object):
         >>> a._elementsChanged()
         >>> a.isFlat
         False
+
+        If `changes` is given, it is a list of the kinds of change made 
+        ('membership', 'offsets', 'durations', 'sortOrder', or 'descendants'),
+        and only cached values that depend on one of these, as declared in 
+        `_cacheDependencies`, are cleared. The Stream this Stream is in is 
+        told that its 'descendants' have changed. A change of 'sortOrder' 
+        alone is not passed on.
+
+        >>> s = stream.Stream()
+        >>> m = stream.Measure()
+        >>> m.append(note.Note('C'))
+        >>> s.append(m)
+        >>> sFlat = s.flat
+        >>> sElements = s.elements
+        >>> mElements = m.elements
+        >>> m._elementsChanged(changes=['durations'])
+        >>> m._cache['elements'] == list(mElements)
+        True
+        >>> s.flat is sFlat
+        False
+        >>> s._cache['elements'] == list(sElements)
+        True
         '''
         # experimental
         if not self._mutable:
@@ -506,17 +992,24 @@ class Stream(base.Music21Object):
         if memo is None:
             memo = []
         memo.append(id(self))
+        # reordering the elements does not change the Streams this Stream
+        # is in or was flattened from
+        reorderedOnly = changes is not None and list(changes) == ['sortOrder']
         # if this Stream is a flat representation of something, and its
         # elements have changed, than we must clear the cache of that
         # ancestor; we can do that by calling _elementsChanged on
         # flattenedRepresentationOf
-        if self.flattenedRepresentationOf is not None:
-            self.flattenedRepresentationOf._elementsChanged(memo=memo)
+        if (self.flattenedRepresentationOf is not None and 
+                not reorderedOnly and
+                id(self.flattenedRepresentationOf) not in memo):
+            self.flattenedRepresentationOf._elementsChanged(memo=memo, 
+                                                            changes=changes)
 
         # may not always need to clear cache of the active site, but may
         # be a good idea; may need to intead clear all sites
-        if self.activeSite is not None:
-            self.activeSite._elementsChanged()
+        if self.activeSite is not None and not reorderedOnly:
+            self.activeSite._elementsChanged(updateIsFlat=False, 
+                changes=['descendants'])
 
         # clear these attributes for setting later
         if clearIsSorted:
@@ -538,11 +1031,108 @@ class Stream(base.Music21Object):
         if len(self._cache) > 0:
             if keepIndex and 'index' in self._cache:
                 indexCache = self._cache['index']
-            # alway clear cache when elements have changed
-            self._cache = {}
+            if changes is None:
+                # alway clear cache when elements have changed
+                self._cache = {}
+            else:
+                # a new dictionary, as shallow copies of this Stream may 
+                # share the cache
+                changes = set(changes)
+                dependencies = self._cacheDependencies
+                self._cache = dict((key, value) for key, value in 
+                                   self._cache.items() 
+                                   if key in dependencies and 
+                                   changes.isdisjoint(dependencies[key]))
             if keepIndex:
                 self._cache['index'] = indexCache
 
+    def _getFlatRepresentations(self):
+        '''
+        Return a dictionary of what :meth:`_storeFlatAdditions` needs to
+        make the flat and semiFlat representations of this Stream again
+        quickly after elements that are not Streams are inserted or
+        appended: for each one cached, the representation made last and
+        the elements added since (see :meth:`_getFlatFromAdditions`).
+        '''
+        flatRepresentations = {}
+        for key in ('flat', 'semiFlat'):
+            flatStream = self._cache.get(key)
+            if flatStream is not None:
+                flatRepresentations[key] = (flatStream, None)
+            elif key + 'Additions' in self._cache:
+                flatRepresentations[key] = self._cache[key + 'Additions']
+        return flatRepresentations
+
+    def _storeFlatAdditions(self, flatRepresentations, elementOffsets):
+        '''
+        Given the flat representations of this Stream from
+        :meth:`_getFlatRepresentations`, found before the elements in
+        `elementOffsets`, a list of (element, offset) pairs, were added to
+        this Stream, store them in the cache with those elements, so that
+        the next `.flat` or `.semiFlat` need not flatten this Stream again.
+        None of the elements may be a Stream.
+
+        A Stream returned by `.flat` before is not changed:
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('C'))
+        >>> sFlat = s.flat
+        >>> s.insert(0.5, note.Note('D'))
+        >>> s.append(note.Note('E'))
+        >>> len(sFlat)
+        1
+        >>> s.flat is sFlat
+        False
+        >>> [n.name for n in s.flat]
+        ['C', 'D', 'E']
+        >>> s.flat is s.flat
+        True
+        '''
+        for key, (flatStream, additions) in flatRepresentations.items():
+            # a linked list, so that no list is copied for each append
+            self._cache[key + 'Additions'] = (flatStream,
+                                              (additions, tuple(elementOffsets)))
+
+    def _getFlatFromAdditions(self, key):
+        '''
+        Return a new flat or semiFlat representation of this Stream, as
+        `key` is 'flat' or 'semiFlat', made from the one made before elements
+        were last inserted or appended and from those elements, as stored by
+        :meth:`_storeFlatAdditions`.  Unlike the representation it is made
+        from, it is not shared with any caller.
+        '''
+        flatStream, additions = self._cache[key + 'Additions']
+        elementOffsetGroups = []
+        while additions is not None:
+            additions, elementOffsets = additions
+            elementOffsetGroups.append(elementOffsets)
+        elementOffsetGroups.reverse()
+
+        sNew = copy.copy(flatStream)
+        # not yet, so that this Stream is not told of the changes below
+        sNew.flattenedRepresentationOf = None
+        sNew._derivation = derivation.Derivation(sNew)
+        sNew._derivation.origin = self
+        sNew.derivation.method = key
+        sNew._cache = {}
+        sNew._elements = []
+        sNew._endElements = []
+        sNew._elementsChanged()
+        for e in flatStream._elements:
+            # as in _getFlatOrSemiFlat(), the containers of a semiFlat
+            # Stream keep their activeSite
+            sNew._insertCore(e.getOffsetBySite(flatStream), e,
+                             setActiveSite=not e.isStream)
+        for elementOffsets in elementOffsetGroups:
+            for e, offset in elementOffsets:
+                sNew._insertCore(offset, e)
+        for e in flatStream._endElements:
+            sNew._storeAtEndCore(e)
+        sNew._elementsChanged()
+        sNew.isFlat = True
+        sNew.flattenedRepresentationOf = self
+        return sNew
+
     def _getElements(self):
         '''
         Combines the two storage lists, _elements and _endElements, such that
@@ -785,6 +1375,11 @@ class Stream(base.Music21Object):
         False
         '''
         #environLocal.printDebug(['calling hasElementOfClass()', className])
+        # only use a class index that already exists; building one costs
+        # more than a search that can stop at the first match
+        classIndex = self._cache.get('classIndex')
+        if classIndex is not None and classIndex.clientId == id(self):
+            return classIndex.hasClass(className)
         for e in self._elements:
             if e.isClassOrSubclass([className]):
                 return True
@@ -1353,8 +1948,10 @@ class Stream(base.Music21Object):
         # using id() here b/c we do not want to get __eq__ comparisons
         if element is self: # cannot add this Stream into itself
             raise StreamException("this Stream cannot be contained within itself")
-        if checkRedundancy:
-            # TODO: might optimize this by storing a list of all obj ids with every insertion and deletion
+        # an element found in this Stream has this Stream as a site, so
+        # the elements only need to be searched if the element has a site
+        # with the id of this Stream
+        if checkRedundancy and element.sites.hasSiteId(id(self)):
             idElement = id(element)
             for e in self._elements:
                 if idElement == id(e):
@@ -1384,21 +1981,57 @@ class Stream(base.Music21Object):
         Do not mix _insertCore with _appendCore operations.
         '''
         #environLocal.printDebug(['_insertCore', 'self', self, 'offset', offset, 'element', element])
-        # need to compare highest time before inserting the element in
-        # the elements list
-        storeSorted = False
-        if not ignoreSort:
-            # if sorted and our insertion is > the highest time, then
-            # are still inserted
-            if self.isSorted is True and self.highestTime <= offset:
-                storeSorted = True
+        self._cache['unannouncedChanges'] = True
         element.sites.add(self, float(offset))
         # need to explicitly set the activeSite of the element
         if setActiveSite:
             element.activeSite = self
+        if ignoreSort:
+            # will be sorted later if necessary
+            self._elements.append(element)
+            return False
+        if self.autoSort is True:
+            # the sort key of the new element is stored with those of the
+            # other elements, so that the next sort() need not compute
+            # them again
+            sortKeys = self._cache.get('sortKeys')
+            if sortKeys is None and self.isSorted is True:
+                sortKeys = self._getSortKeys()
+            if sortKeys is None or len(sortKeys) != len(self._elements):
+                self._cache['sortKeys'] = None
+                self._elements.append(element)
+                return False
+            elementSortKey = element.sortTuple(self)
+            if not sortKeys or elementSortKey >= sortKeys[-1]:
+                self._elements.append(element)
+                sortKeys.append(elementSortKey)
+                return self.isSorted is True
+            if self.isSorted is True:
+                # a sorted Stream is kept sorted if only a few elements must
+                # be moved to make room for the new one; otherwise the new
+                # element is sorted with any others inserted out of order
+                # when the elements are next needed
+                i = bisect.bisect_right(sortKeys, elementSortKey)
+                if len(sortKeys) - i <= self._maximumSortedInsertShift:
+                    self._elements.insert(i, element)
+                    sortKeys.insert(i, elementSortKey)
+                    return True
+            self._elements.append(element)
+            sortKeys.append(elementSortKey)
+            return False
+        if self.isSorted is not True:
+            # will be sorted later if necessary
+            self._elements.append(element)
+            return False
+        if self.highestTime <= offset:
+            # if sorted and our insertion is >= the highest time, then
+            # the Stream is regarded as still sorted
+            self._cache['sortKeys'] = None
+            self._elements.append(element)
+            return True
         # will be sorted later if necessary
         self._elements.append(element)
-        return storeSorted
+        return False
 
 
     def insert(self, offsetOrItemOrList, itemOrNone=None,
@@ -1499,15 +2132,27 @@ class Stream(base.Music21Object):
 
         # checks of element is self; possibly performs additional checks
         self._addElementPreProcess(element)
+        flatRepresentations = None
+        if not element.isStream:
+            flatRepresentations = self._getFlatRepresentations()
         # main insert procedure here
         storeSorted = self._insertCore(offset, element,
                      ignoreSort=ignoreSort, setActiveSite=setActiveSite)
         updateIsFlat = False
         if element.isStream:
             updateIsFlat = True
+        # the sort keys are kept up to date by _insertCore, so they need not
+        # be recalculated after the cache is cleared
+        sortKeys = None
+        if not ignoreSort:
+            sortKeys = self._cache.get('sortKeys')
         self._elementsChanged(updateIsFlat=updateIsFlat)
         if ignoreSort is False:
             self.isSorted = storeSorted
+        if sortKeys is not None:
+            self._cache['sortKeys'] = sortKeys
+        if flatRepresentations:
+            self._storeFlatAdditions(flatRepresentations, [(element, offset)])
 
 
     def _appendCore(self, element):
@@ -1520,6 +2165,7 @@ class Stream(base.Music21Object):
         '''
         # NOTE: this is not called by append, as that is optimized
         # for looping multiple elements
+        self._cache['unannouncedChanges'] = True
         element.sites.add(self, self.highestTime)
         # need to explicitly set the activeSite of the element
         element.activeSite = self
@@ -1713,6 +2359,13 @@ class Stream(base.Music21Object):
         if not common.isListLike(others):
             # back into a list for list processing if single
             others = [others]
+        # stored sort keys can be extended as long as the elements appended
+        # sort after all others
+        sortKeys = None
+        if self.isSorted:
+            sortKeys = self._cache.get('sortKeys')
+        flatRepresentations = self._getFlatRepresentations()
+        elementOffsets = []
         updateIsFlat = False
         for e in others:
             try:
@@ -1724,9 +2377,16 @@ class Stream(base.Music21Object):
             # add this Stream as a location for the new elements, with the
             # the offset set to the current highestTime
             e.sites.add(self, highestTime)
+            elementOffsets.append((e, highestTime))
             # need to explicitly set the activeSite of the element
             e.activeSite = self
             self._elements.append(e)
+            if sortKeys is not None:
+                elementSortKey = e.sortTuple(self)
+                if sortKeys and elementSortKey < sortKeys[-1]:
+                    sortKeys = None
+                else:
+                    sortKeys.append(elementSortKey)
 
             # TODO: may need to be replaced with a common almost equal
             if e.duration.quarterLength != 0:
@@ -1739,6 +2399,10 @@ class Stream(base.Music21Object):
         self._elementsChanged(updateIsFlat=updateIsFlat)
         self.isSorted = storeSorted
         self._setHighestTime(highestTime) # call after to store in cache
+        if sortKeys is not None:
+            self._cache['sortKeys'] = sortKeys
+        if flatRepresentations and not updateIsFlat:
+            self._storeFlatAdditions(flatRepresentations, elementOffsets)
 
 
     def _storeAtEndCore(self, element):
@@ -1747,6 +2411,7 @@ class Stream(base.Music21Object):
         To be called by other methods.
         '''
         self._addElementPreProcess(element)
+        self._cache['unannouncedChanges'] = True
         element.sites.add(self, 'highestTime')
         # need to explicitly set the activeSite of the element
         element.activeSite = self
@@ -2354,6 +3019,32 @@ class Stream(base.Music21Object):
     #---------------------------------------------------------------------------
     # getElementsByX(self): anything that returns a collection of Elements should return a Stream
 
+    def _getClassIndex(self):
+        '''
+        Return a :class:`~music21.stream.streamIndex.ClassIndex` of the
+        elements of this Stream, creating it if necessary.
+
+        The index is stored in the cache and is thus discarded whenever
+        `_elementsChanged` is called.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> ci = s._getClassIndex()
+        >>> ci
+        <ClassIndex {4}>
+        >>> s._getClassIndex() is ci
+        True
+        >>> s.append(note.Rest())
+        >>> s._getClassIndex() is ci
+        False
+        '''
+        classIndex = self._cache.get('classIndex')
+        if classIndex is None or classIndex.clientId != id(self):
+            # creating the index may sort, which replaces the cache dictionary
+            classIndex = streamIndex.ClassIndex(self)
+            self._cache['classIndex'] = classIndex
+        return classIndex
+
     def getElementsByClass(self, classFilterList, returnStreamSubClass=True):
         '''
         Return a list of all Elements that match one
@@ -2473,20 +3164,19 @@ class Stream(base.Music21Object):
 
 
         #found.show('t')
-        # need both _elements and _endElements
-        for e in self._elements:
-            #eClasses = e.classes  # store once, as this is property call
-            if e.isClassOrSubclass(classFilterList):
-                if returnList is False:
-                    found._insertCore(e.getOffsetBySite(self), e, ignoreSort=True)
-                else:
-                    found.append(e)
-        for e in self._endElements:
-            if e.isClassOrSubclass(classFilterList):
-                if returnList is False:
-                    found._storeAtEndCore(e)
-                else:
-                    found.append(e)
+        # the class index gives the positions of matching elements in
+        # _elements followed by _endElements
+        classIndex = self._getClassIndex()
+        indexedElements = classIndex.elements
+        endElementsStart = classIndex.endElementsStart
+        for i in classIndex.positionsOfClass(classFilterList):
+            e = indexedElements[i]
+            if returnList is not False:
+                found.append(e)
+            elif i < endElementsStart:
+                found._insertCore(e.getOffsetBySite(self), e, ignoreSort=True)
+            else:
+                found._storeAtEndCore(e)
 
         if returnList is False:
             found._elementsChanged()
@@ -2537,14 +3227,15 @@ class Stream(base.Music21Object):
             if not isinstance(classFilterList, tuple):
                 classFilterList = [classFilterList]
 
-        # appendedAlready fixes bug where if an element matches two
-        # classes it was appendedTwice
         # need both _elements and _endElements
-        for e in self._elements:
-            if not e.isClassOrSubclass(classFilterList):
+        classIndex = self._getClassIndex()
+        indexedElements = classIndex.elements
+        endElementsStart = classIndex.endElementsStart
+        for i in classIndex.positionsNotOfClass(classFilterList):
+            e = indexedElements[i]
+            if i < endElementsStart:
                 found._insertCore(e.getOffsetBySite(self), e, ignoreSort=True)
-        for e in self._endElements:
-            if not e.isClassOrSubclass(classFilterList):
+            else:
                 found._storeAtEndCore(e)
 
         # if this stream was sorted, the resultant stream is sorted
@@ -2758,6 +3449,41 @@ class Stream(base.Music21Object):
 #        return max([g.priority for g in found])
 
 
+    def _getOffsetIndex(self):
+        '''
+        Return a :class:`~music21.stream.streamIndex.OffsetIndex` of the
+        elements of this Stream, or None if the caller should search
+        the elements linearly.
+
+        The index is stored in the cache and is thus discarded whenever
+        `_elementsChanged` is called.  As building the index costs more than
+        a single linear search, it is only built on the second request made
+        since the elements of the Stream last changed.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> s._getOffsetIndex() is None
+        True
+        >>> s._getOffsetIndex()
+        <OffsetIndex {4}>
+        >>> s._getOffsetIndex() is s._getOffsetIndex()
+        True
+        >>> s.append(note.Rest())
+        >>> s._getOffsetIndex() is None
+        True
+        '''
+        offsetIndex = self._cache.get('offsetIndex')
+        if offsetIndex is not None and offsetIndex.clientId == id(self):
+            return offsetIndex
+        if not self._cache.get('offsetIndexRequested', False):
+            self._cache['offsetIndexRequested'] = True
+            return None
+        # creating the index may sort, which replaces the cache dictionary
+        offsetIndex = streamIndex.OffsetIndex(self)
+        self._cache['offsetIndex'] = offsetIndex
+        self._cache['offsetIndexRequested'] = True
+        return offsetIndex
+
     def getElementsByOffset(self, offsetStart, offsetEnd=None,
                     includeEndBoundary=True, mustFinishInSpan=False,
                     mustBeginInSpan=True, includeElementsThatEndAtStart = True, classList=None ):
@@ -2955,85 +3681,39 @@ class Stream(base.Music21Object):
         ['C', 'D']
 
         '''
-        offsetStart = opFrac(offsetStart)
-        if offsetEnd is None:
-            offsetEnd = offsetStart
-            zeroLengthSearch = True
-        else:
-            offsetEnd = opFrac(offsetEnd)
-            if offsetEnd > offsetStart:
-                zeroLengthSearch = False
-            else:
-                zeroLengthSearch = True
+        offsetFilter = filters.OffsetFilter(offsetStart, offsetEnd,
+            includeEndBoundary=includeEndBoundary,
+            mustFinishInSpan=mustFinishInSpan,
+            mustBeginInSpan=mustBeginInSpan,
+            includeElementsThatEndAtStart=includeElementsThatEndAtStart)
+        offsetEnd = offsetFilter.offsetEnd
 
         found = self.__class__()
         found.derivation.origin = self
         found.derivation.method = 'getElementsByOffset'
 
-        # need both _elements and _endElements
-        for e in self.elements:
+        # the offset index narrows the search down to elements that begin in
+        # the span or are still sounding at its start; every candidate is
+        # then checked by the filter exactly as in a linear search
+        positions = offsetFilter.candidatePositions(self)
+        if positions is not None:
+            indexedElements = self._getOffsetIndex().elements
+            candidates = [indexedElements[i] for i in positions]
+        else:
+            # need both _elements and _endElements
+            candidates = self.elements
+
+        for e in candidates:
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
                     continue
-                
-            dur = e.duration
-            offset = e.getOffsetBySite(self)
-            #offset = common.cleanupFloat(offset)
-
-            if offset > offsetEnd:  # anything that ends after the span is definitely out
-                if self.isSorted:
-                    # if sorted, optimize by breaking after exceeding offsetEnd
-                    # eventually we could do a binary search to speed up...
-                    break
-                else:
-                    continue
 
-            elementEnd = opFrac(offset + dur.quarterLength)
-            if dur.quarterLength == 0:
-                elementIsZeroLength = True
-            else:
-                elementIsZeroLength = False
-
-            if elementEnd < offsetStart:  # anything that finishes before the span ends is definitely out
-                continue
-
-            # all the simple cases done! Now need to filter out those that are border cases depending on settings
-
-            if zeroLengthSearch is True and elementIsZeroLength is True:
-                # zero Length Searches -- include all zeroLengthElements
+            offset = e.getOffsetBySite(self)
+            if offset > offsetEnd and self.isSorted:
+                # if sorted, optimize by breaking after exceeding offsetEnd
+                break
+            if offsetFilter.isElementOffsetInRange(e, offset):
                 found._insertCore(offset, e)
-                continue
-
-
-            if mustFinishInSpan is True:
-                if elementEnd > offsetEnd:
-                    #environLocal.warn([elementEnd, offsetEnd, e])
-                    continue
-                if includeEndBoundary is False:
-                    # we include the end boundary if the search is zeroLength -- otherwise nothing can be retrieved
-                    if elementEnd == offsetEnd:
-                        continue
-
-            if mustBeginInSpan is True:
-                if offset < offsetStart:
-                    continue
-                if includeEndBoundary is False:
-                    if offset >= offsetEnd:
-                        # >= is unnecessary, should just be ==, but better safe than sorry
-                        continue
-
-            if mustBeginInSpan is False:
-                if elementIsZeroLength is False:
-                    if elementEnd == offsetEnd and zeroLengthSearch is True:
-                        continue
-            if includeEndBoundary is False:
-                if offset >= offsetEnd:
-                    continue
-
-            if includeElementsThatEndAtStart is False and elementEnd == offsetStart:
-                continue
-
-            found._insertCore(offset, e)
 
         found._elementsChanged()
         return found
@@ -3125,13 +3805,22 @@ class Stream(base.Music21Object):
         # TODO: need to deal with more than on object the same
         # offset and span from the source
         
-        # TODO: switch to timespans
         candidates = []
         offset = opFrac(offset)
         nearestTrailSpan = offset # start with max time
 
-        # need both _elements and _endElements
-        for e in self.elements:
+        offsetIndex = self._getOffsetIndex()
+        if offsetIndex is not None:
+            # only elements at the nearest offset can be candidates
+            indexedElements = offsetIndex.elements
+            searchElements = [indexedElements[i] for i in
+                offsetIndex.latestPositionsAtOrBefore(offset,
+                    classList=classList)]
+        else:
+            # need both _elements and _endElements
+            searchElements = self.elements
+
+        for e in searchElements:
             #eClasses = e.classes  # store once, as this is property call
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
@@ -3223,8 +3912,17 @@ class Stream(base.Music21Object):
         offset = opFrac(offset)
         nearestTrailSpan = offset # start with max time
 
-        # need both _elements and _endElements
-        for e in self.elements:
+        offsetIndex = self._getOffsetIndex()
+        if offsetIndex is not None:
+            indexedElements = offsetIndex.elements
+            searchElements = [indexedElements[i] for i in
+                offsetIndex.latestPositionsAtOrBefore(offset,
+                    includeOffset=False, classList=classList)]
+        else:
+            # need both _elements and _endElements
+            searchElements = self.elements
+
+        for e in searchElements:
             #eClasses = e.classes  # store once, as this is property call
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
@@ -3827,6 +4525,142 @@ class Stream(base.Music21Object):
                     offsetMap[offset].append(m)
         return offsetMap
 
+    def getMetricalAttributes(self, classFilterList=None, returnLists=False):
+        '''
+        Return a list of (element, measureNumber, beat, beatStrength) tuples,
+        one for each element, with the values that the element's
+        :attr:`~music21.base.Music21Object.measureNumber`,
+        :attr:`~music21.base.Music21Object.beat` and
+        :attr:`~music21.base.Music21Object.beatStrength` would give.
+
+        If this Stream contains Measures, the elements are taken from them;
+        otherwise they are taken from this Stream itself, and their
+        measureNumber is None.  If this Stream contains Parts (as a Score
+        does), the elements are taken from each Part in turn in the same way.
+
+        This is much faster than getting these attributes from each element,
+        as the Measures are walked once, carrying the active
+        :class:`~music21.meter.TimeSignature` forward, and beats and accent
+        weights are only computed once for each position in a measure.
+
+        Elements in Voices are included. Elements stored at the end of a
+        Stream, such as a Measure's right barline, have no position within
+        the bar and are left out. Only elements of classes in
+        `classFilterList` are returned, if it is given. Where no
+        TimeSignature can be found, the beat and beatStrength are None.
+
+        >>> s = stream.Stream()
+        >>> s.insert(0, meter.TimeSignature('3/4'))
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> for attributes in s.getMetricalAttributes('Note'):
+        ...     attributes
+        (<music21.note.Note C>, None, 1.0, 1.0)
+        (<music21.note.Note C>, None, 2.0, 0.5)
+        (<music21.note.Note C>, None, 3.0, 0.5)
+        (<music21.note.Note C>, None, 1.0, 1.0)
+
+        If `returnLists` is True, a list of the elements, a list of their
+        measure numbers, a list of their beats, and a list of their beat
+        strengths are returned instead.
+
+        >>> bach = corpus.parse('bwv66.6')
+        >>> notes, numbers, beats, strengths = bach.parts[0].getMetricalAttributes(
+        ...     'Note', returnLists=True)
+        >>> notes[:4]
+        [<music21.note.Note C#>, <music21.note.Note B>, <music21.note.Note A>, <music21.note.Note B>]
+        >>> numbers[:4]
+        [0, 0, 1, 1]
+        >>> beats[:4]
+        [4.0, 4.5, 1.0, 2.0]
+        >>> strengths[:4]
+        [0.25, 0.125, 1.0, 0.25]
+        >>> beats[:4] == [n.beat for n in notes[:4]]
+        True
+        '''
+        if classFilterList is not None and not common.isListLike(
+                classFilterList):
+            classFilterList = [classFilterList]
+
+        def iterateWithoutEndElements(streamObj):
+            # elements stored at the end have no position within the bar
+            endElementIds = [id(e) for e in streamObj._endElements]
+            for e in streamObj:
+                if not endElementIds or id(e) not in endElementIds:
+                    yield e
+
+        def yieldPositions(container):
+            # yields each element, its Measure, and its offset in the
+            # Measure (including padding) or in the container
+            if container.isMeasure:
+                measures = [container]
+            else:
+                measures = container.getElementsByClass('Measure')
+            if len(measures) == 0:
+                for e in iterateWithoutEndElements(container):
+                    if not e.isStream:
+                        yield e, None, e.getOffsetBySite(container)
+                return
+            for m in measures:
+                paddingLeft = m.paddingLeft
+                for e in iterateWithoutEndElements(m):
+                    if not e.isStream:
+                        yield e, m, e.getOffsetBySite(m) + paddingLeft
+                    elif 'Voice' in e.classes:
+                        voiceOffset = e.getOffsetBySite(m) + paddingLeft
+                        for ve in iterateWithoutEndElements(e):
+                            if not ve.isStream:
+                                yield ve, m, voiceOffset + ve.getOffsetBySite(e)
+
+        if self.hasPartLikeStreams():
+            containers = self.getElementsByClass('Stream')
+        else:
+            containers = [self]
+
+        post = []
+        for container in containers:
+            ts = None
+            searched = False
+            for e, m, mOffset in yieldPositions(container):
+                if 'TimeSignature' in e.classes:
+                    ts = e
+                    beatCache = {}
+                elif ts is None and not searched:
+                    # may be in an enclosing Stream
+                    ts = e.getContextByClass('TimeSignature')
+                    searched = True
+                    beatCache = {}
+                if classFilterList is not None and not e.isClassOrSubclass(
+                        classFilterList):
+                    continue
+                if m is None:
+                    measureNumber = None
+                else:
+                    measureNumber = m.number
+                if ts is None:
+                    post.append((e, measureNumber, None, None))
+                    continue
+                if not beatCache:
+                    # as Music21Object._getMeasureOffsetOrMeterModulusOffset
+                    tsMeasureOffset = ts._getMeasureOffset(
+                        includeMeasurePadding=False)
+                    barQL = ts.barDuration.quarterLength
+                if (mOffset + tsMeasureOffset) < barQL:
+                    position = mOffset
+                else:
+                    position = (mOffset - tsMeasureOffset) % barQL
+                if position not in beatCache:
+                    beatCache[position] = (ts.getBeatProportion(position),
+                        ts.getAccentWeight(position, forcePositionMatch=True,
+                                           permitMeterModulus=False))
+                beat, beatStrength = beatCache[position]
+                post.append((e, measureNumber, beat, beatStrength))
+
+        if returnLists:
+            if not post:
+                return [], [], [], []
+            return [list(values) for values in zip(*post)]
+        return post
+
 
     def _getFinalBarline(self):
         # if we have part-like streams, process each part
@@ -5033,16 +5867,86 @@ class Stream(base.Music21Object):
                 <ElementTimespan (7.0 to 8.0) <music21.note.Note C>>
 
         '''
-        hashedAttributes = hash( (tuple(classList or () ), recurse) ) 
-        cacheKey = "timespanCollection" + str(hashedAttributes)
-        if cacheKey not in self._cache or self._cache[cacheKey] is None:
-            hashedTSC = timespans.streamToTimespanCollection(
+        cacheKey = (tuple(classList or ()), recurse)
+        timespanCollections = self._cache.setdefault('timespanCollections', {})
+        if cacheKey not in timespanCollections:
+            timespanCollections[cacheKey] = timespans.streamToTimespanCollection(
                 self,
                 classList=classList,
                 flatten=recurse,
                 )
-            self._cache[cacheKey] = hashedTSC
-        return self._cache[cacheKey]
+        return timespanCollections[cacheKey]
+
+    def _getContextIndex(self, classList, recurse=True):
+        '''
+        Return a pair of lists used by
+        :meth:`~music21.base.Music21Object.getContextByClass` to find, by
+        bisection, the element of a class in `classList` at or before an
+        offset in this Stream: the sorted start offsets of such elements,
+        and the element that sorts first at each of them (the one that
+        :meth:`asTimespans` would give first). If `recurse` is True, elements 
+        in contained Streams are included, at their offsets in this Stream.
+
+        The index is stored in the cache, and, unlike a TimespanCollection,
+        is kept when only the durations of elements change, so all the
+        elements in a hierarchy share it.
+
+        >>> s = stream.Stream()
+        >>> m1 = stream.Measure()
+        >>> m1.append(meter.TimeSignature('3/4'))
+        >>> m1.append(note.Note(quarterLength=3.0))
+        >>> m2 = stream.Measure()
+        >>> m2.append(meter.TimeSignature('2/4'))
+        >>> m2.append(note.Note(type='half'))
+        >>> s.append([m1, m2])
+        >>> offsets, elements = s._getContextIndex(('TimeSignature',))
+        >>> offsets
+        [0.0, 3.0]
+        >>> elements
+        [<music21.meter.TimeSignature 3/4>, <music21.meter.TimeSignature 2/4>]
+        >>> s._getContextIndex(('TimeSignature',), recurse=False)
+        ([], [])
+        '''
+        from music21 import variant
+        classList = tuple(classList)
+        key = (classList, recurse)
+        contextIndices = self._cache.get('contextIndex', {})
+        if key in contextIndices:
+            return contextIndices[key]
+
+        # elements found at each offset, in the order of the Streams
+        elementsByOffset = {}
+        def collect(site, initialOffset):
+            for element in site._elements + site._endElements:
+                if (element.isStream and
+                        not isinstance(element, spanner.Spanner) and
+                        not isinstance(element, variant.Variant)):
+                    if recurse:
+                        collect(element,
+                                initialOffset + element.getOffsetBySite(site))
+                    continue
+                if not element.isClassOrSubclass(classList):
+                    continue
+                offset = initialOffset + element.getOffsetBySite(site)
+                if offset in elementsByOffset:
+                    elementsByOffset[offset].append(element)
+                else:
+                    elementsByOffset[offset] = [element]
+        collect(self, 0)
+
+        offsets = sorted(elementsByOffset)
+        elements = []
+        for offset in offsets:
+            found = elementsByOffset[offset]
+            if len(found) == 1:
+                elements.append(found[0])
+            else:
+                elements.append(min(found, key=lambda e: e.sortTuple()))
+        # a new dictionary, as shallow copies may share the cache
+        contextIndices = dict(contextIndices)
+        contextIndices[key] = (offsets, elements)
+        self._cache['contextIndex'] = contextIndices
+        return contextIndices[key]
 
     def chordify(self, addTies=True, displayTiedAccidentals=False,
         addPartIdAsGroup=False, removeRedundantPitches=True,
@@ -6193,15 +7097,78 @@ class Stream(base.Music21Object):
 #                 cmp=lambda x, y: cmp(x.priority, y.priority) or
 #                     cmp(x.classSortOrder, y.classSortOrder)
 #                 )
-            self._elements.sort(key=lambda x: x.sortTuple(self))
+            # decorate with sort keys, so that each is computed only once
+            # and can be stored for later insertions; keys stored by
+            # insert() since the last sort are used if there is one for
+            # every element.  Elements inserted in order form a sorted run
+            # that the sort merges in linear time.
+            sortKeys = self._cache.get('sortKeys')
+            if (force or sortKeys is None or
+                    len(sortKeys) != len(self._elements)):
+                sortKeys = [x.sortTuple(self) for x in self._elements]
+            keyed = list(zip(sortKeys, range(len(sortKeys)), self._elements))
+            keyed.sort()
+            self._elements[:] = [x for unused_key, unused_i, x in keyed]
             self._endElements.sort(key=lambda x: x.sortTuple(self))
 
-            # as sorting changes order, elements have changed;
-            # need to clear cache, but flat status is the same
-            self._elementsChanged(updateIsFlat=False, clearIsSorted=False)
+            # as sorting changes order, elements have changed; only values
+            # that depend on the order need be cleared, unless elements were
+            # added with _insertCore() or similar without calling
+            # _elementsChanged() afterwards; flat status is the same
+            changes = ['sortOrder']
+            if 'unannouncedChanges' in self._cache:
+                changes = None
+            self._elementsChanged(updateIsFlat=False, clearIsSorted=False, 
+                                  changes=changes)
             self.isSorted = True
+            self._cache['sortKeys'] = [k for k, unused_i, unused_x in keyed]
             #environLocal.printDebug(['_elements', self._elements])
 
+    def _getSortKeys(self):
+        '''
+        Return a list of the sort keys (see
+        :meth:`~music21.base.Music21Object.sortTuple`) of the elements in
+        `_elements`, in the same order.
+
+        The list is stored in the cache; insert(), append() and sort() keep
+        it up to date.  An element inserted into a sorted Stream is placed
+        by bisecting the keys, so that the Stream stays sorted:
+
+        >>> s = stream.Stream()
+        >>> s.insert(4, note.Note())
+        >>> s.insert(0, note.Note())
+        >>> s.isSorted
+        True
+        >>> [k.offset for k in s._getSortKeys()]
+        [0.0, 4.0]
+
+        Unless more than `_maximumSortedInsertShift` elements would need to
+        be moved; then the element is appended, and sorted without computing
+        the sort keys of all elements again when they are next needed:
+
+        >>> s._maximumSortedInsertShift = 0
+        >>> s.insert(2, clef.TrebleClef())
+        >>> s.isSorted
+        False
+        >>> [k.offset for k in s._getSortKeys()]
+        [0.0, 4.0, 2.0]
+        >>> s.sort()
+        >>> [k.offset for k in s._getSortKeys()]
+        [0.0, 2.0, 4.0]
+        >>> [e.offset for e in s._elements]
+        [0.0, 2.0, 4.0]
+
+        Changing the priority of an element, which is part of its sort key,
+        discards the stored keys of the Streams it is in:
+
+        >>> s._elements[2].priority = -1
+        >>> 'sortKeys' in s._cache
+        False
+        '''
+        if 'sortKeys' not in self._cache or self._cache['sortKeys'] is None:
+            self._cache['sortKeys'] = [e.sortTuple(self) for e in self._elements]
+        return self._cache['sortKeys']
+
     def _getSorted(self):
         if 'sorted' not in self._cache or self._cache['sorted'] is None:
             shallowElements = copy.copy(self._elements) # already a copy
@@ -6437,7 +7404,9 @@ class Stream(base.Music21Object):
 
     def _getFlat(self):
         if 'flat' not in self._cache or self._cache['flat'] is None:
-            if 'semiFlat' in self._cache and self._cache['semiFlat'] is not None:
+            if 'flatAdditions' in self._cache:
+                self._cache['flat'] = self._getFlatFromAdditions('flat')
+            elif 'semiFlat' in self._cache and self._cache['semiFlat'] is not None:
                 self._cache['flat'] = self._getFlatFromSemiFlat()
             else:
                 self._cache['flat'] = self._getFlatOrSemiFlat(
@@ -6633,8 +7602,11 @@ class Stream(base.Music21Object):
     def _getSemiFlat(self):
         if 'semiFlat' not in self._cache or self._cache['semiFlat'] is None:
             #environLocal.printDebug(['using cached semiFlat', self])
-            self._cache['semiFlat'] = self._getFlatOrSemiFlat(
-                                    retainContainers=True)
+            if 'semiFlatAdditions' in self._cache:
+                self._cache['semiFlat'] = self._getFlatFromAdditions('semiFlat')
+            else:
+                self._cache['semiFlat'] = self._getFlatOrSemiFlat(
+                                        retainContainers=True)
         return self._cache['semiFlat']
 
         #return self._getFlatOrSemiFlat(retainContainers = True)
@@ -10499,8 +11471,8 @@ class Stream(base.Music21Object):
         {2.0} <music21.note.Note C>
         {3.0} <music21.note.Note D>
         {4.0} <music21.note.Note E>
-        {15.0} <music21.note.Note G>
         {5.0} <music21.note.Note F>
+        {15.0} <music21.note.Note G>
 
         >>> sGapsExpanded = s._removeOrExpandGaps([(0.0,5.0, []), (11.0,5.0, []), (14.0,1.0, [n])], isRemove = False)
         >>> sGapsExpanded.show('text')
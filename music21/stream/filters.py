@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         filters.py
+# Purpose:      composable element filters for Streams and StreamViews
+#
+# Copyright:    Copyright © 2026 The music21 Project
+# License:      LGPL or BSD, see license.txt
+#------------------------------------------------------------------------------
+'''
+Filters that select elements from a Stream.
+
+Each filter is a callable taking an element and the Stream in which it is
+found and returning True if the element should be kept.  Filters are
+chained by a :class:`~music21.stream.StreamView`, which calls them lazily
+as it iterates over the elements of its source Stream.
+
+A filter may also provide `candidatePositions`, which uses one of the
+indices in :mod:`~music21.stream.streamIndex` to narrow down the elements
+that need to be checked at all.
+'''
+import unittest
+
+from music21 import common
+from music21.common import opFrac
+
+from music21 import environment
+environLocal = environment.Environment("stream.filters")
+
+
+#------------------------------------------------------------------------------
+
+
+class StreamFilter(object):
+    '''
+    The base class for all filters.  A StreamFilter keeps every element.
+
+    `derivationMethod` is the name stored as the derivation method of a
+    Stream created from a view ending with this filter.
+
+    >>> sf = stream.filters.StreamFilter()
+    >>> sf(note.Note(), stream.Stream())
+    True
+    >>> sf.candidatePositions(stream.Stream()) is None
+    True
+    '''
+    derivationMethod = 'streamFilter'
+
+    # True if the positions returned by candidatePositions only contain
+    # elements that pass the filter, so that no further check is needed
+    exactPositions = False
+
+    # True if whether an element passes the filter can only change when
+    # elements are added to, removed from or reordered in the Stream, so
+    # that the elements found can be stored until then
+    dependsOnlyOnElements = False
+
+    def __call__(self, e, srcStream):
+        return True
+
+    def __repr__(self):
+        return '<%s.%s>' % (self.__module__, self.__class__.__name__)
+
+    def candidatePositions(self, srcStream):
+        '''
+        Return a sorted list of positions in `srcStream.elements` that may
+        pass the filter, or None if every element must be checked.
+        '''
+        return None
+
+
+class ClassFilter(StreamFilter):
+    '''
+    Keeps elements that match one or more of the classes in
+    `classFilterList`, given as strings or class objects.
+
+    >>> cf = stream.filters.ClassFilter('Note')
+    >>> cf
+    <music21.stream.filters.ClassFilter Note>
+    >>> s = stream.Stream()
+    >>> cf(note.Note(), s)
+    True
+    >>> cf(note.Rest(), s)
+    False
+    >>> stream.filters.ClassFilter([note.Rest, 'Clef'])(note.Rest(), s)
+    True
+    '''
+    derivationMethod = 'getElementsByClass'
+    exactPositions = True
+    dependsOnlyOnElements = True
+
+    def __init__(self, classFilterList):
+        # much faster in the most common case than calling common.isListLike
+        if not isinstance(classFilterList, (list, tuple)):
+            classFilterList = (classFilterList,)
+        self.classFilterList = tuple(classFilterList)
+
+    def __call__(self, e, srcStream):
+        return e.isClassOrSubclass(self.classFilterList)
+
+    def __repr__(self):
+        names = []
+        for c in self.classFilterList:
+            if common.isStr(c):
+                names.append(c)
+            else:
+                names.append(c.__name__)
+        return '<%s.%s %s>' % (self.__module__, self.__class__.__name__,
+            ','.join(names))
+
+    def candidatePositions(self, srcStream):
+        return srcStream._getClassIndex().positionsOfClass(
+            self.classFilterList)
+
+
+class ClassNotFilter(ClassFilter):
+    '''
+    Keeps elements that match none of the classes in `classFilterList`.
+
+    >>> cnf = stream.filters.ClassNotFilter('Note')
+    >>> s = stream.Stream()
+    >>> cnf(note.Note(), s)
+    False
+    >>> cnf(note.Rest(), s)
+    True
+    '''
+    derivationMethod = 'getElementsNotOfClass'
+
+    def __call__(self, e, srcStream):
+        return not e.isClassOrSubclass(self.classFilterList)
+
+    def candidatePositions(self, srcStream):
+        return srcStream._getClassIndex().positionsNotOfClass(
+            self.classFilterList)
+
+
+class GroupFilter(StreamFilter):
+    '''
+    Keeps elements that belong to one or more of the groups in
+    `groupFilterList`.
+
+    >>> n = note.Note()
+    >>> n.groups.append('trombone')
+    >>> s = stream.Stream()
+    >>> stream.filters.GroupFilter('trombone')(n, s)
+    True
+    >>> stream.filters.GroupFilter(['tuba', 'harp'])(n, s)
+    False
+    '''
+    derivationMethod = 'getElementsByGroup'
+    # groups can be changed without the Stream knowing, so
+    # dependsOnlyOnElements is False
+
+    def __init__(self, groupFilterList):
+        if not common.isListLike(groupFilterList):
+            groupFilterList = [groupFilterList]
+        self.groupFilterList = tuple(groupFilterList)
+
+    def __call__(self, e, srcStream):
+        if not hasattr(e, 'groups'):
+            return False
+        eGroups = e.groups
+        for g in self.groupFilterList:
+            if g in eGroups:
+                return True
+        return False
+
+
+class OffsetFilter(StreamFilter):
+    '''
+    Keeps elements found at a certain offset or within a range of
+    offsets in the Stream being filtered.  The arguments are the same as
+    those of :meth:`~music21.stream.Stream.getElementsByOffset`, which
+    uses this filter to decide which elements are found.
+
+    >>> st1 = stream.Stream()
+    >>> n0 = note.Note('C', type='half')
+    >>> st1.insert(0, n0)
+    >>> n2 = note.Note('D', type='half')
+    >>> st1.insert(2, n2)
+    >>> of = stream.filters.OffsetFilter(1, 3)
+    >>> of
+    <music21.stream.filters.OffsetFilter 1.0-3.0>
+    >>> of(n0, st1), of(n2, st1)
+    (False, True)
+    >>> of = stream.filters.OffsetFilter(1, 3, mustBeginInSpan=False)
+    >>> of(n0, st1), of(n2, st1)
+    (True, True)
+    '''
+    derivationMethod = 'getElementsByOffset'
+    # durations can be changed without the Stream knowing, so
+    # dependsOnlyOnElements is False
+
+    def __init__(self, offsetStart, offsetEnd=None, includeEndBoundary=True,
+        mustFinishInSpan=False, mustBeginInSpan=True,
+        includeElementsThatEndAtStart=True):
+        self.offsetStart = opFrac(offsetStart)
+        if offsetEnd is None:
+            self.offsetEnd = self.offsetStart
+            self.zeroLengthSearch = True
+        else:
+            self.offsetEnd = opFrac(offsetEnd)
+            if self.offsetEnd > self.offsetStart:
+                self.zeroLengthSearch = False
+            else:
+                self.zeroLengthSearch = True
+        self.includeEndBoundary = includeEndBoundary
+        self.mustFinishInSpan = mustFinishInSpan
+        self.mustBeginInSpan = mustBeginInSpan
+        self.includeElementsThatEndAtStart = includeElementsThatEndAtStart
+
+    def __call__(self, e, srcStream):
+        return self.isElementOffsetInRange(e, e.getOffsetBySite(srcStream))
+
+    def __repr__(self):
+        return '<%s.%s %s-%s>' % (self.__module__, self.__class__.__name__,
+            self.offsetStart, self.offsetEnd)
+
+    def candidatePositions(self, srcStream):
+        offsetIndex = srcStream._getOffsetIndex()
+        if offsetIndex is None:
+            return None
+        positions = offsetIndex.positionsStartingBetween(self.offsetStart,
+            self.offsetEnd)
+        if self.mustBeginInSpan is False:
+            positions = sorted(positions +
+                offsetIndex.positionsSoundingAt(self.offsetStart))
+        return positions
+
+    def isElementOffsetInRange(self, e, offset):
+        '''
+        Given an element and its offset in the Stream being searched,
+        return True if the element is found by this filter.
+
+        >>> of = stream.filters.OffsetFilter(0.0, mustBeginInSpan=False)
+        >>> of.isElementOffsetInRange(clef.TrebleClef(), 0.0)
+        True
+        >>> of.isElementOffsetInRange(note.Note(), 1.0)
+        False
+        '''
+        offsetStart = self.offsetStart
+        offsetEnd = self.offsetEnd
+
+        if offset > offsetEnd:  # anything that begins after the span is definitely out
+            return False
+
+        dur = e.duration
+        elementEnd = opFrac(offset + dur.quarterLength)
+        if dur.quarterLength == 0:
+            elementIsZeroLength = True
+        else:
+            elementIsZeroLength = False
+
+        if elementEnd < offsetStart:  # anything that finishes before the span ends is definitely out
+            return False
+
+        # all the simple cases done! Now need to filter out those that are border cases depending on settings
+
+        if self.zeroLengthSearch is True and elementIsZeroLength is True:
+            # zero Length Searches -- include all zeroLengthElements
+            return True
+
+        if self.mustFinishInSpan is True:
+            if elementEnd > offsetEnd:
+                return False
+            if self.includeEndBoundary is False:
+                # we include the end boundary if the search is zeroLength -- otherwise nothing can be retrieved
+                if elementEnd == offsetEnd:
+                    return False
+
+        if self.mustBeginInSpan is True:
+            if offset < offsetStart:
+                return False
+            if self.includeEndBoundary is False:
+                if offset >= offsetEnd:
+                    # >= is unnecessary, should just be ==, but better safe than sorry
+                    return False
+
+        if self.mustBeginInSpan is False:
+            if elementIsZeroLength is False:
+                if elementEnd == offsetEnd and self.zeroLengthSearch is True:
+                    return False
+        if self.includeEndBoundary is False:
+            if offset >= offsetEnd:
+                return False
+
+        if (self.includeElementsThatEndAtStart is False and
+                elementEnd == offsetStart):
+            return False
+
+        return True
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def _getTestStream(self):
+        from music21 import bar
+        from music21 import chord
+        from music21 import clef
+        from music21 import note
+        from music21 import stream
+
+        s = stream.Stream()
+        s.append(clef.TrebleClef())
+        for i in range(24):
+            e = [note.Note('C'), note.Rest(quarterLength=0.5),
+                chord.Chord(['D', 'F'], quarterLength=2),
+                note.Note('G', quarterLength=0)][i % 4]
+            if i % 3 == 0:
+                e.groups.append('marked')
+            s.append(e)
+        s.storeAtEnd(bar.Barline('final'))
+        return s
+
+    def testChainedFiltersMatchStreamMethods(self):
+        s = self._getTestStream()
+        found = s.view.getElementsByClass('GeneralNote').getElementsNotOfClass(
+            'Rest').getElementsByGroup('marked').getElementsByOffset(2, 12)
+        # by name, as the classes here are in __main__ when this module is run
+        self.assertEqual([f.__class__.__name__ for f in found.filters],
+            ['ClassFilter', 'ClassNotFilter', 'GroupFilter', 'OffsetFilter'])
+        expected = s.getElementsByClass('GeneralNote').getElementsNotOfClass(
+            'Rest').getElementsByGroup('marked').getElementsByOffset(2, 12)
+        self.assertEqual(list(found), list(expected))
+        self.assertEqual([e.getOffsetBySite(s) for e in found],
+            [e.getOffsetBySite(s) for e in expected])
+
+        for view, expected in [
+                (s.view.notes, s.notes),
+                (s.view.notesAndRests, s.notesAndRests),
+                (s.view.getElementsNotOfClass('GeneralNote'),
+                    s.getElementsNotOfClass('GeneralNote')),
+                (s.view.getElementsByOffset(3, 6, mustBeginInSpan=False,
+                    includeEndBoundary=False), s.getElementsByOffset(3, 6,
+                    mustBeginInSpan=False, includeEndBoundary=False)),
+                ]:
+            self.assertEqual(list(view), list(expected))
+            self.assertEqual(len(view), len(expected))
+
+        # filters can be called directly
+        n = s.notes[0]
+        self.assertTrue(ClassFilter(['Note'])(n, s))
+        self.assertFalse(ClassNotFilter(['Note'])(n, s))
+        self.assertTrue(GroupFilter(['marked'])(n, s))
+        self.assertTrue(OffsetFilter(0, 1)(n, s))
+        self.assertFalse(OffsetFilter(1, 2, includeEndBoundary=False)(n, s))
+
+    def testViewDoesNotCopy(self):
+        s = self._getTestStream()
+        elements = list(s.elements)
+        sitesBefore = [len(e.sites) for e in elements]
+        view = s.view.getElementsByClass('Note').getElementsByOffset(0, 20)
+        found = list(view)
+        self.assertTrue(len(found) > 0)
+        self.assertTrue(all(any(e is x for x in elements) for e in found))
+        self.assertEqual([len(e.sites) for e in elements], sitesBefore)
+        self.assertEqual(list(s.elements), elements)
+        self.assertTrue(all(e.activeSite is s for e in found))
+
+        # the view follows changes to the source Stream
+        from music21 import note
+        n = note.Note('E')
+        s.insert(1, n)
+        self.assertTrue(any(e is n for e in view))
+        s.remove(n)
+        self.assertFalse(any(e is n for e in view))
+
+    def testViewCannotBeChanged(self):
+        from music21 import note
+        from music21 import stream
+        s = self._getTestStream()
+        m = stream.Measure()
+        m.append(note.Note('C', quarterLength=8))
+        s.insert(0, m)
+        elements = list(s.elements)
+        view = s.view.getElementsByClass('Stream')
+        for method in ('makeRests', 'makeTies', 'append', 'sort'):
+            self.assertRaises(AttributeError, getattr, view, method)
+        self.assertRaises(AttributeError, setattr, view, 'elements', ())
+        self.assertRaises(AttributeError, setattr, view, 'autoSort', False)
+        self.assertEqual(list(s.elements), elements)
+        self.assertEqual(len(m), 1)
+        # methods that change nothing can be called
+        self.assertEqual(view.highestTime, 8.0)
+        self.assertEqual(len(view.getElementsByClass('Measure')), 1)
+        self.assertEqual(len(view.transpose(2)), 1)
+        self.assertEqual(s.notes[0].name, 'C')
+
+
+#------------------------------------------------------------------------------
+
+
+_DOC_ORDER = (
+    StreamFilter,
+    ClassFilter,
+    ClassNotFilter,
+    GroupFilter,
+    OffsetFilter,
+    )
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
@@ -0,0 +1,497 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         streamIndex.py
+# Purpose:      cached indices over the elements of a single Stream
+#
+# Copyright:    Copyright © 2026 The music21 Project
+# License:      LGPL or BSD, see license.txt
+#------------------------------------------------------------------------------
+'''
+Lazily built indices over the elements of a single Stream.
+
+Indices are stored in a Stream's `_cache` and are thus discarded whenever
+:meth:`~music21.stream.Stream._elementsChanged` is called, which also
+happens when the offset of an element in the Stream is changed.  Setting
+the `quarterLength` or `duration` of an element discards the offset index
+of each Stream it is in.  They are a
+lower-level tool that normal music21 users will not need to call directly;
+methods such as :meth:`~music21.stream.Stream.getElementsByOffset` use
+them automatically.
+'''
+import bisect
+import unittest
+
+from music21 import environment
+from music21.common import opFrac
+
+environLocal = environment.Environment("stream.streamIndex")
+
+
+#------------------------------------------------------------------------------
+
+
+class OffsetIndex(object):
+    '''
+    An index of the elements of a Stream by offset.
+
+    Start offsets are kept in a sorted list that can be bisected, so that
+    elements beginning in a region are found in O(log n + k) time.  End
+    times are not stored, as durations can change in place; they are read
+    from the elements when searching.
+
+    Positions returned by an OffsetIndex refer to `.elements`, which is
+    stored at the time the index is created.
+
+    >>> s = stream.Stream()
+    >>> for i, ql in enumerate([2, 1, 1, 4]):
+    ...     n = note.Note(quarterLength=ql)
+    ...     n.id = 'n%d' % i
+    ...     s.append(n)
+    >>> oi = stream.streamIndex.OffsetIndex(s)
+    >>> len(oi)
+    4
+    >>> oi.positionsStartingBetween(1.0, 3.0)
+    [1, 2]
+    >>> oi.positionsStartingBetween(1.0, 3.0, includeEndBoundary=False)
+    [1]
+    >>> oi.positionsSoundingAt(1.5)
+    [0]
+    >>> oi.positionsSoundingAt(2.0)
+    [0]
+    >>> oi.positionsSoundingAt(2.0, includeElementsThatEndAt=False)
+    []
+    >>> oi.latestPositionsAtOrBefore(3.5)
+    [2]
+    >>> oi.latestPositionsAtOrBefore(3.0, includeOffset=False)
+    [1]
+    >>> oi.elements[3].id
+    'n3'
+    '''
+
+    __slots__ = (
+        'clientId',
+        'elements',
+        '_offsets',
+        '_order',
+        '_startOffsets',
+        )
+
+    def __init__(self, srcStream):
+        # keep the id of the Stream indexed, as Streams copied with
+        # copy.copy share a _cache dictionary with their source
+        self.clientId = id(srcStream)
+        # calling .elements will sort if autoSort is True
+        self.elements = srcStream.elements
+        offsets = [e.getOffsetBySite(srcStream) for e in self.elements]
+        self._offsets = offsets
+        # a stable sort keeps elements at the same offset in Stream order;
+        # if the Stream is already sorted this is linear
+        order = sorted(range(len(offsets)), key=offsets.__getitem__)
+        self._order = order
+        self._startOffsets = [offsets[i] for i in order]
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __repr__(self):
+        return '<%s {%d}>' % (self.__class__.__name__, len(self.elements))
+
+    #--------------------------------------------------------------------------
+
+    def offsetAt(self, position):
+        '''
+        Return the offset of the element at `position` when the index
+        was built.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> stream.streamIndex.OffsetIndex(s).offsetAt(2)
+        2.0
+        '''
+        return self._offsets[position]
+
+    def positionsStartingBetween(self, offsetStart, offsetEnd,
+        includeEndBoundary=True):
+        '''
+        Return a sorted list of positions of all elements whose offset
+        is at least `offsetStart` and at most `offsetEnd` (or less than
+        `offsetEnd` if `includeEndBoundary` is False).
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 8)
+        >>> oi = stream.streamIndex.OffsetIndex(s)
+        >>> oi.positionsStartingBetween(2, 4)
+        [2, 3, 4]
+        >>> oi.positionsStartingBetween(2.5, 2.75)
+        []
+        >>> oi.positionsStartingBetween(20, 30)
+        []
+        '''
+        low = bisect.bisect_left(self._startOffsets, offsetStart)
+        if includeEndBoundary:
+            high = bisect.bisect_right(self._startOffsets, offsetEnd)
+        else:
+            high = bisect.bisect_left(self._startOffsets, offsetEnd)
+        if high <= low:
+            return []
+        return sorted(self._order[low:high])
+
+    def positionsSoundingAt(self, offset, includeElementsThatEndAt=True):
+        '''
+        Return a sorted list of positions of all elements that begin
+        before `offset` and are still sounding at `offset`.  Elements that
+        end exactly at `offset` are included unless
+        `includeElementsThatEndAt` is False.
+
+        >>> s = stream.Stream()
+        >>> s.insert(0, note.Note(quarterLength=4))
+        >>> s.insert(1, note.Note(quarterLength=1))
+        >>> s.insert(3, note.Note(quarterLength=1))
+        >>> oi = stream.streamIndex.OffsetIndex(s)
+        >>> oi.positionsSoundingAt(2)
+        [0, 1]
+        >>> oi.positionsSoundingAt(2, includeElementsThatEndAt=False)
+        [0]
+        >>> oi.positionsSoundingAt(0)
+        []
+
+        Durations are read when searching, so changes to them made after
+        the index was built are seen:
+
+        >>> s.notes[1].quarterLength = 0.5
+        >>> oi.positionsSoundingAt(2)
+        [0]
+        >>> s.notes[1].duration.type = 'half'
+        >>> oi.positionsSoundingAt(2)
+        [0, 1]
+        '''
+        startOffsets = self._startOffsets
+        order = self._order
+        elements = self.elements
+        found = []
+        for i in range(bisect.bisect_left(startOffsets, offset)):
+            position = order[i]
+            stopOffset = opFrac(startOffsets[i] +
+                elements[position].duration.quarterLength)
+            if stopOffset > offset or (includeElementsThatEndAt and
+                stopOffset == offset):
+                found.append(position)
+        found.sort()
+        return found
+
+    def latestPositionsAtOrBefore(self, offset, includeOffset=True,
+        classList=None):
+        '''
+        Return a sorted list of the positions of all elements sharing the
+        greatest offset that is at or before `offset` (or strictly before it
+        if `includeOffset` is False).  If `classList` is given, only
+        elements matching it are considered.  Returns an empty list if
+        no element qualifies.
+
+        >>> s = stream.Stream()
+        >>> s.insert(0, clef.TrebleClef())
+        >>> s.insert(0, note.Note())
+        >>> s.insert(2, note.Rest())
+        >>> oi = stream.streamIndex.OffsetIndex(s)
+        >>> oi.latestPositionsAtOrBefore(1)
+        [0, 1]
+        >>> oi.latestPositionsAtOrBefore(5, classList=['Note'])
+        [1]
+        >>> oi.latestPositionsAtOrBefore(0, includeOffset=False)
+        []
+        '''
+        startOffsets = self._startOffsets
+        order = self._order
+        elements = self.elements
+        if includeOffset:
+            i = bisect.bisect_right(startOffsets, offset) - 1
+        else:
+            i = bisect.bisect_left(startOffsets, offset) - 1
+        found = []
+        foundOffset = None
+        while i >= 0:
+            thisOffset = startOffsets[i]
+            if foundOffset is not None and thisOffset != foundOffset:
+                break
+            position = order[i]
+            if classList is None or elements[position].isClassOrSubclass(
+                classList):
+                found.append(position)
+                foundOffset = thisOffset
+            i -= 1
+        found.sort()
+        return found
+
+
+class ClassIndex(object):
+    '''
+    An index of the elements of a Stream by class.
+
+    Elements are grouped by their class when the index is built; a class
+    filter then only needs to be checked against each distinct class found
+    in the Stream rather than against every element.  The positions
+    matching each class filter are stored, so repeated searches for the
+    same classes cost only the length of the result.
+
+    Positions refer to `.elements`, which is stored at the time the index
+    is created and holds `_elements` followed by `_endElements` in their
+    current order; building the index does not sort the Stream.  Positions
+    of `_endElements` begin at `.endElementsStart`.
+
+    >>> s = stream.Stream()
+    >>> s.append(clef.TrebleClef())
+    >>> s.append(note.Note('C'))
+    >>> s.append(note.Rest())
+    >>> s.append(chord.Chord(['D', 'F']))
+    >>> s.storeAtEnd(bar.Barline('final'))
+    >>> ci = stream.streamIndex.ClassIndex(s)
+    >>> ci.positionsOfClass(['Note'])
+    [1]
+    >>> ci.positionsOfClass(['GeneralNote'])
+    [1, 2, 3]
+    >>> ci.positionsOfClass([note.Rest, 'Clef'])
+    [0, 2]
+    >>> ci.positionsNotOfClass(['GeneralNote'])
+    [0, 4]
+    >>> ci.endElementsStart
+    4
+    >>> ci.hasClass('Barline')
+    True
+    >>> ci.hasClass('Measure')
+    False
+    '''
+
+    __slots__ = (
+        'clientId',
+        'elements',
+        'endElementsStart',
+        '_positionsByClass',
+        '_positionsByFilter',
+        )
+
+    def __init__(self, srcStream):
+        self.clientId = id(srcStream)
+        # unlike .elements, this does not sort the Stream; a sort() discards
+        # the index
+        self.elements = srcStream._elements + srcStream._endElements
+        self.endElementsStart = len(srcStream._elements)
+        positionsByClass = {}
+        for i, e in enumerate(self.elements):
+            eClass = e.__class__
+            if eClass in positionsByClass:
+                positionsByClass[eClass].append(i)
+            else:
+                positionsByClass[eClass] = [i]
+        self._positionsByClass = positionsByClass
+        self._positionsByFilter = {}
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __repr__(self):
+        return '<%s {%d}>' % (self.__class__.__name__, len(self.elements))
+
+    @staticmethod
+    def _classMatches(eClass, classFilterList):
+        '''
+        The class-level equivalent of
+        :meth:`~music21.base.Music21Object.isClassOrSubclass`.
+        '''
+        classNames = [x.__name__ for x in eClass.mro()]
+        for className in classFilterList:
+            if className in classNames:
+                return True
+            try: # className may be a string or a Class
+                if issubclass(eClass, className):
+                    return True
+            except TypeError:
+                continue
+        return False
+
+    def positionsOfClass(self, classFilterList):
+        '''
+        Return a sorted list of the positions of all elements that match
+        one or more classes (given as strings or class objects) in
+        `classFilterList`.
+
+        The returned list is stored by the index and must not be changed.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> ci = stream.streamIndex.ClassIndex(s)
+        >>> ci.positionsOfClass(['Note']) is ci.positionsOfClass(['Note'])
+        True
+        '''
+        try:
+            cacheKey = tuple(classFilterList)
+            hash(cacheKey)
+        except TypeError: # unhashable filters are not stored
+            cacheKey = None
+        if cacheKey is not None and cacheKey in self._positionsByFilter:
+            return self._positionsByFilter[cacheKey]
+
+        matches = [positions for eClass, positions in
+            self._positionsByClass.items()
+            if self._classMatches(eClass, classFilterList)]
+        if len(matches) == 1:
+            post = matches[0]
+        else:
+            post = []
+            for positions in matches:
+                post.extend(positions)
+            post.sort()
+        if cacheKey is not None:
+            self._positionsByFilter[cacheKey] = post
+        return post
+
+    def positionsNotOfClass(self, classFilterList):
+        '''
+        Return a sorted list of the positions of all elements that do not
+        match any class in `classFilterList`.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> s.append(note.Rest())
+        >>> stream.streamIndex.ClassIndex(s).positionsNotOfClass(['Rest'])
+        [0]
+        '''
+        post = []
+        for eClass, positions in self._positionsByClass.items():
+            if not self._classMatches(eClass, classFilterList):
+                post.extend(positions)
+        post.sort()
+        return post
+
+    def hasClass(self, className):
+        '''
+        Return True if any element matches `className`.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note())
+        >>> stream.streamIndex.ClassIndex(s).hasClass('NotRest')
+        True
+        '''
+        for eClass in self._positionsByClass:
+            if self._classMatches(eClass, (className,)):
+                return True
+        return False
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testOffsetIndexMatchesLinearScan(self):
+        import random
+        from music21 import note
+        from music21 import stream
+
+        s = stream.Stream()
+        for unused_i in range(200):
+            n = note.Note(quarterLength=random.choice([0, 0.5, 1, 1.5, 4]))
+            s.insert(random.choice(range(40)) * 0.5, n)
+        oi = OffsetIndex(s)
+        offsets = [e.getOffsetBySite(s) for e in s.elements]
+        stops = [o + e.duration.quarterLength
+            for o, e in zip(offsets, s.elements)]
+        for unused_attempt in range(50):
+            start = random.choice(range(45)) * 0.5
+            end = start + random.choice(range(8)) * 0.5
+            self.assertEqual(oi.positionsStartingBetween(start, end),
+                [i for i, o in enumerate(offsets) if start <= o <= end])
+            self.assertEqual(oi.positionsSoundingAt(start),
+                [i for i, o in enumerate(offsets)
+                    if o < start and stops[i] >= start])
+            before = [o for o in offsets if o <= start]
+            if before:
+                self.assertEqual(oi.latestPositionsAtOrBefore(start),
+                    [i for i, o in enumerate(offsets) if o == max(before)])
+
+    def testOffsetIndexSeesDurationsChangedInPlace(self):
+        from music21 import note
+        from music21 import stream
+
+        s = stream.Stream()
+        for ql in [2, 1, 1]:
+            s.append(note.Note(quarterLength=ql))
+        def soundingOffsets(source):
+            found = source.getElementsByOffset(2.5, 3, mustBeginInSpan=False)
+            return [e.getOffsetBySite(s) for e in found]
+        # the index is built when it is asked for a second time
+        self.assertEqual(soundingOffsets(s), [2.0, 3.0])
+        self.assertEqual(soundingOffsets(s), [2.0, 3.0])
+        self.assertTrue(s._getOffsetIndex() is not None)
+        s.notes[0].duration.type = 'whole'
+        self.assertEqual(soundingOffsets(s), [0.0, 2.0, 3.0])
+        self.assertEqual(soundingOffsets(s.view), [0.0, 2.0, 3.0])
+
+        s.notes[0].duration.type = 'quarter'
+        self.assertEqual(soundingOffsets(s), [2.0, 3.0])
+        s.notes[0].duration.dots = 2
+        self.assertEqual(s._getOffsetIndex().positionsSoundingAt(1.5), [0])
+
+    def testClassIndexMatchesIsClassOrSubclass(self):
+        from music21 import bar
+        from music21 import chord
+        from music21 import clef
+        from music21 import note
+        from music21 import stream
+
+        s = stream.Stream()
+        for i in range(30):
+            s.append([note.Note(), note.Rest(), chord.Chord(['C', 'E']),
+                clef.BassClef(), note.Unpitched()][i % 5])
+        s.storeAtEnd(bar.Barline('final'))
+        ci = ClassIndex(s)
+        for classFilterList in [['Note'], ['NotRest'], [note.GeneralNote],
+            ['Clef', note.Rest], ['Barline'], ['Measure'], ['Music21Object']]:
+            self.assertEqual(ci.positionsOfClass(classFilterList),
+                [i for i, e in enumerate(s.elements)
+                    if e.isClassOrSubclass(classFilterList)])
+            self.assertEqual(ci.positionsNotOfClass(classFilterList),
+                [i for i, e in enumerate(s.elements)
+                    if not e.isClassOrSubclass(classFilterList)])
+
+    def testClassIndexDoesNotSort(self):
+        from music21 import note
+        from music21 import stream
+
+        for autoSort in (True, False):
+            s = stream.Stream()
+            s.autoSort = autoSort
+            s.isSorted = False
+            for offset in (3, 1, 2, 0):
+                n = note.Note()
+                n.id = 'n%d' % offset
+                s._insertCore(offset, n)
+            s._elementsChanged()
+            unsorted = list(s._elements)
+            s.getElementsNotOfClass('Rest')
+            self.assertFalse(s.isSorted)
+            self.assertEqual(s._elements, unsorted)
+            self.assertEqual([e.id for e in s._getClassIndex().elements],
+                ['n3', 'n1', 'n2', 'n0'])
+            if not autoSort:
+                self.assertEqual(len(s.getElementsByClass('Note')), 4)
+                self.assertEqual(s._elements, unsorted)
+
+
+#------------------------------------------------------------------------------
+
+
+_DOC_ORDER = (
+    OffsetIndex,
+    ClassIndex,
+    )
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
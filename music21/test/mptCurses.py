@@ -208,7 +208,7 @@ def runOneModuleWithoutImp(args):
     
     try:
         moduleName = modGath._getName(fp)
-        globs = __import__('music21').__dict__.copy()
+        globs = __import__('music21', fromlist=['*']).__dict__.copy()
         docTestOptions = (doctest.ELLIPSIS|doctest.NORMALIZE_WHITESPACE)
         s1 = doctest.DocTestSuite(
             globs=globs,
@@ -221,7 +221,7 @@ def runOneModuleWithoutImp(args):
         else:
             s1.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(moduleObject.Test))
         try:
-            globs = __import__('music21').__dict__.copy()
+            globs = __import__('music21', fromlist=['*']).__dict__.copy()
             s3 = doctest.DocTestSuite(moduleObject,
                 globs=globs,
                 optionflags=docTestOptions,
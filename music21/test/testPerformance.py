@@ -15,6 +15,8 @@ This file is not run with the standard test battery presently.
 '''
 
 
+import subprocess
+import sys
 import unittest
 
 import music21
@@ -253,6 +255,25 @@ class Test(unittest.TestCase):
         '''
         unused = corpus.parse('monteverdi/madrigal.5.3.rntxt', forceSource=True)
 
+    def runImportMusic21(self):
+        '''Importing music21 in a new interpreter
+        '''
+        subprocess.check_call([sys.executable, '-c', 'import music21'])
+
+    def testImportIsLazy(self):
+        '''
+        "import music21" should not load the modules that are only needed
+        by some programs; they are loaded when first used.
+        '''
+        script = ('import sys, music21; '
+                  'print(" ".join(m for m in sys.modules if sys.modules[m]))')
+        loaded = subprocess.check_output([sys.executable, '-c', script],
+                                         stderr=subprocess.STDOUT)
+        loaded = loaded.decode('utf-8').split()
+        for name in ('stream', 'note', 'graph', 'braille', 'lily',
+                     'vexflow', 'features', 'humdrum', 'corpus', 'converter'):
+            self.assertFalse('music21.' + name in loaded, name)
+
     #---------------------------------------------------------------------------
     def testTimingTolerance(self):
         '''Test the performance of methods defined above, comparing the resulting time to the time obtained in past runs. 
@@ -263,6 +284,11 @@ class Test(unittest.TestCase):
         # provide work and expected min/max in seconds
         for testMethod, best in [
 
+            (self.runImportMusic21,
+                {
+                 '2026.10.17': 0.16,
+                }),
+
             (self.runGetElementsByPrevious, 
                 {
                  '2011.11.29': 4.69, 
@@ -155,7 +155,7 @@ def main(testGroup=['test'], restoreEnvironmentDefaults=False, limit=None):
     >>> print(None)
     None
     '''
-    globs = __import__('music21').__dict__.copy()
+    globs = __import__('music21', fromlist=['*']).__dict__.copy()
     docTestOptions = (doctest.ELLIPSIS|doctest.NORMALIZE_WHITESPACE)
     # in case there are any tests here, get a suite to load up later
     s1 = doctest.DocTestSuite(
@@ -199,7 +199,7 @@ def main(testGroup=['test'], restoreEnvironmentDefaults=False, limit=None):
             s2 = unittest.defaultTestLoader.loadTestsFromTestCase(testCase)
             s1.addTests(s2)
         try:
-            globs = __import__('music21').__dict__.copy()
+            globs = __import__('music21', fromlist=['*']).__dict__.copy()
             s3 = doctest.DocTestSuite(
                 module,
                 globs=globs,
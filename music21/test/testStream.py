@@ -3025,7 +3025,7 @@ class Test(unittest.TestCase):
         # this adds to elements list
         m1.leftBarline = b1
         self.assertEqual(len(m1), 2)
-        self.assertEqual(m1[1], b1) # this is on elements
+        self.assertEqual(m1[0], b1) # this is on elements, sorted before the time signature
         self.assertEqual(m1.rightBarline, None) # this is on elements
 
         b2 = bar.Barline('heavy')
@@ -7430,6 +7430,330 @@ class Test(unittest.TestCase):
         #s.show()
 
 
+    def testGetElementsByOffsetIndexed(self):
+        # repeated searches use an offset index; results must be the same
+        # as those of the first, linear search
+        s = Stream()
+        for i in range(60):
+            n = note.Note(quarterLength=[0.5, 1, 2, 3][i % 4])
+            s.insert((i * 7) % 40 * 0.5, n)
+        s.insert(4, clef.BassClef())
+        s.insert(4, meter.TimeSignature('3/4'))
+        s.sort()
+
+        searches = [(2, 6), (3.25, 3.25), (0, 0), (10, 12), (19, 30)]
+        options = [{}, {'mustBeginInSpan': False},
+            {'mustFinishInSpan': True}, {'includeEndBoundary': False},
+            {'mustBeginInSpan': False, 'includeElementsThatEndAtStart': False},
+            {'classList': ['Clef', 'TimeSignature']}]
+        for start, end in searches:
+            for kw in options:
+                s._cache = {}
+                linear = [id(e) for e in s.getElementsByOffset(start, end, **kw)]
+                self.assertFalse('offsetIndex' in s._cache)
+                indexed = [id(e) for e in s.getElementsByOffset(start, end, **kw)]
+                self.assertTrue('offsetIndex' in s._cache)
+                self.assertEqual(linear, indexed)
+
+        for offset in [0, 3.5, 4, 4.25, 30]:
+            for classList in [None, ['Clef'], ['Note']]:
+                s._cache = {}
+                linear = s.getElementAtOrBefore(offset, classList)
+                indexed = s.getElementAtOrBefore(offset, classList)
+                self.assertTrue('offsetIndex' in s._cache)
+                self.assertTrue(linear is indexed)
+            for classList in [['Clef'], ['Note']]:
+                s._cache = {}
+                linear = s.getElementBeforeOffset(offset, classList)
+                indexed = s.getElementBeforeOffset(offset, classList)
+                self.assertTrue('offsetIndex' in s._cache)
+                self.assertTrue(linear is indexed)
+
+        # changing the elements discards the index
+        s.insert(2.25, note.Note('F#'))
+        self.assertFalse('offsetIndex' in s._cache)
+        s.getElementsByOffset(2, 3)
+        found = s.getElementsByOffset(2.25)
+        self.assertEqual([e.name for e in found], ['F#'])
+
+    def testGetElementsByOffsetIndexedAfterChanges(self):
+        # changing offsets and durations after the index is built must give
+        # the same results as a linear search
+        s = Stream()
+        s.repeatAppend(note.Note(), 6)
+        for unused_i in range(2):
+            s.getElementsByOffset(0, 1)
+        self.assertTrue('offsetIndex' in s._cache)
+
+        n = s[1]
+        n.offset = 2.5
+        found = s.getElementsByOffset(2, 3)
+        self.assertEqual([e.offset for e in found], [2.0, 2.5, 3.0])
+        found = s.getElementsByOffset(2, 3)
+        self.assertEqual([e.offset for e in found], [2.0, 2.5, 3.0])
+
+        n.quarterLength = 2
+        for unused_i in range(2):
+            found = s.getElementsByOffset(3.5, 3.5, mustBeginInSpan=False)
+            self.assertEqual([e.offset for e in found], [2.5, 3.0])
+
+
+    def testStreamViewMatchesFilters(self):
+        s = Stream()
+        for i in range(40):
+            if i % 5 == 0:
+                n = note.Rest(quarterLength=1)
+            elif i % 7 == 0:
+                n = chord.Chord(['C4', 'G4'], quarterLength=2)
+            else:
+                n = note.Note('D4', quarterLength=0.5)
+            if i % 3 == 0:
+                n.groups.append('marked')
+            s.insert(i * 0.5, n)
+        s.insert(4, clef.BassClef())
+        s.storeAtEnd(bar.Barline('final'))
+
+        def ids(found):
+            return [id(e) for e in found]
+
+        self.assertEqual(ids(s.view.notes), ids(s.notes))
+        self.assertEqual(ids(s.view.getElementsNotOfClass('Note')),
+            ids(s.getElementsNotOfClass('Note')))
+        self.assertEqual(ids(s.view.getElementsByGroup('marked')),
+            ids(s.getElementsByGroup('marked')))
+        for kw in [{}, {'mustBeginInSpan': False}, {'mustFinishInSpan': True}]:
+            # the second view can use the offset index
+            for unused_i in range(2):
+                self.assertEqual(
+                    ids(s.view.getElementsByClass('Note').getElementsByOffset(
+                        3, 9, **kw)),
+                    ids(s.getElementsByClass('Note').getElementsByOffset(
+                        3, 9, **kw)))
+
+        # a view follows changes to its source
+        v = s.view.getElementsByClass('Rest')
+        self.assertEqual(len(v), 8)
+        s.insert(30, note.Rest())
+        self.assertEqual(len(v), 9)
+        self.assertEqual(v.highestTime, 31.0)
+        s.insert(32, note.Rest())
+        self.assertEqual(v.highestTime, 33.0)
+        self.assertRaises(AttributeError, getattr, v, 'insert')
+
+        # and to changes of durations and groups, which the source Stream
+        # is not told about
+        v = s.view.getElementsByOffset(31.25, 31.75, mustBeginInSpan=False)
+        self.assertEqual(len(v), 0)
+        s.getElementsByOffset(30)[0].quarterLength = 1.5
+        self.assertEqual(len(v), 1)
+        v = s.view.getElementsByGroup('new')
+        self.assertEqual(len(v), 0)
+        s[0].groups.append('new')
+        self.assertEqual(len(v), 1)
+
+        materialized = v.stream()
+        self.assertEqual(ids(materialized), ids(v))
+        self.assertEqual(materialized.derivation.origin, s)
+        self.assertEqual(s.view.getElementsByClass('Barline').stream(
+            )._endElements[0].style, 'final')
+
+
+    def testInsertKeepsSorted(self):
+        # inserting into a sorted Stream stores the sort keys of the new
+        # elements, so that a single sort orders them all
+        offsets = [(i * 7) % 23 for i in range(60)]
+        # elements are placed by bisecting the stored keys when few
+        # elements need to be moved, and otherwise sorted when next needed
+        for maximumShift in (1024, 5):
+            s = Stream()
+            s._maximumSortedInsertShift = maximumShift
+            sExpected = Stream()
+            sExpected.autoSort = False
+            for i, o in enumerate(offsets):
+                if i % 10 == 0:
+                    elements = [clef.BassClef(), clef.BassClef()]
+                else:
+                    elements = [note.Note(quarterLength=2)]
+                for e in elements:
+                    s.insert(o, e)
+                    self.assertEqual(s._cache['sortKeys'],
+                        [x.sortTuple(s) for x in s._elements])
+                    sExpected.insert(o, e)
+            self.assertEqual(s.isSorted, maximumShift == 1024)
+            if not s.isSorted:
+                # a priority change is seen by the next sort
+                sExpected._elements[-1].priority = -1
+            self.assertEqual(s.highestTime, 24.0)
+            sExpected.sort(force=True)
+            self.assertEqual([id(e) for e in s.elements],
+                [id(e) for e in sExpected._elements])
+            self.assertEqual(s._getSortKeys(),
+                [e.sortTuple(s) for e in s._elements])
+
+        # appending keeps the sort keys
+        s.append(note.Rest())
+        self.assertTrue('sortKeys' in s._cache)
+        s.insert(1.5, note.Note('G'))
+        self.assertEqual(s._getSortKeys(),
+            [e.sortTuple(s) for e in s._elements])
+        offsets = [e.offset for e in s.elements]
+        self.assertEqual(offsets, sorted(offsets))
+        self.assertTrue(1.5 in offsets)
+
+        # an element can still only be inserted once
+        n = s.notes[0]
+        self.assertRaises(Exception, s.insert, 5, n)
+
+    def testCacheInvalidationByChange(self):
+        # removing one of two equal notes leaves the other in the flat Stream
+        s = Stream()
+        a = note.Note('C')
+        b = note.Note('C')
+        s.insert(0, a)
+        s.insert(4, b)
+        sFlat = s.flat
+        s.remove(b)
+        self.assertEqual([id(e) for e in s.flat], [id(a)])
+        self.assertEqual(s.flat.highestOffset, 0.0)
+        # a removal discards the flat Stream
+        self.assertEqual([id(e) for e in sFlat], [id(a), id(b)])
+        # an insertion or append leaves Streams returned before unchanged,
+        # and the next ones are made from them and the new elements
+        sFlat = s.flat
+        sSemiFlat = s.semiFlat
+        s.insert(2, b)
+        c = note.Note('E')
+        s.append(c)
+        self.assertTrue(c.activeSite is s)
+        self.assertEqual(len(sFlat), 1)
+        self.assertEqual(len(sSemiFlat), 1)
+        self.assertTrue('flatAdditions' in s._cache)
+        newFlat = s.flat
+        newSemiFlat = s.semiFlat
+        self.assertFalse(newFlat is sFlat)
+        self.assertFalse(newSemiFlat is sSemiFlat)
+        self.assertTrue(s.flat is newFlat)
+        for flatStream in (newFlat, newSemiFlat):
+            self.assertEqual([id(e) for e in flatStream], [id(a), id(b), id(c)])
+            self.assertEqual([e.getOffsetBySite(flatStream) 
+                for e in flatStream], [0.0, 2.0, 3.0])
+            self.assertEqual(flatStream.highestTime, 4.0)
+            self.assertTrue(flatStream.flattenedRepresentationOf is s)
+        self.assertEqual([id(e) for e in sFlat], [id(a)])
+        # changing a Stream returned before discards what was made from it
+        s.insert(5, note.Note('F'))
+        sFlat.insert(1, note.Note('G'))
+        self.assertFalse('flatAdditions' in s._cache)
+        self.assertEqual(len(s.flat), 4)
+        # an inserted Stream is flattened again
+        sFlat = s.flat
+        s.insert(0, Measure())
+        self.assertFalse('flatAdditions' in s._cache)
+        self.assertFalse(s.flat is sFlat)
+
+        # the same for a Stream with contained Streams
+        sc = Score()
+        p = Part()
+        p.repeatAppend(note.Note('C'), 2)
+        sc.insert(0, p)
+        scFlat = sc.flat
+        scSemiFlat = sc.semiFlat
+        sc.insert(1, note.Note('D'))
+        self.assertEqual(len(scFlat), 2)
+        self.assertEqual(len(scSemiFlat), 3)
+        self.assertEqual([e.name for e in sc.flat.notes], ['C', 'C', 'D'])
+        self.assertEqual(len(sc.semiFlat), 4)
+        self.assertTrue(sc.semiFlat.getElementsByClass('Part')[0] is p)
+        self.assertTrue(p.activeSite is not sc.semiFlat)
+
+        # sorting clears only the values that depend on the order
+        s = Stream()
+        s.autoSort = False
+        s.insert(4, note.Note('D'))
+        s.insert(0, note.Note('C'))
+        self.assertEqual(s.highestOffset, 4.0)
+        self.assertEqual(len(s.notes), 2)
+        sFlat = s.flat
+        s.sort()
+        self.assertTrue('HighestOffset' in s._cache)
+        self.assertTrue('notes' in s._cache)
+        self.assertFalse(s.flat is sFlat)
+
+        # unless elements were added without _elementsChanged()
+        s.isSorted = s._insertCore(2, note.Note('E'))
+        s.sort()
+        self.assertFalse('HighestOffset' in s._cache)
+        self.assertEqual(len(s.notes), 3)
+
+        # changes in a contained Stream keep the flat status of its site
+        m = Measure()
+        m.append(note.Note('C'))
+        s = Stream()
+        s.append(m)
+        self.assertFalse(s.isFlat)
+        m.append(note.Note('D'))
+        self.assertFalse(s.isFlat)
+        self.assertEqual(len(s.flat.notes), 2)
+
+    def testTimespanCacheInvalidationByChange(self):
+        s = Stream()
+        s.repeatAppend(note.Note(), 4)
+        tsc = s.asTimespans()
+        self.assertTrue(s.asTimespans() is tsc)
+        self.assertFalse(s.asTimespans(classList=(note.Rest,)) is tsc)
+        # changes to the Stream make new ones, leaving those returned before
+        s.insert(1.5, note.Note('D', quarterLength=0.5))
+        self.assertFalse(s.asTimespans() is tsc)
+        self.assertEqual(len(tsc), 4)
+        self.assertEqual(len(s.asTimespans()), 5)
+        tsc = s.asTimespans()
+        s.notes[0].quarterLength = 2
+        s._elementsChanged(changes=['durations'])
+        self.assertFalse(s.asTimespans() is tsc)
+
+    def testGetMetricalAttributes(self):
+        from music21 import converter
+        s = converter.parse('tinynotation: 3/4 C4 D E 2/4 F8 G A B 6/8 c8 d e f g a')
+        p = s.makeMeasures()
+        p.measure(1).padAsAnacrusis()
+        post = p.getMetricalAttributes('Note')
+        self.assertEqual(len(post), 13)
+        for e, measureNumber, beat, beatStrength in post:
+            self.assertEqual(measureNumber, e.measureNumber)
+            self.assertEqual(beat, e.beat)
+            self.assertEqual(beatStrength, e.beatStrength)
+        self.assertEqual([round(beat, 3) for unused_e, unused_n, beat, unused_s in post][-6:],
+            [1.0, 1.333, 1.667, 2.0, 2.333, 2.667])
+
+        # parts of a Score are each processed
+        sc = Score()
+        sc.insert(0, p)
+        sc.insert(0, copy.deepcopy(p))
+        elements, measureNumbers, beats, beatStrengths = sc.getMetricalAttributes(
+            'Note', returnLists=True)
+        self.assertEqual(len(elements), 26)
+        self.assertEqual(beats[:13], beats[13:])
+        self.assertEqual(measureNumbers[:3], [1, 1, 1])
+
+        # without a TimeSignature no beats are given
+        s = Stream()
+        s.repeatAppend(note.Note(), 2)
+        self.assertEqual(s.getMetricalAttributes(returnLists=True)[2], [None, None])
+
+        # elements stored at the end have no beat and are left out
+        from music21 import bar
+        p.measure(3).rightBarline = bar.Barline('final')
+        m = Measure()
+        m.append(meter.TimeSignature('3/4'))
+        m.append(note.Note(quarterLength=2))
+        m.storeAtEnd(bar.Barline('double'))
+        for container in (p, m):
+            elements = container.getMetricalAttributes(returnLists=True)[0]
+            self.assertFalse(any('Barline' in e.classes for e in elements))
+            self.assertEqual(len(elements), 
+                len([e for e in container.recurse() if not e.isStream and
+                    'Barline' not in e.classes]))
+
 
 #------------------------------------------------------------------------------
 
@@ -13,8 +13,10 @@
 as object representations.  Used by the musicxml converter, obviously, but
 also by environment.py.
 '''
+import codecs
 import copy
 import xml.dom.minidom
+import xml.sax.saxutils
 from music21.ext import six
 
 
@@ -80,6 +82,9 @@ class XMLNodeException(exceptions21.Music21Exception):
     pass
 
 class XMLNode(object):
+    # if True, writeXml() writes the components of this node one at a time
+    _writeIncrementally = False
+
     def __init__(self):
         '''
         >>> a = xmlnode.XMLNode()
@@ -511,61 +516,7 @@ class XMLNode(object):
                 node.appendChild(doc.createTextNode(cd))
 
         for component in self._getComponents():
-            if component == None: continue
-            # its a simple element
-            elif isinstance(component, tuple): 
-                tag, content = component
-                if content == None: continue
-
-                # some elements are treated as boolean values; presence 
-                # of element, w/o text, is true
-                if type(content) == bool and content == False: 
-                    continue 
-                content = fixBytes(content)
-                tag = fixBytes(tag)
-                
-                sub = doc.createElement(tag)
-                if type(content) == bool and content == True:
-                    pass # no text node needed
-                else:
-                    # was the topline; trying to use replace for errors
-                    #entry = u"%s" % content
-                    if (isinstance(content, int) or isinstance(content, float)):
-                        contentStr = str(content)
-                    else:
-                        contentStr = content
-
-                    if six.PY2:                       
-                        try:
-                            entry = unicode(contentStr, errors='replace')
-                        except TypeError:
-                            entry = u"%s" % contentStr
-                            #entry = str(content)
-                        except NameError: # py3
-                            entry = contentStr
-                        except RuntimeError:  # IronPython
-                            entry = u"%s" % contentStr                        
-                    else:
-                        entry = contentStr
-
-
-                    try:
-                        sub.appendChild(doc.createTextNode(entry))
-                    except TypeError:
-                        raise TypeError("More problems with %r, type: %s" % (entry, type(entry)))
-                node.appendChild(sub)
-            elif isinstance(component, XMLNode): # its a XMLNode subclass
-                # parent is this node
-                # if we have sub objects, we need to attach them to caller node
-                component.toxml(doc, node, 0)
-            elif isinstance(component, list):
-                # TODO: this error is raised in a few cases that objects
-                # are not properly organized in the resulting xml object; 
-                # the problem is generally not here, but in the higher-level
-                print(['cannot process component object', component, 'doc', doc, 'parent', parent])
-            else:
-                raise XMLNodeException(
-                    'cannot process component object: %s' % component)
+            self._appendComponent(doc, node, component)
 
         # append completed node to parent (from arg) or document
         parent.appendChild(node)
@@ -580,16 +531,154 @@ class XMLNode(object):
             # do not need to do anything, as has been attached to parent
             return None 
 
+    def _appendComponent(self, doc, node, component):
+        '''
+        Append the DOM node (if any) for one of the components of this
+        XMLNode, as returned by _getComponents(), to `node`.
+        '''
+        if component == None:
+            return
+        # its a simple element
+        elif isinstance(component, tuple): 
+            tag, content = component
+            if content == None:
+                return
+
+            # some elements are treated as boolean values; presence 
+            # of element, w/o text, is true
+            if type(content) == bool and content == False: 
+                return
+            content = fixBytes(content)
+            tag = fixBytes(tag)
+            
+            sub = doc.createElement(tag)
+            if type(content) == bool and content == True:
+                pass # no text node needed
+            else:
+                # was the topline; trying to use replace for errors
+                #entry = u"%s" % content
+                if (isinstance(content, int) or isinstance(content, float)):
+                    contentStr = str(content)
+                else:
+                    contentStr = content
+
+                if six.PY2:                       
+                    try:
+                        entry = unicode(contentStr, errors='replace')
+                    except TypeError:
+                        entry = u"%s" % contentStr
+                        #entry = str(content)
+                    except NameError: # py3
+                        entry = contentStr
+                    except RuntimeError:  # IronPython
+                        entry = u"%s" % contentStr                        
+                else:
+                    entry = contentStr
+
+
+                try:
+                    sub.appendChild(doc.createTextNode(entry))
+                except TypeError:
+                    raise TypeError("More problems with %r, type: %s" % (entry, type(entry)))
+            node.appendChild(sub)
+        elif isinstance(component, XMLNode): # its a XMLNode subclass
+            # parent is this node
+            # if we have sub objects, we need to attach them to caller node
+            component.toxml(doc, node, 0)
+        elif isinstance(component, list):
+            # TODO: this error is raised in a few cases that objects
+            # are not properly organized in the resulting xml object; 
+            # the problem is generally not here, but in the higher-level
+            print(['cannot process component object', component, 'doc', doc, 'node', node])
+        else:
+            raise XMLNodeException(
+                'cannot process component object: %s' % component)
+
+    def writeXml(self, fileLike):
+        '''
+        Write this XMLNode as a complete XML document to a file-like object,
+        which takes encoded (utf-8) bytes in Python 2 and strings in Python 3.
+
+        The output is the same as that of xmlStr(), but the document is
+        never held in memory at once: the components of XMLNodes whose
+        class sets `_writeIncrementally` to True (such as MusicXML scores
+        and parts) are written one at a time, each from a DOM of just that
+        component.
+
+        >>> from music21.ext import six
+        >>> a = musicxml.mxObjects.Pitch()
+        >>> a.setDefaults()
+        >>> f = six.BytesIO() if six.PY2 else six.StringIO()
+        >>> a.writeXml(f)
+        >>> f.getvalue() == a.xmlStr()
+        True
+        '''
+        doc = self.getNewDoc()
+        if six.PY2:
+            # as done by minidom's toprettyxml
+            writer = codecs.getwriter('utf-8')(fileLike)
+            doc.writexml(writer, '', '  ', '\n', 'utf-8')
+        else:
+            writer = fileLike
+            doc.writexml(writer, '', '  ', '\n')
+        self._writeIncremental(doc, writer, '', '  ', '\n')
+        doc.unlink()
+
+    def _writeIncremental(self, doc, writer, indent, addindent, newl):
+        '''
+        Write this XMLNode to `writer` as minidom's writexml() would write
+        its DOM node, but component by component if `_writeIncrementally`
+        is True.
+        '''
+        if not self._writeIncrementally:
+            holder = doc.createElement('holder')
+            self.toxml(doc, holder)
+            holder.firstChild.writexml(writer, indent, addindent, newl)
+            holder.unlink()
+            return
+
+        # same as fixed_writexml, but for an element without character data
+        writer.write(indent + '<' + self._tag)
+        attributes = {}
+        for name, value in self._getAttributes():
+            if value in [None, '']: continue
+            attributes[name] = str(value)
+        for name in sorted(attributes):
+            # escaped as minidom escapes attribute values
+            writer.write(' %s="%s"' % (name, xml.sax.saxutils.escape(attributes[name],
+                                                                   {'"': '&quot;'})))
+
+        hasChildren = False
+        for component in self._getComponents():
+            if isinstance(component, XMLNode) and component._writeIncrementally:
+                if not hasChildren:
+                    writer.write('>' + newl)
+                    hasChildren = True
+                component._writeIncremental(doc, writer, indent + addindent,
+                                            addindent, newl)
+                continue
+            holder = doc.createElement('holder')
+            self._appendComponent(doc, holder, component)
+            for node in holder.childNodes:
+                if not hasChildren:
+                    writer.write('>' + newl)
+                    hasChildren = True
+                node.writexml(writer, indent + addindent, addindent, newl)
+            holder.unlink()
+
+        if hasChildren:
+            writer.write('%s</%s>%s' % (indent, self._tag, newl))
+        else:
+            writer.write('/>' + newl)
+
     def xmlStr(self):
         '''Shortcut method to provide quick xml out.'''
-        x = self.toxml(None, None, 1)
         if six.PY2:
-            return x
+            f = six.BytesIO()
         else:
-            if isinstance(x, bytes):
-                return x.decode(errors='replace')
-            else:
-                return x
+            f = six.StringIO()
+        self.writeXml(f)
+        return f.getvalue()
 
 
 class XMLNodeList(XMLNode):
@@ -692,6 +781,22 @@ class Test(unittest.TestCase):
                 unused_a = copy.copy(obj)
                 unused_b = copy.deepcopy(obj)
 
+    def testWriteXmlEscapesAttributes(self):
+        from music21.musicxml import mxObjects
+        mxPart = mxObjects.Part()
+        mxPart.set('id', 'a&b"<c>\'d')
+        mxScore = mxObjects.Score()
+        mxScore.componentList.append(mxPart)
+        self.assertTrue(mxScore._writeIncrementally)
+        # the same as minidom writes for the DOM of the part
+        doc = xml.dom.minidom.Document()
+        holder = doc.createElement('holder')
+        mxPart.toxml(doc, holder)
+        f = six.StringIO()
+        holder.firstChild.writexml(f, '  ', '  ', '\n')
+        self.assertIn(f.getvalue(), mxScore.xmlStr())
+        self.assertIn('<part id="a&amp;b&quot;&lt;c&gt;\'d"/>', f.getvalue())
+
 
 
 #-------------------------------------------------------------------------------